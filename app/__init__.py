@@ -84,6 +84,7 @@ def create_app(config_name=None):
     from app.routes.linked_data import linked_data_bp
     from app.routes.docs import docs_bp
     from app.routes.document_methods_api import document_methods_bp
+    from app.routes.metrics import metrics_bp
 
     app.register_blueprint(auth_bp, url_prefix='/auth')
     app.register_blueprint(admin_bp)
@@ -104,6 +105,11 @@ def create_app(config_name=None):
     app.register_blueprint(linked_data_bp, url_prefix='/linked-data')
     app.register_blueprint(docs_bp)
     app.register_blueprint(document_methods_bp)
+    app.register_blueprint(metrics_bp)
+
+    # Request latency, per-request DB statements and trace spans
+    from app.utils.request_metrics import init_request_metrics
+    init_request_metrics(app)
 
     # Composite documents removed - using inheritance-based versioning
     
@@ -342,6 +348,17 @@ def register_cli(app: Flask) -> None:
             _db.create_all()
         click.echo("Database initialized.")
 
+    @app.cli.command("reindex-search")
+    @click.option("--config", default=None,
+                  help="Text search configuration to switch to (e.g. english, simple, ontextract_historical).")
+    @click.option("--batch-size", default=500, show_default=True)
+    def reindex_search_command(config, batch_size):
+        """Recompute documents' full-text search vectors."""
+        from app.services.document_search_service import get_document_search_service
+        with app.app_context():
+            updated = get_document_search_service().reindex(config, batch_size=batch_size)
+        click.echo(f"Reindexed {updated} documents.")
+
     @app.cli.command("create-admin")
     @click.option("--username", prompt=True)
     @click.option("--email", prompt=True)
@@ -74,6 +74,42 @@ class StartProcessingDTO(BaseDTO):
         return self
 
 
+class ProcessingStageDTO(BaseDTO):
+    """
+    DTO for one stage of a processing plan
+
+    Validates a processing type/method pair.
+    """
+
+    model_config = ConfigDict(extra='forbid')
+
+    processing_type: str = Field(..., min_length=1, max_length=50, description="Type of processing")
+    processing_method: str = Field(..., min_length=1, max_length=50, description="Processing method")
+
+    @model_validator(mode='after')
+    def validate_type_method_pair(self):
+        if self.processing_method not in SUPPORTED_PROCESSING_METHODS.get(self.processing_type, ()):
+            raise ValueError(
+                f'Unsupported method {self.processing_method} for '
+                f'{self.processing_type}'
+            )
+        return self
+
+
+class StartProcessingPlanDTO(BaseDTO):
+    """
+    DTO for scheduling processing stages over an experiment's documents
+
+    Stages are run per document; ``document_ids`` restricts the plan to
+    some of the experiment's documents.
+    """
+
+    model_config = ConfigDict(extra='forbid')
+
+    stages: List[ProcessingStageDTO] = Field(..., min_length=1, description="Stages to run")
+    document_ids: Optional[List[int]] = Field(None, description="Documents to process (default: all)")
+
+
 class ProcessingStatusResponseDTO(BaseDTO):
     """
     DTO for processing status response
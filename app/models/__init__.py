@@ -3,6 +3,8 @@ from app import db
 # Import all models here for easy access
 from .user import User
 from .document import Document
+from . import document_search  # noqa: F401 - installs the search_vector trigger
+from . import fuzzy_search  # noqa: F401 - installs the trigram indexes
 from .processing_job import ProcessingJob
 from .extracted_entity import ExtractedEntity
 from .ontology_mapping import OntologyMapping
@@ -12,6 +14,9 @@ from .experiment import Experiment
 # Experiment-document relationship model
 from .experiment_document import ExperimentDocument
 
+# Trigger-maintained experiment corpus membership
+from .experiment_corpus import ExperimentCorpusMember
+
 # Experiment processing models
 from .experiment_processing import ExperimentDocumentProcessing, ProcessingArtifact, DocumentProcessingIndex
 from .processing_artifact_group import ProcessingArtifactGroup
@@ -20,6 +25,14 @@ from .processing_artifact_group import ProcessingArtifactGroup
 from .experiment_orchestration_run import ExperimentOrchestrationRun
 from .orchestration_logs import OrchestrationDecision, ToolExecutionLog, MultiModelConsensus
 from .orchestration_feedback import OrchestrationFeedback, LearningPattern, OrchestrationOverride
+from .orchestration_checkpoint import OrchestrationToolCheckpoint
+
+# Background purge progress
+from .document_purge_job import DocumentPurgeJob
+from .oed_parse_job import OEDParseJob, OEDPdfPageLayout
+
+# Scheduled per-document processing stages
+from .processing_plan import ProcessingPlan, ProcessingPlanNode
 
 # Term management models
 from .term import Term, TermVersion, FuzzinessAdjustment
@@ -44,6 +57,7 @@ from .temporal_experiment import (
     TermDisciplinaryDefinition,
     SemanticShiftAnalysis
 )
+from .semantic_event import SemanticEvent, SemanticEventDocument
 
 __all__ = [
     'User',
@@ -54,6 +68,7 @@ __all__ = [
     'TextSegment',
     'Experiment',
     'ExperimentDocument',
+    'ExperimentCorpusMember',
     # Experiment processing models
     'ExperimentDocumentProcessing',
     'ProcessingArtifact',
@@ -67,6 +82,12 @@ __all__ = [
     'OrchestrationFeedback',
     'LearningPattern',
     'OrchestrationOverride',
+    'OrchestrationToolCheckpoint',
+    'DocumentPurgeJob',
+    'OEDParseJob',
+    'OEDPdfPageLayout',
+    'ProcessingPlan',
+    'ProcessingPlanNode',
     # Term management models
     'Term',
     'TermVersion',
@@ -86,5 +107,7 @@ __all__ = [
     'DocumentTemporalMetadata',
     'OEDTimelineMarker',
     'TermDisciplinaryDefinition',
-    'SemanticShiftAnalysis'
+    'SemanticShiftAnalysis',
+    'SemanticEvent',
+    'SemanticEventDocument'
 ]
@@ -1,6 +1,7 @@
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 from app import db
+from app.models.fuzzy_search import fuzzy_match
 import uuid
 
 
@@ -41,13 +42,10 @@ class ContextAnchor(db.Model):
         return anchor
     
     @staticmethod
-    def search_anchors(query, limit=50):
-        """Search anchor terms for autocomplete"""
-        if not query:
-            return ContextAnchor.query.order_by(ContextAnchor.frequency.desc()).limit(limit).all()
-        
-        return ContextAnchor.query.filter(
-            ContextAnchor.anchor_term.ilike(f'%{query}%')
+    def search_anchors(query, limit=50, mode='fuzzy'):
+        """Search anchor terms for autocomplete, best match first"""
+        return fuzzy_match(
+            ContextAnchor.query, ContextAnchor.anchor_term, query, mode
         ).order_by(ContextAnchor.frequency.desc()).limit(limit).all()
     
     @staticmethod
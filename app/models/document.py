@@ -1,5 +1,5 @@
 from sqlalchemy import text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from datetime import datetime
 import os
 import uuid as uuid_lib
@@ -9,6 +9,9 @@ class Document(db.Model):
     """Model for storing uploaded files and pasted text content"""
 
     __tablename__ = 'documents'
+    __table_args__ = (
+        db.Index('ix_documents_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     uuid = db.Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid_lib.uuid4, index=True)
@@ -64,6 +67,9 @@ class Document(db.Model):
     # Text content (for pasted text or extracted from files)
     content = db.Column(db.Text)
     content_preview = db.Column(db.Text)  # First 500 characters for display
+    # Weighted title + content lexemes, maintained by a trigger (see
+    # app.models.document_search); deferred so rows never load it
+    search_vector = db.deferred(db.Column(TSVECTOR))
     
     # Language detection
     detected_language = db.Column(db.String(10))
@@ -0,0 +1,69 @@
+"""
+Document Purge Job Model
+
+Durable progress record for a chunked purge of all documents. The purge
+engine commits each batch of deletions together with the job's step, keyset
+cursor and the file paths it still has to unlink, so an interrupted purge
+resumes exactly where it stopped.
+"""
+
+from app import db
+from datetime import datetime
+import uuid
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+
+class DocumentPurgeJob(db.Model):
+    """
+    One administrative purge of all documents and their dependent records.
+
+    Status lifecycle: pending -> running -> completed | failed. A failed or
+    stalled running job is resumed from its saved step and cursor.
+    """
+
+    __tablename__ = 'document_purge_jobs'
+
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    requested_by = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+
+    status = db.Column(db.String(20), nullable=False, default='pending', index=True)
+    step = db.Column(db.String(100), nullable=True)  # Name of the step in progress
+    step_index = db.Column(db.Integer, nullable=False, default=0)
+    cursor = db.Column(JSONB, nullable=True)  # Last key deleted in the current step
+    counts = db.Column(JSONB, nullable=False, default=dict)  # Rows affected per step
+    pending_files = db.Column(JSONB, nullable=False, default=list)  # Committed deletions awaiting unlink
+    files_deleted = db.Column(db.Integer, nullable=False, default=0)
+    files_failed = db.Column(db.Integer, nullable=False, default=0)
+    batch_size = db.Column(db.Integer, nullable=False, default=1000)
+    total_documents = db.Column(db.Integer, nullable=True)
+
+    celery_task_id = db.Column(db.String(255), nullable=True)
+    error_message = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<DocumentPurgeJob {self.id} {self.status} step={self.step}>'
+
+    def to_dict(self):
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'id': str(self.id),
+            'requested_by': self.requested_by,
+            'status': self.status,
+            'step': self.step,
+            'step_index': self.step_index,
+            'counts': self.counts or {},
+            'pending_files': len(self.pending_files or []),
+            'files_deleted': self.files_deleted,
+            'files_failed': self.files_failed,
+            'total_documents': self.total_documents,
+            'error_message': self.error_message,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
@@ -0,0 +1,219 @@
+"""
+Document Full-Text Search Schema
+
+``documents.search_vector`` holds the weighted lexemes of each document's
+title (A) and content (B) and is GIN-indexed. A ``BEFORE INSERT OR UPDATE OF
+title, content`` trigger recomputes it, so every write path keeps it
+current.
+
+The text search configuration used for indexing is whatever
+``ontextract_search_config()`` returns; queries go through the same function,
+so they always match the index. ``ontextract_historical`` (the default) is
+the English configuration applied to text passed through
+``ontextract_normalize_historical``. That function folds long s and
+ligatures, the ``-ick`` forms in ``HISTORICAL_ICK_WORDS`` (``musick``,
+``publick``) and the spellings in ``HISTORICAL_SPELLINGS`` onto their modern
+forms, so queries in either spelling find both. ``-ick`` is folded only for
+listed words, since most ``-ick`` words (homesick, sidekick, Warwick) are
+not historical spellings. ``historical_variants`` inverts the folding for
+highlighting. PostgreSQL dictionaries that would do this (synonym,
+thesaurus) need files on the database server, so the folding lives in SQL
+instead. ``DocumentSearchService.reindex`` switches configurations.
+
+Only the first ``SEARCH_MAX_CHARS`` characters of content are indexed,
+which keeps very large PDF extractions under the tsvector size limit.
+"""
+
+import re
+from typing import List
+
+from sqlalchemy import DDL, event
+
+from app import db
+
+HISTORICAL_CONFIG = 'ontextract_historical'
+DEFAULT_SEARCH_CONFIG = HISTORICAL_CONFIG
+SEARCH_MAX_CHARS = 1000000
+
+# Whole-word early modern spellings and their modern forms
+HISTORICAL_SPELLINGS = (
+    ('antient', 'ancient'),
+    ('antients', 'ancients'),
+    ('chymical', 'chemical'),
+    ('chymist', 'chemist'),
+    ('chymistry', 'chemistry'),
+    ('compleat', 'complete'),
+    ('connexion', 'connection'),
+    ('croud', 'crowd'),
+    ('oeconomy', 'economy'),
+    ('phrenzy', 'frenzy'),
+    ('shew', 'show'),
+    ('shewed', 'showed'),
+    ('shewn', 'shown'),
+    ('shews', 'shows'),
+)
+
+# Early modern -ick spellings of modern -ic words (plurals fold too)
+HISTORICAL_ICK_WORDS = (
+    'academick', 'antick', 'arithmetick', 'authentick', 'catholick', 'characteristick',
+    'comick', 'critick', 'domestick', 'emetick', 'epick', 'ethick', 'fantastick',
+    'frolick', 'heroick', 'logick', 'lyrick', 'magick', 'mathematick', 'mechanick',
+    'metaphysick', 'musick', 'panegyrick', 'physick', 'poetick', 'politick', 'publick',
+    'rhetorick', 'romantick', 'rustick', 'satirick', 'topick', 'traffick', 'tragick',
+)
+
+# Characters folded one for one, then multi-character ligatures
+_TRANSLATED = ('ſ', 's')  # long s
+_LIGATURES = (
+    ('æ', 'ae'), ('Æ', 'Ae'), ('œ', 'oe'), ('Œ', 'Oe'),
+    ('ﬀ', 'ff'), ('ﬁ', 'fi'), ('ﬂ', 'fl'), ('ﬃ', 'ffi'),
+    ('ﬄ', 'ffl'), ('ﬅ', 'st'), ('ﬆ', 'st'),
+)
+
+
+def _normalize_function_sql():
+    steps = [f"result := translate(result, '{_TRANSLATED[0]}', '{_TRANSLATED[1]}');"]
+    steps.extend(f"result := replace(result, '{old}', '{new}');" for old, new in _LIGATURES)
+    stems = '|'.join(word[:-3] for word in HISTORICAL_ICK_WORDS)
+    steps.append(rf"result := regexp_replace(result, '\m({stems})ick(s?)\M', '\1ic\2', 'gi');")
+    steps.extend(
+        rf"result := regexp_replace(result, '\m{old}\M', '{new}', 'gi');"
+        for old, new in HISTORICAL_SPELLINGS
+    )
+    body = '\n    '.join(steps)
+    return f"""
+CREATE OR REPLACE FUNCTION ontextract_normalize_historical(body text) RETURNS text AS $$
+DECLARE
+    result text := body;
+BEGIN
+    IF result IS NULL THEN
+        RETURN NULL;
+    END IF;
+    {body}
+    RETURN result;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE;
+"""
+
+
+def historical_variants(query: str) -> List[str]:
+    """
+    Historical spellings of the words in ``query`` that the folding maps onto
+    them (``music`` -> ``musick``), for highlighting matches in raw content.
+    Excluded (``-word``) terms are skipped.
+    """
+    ick = {word[:-1]: word for word in HISTORICAL_ICK_WORDS}
+    spellings = {}
+    for old, new in HISTORICAL_SPELLINGS:
+        spellings.setdefault(new, []).append(old)
+    variants = []
+    for excluded, word in re.findall(r"(-?)([^\W\d_]+)", query.lower()):
+        if excluded:
+            continue
+        for stem, plural in ((word, ''), (word[:-1], 's') if word.endswith('s') else (None, '')):
+            if stem in ick:
+                variants.append(ick[stem] + plural)
+        variants.extend(spellings.get(word, []))
+        ligatured = word.replace('ae', 'æ').replace('oe', 'œ')
+        if ligatured != word:
+            variants.append(ligatured)
+    return list(dict.fromkeys(variants))
+
+
+CREATE_CONFIG_SQL = f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{HISTORICAL_CONFIG}') THEN
+        CREATE TEXT SEARCH CONFIGURATION {HISTORICAL_CONFIG} (COPY = pg_catalog.english);
+    END IF;
+END;
+$$;
+"""
+
+
+def search_config_function_sql(config: str = DEFAULT_SEARCH_CONFIG) -> str:
+    """DDL making ``config`` the configuration used to index and query."""
+    return f"""
+CREATE OR REPLACE FUNCTION ontextract_search_config() RETURNS regconfig AS $$
+    SELECT '{config}'::regconfig
+$$ LANGUAGE sql STABLE;
+"""
+
+
+# Installs the default configuration without overriding a reindexed choice
+CREATE_CONFIG_FUNCTION_SQL = f"""
+DO $do$
+BEGIN
+    IF to_regprocedure('ontextract_search_config()') IS NULL THEN
+        CREATE FUNCTION ontextract_search_config() RETURNS regconfig AS $f$
+            SELECT '{DEFAULT_SEARCH_CONFIG}'::regconfig
+        $f$ LANGUAGE sql STABLE;
+    END IF;
+END;
+$do$;
+"""
+
+SEARCH_TEXT_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION ontextract_search_text(cfg regconfig, body text) RETURNS text AS $$
+    SELECT CASE WHEN cfg = '{HISTORICAL_CONFIG}'::regconfig
+                THEN ontextract_normalize_historical(body) ELSE body END
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+SEARCH_VECTOR_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION ontextract_search_vector(cfg regconfig, title text, body text) RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector(cfg, ontextract_search_text(cfg, coalesce(title, ''))), 'A')
+        || setweight(to_tsvector(cfg, ontextract_search_text(cfg, left(coalesce(body, ''), {SEARCH_MAX_CHARS}))), 'B')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+SEARCH_QUERY_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION ontextract_search_query(cfg regconfig, query text) RETURNS tsquery AS $$
+    SELECT websearch_to_tsquery(cfg, ontextract_search_text(cfg, query))
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+REFRESH_TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION documents_search_vector_refresh() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := ontextract_search_vector(ontextract_search_config(), NEW.title, NEW.content);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def search_trigger_statements():
+    """DDL creating the configuration, search functions and refresh trigger."""
+    return [
+        CREATE_CONFIG_SQL,
+        _normalize_function_sql(),
+        CREATE_CONFIG_FUNCTION_SQL,
+        SEARCH_TEXT_FUNCTION_SQL,
+        SEARCH_VECTOR_FUNCTION_SQL,
+        SEARCH_QUERY_FUNCTION_SQL,
+        REFRESH_TRIGGER_FUNCTION_SQL,
+        "CREATE OR REPLACE TRIGGER documents_search_vector "
+        "BEFORE INSERT OR UPDATE OF title, content ON documents "
+        "FOR EACH ROW EXECUTE FUNCTION documents_search_vector_refresh()",
+    ]
+
+
+def drop_search_trigger_statements():
+    """DDL removing the trigger, functions and configuration."""
+    return [
+        "DROP TRIGGER IF EXISTS documents_search_vector ON documents",
+        "DROP FUNCTION IF EXISTS documents_search_vector_refresh()",
+        "DROP FUNCTION IF EXISTS ontextract_search_query(regconfig, text)",
+        "DROP FUNCTION IF EXISTS ontextract_search_vector(regconfig, text, text)",
+        "DROP FUNCTION IF EXISTS ontextract_search_text(regconfig, text)",
+        "DROP FUNCTION IF EXISTS ontextract_search_config()",
+        "DROP FUNCTION IF EXISTS ontextract_normalize_historical(text)",
+        f"DROP TEXT SEARCH CONFIGURATION IF EXISTS {HISTORICAL_CONFIG}",
+    ]
+
+
+# db.create_all() (tests, fresh installs) installs the trigger too; the
+# migration installs it and backfills existing databases
+for _statement in search_trigger_statements():
+    event.listen(db.metadata, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
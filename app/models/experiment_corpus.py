@@ -0,0 +1,207 @@
+"""
+Experiment Corpus Membership Model
+
+``experiment_corpus_members`` is the resolved corpus of every experiment: one
+row per document linked through ``experiment_documents_v2``, the legacy
+``experiment_documents`` table or ``experiment_references`` (reference-type
+documents only, like ``Experiment.references``), with the
+document's version family root, its role and whether it is the latest
+associated version of that family.
+
+The table is maintained by PostgreSQL triggers on the three association
+tables and on the ``documents`` version and type columns, so it changes in the same
+transaction as the links it mirrors, whichever code path wrote them.
+"""
+
+from sqlalchemy import DDL, event
+
+from app import db
+
+
+class ExperimentCorpusMember(db.Model):
+    """One document in an experiment's effective corpus (trigger-maintained)."""
+
+    __tablename__ = 'experiment_corpus_members'
+
+    experiment_id = db.Column(db.Integer, db.ForeignKey('experiments.id', ondelete='CASCADE'), primary_key=True)
+    document_id = db.Column(db.Integer, db.ForeignKey('documents.id', ondelete='CASCADE'), primary_key=True)
+    root_document_id = db.Column(db.Integer, nullable=False)  # source_document_id, or the document itself
+    role = db.Column(db.String(20), nullable=False)  # 'document' or 'reference'
+    experiment_document_id = db.Column(db.Integer, nullable=True)  # experiment_documents_v2 row, when associated
+    legacy = db.Column(db.Boolean, nullable=False, default=False)  # Linked via experiment_documents
+    is_latest = db.Column(db.Boolean, nullable=False, default=False)  # Latest associated version of its family
+
+    document = db.relationship('Document', foreign_keys=[document_id], viewonly=True)
+
+    __table_args__ = (
+        db.Index('ix_experiment_corpus_members_experiment_role', 'experiment_id', 'role'),
+        db.Index('ix_experiment_corpus_members_experiment_root', 'experiment_id', 'root_document_id'),
+        db.Index('ix_experiment_corpus_members_document', 'document_id'),
+    )
+
+    def __repr__(self):
+        return f'<ExperimentCorpusMember exp={self.experiment_id} doc={self.document_id} {self.role}>'
+
+
+# Recompute the corpus of the given experiments from the association tables
+REFRESH_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION refresh_experiment_corpus(exp_ids integer[]) RETURNS void AS $$
+BEGIN
+    IF exp_ids IS NULL OR cardinality(exp_ids) = 0 THEN
+        RETURN;
+    END IF;
+
+    DELETE FROM experiment_corpus_members
+    WHERE experiment_id = ANY(exp_ids)
+      AND (experiment_id, document_id) NOT IN (
+          SELECT experiment_id, document_id FROM experiment_documents_v2 WHERE experiment_id = ANY(exp_ids)
+          UNION SELECT experiment_id, document_id FROM experiment_documents WHERE experiment_id = ANY(exp_ids)
+          UNION SELECT r.experiment_id, r.reference_id
+          FROM experiment_references r JOIN documents rd ON rd.id = r.reference_id
+          WHERE r.experiment_id = ANY(exp_ids) AND rd.document_type = 'reference'
+      );
+
+    INSERT INTO experiment_corpus_members
+        (experiment_id, document_id, root_document_id, role, experiment_document_id, legacy, is_latest)
+    SELECT
+        links.experiment_id,
+        links.document_id,
+        COALESCE(d.source_document_id, d.id),
+        CASE WHEN bool_or(links.reference) THEN 'reference' ELSE 'document' END,
+        max(links.experiment_document_id),
+        bool_or(links.legacy),
+        max(links.experiment_document_id) IS NOT NULL AND row_number() OVER (
+            PARTITION BY links.experiment_id, COALESCE(d.source_document_id, d.id),
+                         max(links.experiment_document_id) IS NOT NULL
+            ORDER BY COALESCE(d.version_number, 0) DESC, d.id DESC
+        ) = 1
+    FROM (
+        SELECT experiment_id, document_id, id AS experiment_document_id, false AS legacy, false AS reference
+        FROM experiment_documents_v2 WHERE experiment_id = ANY(exp_ids)
+        UNION ALL
+        SELECT experiment_id, document_id, NULL, true, false
+        FROM experiment_documents WHERE experiment_id = ANY(exp_ids)
+        UNION ALL
+        SELECT r.experiment_id, r.reference_id, NULL, false, true
+        FROM experiment_references r JOIN documents rd ON rd.id = r.reference_id
+        WHERE r.experiment_id = ANY(exp_ids) AND rd.document_type = 'reference'
+    ) AS links
+    JOIN documents d ON d.id = links.document_id
+    GROUP BY links.experiment_id, links.document_id, d.id
+    ON CONFLICT (experiment_id, document_id) DO UPDATE SET
+        root_document_id = EXCLUDED.root_document_id,
+        role = EXCLUDED.role,
+        experiment_document_id = EXCLUDED.experiment_document_id,
+        legacy = EXCLUDED.legacy,
+        is_latest = EXCLUDED.is_latest;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Statement-level: one refresh per statement however many links it touched
+LINKS_INSERTED_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION experiment_corpus_links_inserted() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_experiment_corpus(ARRAY(SELECT DISTINCT experiment_id FROM new_links));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+LINKS_DELETED_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION experiment_corpus_links_deleted() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_experiment_corpus(ARRAY(SELECT DISTINCT experiment_id FROM old_links));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+LINK_UPDATED_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION experiment_corpus_link_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_experiment_corpus(ARRAY[OLD.experiment_id, NEW.experiment_id]);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DOCUMENT_VERSION_CHANGED_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION experiment_corpus_document_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_experiment_corpus(ARRAY(
+        SELECT experiment_id FROM experiment_corpus_members
+        WHERE document_id = NEW.id OR root_document_id IN (OLD.id, OLD.source_document_id, NEW.source_document_id)
+        UNION
+        SELECT experiment_id FROM experiment_references WHERE reference_id = NEW.id
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# (table, link columns updated in place) for each association table
+CORPUS_LINK_TABLES = (
+    ('experiment_documents_v2', 'experiment_id, document_id'),
+    ('experiment_documents', 'experiment_id, document_id'),
+    ('experiment_references', 'experiment_id, reference_id'),
+)
+
+
+def corpus_trigger_statements():
+    """DDL creating the refresh function and every maintenance trigger."""
+    statements = [
+        REFRESH_FUNCTION_SQL,
+        LINKS_INSERTED_FUNCTION_SQL,
+        LINKS_DELETED_FUNCTION_SQL,
+        LINK_UPDATED_FUNCTION_SQL,
+        DOCUMENT_VERSION_CHANGED_FUNCTION_SQL,
+    ]
+    for table, columns in CORPUS_LINK_TABLES:
+        statements.extend([
+            f"CREATE OR REPLACE TRIGGER {table}_corpus_insert AFTER INSERT ON {table} "
+            f"REFERENCING NEW TABLE AS new_links FOR EACH STATEMENT "
+            f"EXECUTE FUNCTION experiment_corpus_links_inserted()",
+            f"CREATE OR REPLACE TRIGGER {table}_corpus_delete AFTER DELETE ON {table} "
+            f"REFERENCING OLD TABLE AS old_links FOR EACH STATEMENT "
+            f"EXECUTE FUNCTION experiment_corpus_links_deleted()",
+            f"CREATE OR REPLACE TRIGGER {table}_corpus_update AFTER UPDATE OF {columns} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION experiment_corpus_link_updated()",
+        ])
+    statements.append(
+        "CREATE OR REPLACE TRIGGER documents_corpus_update "
+        "AFTER UPDATE OF source_document_id, version_number, document_type ON documents "
+        "FOR EACH ROW WHEN (OLD.source_document_id IS DISTINCT FROM NEW.source_document_id "
+        "OR OLD.version_number IS DISTINCT FROM NEW.version_number "
+        "OR OLD.document_type IS DISTINCT FROM NEW.document_type) "
+        "EXECUTE FUNCTION experiment_corpus_document_changed()"
+    )
+    return statements
+
+
+def drop_corpus_trigger_statements():
+    """DDL removing the maintenance triggers and functions."""
+    statements = []
+    for table, _ in CORPUS_LINK_TABLES:
+        statements.extend(
+            f"DROP TRIGGER IF EXISTS {table}_corpus_{event_name} ON {table}"
+            for event_name in ('insert', 'delete', 'update')
+        )
+    statements.append("DROP TRIGGER IF EXISTS documents_corpus_update ON documents")
+    statements.extend(
+        f"DROP FUNCTION IF EXISTS {name}"
+        for name in (
+            'experiment_corpus_document_changed()',
+            'experiment_corpus_link_updated()',
+            'experiment_corpus_links_deleted()',
+            'experiment_corpus_links_inserted()',
+            'refresh_experiment_corpus(integer[])',
+        )
+    )
+    return statements
+
+
+# db.create_all() (tests, fresh installs) installs the triggers too; the
+# migration installs them on existing databases
+for _statement in corpus_trigger_statements():
+    event.listen(db.metadata, 'after_create', DDL(_statement).execute_if(dialect='postgresql'))
@@ -50,6 +50,8 @@ class ExperimentDocument(db.Model):
     # Unique constraint to prevent duplicates
     __table_args__ = (
         db.UniqueConstraint('experiment_id', 'document_id', name='unique_exp_doc'),
+        # Document -> experiment association IDs without touching the table
+        db.Index('ix_experiment_documents_v2_document_id_id', 'document_id', 'id'),
     )
     
     @property
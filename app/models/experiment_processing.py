@@ -34,6 +34,15 @@ class ExperimentDocumentProcessing(db.Model):
     # Relationships
     experiment_document = db.relationship('ExperimentDocument', backref='processing_operations')
 
+    __table_args__ = (
+        # Covers the job-history read (family documents -> processing rows of one type)
+        db.Index(
+            'ix_experiment_document_processing_history',
+            'experiment_document_id', 'processing_type', 'status',
+            postgresql_include=['id', 'created_at', 'completed_at', 'processing_method'],
+        ),
+    )
+
     def get_configuration(self):
         """Get configuration as dict"""
         if self.configuration_json:
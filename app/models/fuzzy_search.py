@@ -0,0 +1,165 @@
+"""
+Trigram Fuzzy Match Schema
+
+Short text columns searched from autocomplete and listing filters (term
+text, context anchors, document titles and authors) get ``pg_trgm`` GIN
+indexes over ``ontextract_normalize_historical(column)``, so ``musick``
+finds ``music`` and the other way round (see ``app.models.document_search``).
+Queries go through ``fuzzy_match``, which applies the same expression so
+the planner uses the index:
+
+- ``mode='fuzzy'`` matches substrings and, through the trigram similarity
+  operators, misspellings, ranked by similarity;
+- ``mode='prefix'`` matches the start of the text for autocomplete,
+  shortest first, and is capped at ``AUTOCOMPLETE_MAX_RESULTS`` by
+  ``bounded_limit``.
+
+``pg_trgm`` ships with PostgreSQL's contrib package but may be missing from
+a server. The indexes are only created when the extension is available,
+and without it ``fuzzy_match`` falls back to (unindexed) substring matching
+with no typo tolerance.
+"""
+
+from sqlalchemy import DDL, Text, cast, event, func, literal, or_, select, text
+
+from app import db
+
+AUTOCOMPLETE_MAX_RESULTS = 25
+FUZZY_MATCH_MODES = ('fuzzy', 'prefix')
+
+# (index name, table, column)
+TRIGRAM_INDEXES = (
+    ('ix_terms_term_text_trgm', 'terms', 'term_text'),
+    ('ix_context_anchors_anchor_term_trgm', 'context_anchors', 'anchor_term'),
+    ('ix_documents_title_trgm', 'documents', 'title'),
+    ('ix_documents_authors_trgm', 'documents', 'authors'),
+)
+
+_trigram_available = {}
+
+
+def _index_sql(name, table, column):
+    return (
+        f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+        f"USING gin (ontextract_normalize_historical({column}) gin_trgm_ops)"
+    )
+
+
+def trigram_index_statements():
+    """DDL installing ``pg_trgm`` and the trigram indexes."""
+    return ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+        _index_sql(name, table, column) for name, table, column in TRIGRAM_INDEXES
+    ]
+
+
+def drop_trigram_index_statements():
+    """DDL removing the trigram indexes (the extension is left installed)."""
+    return [f"DROP INDEX IF EXISTS {name}" for name, _, _ in TRIGRAM_INDEXES]
+
+
+# db.create_all() only installs the extension where the server offers it
+_CREATE_IF_AVAILABLE_SQL = """
+DO $do$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        {statements}
+    END IF;
+END;
+$do$;
+""".format(statements='\n        '.join(
+    f"EXECUTE '{statement}';" for statement in trigram_index_statements()
+))
+
+
+def trigram_available(session=None) -> bool:
+    """Whether ``pg_trgm`` is installed in the session's database (cached per engine)."""
+    session = session or db.session
+    bind = session.get_bind()
+    key = str(getattr(bind, 'engine', bind).url)
+    if key not in _trigram_available:
+        _trigram_available[key] = bind.dialect.name == 'postgresql' and bool(session.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).scalar())
+    return _trigram_available[key]
+
+
+def bounded_limit(limit, mode='fuzzy', default=20, maximum=100):
+    """Clamp a requested result size; prefix (autocomplete) mode caps it lower."""
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        limit = default
+    if mode == 'prefix':
+        maximum = min(maximum, AUTOCOMPLETE_MAX_RESULTS)
+    return max(1, min(limit, maximum))
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def fuzzy_match(query, columns, search, mode='fuzzy', threshold=None, session=None):
+    """
+    Filter ``query`` to rows whose ``columns`` match ``search`` and order it
+    best match first (by similarity, or shortest first for prefixes).
+    Further ``order_by`` calls add tie-breakers.
+
+    Args:
+        query: SQLAlchemy query to filter
+        columns: Column or sequence of columns to match against
+        search: User-entered text
+        mode: 'fuzzy' (similarity, typo tolerant) or 'prefix' (autocomplete)
+        threshold: Minimum similarity for fuzzy matches (default: pg_trgm's)
+
+    Returns:
+        The filtered, ordered query (unchanged when ``search`` is blank)
+    """
+    if mode not in FUZZY_MATCH_MODES:
+        raise ValueError(f'Unknown match mode: {mode}')
+    search = (search or '').strip()
+    if not search:
+        return query
+    if not isinstance(columns, (list, tuple)):
+        columns = [columns]
+    session = session or db.session
+
+    if session.get_bind().dialect.name == 'postgresql':
+        search = session.execute(select(func.ontextract_normalize_historical(search))).scalar()
+        expressions = [func.ontextract_normalize_historical(column) for column in columns]
+    else:
+        expressions = [func.lower(column) for column in columns]
+        search = search.lower()
+
+    pattern = _escape_like(search) + '%'
+    if mode == 'fuzzy':
+        pattern = '%' + pattern
+    conditions = [expression.ilike(pattern, escape='\\') for expression in expressions]
+    term = cast(literal(search), Text)
+
+    if mode == 'fuzzy' and trigram_available(session):
+        if threshold is not None:
+            session.execute(
+                text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true), "
+                     "set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+                {'threshold': str(float(threshold))},
+            )
+        for expression in expressions:
+            conditions.append(expression.op('%')(term))
+            conditions.append(term.op('<%')(expression))
+        scores = [
+            func.greatest(func.similarity(expression, term), func.word_similarity(term, expression))
+            for expression in expressions
+        ]
+        rank = scores[0] if len(scores) == 1 else func.greatest(*scores)
+        return query.filter(or_(*conditions)).order_by(rank.desc())
+
+    query = query.filter(or_(*conditions))
+    if mode == 'prefix':
+        return query.order_by(func.length(columns[0]))
+    # Substring matches carry no rank; the caller's ordering decides
+    return query
+
+
+# db.create_all() (tests, fresh installs) installs the indexes too; the
+# migration installs them on existing databases
+event.listen(db.metadata, 'after_create', DDL(_CREATE_IF_AVAILABLE_SQL).execute_if(dialect='postgresql'))
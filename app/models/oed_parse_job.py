@@ -0,0 +1,105 @@
+"""
+OED PDF Parse Job Models
+
+An uploaded OED entry PDF is parsed by a background job: one pdfplumber
+pass extracts each page's text and column layout, then the serialized
+layout goes to the structured extractor (LangExtract or Anthropic).
+
+Page layouts are cached by the SHA-256 of the PDF, one row per page and
+committed as each page finishes, so an interrupted extraction resumes at
+the next page and a re-uploaded PDF skips extraction altogether. A
+completed job keeps the structured result, which later jobs for the same
+file reuse unless a re-parse is forced.
+"""
+
+from app import db
+from datetime import datetime
+import uuid
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+
+class OEDParseJob(db.Model):
+    """
+    One OED PDF ingestion.
+
+    Status lifecycle: pending -> running -> completed | failed. ``stage``
+    names the step in progress (extracting, parsing).
+    """
+
+    __tablename__ = 'oed_parse_jobs'
+
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    requested_by = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+
+    file_hash = db.Column(db.String(64), nullable=False, index=True)  # SHA-256 of the PDF
+    file_path = db.Column(db.String(500), nullable=True)  # Stored upload, removed once parsed
+    original_filename = db.Column(db.String(255), nullable=True)
+
+    status = db.Column(db.String(20), nullable=False, default='pending', index=True)
+    stage = db.Column(db.String(50), nullable=True)
+    pages_total = db.Column(db.Integer, nullable=True)
+    pages_done = db.Column(db.Integer, nullable=False, default=0)
+    force_reparse = db.Column(db.Boolean, nullable=False, default=False)  # Ignore earlier results
+    layout_cached = db.Column(db.Boolean, nullable=False, default=False)  # Extraction skipped
+    result_reused_from = db.Column(UUID(as_uuid=True), nullable=True)  # Completed job whose result was reused
+    result = db.Column(JSONB, nullable=True)
+
+    celery_task_id = db.Column(db.String(255), nullable=True)
+    error_message = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<OEDParseJob {self.id} {self.status} stage={self.stage}>'
+
+    def to_dict(self, include_result=True):
+        """Convert to dictionary for JSON serialization."""
+        data = {
+            'id': str(self.id),
+            'requested_by': self.requested_by,
+            'file_hash': self.file_hash,
+            'original_filename': self.original_filename,
+            'status': self.status,
+            'stage': self.stage,
+            'pages_total': self.pages_total,
+            'pages_done': self.pages_done,
+            'force_reparse': self.force_reparse,
+            'layout_cached': self.layout_cached,
+            'result_reused_from': str(self.result_reused_from) if self.result_reused_from else None,
+            'error_message': self.error_message,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
+        if include_result:
+            data['result'] = self.result
+        return data
+
+
+class OEDPdfPageLayout(db.Model):
+    """Cached pdfplumber layout of one page of an OED PDF, keyed by file hash."""
+
+    __tablename__ = 'oed_pdf_page_layouts'
+
+    file_hash = db.Column(db.String(64), primary_key=True)
+    page_number = db.Column(db.Integer, primary_key=True)  # 1-based
+    page_count = db.Column(db.Integer, nullable=False)
+    width = db.Column(db.Float, nullable=True)
+    height = db.Column(db.Float, nullable=True)
+    lines = db.Column(JSONB, nullable=False, default=list)  # [{'y', 'left', 'right'}]
+    text = db.Column(db.Text, nullable=True)  # Plain page text when extracted without pdfplumber
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<OEDPdfPageLayout {self.file_hash[:12]} p{self.page_number}/{self.page_count}>'
+
+    def to_layout(self):
+        """Page dict in the shape ``OEDParser`` consumes."""
+        layout = {'width': self.width, 'height': self.height, 'lines': self.lines or []}
+        if self.text is not None:
+            layout['text'] = self.text
+        return layout
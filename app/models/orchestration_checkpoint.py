@@ -0,0 +1,84 @@
+"""
+Orchestration Tool Checkpoint Model
+
+Durable record of each (document, tool) execution within an orchestration
+run. A retried or resumed run looks checkpoints up by idempotency key and
+skips work that already completed, so a worker crash no longer restarts the
+whole strategy or writes duplicate ProcessingArtifacts.
+"""
+
+from app import db
+from datetime import datetime
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+
+class OrchestrationToolCheckpoint(db.Model):
+    """
+    One tool execution on one document for an orchestration run.
+
+    Status lifecycle: running -> completed | failed. A checkpoint left in
+    ``running`` means the worker died mid-execution and the tool is re-run.
+    """
+
+    __tablename__ = 'orchestration_tool_checkpoints'
+    __table_args__ = (
+        db.UniqueConstraint('run_id', 'idempotency_key', name='uq_orchestration_checkpoint_key'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    run_id = db.Column(
+        UUID(as_uuid=True),
+        db.ForeignKey('experiment_orchestration_runs.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    document_id = db.Column(db.Integer, db.ForeignKey('documents.id', ondelete='CASCADE'), nullable=False, index=True)
+    tool_name = db.Column(db.String(100), nullable=False)
+
+    # sha256 of document version + content + tool + parameters
+    idempotency_key = db.Column(db.String(64), nullable=False)
+
+    status = db.Column(db.String(20), nullable=False, default='running')  # running, completed, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    result = db.Column(JSONB, nullable=True)  # Tool result summary (artifacts live in ProcessingArtifact)
+    error_message = db.Column(db.Text, nullable=True)
+
+    started_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    run = db.relationship(
+        'ExperimentOrchestrationRun',
+        backref=db.backref('tool_checkpoints', lazy='dynamic', passive_deletes=True)
+    )
+
+    def mark_completed(self, result):
+        """Record a successful execution (caller commits)."""
+        self.status = 'completed'
+        self.result = result
+        self.error_message = None
+        self.completed_at = datetime.utcnow()
+
+    def mark_failed(self, error):
+        """Record a failed execution (caller commits)."""
+        self.status = 'failed'
+        self.error_message = str(error)
+        self.completed_at = datetime.utcnow()
+
+    def __repr__(self):
+        return f'<OrchestrationToolCheckpoint {self.run_id} doc={self.document_id} {self.tool_name} {self.status}>'
+
+    def to_dict(self):
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'id': self.id,
+            'run_id': str(self.run_id),
+            'document_id': self.document_id,
+            'tool_name': self.tool_name,
+            'idempotency_key': self.idempotency_key,
+            'status': self.status,
+            'attempts': self.attempts,
+            'result': self.result,
+            'error_message': self.error_message,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
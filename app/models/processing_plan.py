@@ -0,0 +1,141 @@
+"""
+Processing Plan Models
+
+A processing plan is an experiment's documents x stages expanded into one
+node per (document, stage). Nodes record the nodes they wait on, so the
+scheduler can fan independent nodes out to Celery workers while keeping
+dependent stages (segment embeddings after segmentation) in order.
+"""
+
+from app import db
+from datetime import datetime
+import uuid
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+# Node states that will not change again
+TERMINAL_NODE_STATUSES = ('completed', 'failed', 'skipped', 'blocked')
+# Node states that count against a stage's concurrency limit
+ACTIVE_NODE_STATUSES = ('queued', 'running')
+
+
+class ProcessingPlan(db.Model):
+    """
+    One scheduled batch of processing stages over an experiment's documents.
+
+    Status lifecycle: running -> completed | failed. A plan is failed when any
+    of its nodes failed (or was blocked by a failed dependency).
+    """
+
+    __tablename__ = 'processing_plans'
+
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    experiment_id = db.Column(db.Integer, db.ForeignKey('experiments.id', ondelete='CASCADE'),
+                              nullable=False, index=True)
+    requested_by = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+
+    status = db.Column(db.String(20), nullable=False, default='running', index=True)
+    stages = db.Column(JSONB, nullable=False, default=list)  # [{'processing_type', 'processing_method'}]
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    nodes = db.relationship('ProcessingPlanNode', backref='plan', lazy='dynamic',
+                            cascade='all, delete-orphan', passive_deletes=True)
+
+    def __repr__(self):
+        return f'<ProcessingPlan {self.id} exp:{self.experiment_id} {self.status}>'
+
+    def node_counts(self):
+        """Number of nodes per status."""
+        rows = db.session.query(ProcessingPlanNode.status, db.func.count(ProcessingPlanNode.id)).filter(
+            ProcessingPlanNode.plan_id == self.id
+        ).group_by(ProcessingPlanNode.status).all()
+        return {status: count for status, count in rows}
+
+    def to_dict(self, include_nodes=False):
+        """Convert to dictionary for JSON serialization."""
+        counts = self.node_counts()
+        total = sum(counts.values())
+        finished = sum(counts.get(status, 0) for status in TERMINAL_NODE_STATUSES)
+        data = {
+            'id': str(self.id),
+            'experiment_id': self.experiment_id,
+            'requested_by': self.requested_by,
+            'status': self.status,
+            'stages': self.stages or [],
+            'node_counts': counts,
+            'total_nodes': total,
+            'progress': round(100 * finished / total) if total else 100,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
+        if include_nodes:
+            data['nodes'] = [
+                node.to_dict() for node in self.nodes.order_by(ProcessingPlanNode.position)
+            ]
+        return data
+
+
+class ProcessingPlanNode(db.Model):
+    """
+    One processing stage for one experiment document within a plan.
+
+    Status lifecycle: waiting -> queued -> running -> completed | failed.
+    Nodes whose operation already completed start as ``skipped``; nodes whose
+    dependency failed end as ``blocked`` without running.
+    """
+
+    __tablename__ = 'processing_plan_nodes'
+
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    plan_id = db.Column(UUID(as_uuid=True), db.ForeignKey('processing_plans.id', ondelete='CASCADE'),
+                        nullable=False, index=True)
+    experiment_document_id = db.Column(db.Integer, db.ForeignKey('experiment_documents_v2.id', ondelete='CASCADE'),
+                                       nullable=False)
+    document_id = db.Column(db.Integer, nullable=False)
+    position = db.Column(db.Integer, nullable=False, default=0)  # Dispatch order within the plan
+
+    processing_type = db.Column(db.String(50), nullable=False)
+    processing_method = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='waiting')
+    depends_on = db.Column(JSONB, nullable=False, default=list)  # Node ids (str) that must finish first
+
+    processing_id = db.Column(UUID(as_uuid=True),
+                              db.ForeignKey('experiment_document_processing.id', ondelete='SET NULL'),
+                              nullable=True)
+    celery_task_id = db.Column(db.String(255), nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    error_message = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        # Ready-node scan and per-stage active counts
+        db.Index('idx_processing_plan_nodes_status_type', 'status', 'processing_type'),
+    )
+
+    def __repr__(self):
+        return f'<ProcessingPlanNode {self.processing_type}:{self.processing_method} doc:{self.document_id} {self.status}>'
+
+    def to_dict(self):
+        """Convert to dictionary for JSON serialization."""
+        return {
+            'id': str(self.id),
+            'plan_id': str(self.plan_id),
+            'experiment_document_id': self.experiment_document_id,
+            'document_id': self.document_id,
+            'processing_type': self.processing_type,
+            'processing_method': self.processing_method,
+            'status': self.status,
+            'depends_on': self.depends_on or [],
+            'processing_id': str(self.processing_id) if self.processing_id else None,
+            'attempts': self.attempts,
+            'error_message': self.error_message,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+        }
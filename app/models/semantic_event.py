@@ -0,0 +1,113 @@
+"""
+Semantic Event Models
+
+Semantic events (broadening, narrowing, pejoration, ...) annotate the
+timeline of a temporal evolution experiment. They used to live in the
+experiment's ``configuration`` JSON, so every edit rewrote the whole blob
+and concurrent edits overwrote each other. Each event is now a row,
+indexed by experiment, period and type, with its evidence documents in
+``semantic_event_documents``.
+
+Rows carry a version counter (SQLAlchemy ``version_id_col``): an update
+based on a stale read fails instead of silently overwriting a concurrent
+edit.
+"""
+
+from datetime import datetime
+
+from app import db
+
+
+class SemanticEvent(db.Model):
+    """One semantic change event on an experiment's timeline."""
+
+    __tablename__ = 'semantic_events'
+
+    id = db.Column(db.Integer, primary_key=True)
+    experiment_id = db.Column(db.Integer, db.ForeignKey('experiments.id', ondelete='CASCADE'), nullable=False)
+    event_id = db.Column(db.String(64), nullable=False)  # Public ID (UUID, or the legacy JSON id)
+
+    event_type = db.Column(db.String(100), nullable=False)
+    from_period = db.Column(db.Integer, nullable=True)  # Year; NULL only for imported events without one
+    to_period = db.Column(db.Integer, nullable=True)  # Year; open-ended when NULL
+    description = db.Column(db.Text, nullable=False)
+
+    # Ontology metadata captured when the event was saved
+    type_label = db.Column(db.String(255), nullable=True)
+    type_uri = db.Column(db.String(500), nullable=True)
+    definition = db.Column(db.Text, nullable=True)
+    citation = db.Column(db.Text, nullable=True)
+    example = db.Column(db.Text, nullable=True)
+
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    modified_by = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    modified_at = db.Column(db.DateTime, nullable=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
+
+    related_documents = db.relationship(
+        'SemanticEventDocument',
+        order_by='SemanticEventDocument.position',
+        cascade='all, delete-orphan',
+        passive_deletes=True,
+        lazy='selectin',
+    )
+
+    __mapper_args__ = {'version_id_col': version}
+
+    __table_args__ = (
+        db.UniqueConstraint('experiment_id', 'event_id', name='uq_semantic_events_experiment_event'),
+        db.Index('ix_semantic_events_experiment_period', 'experiment_id', 'from_period', 'to_period'),
+        db.Index('ix_semantic_events_experiment_type', 'experiment_id', 'event_type'),
+    )
+
+    def __repr__(self):
+        return f'<SemanticEvent {self.event_id} {self.event_type} {self.from_period}-{self.to_period}>'
+
+    def to_dict(self):
+        """Event in the shape the timeline views (and the old JSON) use."""
+        return {
+            'id': self.event_id,
+            'event_type': self.event_type,
+            'from_period': self.from_period,
+            'to_period': self.to_period,
+            'description': self.description,
+            'related_documents': [link.to_dict() for link in self.related_documents],
+            'type_label': self.type_label,
+            'type_uri': self.type_uri,
+            'definition': self.definition,
+            'citation': self.citation,
+            'example': self.example,
+            'created_by': self.created_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'modified_by': self.modified_by,
+            'modified_at': self.modified_at.isoformat() if self.modified_at else None,
+            'version': self.version,
+        }
+
+
+class SemanticEventDocument(db.Model):
+    """Evidence document linked to a semantic event, in display order."""
+
+    __tablename__ = 'semantic_event_documents'
+
+    semantic_event_id = db.Column(
+        db.Integer, db.ForeignKey('semantic_events.id', ondelete='CASCADE'), primary_key=True
+    )
+    document_id = db.Column(
+        db.Integer, db.ForeignKey('documents.id', ondelete='CASCADE'), primary_key=True
+    )
+    position = db.Column(db.Integer, nullable=False, default=0)
+
+    document = db.relationship('Document', lazy='joined', viewonly=True)
+
+    __table_args__ = (
+        db.Index('ix_semantic_event_documents_document', 'document_id'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.document_id,
+            'uuid': str(self.document.uuid) if self.document else None,
+            'title': (self.document.title if self.document else None) or 'Untitled Document',
+        }
@@ -2,6 +2,7 @@ from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import UUID, JSON
 from datetime import datetime
 from app import db
+from app.models.fuzzy_search import fuzzy_match
 import uuid
 
 # Association table for many-to-many relationship between term versions and context anchors
@@ -120,12 +121,10 @@ class Term(db.Model):
         return result
     
     @staticmethod
-    def search_terms(query, status=None, research_domain=None, created_by=None):
-        """Search terms with various filters"""
+    def search_terms(query, status=None, research_domain=None, created_by=None, mode='fuzzy'):
+        """Search terms with various filters, best match first ('fuzzy' or 'prefix' mode)"""
         filters = []
         
-        if query:
-            filters.append(Term.term_text.ilike(f'%{query}%'))
         if status:
             filters.append(Term.status == status)
         if research_domain:
@@ -133,9 +132,7 @@ class Term(db.Model):
         if created_by:
             filters.append(Term.created_by == created_by)
         
-        if filters:
-            return Term.query.filter(*filters).order_by(Term.term_text)
-        return Term.query.order_by(Term.term_text)
+        return fuzzy_match(Term.query.filter(*filters), Term.term_text, query, mode).order_by(Term.term_text)
     
     def __repr__(self):
         return f'<Term {self.term_text}>'
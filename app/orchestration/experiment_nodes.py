@@ -20,6 +20,7 @@ from langchain_core.messages import HumanMessage
 from langchain_core.output_parsers import JsonOutputParser
 
 from .experiment_state import ExperimentOrchestrationState
+from .llm_cache import cached_chat_model
 from ..services.extraction_tools import get_tool_registry
 from .retry_utils import call_llm_with_retry, LLMTimeoutError, LLMRetryExhaustedError
 from .config import config
@@ -27,8 +28,11 @@ from .prompts import get_analyze_prompt, get_recommend_strategy_prompt, get_synt
 
 # Database imports for progress tracking
 from app import db
-from app.models.experiment_orchestration_run import ExperimentOrchestrationRun
 from app.models.experiment_document import ExperimentDocument
+from app.services.orchestration_checkpoint_service import OrchestrationCheckpointService
+from app.services.orchestration_progress_service import get_progress_reporter
+from app.services.orchestration_status_service import OrchestrationStatusService
+from shared_services.metrics import timed_stage
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +58,7 @@ def get_claude_client():
     return _claude_client
 
 
+@timed_stage('analyze')
 async def analyze_experiment_node(state: ExperimentOrchestrationState) -> Dict[str, Any]:
     """
     Stage 1: Analyze the experiment to understand its goals.
@@ -99,7 +104,7 @@ async def analyze_experiment_node(state: ExperimentOrchestrationState) -> Dict[s
 
     # Use JSON output parser for structured response
     json_parser = JsonOutputParser()
-    chain = claude_client | json_parser
+    chain = cached_chat_model(claude_client) | json_parser
 
     # Execute LLM call with timeout and retry
     try:
@@ -130,6 +135,7 @@ async def analyze_experiment_node(state: ExperimentOrchestrationState) -> Dict[s
         }
 
 
+@timed_stage('recommend_strategy')
 async def recommend_strategy_node(state: ExperimentOrchestrationState) -> Dict[str, Any]:
     """
     Stage 2: Recommend processing tools for each document.
@@ -188,7 +194,7 @@ async def recommend_strategy_node(state: ExperimentOrchestrationState) -> Dict[s
         tool_descriptions=tool_descriptions
     )
 
-    chain = claude_client | JsonOutputParser()
+    chain = cached_chat_model(claude_client) | JsonOutputParser()
 
     # Execute LLM call with timeout and retry
     try:
@@ -222,6 +228,7 @@ async def recommend_strategy_node(state: ExperimentOrchestrationState) -> Dict[s
         }
 
 
+@timed_stage('human_review')
 async def human_review_node(state: ExperimentOrchestrationState) -> Dict[str, Any]:
     """
     Stage 3: Wait for human approval/modification of strategy.
@@ -243,23 +250,56 @@ async def human_review_node(state: ExperimentOrchestrationState) -> Dict[str, An
     }
 
 
-def update_current_operation(run_id: str, operation_text: str):
+def update_current_operation(run_id: str, operation_text: str, **fields):
     """
-    Update current_operation field in database for progress tracking.
+    Publish current_operation progress for the run.
 
-    Minimal overhead - just one UPDATE query.
+    The event is pushed to subscribers (SSE) immediately; the database
+    column is written at most once per flush interval.
     """
-    try:
-        run = ExperimentOrchestrationRun.query.filter_by(id=run_id).first()
-        if run:
-            run.current_operation = operation_text
-            db.session.commit()
-    except Exception as e:
-        logger.error(f"Error updating current_operation: {e}")
-        # Don't fail execution if progress update fails
-        db.session.rollback()
+    get_progress_reporter().report(run_id, operation_text, **fields)
+
+
+# Seconds a single (document, tool) execution may run
+TOOL_TIMEOUT_SECONDS = 60.0
+
 
+def tool_parameters(tool_name: str, document_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Tool-specific parameters for one document.
+
+    These are passed to the tool and are part of the checkpoint's idempotency
+    key, so a changed parameter (e.g. a corrected publication year) re-runs
+    the tool instead of reusing the old result.
+    """
+    if tool_name == 'period_aware_embedding' and document_metadata.get('year'):
+        return {'period': str(document_metadata['year'])}
+    return {}
 
+
+async def execute_with_timeout(execution, timeout: float):
+    """
+    Await a tool execution, cancelling it on timeout.
+
+    The task is awaited after cancellation so it cannot complete its
+    checkpoint once the caller has recorded the timeout. An execution that
+    finished before the cancellation landed returns its result.
+
+    Raises:
+        asyncio.TimeoutError: If the execution was cancelled
+    """
+    task = asyncio.ensure_future(execution)
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+    if not done:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            raise asyncio.TimeoutError() from None
+    return task.result()
+
+
+@timed_stage('execute_strategy')
 async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str, Any]:
     """
     Stage 4: Execute the approved processing strategy.
@@ -269,6 +309,8 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
     Tracks execution provenance for PROV-O compliance.
 
     Results are stored in ProcessingArtifact table for unified storage.
+    Each (document, tool) execution is checkpointed; when a run is retried or
+    resumed, executions with a completed checkpoint are skipped.
 
     Returns:
         - processing_results: {doc_id: {tool: result, ...}} (summaries only, data in DB)
@@ -277,6 +319,7 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
     """
     strategy = state.get('modified_strategy') or state['recommended_strategy']
     documents = state['documents']
+    document_metadata = state.get('document_metadata') or {}
     run_id = state['run_id']
     experiment_id = state['experiment_id']
 
@@ -309,9 +352,18 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
         else:
             logger.warning(f"No ExperimentDocument found for experiment {experiment_id}, document {doc_id}")
 
+    # Checkpoints from earlier attempts of this run (worker crash, Celery retry)
+    checkpoints = OrchestrationCheckpointService
+    doc_versions = checkpoints.document_versions(doc['id'] for doc in documents)
+    existing_checkpoints = checkpoints.load(run_id)
+    resumed = sum(1 for c in existing_checkpoints.values() if c.status == 'completed')
+
     # Initial progress update
     if run_id:
-        update_current_operation(run_id, f"Processing {len(documents)} documents with {total_tools} operations...")
+        message = f"Processing {len(documents)} documents with {total_tools} operations..."
+        if resumed:
+            message = f"Resuming: {resumed}/{total_tools} operations already completed. " + message
+        update_current_operation(run_id, message)
 
     async def process_document(doc: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
         """Process a single document with its recommended tools."""
@@ -326,30 +378,60 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
         for tool_name in tool_names:
             tool = tool_registry.get(tool_name)
             if tool:
+                tool_params = tool_parameters(tool_name, document_metadata.get(str(doc_id)) or {})
+                checkpoint_key = checkpoints.idempotency_key(
+                    doc_id, doc_versions.get(doc_id), doc_content, tool_name, tool_params
+                )
+                checkpoint = existing_checkpoints.get(checkpoint_key)
+
+                # Resumed/retried run: reuse the stored result instead of re-executing
+                if checkpoint is not None and checkpoint.status == 'completed':
+                    logger.info(f"[Run {run_id}] Skipping {tool_name} on doc {doc_id} (checkpoint)")
+                    results[tool_name] = checkpoint.result
+                    completed_tools += 1
+                    execution_trace.append({
+                        "run_id": run_id,
+                        "document_id": doc_id,
+                        "tool": tool_name,
+                        "timestamp": datetime.utcnow().isoformat(),
+                        "status": "skipped",
+                        "reason": "checkpoint"
+                    })
+                    continue
+
                 try:
+                    checkpoint = checkpoints.begin(run_id, doc_id, tool_name, checkpoint_key, existing=checkpoint)
+
                     # Update progress in database with document title
                     doc_title = doc_titles.get(doc_id, f"Doc {doc_id}")
                     update_current_operation(
                         run_id,
-                        f"{tool_name} on '{doc_title}' ({completed_tools + 1}/{total_tools})"
+                        f"{tool_name} on '{doc_title}' ({completed_tools + 1}/{total_tools})",
+                        completed=completed_tools,
+                        total=total_tools,
+                        progress_percentage=OrchestrationStatusService.execution_percentage(
+                            completed_tools, total_tools
+                        )
                     )
 
                     # Use the experimental version (v2) directly for artifact storage
                     # No need to create v3 processed versions - keeps document management simpler
                     logger.info(f"[Run {run_id}] Processing doc {doc_id} with tool {tool_name}")
 
-                    # Execute tool with 60 second timeout
+                    # Execute tool with a timeout (TOOL_TIMEOUT_SECONDS), cancelling it when exceeded
                     # Pass document_id and experiment_document_id for unified storage
                     # Results are stored in ProcessingArtifact table on the experimental version (v2)
                     exp_doc_id = exp_doc_mapping.get(doc_id)
-                    result = await asyncio.wait_for(
+                    result = await execute_with_timeout(
                         tool.execute(
                             doc_content,
                             document_id=int(doc_id),
                             orchestration_run_id=str(run_id),
-                            experiment_document_id=exp_doc_id
+                            experiment_document_id=exp_doc_id,
+                            checkpoint=checkpoint,
+                            **tool_params
                         ),
-                        timeout=60.0
+                        TOOL_TIMEOUT_SECONDS
                     )
 
                     # Normalize status to "executed" for UI compatibility
@@ -359,6 +441,11 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
 
                     results[tool_name] = result
 
+                    if result.get('status') == 'error':
+                        checkpoints.fail(checkpoint, result.get('error', 'Tool reported an error'))
+                    else:
+                        checkpoints.complete(checkpoint, result)
+
                     logger.info(f"[Run {run_id}] Successfully executed {tool_name} on doc {doc_id}")
 
                     # Increment completed counter
@@ -376,13 +463,16 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
                 except asyncio.TimeoutError:
                     # Tool execution timed out
                     logger.warning(f"[Run {run_id}] Timeout executing {tool_name} on doc {doc_id}")
+                    # Discard whatever the cancelled tool flushed but did not commit
+                    db.session.rollback()
+                    checkpoints.fail(checkpoint, "Execution timeout")
                     execution_trace.append({
                         "run_id": run_id,
                         "document_id": doc_id,
                         "tool": tool_name,
                         "timestamp": datetime.utcnow().isoformat(),
                         "status": "timeout",
-                        "error": "Tool execution exceeded 60 second timeout"
+                        "error": f"Tool execution exceeded {TOOL_TIMEOUT_SECONDS:g} second timeout"
                     })
                     results[tool_name] = {
                         "status": "error",
@@ -393,6 +483,8 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
                 except Exception as e:
                     # Log failure
                     logger.error(f"[Run {run_id}] Error executing {tool_name} on doc {doc_id}: {e}", exc_info=True)
+                    if checkpoint is not None:
+                        checkpoints.fail(checkpoint, e)
                     execution_trace.append({
                         "run_id": run_id,
                         "document_id": doc_id,
@@ -412,6 +504,9 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
     for doc_id, results in results_list:
         processing_results[doc_id] = results
 
+    if run_id:
+        get_progress_reporter().flush(run_id)
+
     return {
         "processing_results": processing_results,
         "execution_trace": execution_trace,
@@ -419,6 +514,7 @@ async def execute_strategy_node(state: ExperimentOrchestrationState) -> Dict[str
     }
 
 
+@timed_stage('synthesize')
 async def synthesize_experiment_node(state: ExperimentOrchestrationState) -> Dict[str, Any]:
     """
     Stage 5: Synthesize insights across all documents.
@@ -463,7 +559,7 @@ async def synthesize_experiment_node(state: ExperimentOrchestrationState) -> Dic
     )
 
     # Use JSON parser to get structured response
-    chain = claude_client | JsonOutputParser()
+    chain = cached_chat_model(claude_client) | JsonOutputParser()
 
     # Execute LLM call with timeout and retry
     try:
@@ -0,0 +1,60 @@
+"""
+Route LangChain chat model calls through the shared LLM gateway.
+
+Wrapping the Claude client lets orchestration runs reuse recorded responses
+(``LLM_CACHE_MODE=auto``) or run fully offline from fixtures (``replay``)
+without changing how the nodes build prompts or parse output.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from shared_services.llm.gateway import get_llm_gateway
+
+_ROLES = {'human': 'user', 'ai': 'assistant'}
+
+
+def _request(client, messages: List[BaseMessage]) -> Tuple[Dict[str, Any], Optional[str], List[Dict[str, Any]]]:
+    system = '\n\n'.join(str(m.content) for m in messages if m.type == 'system') or None
+    chat = [
+        {'role': _ROLES.get(m.type, m.type), 'content': m.content}
+        for m in messages if m.type != 'system'
+    ]
+    params = {
+        'max_tokens': getattr(client, 'max_tokens', None),
+        'temperature': getattr(client, 'temperature', None),
+    }
+    return params, system, chat
+
+
+async def ainvoke_cached(client, messages: List[BaseMessage]) -> AIMessage:
+    """``client.ainvoke(messages)`` through the gateway."""
+    params, system, chat = _request(client, messages)
+
+    async def call():
+        return (await client.ainvoke(messages)).content
+
+    text = await get_llm_gateway().acomplete(
+        provider='anthropic', model=client.model, messages=chat, system=system, call=call, **params
+    )
+    return AIMessage(content=text)
+
+
+def invoke_cached(client, messages: List[BaseMessage]) -> AIMessage:
+    """``client.invoke(messages)`` through the gateway."""
+    params, system, chat = _request(client, messages)
+    text = get_llm_gateway().complete(
+        provider='anthropic', model=client.model, messages=chat, system=system,
+        call=lambda: client.invoke(messages).content, **params
+    )
+    return AIMessage(content=text)
+
+
+def cached_chat_model(client) -> Runnable:
+    """A runnable drop-in for ``client`` (e.g. ``cached_chat_model(client) | parser``)."""
+    return RunnableLambda(
+        lambda messages: invoke_cached(client, messages),
+        afunc=lambda messages: ainvoke_cached(client, messages),
+    )
@@ -13,6 +13,7 @@ from typing import List, Dict, Any
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from app.orchestration.llm_cache import ainvoke_cached
 from app.orchestration.state import OrchestratorState
 
 logger = logging.getLogger(__name__)
@@ -109,7 +110,7 @@ What tools should we use and why?"""
             HumanMessage(content=user_prompt)
         ]
 
-        response = await claude_client.ainvoke(messages)
+        response = await ainvoke_cached(claude_client, messages)
         response_text = response.content
 
         # Parse Claude's response
@@ -231,27 +232,24 @@ async def extract_entities_spacy_node(state: OrchestratorState) -> Dict[str, Any
     logger.info(f"Executing spaCy entity extraction for document {state['document_id']}")
 
     try:
-        import spacy
+        from app.services.windowed_nlp import get_windowed_nlp_runner
 
-        # Load spaCy model (cache this in production)
+        runner = get_windowed_nlp_runner()
         try:
-            nlp = spacy.load("en_core_web_sm")
+            runner.store.get_nlp()
         except OSError:
             logger.warning("spaCy model not found, downloading...")
             os.system("python -m spacy download en_core_web_sm")
-            nlp = spacy.load("en_core_web_sm")
 
-        # Process document
-        doc = nlp(state['document_text'][:100000])  # Limit to avoid memory issues
-
-        # Extract entities
+        # Process the whole document in sentence-aligned windows
         entities = [
             {
                 "text": ent.text,
                 "label": ent.label_,
-                "start": ent.start_char,
-                "end": ent.end_char
+                "start": offset + ent.start_char,
+                "end": offset + ent.end_char
             }
+            for offset, doc in runner.docs(state['document_text'])
             for ent in doc.ents
         ]
 
@@ -383,7 +381,7 @@ Provide your synthesis, insights, and recommendations."""
             HumanMessage(content=results_summary)
         ]
 
-        response = await claude_client.ainvoke(messages)
+        response = await ainvoke_cached(claude_client, messages)
         synthesis_text = response.content
 
         # Parse synthesis (simple parsing for now)
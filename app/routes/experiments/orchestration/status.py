@@ -1,10 +1,15 @@
-"""Authorized orchestration status JSON routes."""
+"""Authorized orchestration status JSON and event-stream routes."""
 
-from flask import jsonify
+from flask import Response, jsonify, stream_with_context
 from flask_login import current_user, login_required
 
 from app.services.base_service import NotFoundError, PermissionError
+from app.services.orchestration_progress_service import (
+    OrchestrationProgressStream,
+    get_progress_channel,
+)
 from app.services.orchestration_read_service import OrchestrationReadService
+from app.services.orchestration_status_service import OrchestrationStatusService
 
 from .. import experiments_bp
 
@@ -53,3 +58,25 @@ def get_orchestration_status(run_id):
         ))
     except (NotFoundError, PermissionError) as exc:
         return _error(exc)
+
+
+@experiments_bp.route('/orchestration/stream/<uuid:run_id>')
+@login_required
+def stream_orchestration_status(run_id):
+    """Push run progress as SSE events instead of status polling."""
+    try:
+        OrchestrationReadService.authorized_run(run_id, current_user.id)
+    except (NotFoundError, PermissionError) as exc:
+        return _error(exc)
+    stream = OrchestrationProgressStream(
+        get_progress_channel(),
+        OrchestrationStatusService.get_run_status,
+    )
+    return Response(
+        stream_with_context(stream.stream(run_id)),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        },
+    )
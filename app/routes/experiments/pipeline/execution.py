@@ -2,17 +2,18 @@
 
 import logging
 
-from flask import jsonify, request
-from flask_login import current_user
+from flask import current_app, jsonify, request, url_for
+from flask_login import current_user, login_required
 from pydantic import ValidationError as PydanticValidationError
 
-from app.dto.pipeline_dto import StartProcessingDTO
+from app.dto.pipeline_dto import StartProcessingDTO, StartProcessingPlanDTO
 from app.services.base_service import (
     NotFoundError,
     PermissionError,
     ServiceError,
     ValidationError,
 )
+from app.services.processing_plan_service import get_processing_plan_service
 from app.utils.auth_decorators import api_require_login_for_write
 
 from .. import experiments_bp
@@ -128,3 +129,67 @@ def start_experiment_processing():
             'success': False,
             'error': 'Failed to start processing',
         }), 500
+
+
+@experiments_bp.route('/<int:experiment_id>/api/processing-plans', methods=['POST'])
+@api_require_login_for_write
+def start_processing_plan(experiment_id):
+    """Schedule processing stages over an experiment's documents.
+
+    Returns 202 with the plan when its nodes run in Celery workers (poll
+    ``status_url``), or 200 with the finished plan when run inline.
+    """
+    try:
+        data = StartProcessingPlanDTO(**(request.get_json(silent=True) or {}))
+        background = current_app.config.get('PROCESSING_PLAN_BACKGROUND', True)
+        plan = get_processing_plan_service().start_plan(
+            experiment_id,
+            [stage.model_dump() for stage in data.stages],
+            current_user.id,
+            document_ids=data.document_ids,
+            background=background,
+            limits=current_app.config.get('PROCESSING_STAGE_CONCURRENCY'),
+            default_limit=current_app.config.get('PROCESSING_STAGE_CONCURRENCY_DEFAULT', 4),
+        )
+        return jsonify({
+            'success': True,
+            'plan': plan,
+            'status_url': url_for(
+                'experiments.processing_plan_status', plan_id=plan['id']
+            ),
+        }), 202 if background else 200
+    except PydanticValidationError as exc:
+        logger.warning(f"Validation error starting processing plan: {exc}")
+        return jsonify({
+            'success': False,
+            'error': 'Validation failed',
+            'details': exc.errors(include_context=False),
+        }), 400
+    except ValidationError as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 400
+    except NotFoundError as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 404
+    except PermissionError:
+        return jsonify({'success': False, 'error': 'Permission denied'}), 403
+    except Exception as exc:
+        logger.error(
+            f"Unexpected error starting processing plan: {exc}",
+            exc_info=True,
+        )
+        return jsonify({
+            'success': False,
+            'error': 'Failed to start processing plan',
+        }), 500
+
+
+@experiments_bp.route('/api/processing-plans/<uuid:plan_id>', methods=['GET'])
+@login_required
+def processing_plan_status(plan_id):
+    """Progress of a processing plan and its nodes."""
+    try:
+        plan = get_processing_plan_service().get_plan(plan_id, current_user.id)
+        return jsonify({'success': True, 'plan': plan})
+    except NotFoundError as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 404
+    except PermissionError:
+        return jsonify({'success': False, 'error': 'Permission denied'}), 403
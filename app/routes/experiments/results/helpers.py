@@ -2,7 +2,6 @@
 
 from flask import render_template
 from app.models import Experiment, Document
-from app.models.experiment_document import ExperimentDocument
 from app.models.experiment_processing import (
     ProcessingArtifact,
     ExperimentDocumentProcessing
@@ -12,6 +11,7 @@ from app.models.processing_artifact_group import ProcessingArtifactGroup
 from app.models.processing_job import ProcessingJob
 from app.models.text_segment import TextSegment
 from app.models.extracted_entity import ExtractedEntity
+from app.services.experiment_corpus_service import ExperimentCorpusService
 from app import db
 import logging
 from .. import experiments_bp
@@ -21,32 +21,15 @@ def _get_experiment_documents(experiment_id):
     """
     Get all documents for an experiment with their IDs.
 
-    Groups documents by root and returns the latest version for each.
-    This matches the logic in crud.view() and pipeline_service.get_pipeline_overview().
+    Returns the latest associated version of each document family from the
+    experiment corpus membership table (as the pipeline overview does).
 
     Version chain: v1 (original) -> v2 (experimental, used in experiments)
     """
-    exp_docs = ExperimentDocument.query.filter_by(experiment_id=experiment_id).all()
-
-    # Group documents by root to show only latest version
-    doc_families = {}
-    for exp_doc in exp_docs:
-        doc = exp_doc.document
-        # Get root document ID (either the document itself or its source)
-        root_id = doc.source_document_id if doc.source_document_id else doc.id
-        if root_id not in doc_families:
-            doc_families[root_id] = []
-        doc_families[root_id].append((exp_doc, doc))
-
-    # For each family, select only the latest version
-    documents = []
-    document_ids = []
-    for root_id, family_members in doc_families.items():
-        # Sort by version_number (desc) and pick the first one
-        family_members.sort(key=lambda x: x[1].version_number or 0, reverse=True)
-        exp_doc, doc = family_members[0]
-        documents.append(doc)
-        document_ids.append(doc.id)
+    documents = [
+        doc for _, doc in ExperimentCorpusService.latest_associations(experiment_id)
+    ]
+    document_ids = [doc.id for doc in documents]
 
     return documents, document_ids
 
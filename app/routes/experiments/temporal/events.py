@@ -1,9 +1,11 @@
-"""Semantic event creation, update, and removal routes."""
+"""Semantic event listing, creation, update, and removal routes."""
 
 from flask import jsonify, request
 from flask_login import current_user
 
-from app.services.base_service import NotFoundError, PermissionError, ValidationError
+from app import db
+from app.models.experiment import Experiment
+from app.services.base_service import ConflictError, NotFoundError, PermissionError, ValidationError
 from app.services.semantic_event_service import SemanticEventService
 from app.utils.auth_decorators import api_require_login_for_write
 
@@ -15,6 +17,24 @@ def _error(exc, status):
     return jsonify({'success': False, 'error': str(exc)}), status
 
 
+@experiments_bp.route('/<int:experiment_id>/semantic_events', methods=['GET'])
+@api_require_login_for_write
+def list_semantic_events(experiment_id):
+    """Events overlapping ``?from=<year>&to=<year>``, optionally of one ``event_type``."""
+    experiment = db.session.get(Experiment, experiment_id)
+    if experiment is None:
+        return _error('Experiment not found', 404)
+    return jsonify({
+        'success': True,
+        'semantic_events': SemanticEventService.events_for(
+            experiment,
+            start=request.args.get('from', type=int),
+            end=request.args.get('to', type=int),
+            event_type=request.args.get('event_type') or None,
+        ),
+    })
+
+
 @experiments_bp.route('/<int:experiment_id>/save_semantic_event', methods=['POST'])
 @api_require_login_for_write
 def save_semantic_event(experiment_id):
@@ -28,6 +48,8 @@ def save_semantic_event(experiment_id):
         return _error(exc, 404)
     except PermissionError as exc:
         return _error(exc, 403)
+    except ConflictError as exc:
+        return _error(exc, 409)
     except ValidationError as exc:
         return _error(exc, 400)
     except Exception as exc:
@@ -52,6 +74,8 @@ def remove_semantic_event(experiment_id):
         return _error(exc, 404)
     except PermissionError as exc:
         return _error(exc, 403)
+    except ConflictError as exc:
+        return _error(exc, 409)
     except ValidationError as exc:
         return _error(exc, 400)
     except Exception as exc:
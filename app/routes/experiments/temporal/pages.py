@@ -4,6 +4,7 @@ from flask import render_template, request, jsonify, flash, redirect, url_for
 from flask_login import current_user
 from app.utils.auth_decorators import api_require_login_for_write
 from app.services.base_service import ServiceError, ValidationError, NotFoundError
+from app.services.semantic_event_service import SemanticEventService
 from app.dto.temporal_dto import (
     UpdateTemporalTermsDTO,
     FetchTemporalDataDTO
@@ -85,11 +86,18 @@ def timeline_view(experiment_id):
         # Get temporal UI data from service
         data = temporal_service.get_temporal_ui_data(experiment_id)
 
+        semantic_events = data['semantic_events']
+        start = request.args.get('from', type=int)
+        end = request.args.get('to', type=int)
+        if start is not None or end is not None:
+            # Only the events overlapping the requested years
+            semantic_events = SemanticEventService.events_for(data['experiment'], start=start, end=end)
+
         return render_template(
             'experiments/temporal_timeline_view.html',
             experiment=data['experiment'],
             periods=data.get('periods', []),
-            semantic_events=data['semantic_events']
+            semantic_events=semantic_events
         )
 
     except ValidationError as e:
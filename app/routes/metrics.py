@@ -0,0 +1,21 @@
+"""Prometheus scrape endpoint."""
+
+import hmac
+
+from flask import Blueprint, Response, abort, current_app, request
+
+from shared_services.metrics import registered_collectors, render_latest
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/metrics')
+def metrics():
+    """Prometheus text exposition of the process (or multiprocess) metrics."""
+    if not current_app.config.get('METRICS_ENABLED', True):
+        abort(404)
+    token = current_app.config.get('METRICS_TOKEN')
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        abort(401)
+    body, content_type = render_latest(registered_collectors())
+    return Response(body, headers={'Content-Type': content_type})
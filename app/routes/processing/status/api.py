@@ -1,8 +1,15 @@
 """Processing job status and diagnostic APIs."""
 
-from flask import jsonify
+from flask import Response, jsonify, stream_with_context
 
 from app.services.base_service import NotFoundError, ValidationError
+from app.services.orchestration_progress_service import (
+    JOB_TERMINAL_STATUSES,
+    OrchestrationProgressStream,
+    get_progress_channel,
+    processing_document_channel_key,
+    processing_job_channel_key,
+)
 from app.utils.auth_decorators import api_require_login_for_write
 
 from .. import processing_bp
@@ -34,6 +41,21 @@ def get_job_status(job_id):
         return jsonify({'success': False, 'error': str(exc)}), 500
 
 
+@processing_bp.route('/job/<int:job_id>/stream', methods=['GET'])
+def stream_job_status(job_id):
+    """Push job status and progress as SSE events instead of status polling."""
+    try:
+        processing_status_service.get_job_status(job_id)
+    except NotFoundError as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 404
+    stream = OrchestrationProgressStream(
+        get_progress_channel(),
+        processing_status_service.get_job_status,
+        terminal_statuses=JOB_TERMINAL_STATUSES,
+    )
+    return _event_stream(stream.stream(job_id, channel_key=processing_job_channel_key(job_id)))
+
+
 @processing_bp.route(
     '/document/<string:document_uuid>/processing-jobs',
     methods=['GET'],
@@ -48,3 +70,34 @@ def get_document_processing_jobs(document_uuid):
         return jsonify({'success': False, 'error': str(exc)}), 404
     except Exception as exc:
         return jsonify({'success': False, 'error': str(exc)}), 500
+
+
+@processing_bp.route(
+    '/document/<string:document_uuid>/processing-jobs/stream',
+    methods=['GET'],
+)
+def stream_document_processing_jobs(document_uuid):
+    """Push the grouped job list again whenever one of the document's jobs changes."""
+    try:
+        document = processing_status_service.get_document_by_uuid(document_uuid)
+    except NotFoundError as exc:
+        return jsonify({'success': False, 'error': str(exc)}), 404
+    stream = OrchestrationProgressStream(
+        get_progress_channel(),
+        processing_status_service.get_document_processing_jobs,
+        terminal_statuses=(),
+    )
+    return _event_stream(stream.stream(
+        document_uuid, channel_key=processing_document_channel_key(document.id),
+    ))
+
+
+def _event_stream(events):
+    return Response(
+        stream_with_context(events),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        },
+    )
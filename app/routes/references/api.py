@@ -4,14 +4,16 @@ References API Routes
 This module handles API endpoints for search and WordNet operations.
 
 Routes:
-- GET /references/api/search              - Search references
+- GET /references/api/search              - Search references by title/author (fuzzy or prefix)
 - GET /references/api/wordnet/search      - Search WordNet
 - GET /references/api/wordnet/similarity  - Calculate WordNet similarity
+- POST /references/api/wordnet/similarity/batch - Score terms against context anchors
 """
 
 from flask import request, jsonify
 from app.utils.auth_decorators import api_require_login_for_write
 from app.models.document import Document
+from app.models.fuzzy_search import FUZZY_MATCH_MODES, bounded_limit, fuzzy_match
 from app.services.wordnet_service import WordNetService
 
 from . import references_bp
@@ -22,16 +24,14 @@ from . import references_bp
 def api_search():
     """Search references for autocomplete/selection"""
     query = request.args.get('q', '')
+    mode = request.args.get('mode', 'fuzzy')
+    if mode not in FUZZY_MATCH_MODES:
+        return jsonify({"success": False, "error": f"Unknown search mode: {mode}"}), 400
 
-    if not query:
-        references = Document.query.filter_by(
-            document_type='reference'
-        ).limit(20).all()
-    else:
-        references = Document.query.filter(
-            Document.document_type == 'reference',
-            Document.title.contains(query)
-        ).limit(20).all()
+    references = fuzzy_match(
+        Document.query.filter_by(document_type='reference'),
+        [Document.title, Document.authors], query, mode
+    ).limit(bounded_limit(request.args.get('limit', 20), mode)).all()
 
     return jsonify([{
         'id': ref.id,
@@ -69,3 +69,32 @@ def api_wordnet_similarity():
     data = service.get_word_similarity(word1, word2)
     status = 200 if data.get('success', True) else 500
     return jsonify(data), status
+
+
+@references_bp.route('/api/wordnet/similarity/batch', methods=['POST'])
+@api_require_login_for_write
+def api_wordnet_similarity_batch():
+    """Score a list of terms against context anchors using WordNet."""
+    data = request.get_json(silent=True) or {}
+    terms = data.get('terms')
+    anchors = data.get('anchors')
+
+    if not isinstance(terms, list) or not isinstance(anchors, list):
+        return jsonify({"success": False, "error": "'terms' and 'anchors' must be lists"}), 400
+
+    terms = [str(t).strip() for t in terms if str(t).strip()]
+    anchors = [str(a).strip() for a in anchors if str(a).strip()]
+    if not terms or not anchors:
+        return jsonify({"success": False, "error": "At least one term and one anchor are required"}), 400
+
+    top_k = data.get('top_k')
+    try:
+        top_k = int(top_k) if top_k is not None else None
+        min_score = float(data.get('min_score', 0.0))
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "error": "'top_k' and 'min_score' must be numbers"}), 400
+
+    service = WordNetService()
+    data = service.score_terms_against_anchors(terms, anchors, top_k=top_k, min_score=min_score)
+    status = 200 if data.get('success', True) else 500
+    return jsonify(data), status
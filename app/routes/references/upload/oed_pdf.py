@@ -1,22 +1,41 @@
 """OED PDF parsing routes."""
 
-import os
-import tempfile
-
-from flask import current_app, jsonify, request
-from werkzeug.utils import secure_filename
+from flask import Response, current_app, jsonify, request, stream_with_context, url_for
+from flask_login import current_user, login_required
 
+from app.services.base_service import ValidationError
+from app.services.oed_parse_job_service import get_oed_parse_job_service
+from app.services.orchestration_progress_service import OrchestrationProgressStream, get_progress_channel
 from app.utils.auth_decorators import api_require_login_for_write
 
 from .. import references_bp
 
 
+def _job_payload(job):
+    return {
+        'job': job.to_dict(include_result=False),
+        'status_url': url_for('references.oed_parse_job_status', job_id=job.id),
+        'stream_url': url_for('references.stream_oed_parse_job', job_id=job.id),
+    }
+
+
+def _authorized_job(job_id):
+    job = get_oed_parse_job_service().get_job(job_id)
+    if job is None or (job.requested_by != current_user.id and not current_user.is_admin):
+        return None
+    return job
+
+
 @references_bp.route('/parse_oed_pdf', methods=['POST'])
 @api_require_login_for_write
 def parse_oed_pdf():
-    """Parse uploaded OED PDF and return structured data"""
-    from app.services.oed_parser_final import OEDParser
+    """
+    Start parsing an uploaded OED PDF.
 
+    In the background (``OED_PARSE_BACKGROUND``) this returns 202 with the
+    job's status and progress-stream URLs; inline it returns the parsed
+    entry as before. ``force=true`` re-parses a PDF parsed earlier.
+    """
     if 'file' not in request.files:
         return jsonify({'error': 'No file provided'}), 400
 
@@ -24,43 +43,68 @@ def parse_oed_pdf():
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
 
-    # Check if it's a PDF
-    if not (file.filename or '').lower().endswith('.pdf'):
-        return jsonify({'error': 'Only PDF files are supported'}), 400
-
-    # Save temporarily
-    temp_dir = tempfile.gettempdir()
-    temp_name = secure_filename(file.filename or 'oed.pdf')
-    temp_path = os.path.join(temp_dir, temp_name)
-
+    background = current_app.config.get('OED_PARSE_BACKGROUND', True)
     try:
-        file.save(temp_path)
-
-        # Parse with OED parser
-        parser = OEDParser()
-        extracted_data = parser.parse_pdf(temp_path)
-
-        # Format for frontend
-        response_data = {
-            'success': True,
-            'data': extracted_data,
-            'message': 'Successfully parsed OED entry'
-        }
-
-        return jsonify(response_data)
-
+        job = get_oed_parse_job_service().submit(
+            file,
+            user_id=current_user.id if current_user.is_authenticated else None,
+            background=background,
+            force=request.form.get('force', '').lower() == 'true',
+        )
+    except ValidationError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        current_app.logger.error(f"Error parsing OED PDF: {str(e)}")
+        current_app.logger.error(f"Error starting OED PDF parse: {str(e)}")
         return jsonify({
             'success': False,
             'error': str(e),
             'message': 'Failed to parse OED PDF'
         }), 500
 
-    finally:
-        # Clean up temp file
-        if os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except:
-                pass
+    if background:
+        return jsonify({'success': True, 'message': 'Parsing OED PDF', **_job_payload(job)}), 202
+
+    if job.status != 'completed':
+        return jsonify({
+            'success': False,
+            'error': job.error_message,
+            'message': 'Failed to parse OED PDF',
+            **_job_payload(job),
+        }), 500
+
+    return jsonify({
+        'success': True,
+        'data': job.result,
+        'message': 'Successfully parsed OED entry',
+        **_job_payload(job),
+    })
+
+
+@references_bp.route('/api/oed-parse-jobs/<uuid:job_id>')
+@login_required
+def oed_parse_job_status(job_id):
+    """Job status; includes the parsed entry once completed."""
+    job = _authorized_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+
+@references_bp.route('/api/oed-parse-jobs/<uuid:job_id>/stream')
+@login_required
+def stream_oed_parse_job(job_id):
+    """Push job progress (pages extracted, stage changes) as SSE events."""
+    if _authorized_job(job_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+    stream = OrchestrationProgressStream(
+        get_progress_channel(),
+        get_oed_parse_job_service().job_status,
+    )
+    return Response(
+        stream_with_context(stream.stream(job_id)),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',
+        },
+    )
@@ -13,19 +13,27 @@ from . import get_term_analysis_service, terms_bp
 @terms_bp.route('/api/context-anchors')
 @api_require_login_for_write
 def api_context_anchors():
-    return jsonify(TermApiService.search_context_anchors(
-        request.args.get('query', ''),
-        request.args.get('limit', 20),
-    ))
+    try:
+        return jsonify(TermApiService.search_context_anchors(
+            request.args.get('query', ''),
+            request.args.get('limit', 20),
+            request.args.get('mode', 'fuzzy'),
+        ))
+    except ValidationError as exc:
+        return jsonify({'error': str(exc)}), 400
 
 
 @terms_bp.route('/api/terms/search')
 @api_require_login_for_write
 def api_term_search():
-    return jsonify(TermApiService.search_terms(
-        request.args.get('query', request.args.get('q', '')),
-        request.args.get('limit', 10),
-    ))
+    try:
+        return jsonify(TermApiService.search_terms(
+            request.args.get('query', request.args.get('q', '')),
+            request.args.get('limit', 10),
+            request.args.get('mode', 'fuzzy'),
+        ))
+    except ValidationError as exc:
+        return jsonify({'error': str(exc)}), 400
 
 
 @terms_bp.route(
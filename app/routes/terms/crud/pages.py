@@ -4,6 +4,7 @@ from flask import render_template, request
 
 from app import db
 from app.models import Term
+from app.models.fuzzy_search import fuzzy_match
 
 from .. import terms_bp
 
@@ -23,17 +24,14 @@ def term_index():
     query = Term.query
 
     # Apply filters
-    if search_query:
-        query = query.filter(Term.term_text.ilike(f'%{search_query}%'))
-
     if status_filter:
         query = query.filter(Term.status == status_filter)
 
     if domain_filter:
         query = query.filter(Term.research_domain == domain_filter)
 
-    # Order alphabetically
-    query = query.order_by(Term.term_text)
+    # Best matches first when searching, then alphabetically
+    query = fuzzy_match(query, Term.term_text, search_query).order_by(Term.term_text)
 
     # Paginate
     terms = query.paginate(page=page, per_page=per_page, error_out=False)
@@ -1,6 +1,6 @@
-"""Administrative all-document purge route."""
+"""Administrative all-document purge routes."""
 
-from flask import current_app, jsonify
+from flask import current_app, jsonify, url_for
 from flask_login import current_user
 
 from app.services.document_purge_service import DocumentPurgeService
@@ -9,26 +9,49 @@ from app.utils.auth_decorators import write_login_required
 from ... import text_input_bp
 
 
+def _admin_required_response():
+    if current_user.is_admin:
+        return None
+    current_app.logger.warning(
+        f"Non-admin user {current_user.id} attempted to delete all documents"
+    )
+    return jsonify({
+        'success': False,
+        'error': 'Admin access required'
+    }), 403
+
+
 @text_input_bp.route('/documents/delete-all', methods=['POST'])
 @write_login_required
 def delete_all_documents():
-    """Delete every document and dependent record; administrators only."""
-    if not current_user.is_admin:
-        current_app.logger.warning(
-            f"Non-admin user {current_user.id} attempted to delete all documents"
-        )
-        return jsonify({
-            'success': False,
-            'error': 'Admin access required'
-        }), 403
+    """Delete every document and dependent record; administrators only.
+
+    Returns 202 with the purge job when the purge runs in the background
+    (poll ``status_url``), or 200 with the deletion details when inline.
+    """
+    denied = _admin_required_response()
+    if denied:
+        return denied
 
     try:
-        result = DocumentPurgeService.purge_all(
+        result = DocumentPurgeService.start_purge(
             current_user.id,
             current_app.logger,
+            background=current_app.config.get('DOCUMENT_PURGE_BACKGROUND', True),
+            batch_size=current_app.config.get('DOCUMENT_PURGE_BATCH_SIZE', 1000),
         )
         if not result['success']:
             return jsonify(result), result['status']
+        if result.get('status') == 202:
+            job = result['job']
+            return jsonify({
+                'success': True,
+                'message': 'Deleting all documents in the background',
+                'job': job,
+                'status_url': url_for(
+                    'text_input.delete_all_documents_status', job_id=job['id']
+                ),
+            }), 202
         return jsonify({
             'success': True,
             'message': (
@@ -47,3 +70,17 @@ def delete_all_documents():
             'success': False,
             'error': f'An error occurred while deleting documents: {exc}'
         }), 500
+
+
+@text_input_bp.route('/documents/delete-all/<uuid:job_id>', methods=['GET'])
+@write_login_required
+def delete_all_documents_status(job_id):
+    """Progress of a delete-all purge job; administrators only."""
+    denied = _admin_required_response()
+    if denied:
+        return denied
+
+    job = DocumentPurgeService.get_job(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Purge job not found'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()})
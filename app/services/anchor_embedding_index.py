@@ -0,0 +1,219 @@
+"""
+In-process embedding matrix of the context-anchor vocabulary.
+
+Context-anchor discovery used to load the 100 most frequent anchors and
+call the encoder once per anchor on every request, then compare them one
+at a time. The index embeds each anchor once per embedding model, keeps the
+unit-normalized vectors stacked in a matrix, and ranks every anchor with a
+single matrix-vector product:
+
+- each query reads the current anchor terms and frequencies (one light
+  query); anchors added since the last query are embedded, deleted ones are
+  dropped, and the matrix is restacked only when the anchor set changed
+- vectors are cached per model name, so switching providers never mixes
+  embedding spaces
+- anchors that fail to embed (or embed to a zero vector) are left out and
+  retried on the next query; with an ``EmbeddingService`` this includes
+  anchors only a fallback provider or the random fallback could encode,
+  since their vectors do not belong to the keyed model
+
+Returned rows are plain tuples and safe to share.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Model names that stand for random vectors; those are never cached
+_UNCACHEABLE_MODEL_PREFIXES = ('fallback:',)
+
+
+def model_key(embedding_service) -> str:
+    """Name of the embedding space ``embedding_service`` currently encodes into."""
+    getter = getattr(embedding_service, 'get_model_name', None)
+    if callable(getter):
+        try:
+            return str(getter())
+        except Exception as e:
+            logger.debug(f"Could not read embedding model name: {e}")
+    return f"{type(embedding_service).__module__}.{type(embedding_service).__qualname__}"
+
+
+def _unit(vector) -> Optional[np.ndarray]:
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    if not vector.size or not np.all(np.isfinite(vector)):
+        return None
+    norm = float(np.linalg.norm(vector))
+    # A zero vector is what providers return on failure; treat it as one
+    return vector / norm if norm else None
+
+
+class _ModelMatrix:
+    """Anchor vectors of one embedding model."""
+
+    def __init__(self):
+        self.vectors: Dict[str, np.ndarray] = {}
+        self.terms: Tuple[str, ...] = ()
+        self.matrix: Optional[np.ndarray] = None
+        # Anchor set the matrix fully covers; None forces a resync
+        self.synced: Optional[frozenset] = None
+
+
+class AnchorEmbeddingIndex:
+    """Normalized anchor-embedding matrices, one per embedding model."""
+
+    def __init__(self, anchor_loader=None):
+        """
+        Args:
+            anchor_loader: Callable returning ``[(anchor_term, frequency), ...]``
+                for every anchor (reads ``context_anchors`` by default)
+        """
+        self.anchor_loader = anchor_loader or _load_anchors
+        self._models: Dict[str, _ModelMatrix] = {}
+        self._lock = threading.Lock()
+        self._encoded = 0
+
+    def top_k(self, embedding_service, query_embedding, k: int,
+              min_similarity: Optional[float] = None) -> List[Tuple[str, int, float]]:
+        """
+        Anchors most similar to ``query_embedding``.
+
+        Returns:
+            ``[(anchor_term, frequency, cosine_similarity), ...]``, best first;
+            ties go to the more frequent anchor
+        """
+        query = _unit(query_embedding)
+        anchors = self.anchor_loader()
+        if query is None or not anchors or k <= 0:
+            return []
+
+        frequencies = {term: frequency or 0 for term, frequency in anchors}
+        terms, matrix = self._matrix(embedding_service, [term for term, _ in anchors])
+        if matrix is None or matrix.shape[1] != query.shape[0]:
+            return []
+
+        scores = matrix @ query
+        candidates = np.arange(len(terms))
+        if min_similarity is not None:
+            candidates = candidates[scores[candidates] > min_similarity]
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        order = sorted(
+            candidates.tolist(),
+            key=lambda i: (-scores[i], -frequencies[terms[i]], terms[i]),
+        )
+        return [(terms[i], frequencies[terms[i]], float(scores[i])) for i in order]
+
+    def invalidate(self, model: Optional[str] = None) -> None:
+        """Drop cached vectors for ``model`` (every model when omitted)."""
+        with self._lock:
+            if model is None:
+                self._models.clear()
+            else:
+                self._models.pop(model, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'models': len(self._models),
+                'anchors': sum(len(entry.terms) for entry in self._models.values()),
+                'encoded': self._encoded,
+            }
+
+    def _matrix(self, embedding_service, terms: Sequence[str]):
+        key = model_key(embedding_service)
+        if key.startswith(_UNCACHEABLE_MODEL_PREFIXES):
+            vectors = self._encode(embedding_service, list(terms))
+            return self._stack(terms, vectors)
+
+        with self._lock:
+            entry = self._models.setdefault(key, _ModelMatrix())
+            current = frozenset(terms)
+            if entry.synced == current:
+                return entry.terms, entry.matrix
+
+            missing = [term for term in terms if term not in entry.vectors]
+            entry.vectors.update(self._encode(embedding_service, missing))
+            entry.vectors = {
+                term: vector for term, vector in entry.vectors.items() if term in current
+            }
+            entry.terms, entry.matrix = self._stack(terms, entry.vectors)
+            # Anchors that failed to embed are retried on the next query
+            entry.synced = current if len(entry.terms) == len(current) else None
+            return entry.terms, entry.matrix
+
+    @staticmethod
+    def _stack(terms, vectors):
+        kept = tuple(term for term in terms if term in vectors)
+        if not kept:
+            return (), None
+        dimension = vectors[kept[0]].shape[0]
+        kept = tuple(term for term in kept if vectors[term].shape[0] == dimension)
+        return kept, np.vstack([vectors[term] for term in kept])
+
+    def _encode(self, embedding_service, terms: List[str]) -> Dict[str, np.ndarray]:
+        if not terms:
+            return {}
+        primary = getattr(embedding_service, 'embed_primary', None)
+        if callable(primary):
+            # Only vectors of the keyed model; fallback vectors come back as None
+            try:
+                embeddings = primary(terms)
+            except Exception as e:
+                logger.debug(f"Anchor embedding failed: {e}")
+                embeddings = []
+            encoded = {
+                term: _unit(vector) for term, vector in zip(terms, embeddings)
+                if vector is not None
+            }
+        else:
+            encoded = self._encode_any(embedding_service, terms)
+        encoded = {term: vector for term, vector in encoded.items() if vector is not None}
+        self._encoded += len(encoded)
+        return encoded
+
+    @staticmethod
+    def _encode_any(embedding_service, terms: List[str]) -> Dict[str, Optional[np.ndarray]]:
+        """Encode with services that cannot tell which provider produced a vector."""
+        batch = getattr(embedding_service, 'embed_documents', None)
+        if callable(batch):
+            try:
+                embeddings = batch(terms)
+                if len(embeddings) == len(terms):
+                    return {term: _unit(vector) for term, vector in zip(terms, embeddings)}
+            except Exception as e:
+                logger.debug(f"Batch anchor embedding failed, embedding one at a time: {e}")
+        encoded = {}
+        for term in terms:
+            try:
+                encoded[term] = _unit(embedding_service.get_embedding(term))
+            except Exception as e:
+                logger.debug(f"Failed to embed anchor {term}: {e}")
+        return encoded
+
+
+def _load_anchors() -> List[Tuple[str, int]]:
+    from app import db
+    from app.models.context_anchor import ContextAnchor
+
+    return db.session.query(ContextAnchor.anchor_term, ContextAnchor.frequency).all()
+
+
+_anchor_embedding_index: Optional[AnchorEmbeddingIndex] = None
+
+
+def get_anchor_embedding_index() -> AnchorEmbeddingIndex:
+    """
+    Get the process-wide anchor embedding index.
+
+    Returns:
+        The shared AnchorEmbeddingIndex instance
+    """
+    global _anchor_embedding_index
+    if _anchor_embedding_index is None:
+        _anchor_embedding_index = AnchorEmbeddingIndex()
+    return _anchor_embedding_index
@@ -149,3 +149,8 @@ class NotFoundError(ServiceError):
 class PermissionError(ServiceError):
     """Exception for permission/authorization errors"""
     pass
+
+
+class ConflictError(ServiceError):
+    """Exception for edits based on data someone else has since changed"""
+    pass
@@ -10,6 +10,8 @@ import requests
 from datetime import datetime
 import logging
 
+from shared_services.http_client import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,9 +33,11 @@ class CrossRefMetadataExtractor:
             email: Optional polite pool email for better API performance
         """
         self.email = email
-        self.session = requests.Session()
+        # Shared keep-alive pool; per-extractor headers are sent per request
+        self.session = get_http_pool().session()
+        self.headers = {}
         if email:
-            self.session.headers.update({'User-Agent': f'OntExtract/1.0 (mailto:{email})'})
+            self.headers['User-Agent'] = f'OntExtract/1.0 (mailto:{email})'
 
     def extract_from_doi(self, doi: str) -> Optional[Dict[str, Any]]:
         """
@@ -50,7 +54,7 @@ class CrossRefMetadataExtractor:
             clean_doi = doi.replace('https://doi.org/', '').replace('http://dx.doi.org/', '')
 
             url = f"{self.BASE_URL}/{clean_doi}"
-            response = self.session.get(url, timeout=5)
+            response = self.session.get(url, headers=self.headers, timeout=5)
 
             if response.status_code != 200:
                 logger.warning(f"CrossRef API returned status {response.status_code} for DOI: {doi}")
@@ -107,7 +111,7 @@ class CrossRefMetadataExtractor:
                 params['query.author'] = first_author
                 logger.info(f"Searching CrossRef with title and first author: {first_author}")
 
-            response = self.session.get(self.BASE_URL, params=params, timeout=5)
+            response = self.session.get(self.BASE_URL, params=params, headers=self.headers, timeout=5)
 
             if response.status_code != 200:
                 logger.warning(f"CrossRef API returned status {response.status_code} for metadata search: {title}")
@@ -207,7 +211,7 @@ class CrossRefMetadataExtractor:
                 'rows': limit
             }
 
-            response = self.session.get(self.BASE_URL, params=params, timeout=5)
+            response = self.session.get(self.BASE_URL, params=params, headers=self.headers, timeout=5)
 
             if response.status_code != 200:
                 logger.warning(f"CrossRef API returned status {response.status_code} for title search: {title}")
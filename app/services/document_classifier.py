@@ -14,6 +14,7 @@ import logging
 from anthropic import Anthropic
 
 from app.utils.file_handler import FileHandler
+from shared_services.llm.gateway import get_llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -106,8 +107,6 @@ class DocumentClassifier:
         """
         Use Claude to classify document and extract semantic information.
         """
-        client = Anthropic()
-
         # Prepare context information
         context_info = []
         if publication_year:
@@ -177,18 +176,25 @@ IMPORTANT INSTRUCTIONS:
 
 Return ONLY the JSON, no other text."""
 
-        # Call Claude API
-        message = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=2000,
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }]
-        )
+        # Call Claude API (through the gateway so identical prompts are served from cache)
+        model = "claude-sonnet-4-5-20250929"
+        messages = [{
+            "role": "user",
+            "content": prompt
+        }]
+
+        def call():
+            message = Anthropic().messages.create(
+                model=model,
+                max_tokens=2000,
+                messages=messages
+            )
+            return message.content[0].text
 
         # Parse response
-        response_text = message.content[0].text.strip()
+        response_text = get_llm_gateway().complete(
+            provider='anthropic', model=model, messages=messages, call=call, max_tokens=2000
+        ).strip()
 
         # Extract JSON from response (handle markdown code blocks)
         if response_text.startswith("```"):
@@ -1,10 +1,62 @@
 """Definition extraction tools."""
 
 import os
+import re
 
 from .context import ProcessorContext
+from .patterns import PatternSpec, get_pattern_set
 from .result import ProcessingResult
 
+# Definition patterns (more specific patterns first). ``data`` is
+# (pattern type, confidence); literals let sentences without the cue words
+# skip a pattern. Acronyms need exact case matching, the rest ignore case.
+DEFINITION_PATTERNS = (
+    # Dictionary-style definitions (e.g., "AGE. Signifies those periods...")
+    # Term in ALL CAPS followed by period, definition starts with verb
+    PatternSpec('dictionary', r'\b([A-Z][A-Z]+(?:\s+[A-Z]+)*)\.\s+((?:Signifies|Means|Denotes|Describes|Refers to|Is|Are|Was|Were|The|A|An|One who|In)\s+.+?)(?:\.\s*\n|\.\s*$)',
+                re.IGNORECASE, ('.',), ('dictionary', 0.90)),
+
+    # Explicit definitions
+    PatternSpec('is_defined_as', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+defined\s+as\s+(.+?)(?:[.;]|$)',
+                re.IGNORECASE, ('is', 'defined', 'as'), ('explicit_definition', 0.90)),
+    PatternSpec('can_be_defined_as', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+can\s+be\s+defined\s+as\s+(.+?)(?:[.;]|$)',
+                re.IGNORECASE, ('can', 'be', 'defined', 'as'), ('explicit_definition', 0.90)),
+    PatternSpec('refers_to', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+refers\s+to\s+(.+?)(?:[.;]|$)',
+                re.IGNORECASE, ('refers', 'to'), ('explicit_reference', 0.85)),
+    PatternSpec('denotes', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+denotes\s+(.+?)(?:[.;]|$)',
+                re.IGNORECASE, ('denotes',), ('explicit_reference', 0.85)),
+
+    # Meaning/explanation patterns
+    PatternSpec('means', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+means\s+(.+?)(?:[.;]|$)',
+                re.IGNORECASE, ('means',), ('meaning', 0.80)),
+    PatternSpec('represents', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+represents\s+(.+?)(?:[.;]|$)',
+                re.IGNORECASE, ('represents',), ('meaning', 0.75)),
+    PatternSpec('describes', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+describes\s+(.+?)(?:[.;]|$)',
+                re.IGNORECASE, ('describes',), ('meaning', 0.70)),
+
+    # Copula definitions (be careful with these - higher false positive rate)
+    PatternSpec('copula', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+(?:a|an|the)\s+(.+?)(?:[.;]|$)',
+                re.IGNORECASE, ('is',), ('copula', 0.65)),
+
+    # Acronym expansions - STRICT patterns only
+    # Pattern: "IRA (Information Retrieval Agent)" - acronym before expansion
+    # Requires: 2-6 uppercase letters, expansion must start with matching letters
+    PatternSpec('acronym', r'\b([A-Z]{2,6})\s+\(([A-Z][a-z]+(?:\s+[A-Z]?[a-z]+)*)\)',
+                0, ('(', ')'), ('acronym', 0.85)),
+
+    # Also known as patterns
+    PatternSpec('also_known_as_parenthetical', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\(also\s+known\s+as\s+([^)]+)\)',
+                re.IGNORECASE, ('(', 'also', 'known', 'as'), ('also_known_as', 0.80)),
+    PatternSpec('also_known_as_appositive', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s+also\s+known\s+as\s+(.+?),',
+                re.IGNORECASE, (',', 'also', 'known', 'as'), ('also_known_as', 0.80)),
+
+    # Or/i.e. patterns
+    PatternSpec('ie_parenthetical', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\(i\.e\.,\s+([^)]+)\)',
+                re.IGNORECASE, ('(', 'i', 'e', '.', ','), ('ie_explanation', 0.75)),
+    PatternSpec('ie_appositive', r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s+i\.e\.,\s+(.+?),',
+                re.IGNORECASE, ('i', 'e', '.', ','), ('ie_explanation', 0.75)),
+)
+
 
 class DefinitionExtractionTools(ProcessorContext):
     def extract_definitions(self, text: str) -> ProcessingResult:
@@ -35,8 +87,8 @@ class DefinitionExtractionTools(ProcessorContext):
             - end: character end position
         """
         try:
-            import re
-            import spacy
+            from app.services.spacy_annotation_store import SYNTAX_ONLY_EXCLUDE
+            from app.services.windowed_nlp import get_windowed_nlp_runner
 
             # Get confidence threshold from settings
             from app.models.app_settings import AppSetting
@@ -65,53 +117,72 @@ class DefinitionExtractionTools(ProcessorContext):
                 except (ImportError, Exception):
                     classifier_available = False
 
-            # Load spaCy model for sentence segmentation and dependency parsing
+            # spaCy sentence segmentation and appositive candidates (NER is not
+            # needed); long texts are parsed in sentence-aligned windows
+            sentences = []
+            appositives = []
+            parsed = True
             try:
-                nlp = spacy.load('en_core_web_sm')
-            except OSError:
-                nlp = None
+                for offset, doc in get_windowed_nlp_runner().docs(text, exclude=SYNTAX_ONLY_EXCLUDE):
+                    for sent in doc.sents:
+                        sentences.append(sent.text)
+                        for token in sent:
+                            # Look for appositive constructions (noun, noun_phrase,)
+                            if token.dep_ == 'appos' and token.head.pos_ in ['NOUN', 'PROPN']:
+                                term = token.head.text
+                                definition_text = token.text
+
+                                # Get fuller context
+                                term_phrase = ' '.join([t.text for t in token.head.subtree])
+                                definition_phrase = ' '.join([t.text for t in token.subtree])
+
+                                # Only keep terms with 1-3 words
+                                term_word_count = len(term_phrase.split())
+                                if term_word_count > 3:
+                                    continue
 
-            definitions = []
+                                # REJECT: Run-together words (PDF extraction artifacts)
+                                if re.search(r'[a-z][A-Z]', term_phrase) or re.search(r'[a-z][A-Z]', definition_phrase):
+                                    continue
 
-            # Definition patterns (more specific patterns first)
-            definition_patterns = [
-                # Dictionary-style definitions (e.g., "AGE. Signifies those periods...")
-                # Term in ALL CAPS followed by period, definition starts with verb
-                (r'\b([A-Z][A-Z]+(?:\s+[A-Z]+)*)\.\s+((?:Signifies|Means|Denotes|Describes|Refers to|Is|Are|Was|Were|The|A|An|One who|In)\s+.+?)(?:\.\s*\n|\.\s*$)', 'dictionary', 0.90),
+                                # REJECT: Single character terms or definitions
+                                if len(term_phrase.strip()) < 3 or len(definition_phrase.strip()) < 5:
+                                    continue
 
-                # Explicit definitions
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+defined\s+as\s+(.+?)(?:[.;]|$)', 'explicit_definition', 0.90),
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+can\s+be\s+defined\s+as\s+(.+?)(?:[.;]|$)', 'explicit_definition', 0.90),
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+refers\s+to\s+(.+?)(?:[.;]|$)', 'explicit_reference', 0.85),
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+denotes\s+(.+?)(?:[.;]|$)', 'explicit_reference', 0.85),
+                                # REJECT: Terms that are just author names (contains comma-separated names pattern)
+                                if re.search(r'[A-Z][a-z]+\s*,\s*and\s*[A-Z]', term_phrase):
+                                    continue
 
-                # Meaning/explanation patterns
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+means\s+(.+?)(?:[.;]|$)', 'meaning', 0.80),
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+represents\s+(.+?)(?:[.;]|$)', 'meaning', 0.75),
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+describes\s+(.+?)(?:[.;]|$)', 'meaning', 0.70),
+                                # REJECT: arXiv references or citation artifacts
+                                if re.search(r'arXiv|arxiv|\d{4}\.\d+', term_phrase) or re.search(r'arXiv|arxiv|\d{4}\.\d+', definition_phrase):
+                                    continue
 
-                # Copula definitions (be careful with these - higher false positive rate)
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+is\s+(?:a|an|the)\s+(.+?)(?:[.;]|$)', 'copula', 0.65),
+                                # REJECT: Stop words as the main term
+                                main_term = term.lower()
+                                stop_terms = {'which', 'that', 'this', 'these', 'those', 'what', 'who', 'where',
+                                             'when', 'why', 'how', 'the', 'a', 'an', 'it', 'they', 'we', 'you'}
+                                if main_term in stop_terms:
+                                    continue
 
-                # Acronym expansions - STRICT patterns only
-                # Pattern: "IRA (Information Retrieval Agent)" - acronym before expansion
-                # Requires: 2-6 uppercase letters, expansion must start with matching letters
-                (r'\b([A-Z]{2,6})\s+\(([A-Z][a-z]+(?:\s+[A-Z]?[a-z]+)*)\)', 'acronym', 0.85),
+                                # REJECT: Definition is just author names or citations
+                                if re.match(r'^[A-Z][a-z]+\s+[A-Z]', definition_phrase) and ',' in definition_phrase:
+                                    # Looks like "FirstName LastName, ..." - likely author list
+                                    continue
 
-                # Also known as patterns
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\(also\s+known\s+as\s+([^)]+)\)', 'also_known_as', 0.80),
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s+also\s+known\s+as\s+(.+?),', 'also_known_as', 0.80),
+                                appositives.append({
+                                    'term': term_phrase,
+                                    'definition': definition_phrase,
+                                    'start': offset + token.head.idx,
+                                    'end': offset + token.idx + len(definition_phrase),
+                                    'sentence': sent.text
+                                })
+            except OSError:
+                parsed = False
 
-                # Or/i.e. patterns
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+\(i\.e\.,\s+([^)]+)\)', 'ie_explanation', 0.75),
-                (r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s+i\.e\.,\s+(.+?),', 'ie_explanation', 0.75),
-            ]
+            definitions = []
 
             # Process text - get sentences
-            if nlp:
-                doc = nlp(text)
-                sentences = [sent.text for sent in doc.sents]
-            else:
+            if not parsed:
                 # Fallback: simple sentence splitting
                 sentences = re.split(r'[.!?]+\s+', text)
 
@@ -194,200 +265,155 @@ class DefinitionExtractionTools(ProcessorContext):
             # Always use all sentences - pattern validation handles quality
             candidate_sentences = sentences
 
-            # Apply patterns to candidate sentences
+            # Apply patterns to candidate sentences (compiled once per process)
+            pattern_set = get_pattern_set('definitions', DEFINITION_PATTERNS)
+            pattern_stats = {}
             for sent in candidate_sentences:
-                for pattern, pattern_type, confidence in definition_patterns:
-                    # Use IGNORECASE for most patterns, but not for acronym (needs exact case matching)
-                    flags = 0 if pattern_type == 'acronym' else re.IGNORECASE
-                    matches = re.finditer(pattern, sent, flags)
-
-                    for match in matches:
-                        term = match.group(1).strip()
-                        definition_text = match.group(2).strip()
-
-                        # Quality filters - basic length checks
-                        if (len(term) < 2 or len(definition_text) < 10 or
-                            len(definition_text) > 200):  # Too short or too long
-                            continue
-
-                        # REJECT: Terms with more than 3 words (only keep single words or short phrases)
-                        term_word_count = len(term.split())
-                        if term_word_count > 3:
-                            continue
-
-                        # REJECT: Academic citations (e.g., "Dubossarsky et al., 2015")
-                        if re.search(r'\bet\s+al\.\s*,?\s*\d{4}', definition_text):
-                            continue
-
-                        # REJECT: Multiple citations in parentheses
-                        if definition_text.count('(') > 2 or definition_text.count(';') > 2:
-                            continue
-
-                        # REJECT: Year ranges or multiple years (reference lists)
-                        if re.search(r'\d{4}\s*[-–]\s*\d{4}|\d{4}\s*,\s*\d{4}', definition_text):
-                            continue
-
-                        # REJECT: Sentences that are mostly technical symbols
-                        symbol_ratio = len(re.findall(r'[(){}\[\];,—–]', definition_text)) / max(len(definition_text), 1)
-                        if symbol_ratio > 0.15:  # More than 15% special characters
-                            continue
-
-                        # REJECT: Too many uppercase words (likely acronyms list)
-                        uppercase_words = re.findall(r'\b[A-Z]{2,}\b', definition_text)
-                        if len(uppercase_words) > 3:
-                            continue
-
-                        # REJECT: Starts with common non-definitional words
-                        if re.match(r'^(e\.g\.|for example|such as|including|like)', definition_text, re.IGNORECASE):
-                            continue
-
-                        # REJECT: Run-together words (PDF extraction artifacts)
-                        # E.g., "byAgent", "ofmle-solver", "andTatsunori"
-                        # Detect: lowercase followed immediately by uppercase, or common words without spaces
-                        if re.search(r'[a-z][A-Z]', term) or re.search(r'[a-z][A-Z]', definition_text):
-                            continue
-
-                        # REJECT: Stop words or function words as terms
-                        stop_terms = {'which', 'that', 'this', 'these', 'those', 'what', 'who', 'whom',
-                                     'where', 'when', 'why', 'how', 'the', 'a', 'an', 'is', 'are', 'was',
-                                     'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
-                                     'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must',
-                                     'shall', 'can', 'your', 'my', 'his', 'her', 'its', 'our', 'their'}
-                        if term.lower() in stop_terms:
-                            continue
-
-                        # REJECT: Terms that look like variable placeholders (e.g., "where COMMAND", "where title here")
-                        if term.lower().startswith('where '):
+                for spec, match in pattern_set.scan(sent, stats=pattern_stats):
+                    pattern_type, confidence = spec.data
+                    term = match.group(1).strip()
+                    definition_text = match.group(2).strip()
+
+                    # Quality filters - basic length checks
+                    if (len(term) < 2 or len(definition_text) < 10 or
+                        len(definition_text) > 200):  # Too short or too long
+                        continue
+
+                    # REJECT: Terms with more than 3 words (only keep single words or short phrases)
+                    term_word_count = len(term.split())
+                    if term_word_count > 3:
+                        continue
+
+                    # REJECT: Academic citations (e.g., "Dubossarsky et al., 2015")
+                    if re.search(r'\bet\s+al\.\s*,?\s*\d{4}', definition_text):
+                        continue
+
+                    # REJECT: Multiple citations in parentheses
+                    if definition_text.count('(') > 2 or definition_text.count(';') > 2:
+                        continue
+
+                    # REJECT: Year ranges or multiple years (reference lists)
+                    if re.search(r'\d{4}\s*[-–]\s*\d{4}|\d{4}\s*,\s*\d{4}', definition_text):
+                        continue
+
+                    # REJECT: Sentences that are mostly technical symbols
+                    symbol_ratio = len(re.findall(r'[(){}\[\];,—–]', definition_text)) / max(len(definition_text), 1)
+                    if symbol_ratio > 0.15:  # More than 15% special characters
+                        continue
+
+                    # REJECT: Too many uppercase words (likely acronyms list)
+                    uppercase_words = re.findall(r'\b[A-Z]{2,}\b', definition_text)
+                    if len(uppercase_words) > 3:
+                        continue
+
+                    # REJECT: Starts with common non-definitional words
+                    if re.match(r'^(e\.g\.|for example|such as|including|like)', definition_text, re.IGNORECASE):
+                        continue
+
+                    # REJECT: Run-together words (PDF extraction artifacts)
+                    # E.g., "byAgent", "ofmle-solver", "andTatsunori"
+                    # Detect: lowercase followed immediately by uppercase, or common words without spaces
+                    if re.search(r'[a-z][A-Z]', term) or re.search(r'[a-z][A-Z]', definition_text):
+                        continue
+
+                    # REJECT: Stop words or function words as terms
+                    stop_terms = {'which', 'that', 'this', 'these', 'those', 'what', 'who', 'whom',
+                                 'where', 'when', 'why', 'how', 'the', 'a', 'an', 'is', 'are', 'was',
+                                 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+                                 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must',
+                                 'shall', 'can', 'your', 'my', 'his', 'her', 'its', 'our', 'their'}
+                    if term.lower() in stop_terms:
+                        continue
+
+                    # REJECT: Terms that look like variable placeholders (e.g., "where COMMAND", "where title here")
+                    if term.lower().startswith('where '):
+                        continue
+
+                    # REJECT: All-caps terms (usually placeholders or labels, not definitional terms)
+                    # Exception: acronym patterns are expected to be all-caps
+                    if term.isupper() and pattern_type != 'acronym':
+                        continue
+
+                    # REJECT: Terms starting with possessive pronouns (instruction text, not definitions)
+                    if re.match(r'^(your|my|his|her|its|our|their)\s', term, re.IGNORECASE):
+                        continue
+
+                    # Avoid duplicate terms (keep first occurrence)
+                    term_key = term.lower()
+                    if term_key in seen_terms:
+                        continue
+
+                    seen_terms.add(term_key)
+
+                    # Find position in original text
+                    start_pos = text.find(match.group(0))
+                    if start_pos == -1:
+                        continue  # Can't locate in original text
+
+                    # Additional validation for copula patterns (prone to false positives)
+                    if pattern_type == 'copula':
+                        # Check if definition contains enough content words
+                        content_words = re.findall(r'\b[a-z]{4,}\b', definition_text.lower())
+                        if len(content_words) < 2:
                             continue
 
-                        # REJECT: All-caps terms (usually placeholders or labels, not definitional terms)
-                        # Exception: acronym patterns are expected to be all-caps
-                        if term.isupper() and pattern_type != 'acronym':
-                            continue
+                    # Additional validation for acronym patterns
+                    if pattern_type == 'acronym':
+                        # Strict acronym validation
+                        # Good: "IRA (Information Retrieval Agent)"
+                        # Bad: "AI (LNAI Volume 478)"
 
-                        # REJECT: Terms starting with possessive pronouns (instruction text, not definitions)
-                        if re.match(r'^(your|my|his|her|its|our|their)\s', term, re.IGNORECASE):
+                        # Contains a year - likely citation
+                        if re.search(r'\d{4}', definition_text):
                             continue
 
-                        # Avoid duplicate terms (keep first occurrence)
-                        term_key = term.lower()
-                        if term_key in seen_terms:
+                        # Must have at least 2 words in expansion
+                        words = definition_text.split()
+                        if len(words) < 2:
                             continue
 
-                        seen_terms.add(term_key)
-
-                        # Find position in original text
-                        start_pos = text.find(match.group(0))
-                        if start_pos == -1:
-                            continue  # Can't locate in original text
-
-                        # Additional validation for copula patterns (prone to false positives)
-                        if pattern_type == 'copula':
-                            # Check if definition contains enough content words
-                            content_words = re.findall(r'\b[a-z]{4,}\b', definition_text.lower())
-                            if len(content_words) < 2:
-                                continue
-
-                        # Additional validation for acronym patterns
-                        if pattern_type == 'acronym':
-                            # Strict acronym validation
-                            # Good: "IRA (Information Retrieval Agent)"
-                            # Bad: "AI (LNAI Volume 478)"
-
-                            # Contains a year - likely citation
-                            if re.search(r'\d{4}', definition_text):
-                                continue
-
-                            # Must have at least 2 words in expansion
-                            words = definition_text.split()
-                            if len(words) < 2:
-                                continue
-
-                            # Expansion should start with letters matching acronym
-                            # E.g., "IRA" should expand to "Information Retrieval Agent"
-                            acronym_letters = list(term.upper())
-                            expansion_words = [w for w in words if w[0].isupper()]
-                            if len(expansion_words) >= len(acronym_letters):
-                                # Check if first letters match
-                                first_letters = [w[0].upper() for w in expansion_words[:len(acronym_letters)]]
-                                if first_letters != acronym_letters:
-                                    continue
-                            else:
-                                # Not enough capitalized words to match acronym
-                                continue
-
-                        # Pattern-based confidence (transformer extractions already added above)
-                        definitions.append({
-                            'term': term,
-                            'definition': definition_text,
-                            'pattern': pattern_type,
-                            'confidence': confidence,
-                            'start': start_pos,
-                            'end': start_pos + len(match.group(0)),
-                            'sentence': sent
-                        })
-
-            # If spaCy is available, try to extract appositive definitions
-            if nlp:
-                doc = nlp(text)
-                for sent in doc.sents:
-                    for token in sent:
-                        # Look for appositive constructions (noun, noun_phrase,)
-                        if token.dep_ == 'appos' and token.head.pos_ in ['NOUN', 'PROPN']:
-                            term = token.head.text
-                            definition_text = token.text
-
-                            # Get fuller context
-                            term_phrase = ' '.join([t.text for t in token.head.subtree])
-                            definition_phrase = ' '.join([t.text for t in token.subtree])
-
-                            # Only keep terms with 1-3 words
-                            term_word_count = len(term_phrase.split())
-                            if term_word_count > 3:
-                                continue
-
-                            # REJECT: Run-together words (PDF extraction artifacts)
-                            if re.search(r'[a-z][A-Z]', term_phrase) or re.search(r'[a-z][A-Z]', definition_phrase):
-                                continue
-
-                            # REJECT: Single character terms or definitions
-                            if len(term_phrase.strip()) < 3 or len(definition_phrase.strip()) < 5:
-                                continue
-
-                            # REJECT: Terms that are just author names (contains comma-separated names pattern)
-                            if re.search(r'[A-Z][a-z]+\s*,\s*and\s*[A-Z]', term_phrase):
-                                continue
-
-                            # REJECT: arXiv references or citation artifacts
-                            if re.search(r'arXiv|arxiv|\d{4}\.\d+', term_phrase) or re.search(r'arXiv|arxiv|\d{4}\.\d+', definition_phrase):
-                                continue
-
-                            # REJECT: Stop words as the main term
-                            main_term = term.lower()
-                            stop_terms = {'which', 'that', 'this', 'these', 'those', 'what', 'who', 'where',
-                                         'when', 'why', 'how', 'the', 'a', 'an', 'it', 'they', 'we', 'you'}
-                            if main_term in stop_terms:
+                        # Expansion should start with letters matching acronym
+                        # E.g., "IRA" should expand to "Information Retrieval Agent"
+                        acronym_letters = list(term.upper())
+                        expansion_words = [w for w in words if w[0].isupper()]
+                        if len(expansion_words) >= len(acronym_letters):
+                            # Check if first letters match
+                            first_letters = [w[0].upper() for w in expansion_words[:len(acronym_letters)]]
+                            if first_letters != acronym_letters:
                                 continue
+                        else:
+                            # Not enough capitalized words to match acronym
+                            continue
 
-                            # REJECT: Definition is just author names or citations
-                            if re.match(r'^[A-Z][a-z]+\s+[A-Z]', definition_phrase) and ',' in definition_phrase:
-                                # Looks like "FirstName LastName, ..." - likely author list
-                                continue
+                    # Pattern-based confidence (transformer extractions already added above)
+                    definitions.append({
+                        'term': term,
+                        'definition': definition_text,
+                        'pattern': pattern_type,
+                        'confidence': confidence,
+                        'start': start_pos,
+                        'end': start_pos + len(match.group(0)),
+                        'sentence': sent
+                    })
 
-                            if (len(term_phrase) > 2 and len(definition_phrase) > 10 and
-                                term_phrase.lower() not in seen_terms):
+            # If spaCy is available, keep appositive definitions of new terms
+            for candidate in appositives:
+                term_phrase = candidate['term']
+                definition_phrase = candidate['definition']
+                if (len(term_phrase) > 2 and len(definition_phrase) > 10 and
+                    term_phrase.lower() not in seen_terms):
 
-                                seen_terms.add(term_phrase.lower())
+                    seen_terms.add(term_phrase.lower())
 
-                                definitions.append({
-                                    'term': term_phrase,
-                                    'definition': definition_phrase,
-                                    'pattern': 'appositive',
-                                    'confidence': 0.70,
-                                    'start': token.head.idx,
-                                    'end': token.idx + len(definition_phrase),
-                                    'sentence': sent.text
-                                })
+                    definitions.append({
+                        'term': term_phrase,
+                        'definition': definition_phrase,
+                        'pattern': 'appositive',
+                        'confidence': 0.70,
+                        'start': candidate['start'],
+                        'end': candidate['end'],
+                        'sentence': candidate['sentence']
+                    })
 
             # Sort by position in text
             definitions.sort(key=lambda x: x['start'])
@@ -402,7 +428,7 @@ class DefinitionExtractionTools(ProcessorContext):
             if classifier_available:
                 method_parts.append("zero_shot_filtering")
             method_parts.append("pattern_matching")
-            if nlp:
+            if parsed:
                 method_parts.append("dependency_parsing")
 
             metadata = {
@@ -416,6 +442,7 @@ class DefinitionExtractionTools(ProcessorContext):
                 "classifier_model": "facebook/bart-large-mnli" if classifier_available else None,
                 "classifier_used": classifier_used_for_boost,
                 "confidence_threshold": confidence_threshold,
+                "pattern_stats": pattern_stats,
                 "text_length": len(text)
             }
 
@@ -26,12 +26,58 @@ class EntityExtractionTools(ProcessorContext):
             - confidence: extraction confidence score
         """
         try:
-            import spacy
+            from bisect import bisect_right
             from collections import defaultdict
+            from app.services.windowed_nlp import get_windowed_nlp_runner
 
-            # Load spaCy model
+            entities = []
+            concepts = []
+            entity_counts = defaultdict(int)
+
+            # Long texts are parsed in sentence-aligned windows; short ones
+            # reuse the annotation store's cached Doc
             try:
-                nlp = spacy.load('en_core_web_sm')
+                for offset, doc in get_windowed_nlp_runner().docs(text):
+                    # spaCy entities are sorted and never overlap
+                    starts = [ent.start_char for ent in doc.ents]
+                    ends = [ent.end_char for ent in doc.ents]
+
+                    # Extract named entities
+                    for ent in doc.ents:
+                        entities.append({
+                            'entity': ent.text,
+                            'type': ent.label_,
+                            'start': offset + ent.start_char,
+                            'end': offset + ent.end_char,
+                            'confidence': 0.85  # spaCy NER typically has high confidence
+                        })
+                        entity_counts[ent.label_] += 1
+
+                    # Extract significant noun phrases as potential concepts
+                    for chunk in doc.noun_chunks:
+                        # Only include noun phrases that aren't already entities
+                        # and have some substance (not just pronouns/determiners)
+                        if (len(chunk.text) > 3 and
+                            not all(token.is_stop for token in chunk) and
+                            any(token.pos_ in ['PROPN', 'NOUN'] for token in chunk)):
+
+                            # Skip noun phrases starting or ending inside an entity
+                            i = bisect_right(starts, chunk.start_char) - 1
+                            j = bisect_right(starts, chunk.end_char - 1) - 1
+                            is_duplicate = (
+                                (i >= 0 and chunk.start_char < ends[i]) or
+                                (j >= 0 and chunk.end_char <= ends[j])
+                            )
+
+                            if not is_duplicate:
+                                concepts.append({
+                                    'entity': chunk.text,
+                                    'type': 'CONCEPT',
+                                    'start': offset + chunk.start_char,
+                                    'end': offset + chunk.end_char,
+                                    'confidence': 0.65  # Lower confidence for noun phrases
+                                })
+                                entity_counts['CONCEPT'] += 1
             except OSError:
                 return ProcessingResult(
                     tool_name="extract_entities_spacy",
@@ -40,48 +86,7 @@ class EntityExtractionTools(ProcessorContext):
                     metadata={"error": "spaCy model not found. Run: python -m spacy download en_core_web_sm"},
                     provenance=self._generate_provenance("extract_entities_spacy")
                 )
-
-            # Process text
-            doc = nlp(text)
-
-            entities = []
-            entity_counts = defaultdict(int)
-
-            # Extract named entities
-            for ent in doc.ents:
-                entities.append({
-                    'entity': ent.text,
-                    'type': ent.label_,
-                    'start': ent.start_char,
-                    'end': ent.end_char,
-                    'confidence': 0.85  # spaCy NER typically has high confidence
-                })
-                entity_counts[ent.label_] += 1
-
-            # Extract significant noun phrases as potential concepts
-            for chunk in doc.noun_chunks:
-                # Only include noun phrases that aren't already entities
-                # and have some substance (not just pronouns/determiners)
-                if (len(chunk.text) > 3 and
-                    not all(token.is_stop for token in chunk) and
-                    any(token.pos_ in ['PROPN', 'NOUN'] for token in chunk)):
-
-                    # Check if this noun phrase overlaps with existing entities
-                    is_duplicate = any(
-                        ent['start'] <= chunk.start_char < ent['end'] or
-                        ent['start'] < chunk.end_char <= ent['end']
-                        for ent in entities
-                    )
-
-                    if not is_duplicate:
-                        entities.append({
-                            'entity': chunk.text,
-                            'type': 'CONCEPT',
-                            'start': chunk.start_char,
-                            'end': chunk.end_char,
-                            'confidence': 0.65  # Lower confidence for noun phrases
-                        })
-                        entity_counts['CONCEPT'] += 1
+            entities.extend(concepts)
 
             metadata = {
                 "total_entities": len(entities),
@@ -0,0 +1,164 @@
+"""Compiled pattern sets and span bookkeeping shared by the regex-based extractors."""
+
+import bisect
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_TOKEN_RE = re.compile(r'\w+|[^\w\s]')
+
+
+@dataclass(frozen=True)
+class PatternSpec:
+    """
+    One pattern in a set.
+
+    ``literals`` are lowercase tokens (words or single punctuation marks)
+    that every match must contain; text lacking any of them skips the
+    pattern without running the regex. Leave empty when there is no safe
+    literal.
+    """
+    name: str
+    pattern: str
+    flags: int = 0
+    literals: Tuple[str, ...] = ()
+    data: Any = None
+
+
+class CompiledPatternSet:
+    """A fixed, ordered set of patterns compiled once and scanned together."""
+
+    def __init__(self, name: str, specs: Sequence[PatternSpec]):
+        self.name = name
+        self.specs = tuple(specs)
+        self._compiled = [re.compile(spec.pattern, spec.flags) for spec in self.specs]
+        self._literals = [frozenset(spec.literals) for spec in self.specs]
+        self._needs_tokens = any(self._literals)
+        self._lock = threading.Lock()
+        self._totals = {spec.name: _empty_stats() for spec in self.specs}
+
+    def scan(self, text: str, stats: Optional[Dict[str, Dict[str, float]]] = None
+             ) -> List[Tuple[PatternSpec, 're.Match']]:
+        """
+        Run every applicable pattern over ``text``.
+
+        Matches are returned grouped in pattern order (priority order), each
+        group in text order, so callers resolving overlaps keep the
+        higher-priority match.
+
+        Args:
+            text: Text to scan
+            stats: Optional dict accumulating per-pattern counters for this caller
+
+        Returns:
+            List of (spec, match) pairs
+        """
+        # One tokenization pass decides which patterns can possibly match
+        tokens = set(_TOKEN_RE.findall(text.lower())) if self._needs_tokens else None
+        results = []
+        call_stats = {}
+        for spec, regex, literals in zip(self.specs, self._compiled, self._literals):
+            entry = call_stats.setdefault(spec.name, _empty_stats())
+            if literals and not literals <= tokens:
+                entry['skipped'] += 1
+                continue
+            started = time.perf_counter()
+            matches = list(regex.finditer(text))
+            entry['seconds'] += time.perf_counter() - started
+            entry['scans'] += 1
+            entry['matches'] += len(matches)
+            results.extend((spec, match) for match in matches)
+
+        with self._lock:
+            _merge_stats(self._totals, call_stats)
+        if stats is not None:
+            _merge_stats(stats, call_stats)
+        return results
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-pattern counters accumulated over the life of the process."""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._totals.items()}
+
+
+class IntervalSet:
+    """
+    Non-overlapping half-open spans with O(log n) overlap checks.
+
+    Spans added in ascending order (as one pattern's matches are) are
+    appended to a pending run; the run is merged into the main arrays only
+    when an earlier span arrives, so each pattern costs one linear merge.
+    """
+
+    def __init__(self, spans: Iterable[Tuple[int, int]] = ()):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._pending_starts: List[int] = []
+        self._pending_ends: List[int] = []
+        for start, end in spans:
+            self.add(start, end)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """True if [start, end) intersects a stored span."""
+        return (_overlaps(self._starts, self._ends, start, end)
+                or _overlaps(self._pending_starts, self._pending_ends, start, end))
+
+    def add(self, start: int, end: int) -> bool:
+        """Store [start, end) unless it overlaps; return whether it was stored."""
+        if self.overlaps(start, end):
+            return False
+        if self._pending_starts and start < self._pending_starts[-1]:
+            self._merge_pending()
+        self._pending_starts.append(start)
+        self._pending_ends.append(end)
+        return True
+
+    def _merge_pending(self) -> None:
+        # Both runs are sorted; timsort merges them in linear time
+        merged = sorted(zip(self._starts + self._pending_starts, self._ends + self._pending_ends))
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+        self._pending_starts, self._pending_ends = [], []
+
+    def __len__(self) -> int:
+        return len(self._starts) + len(self._pending_starts)
+
+
+def _overlaps(starts: List[int], ends: List[int], start: int, end: int) -> bool:
+    i = bisect.bisect_left(starts, end)
+    # Only the last span starting before ``end`` can reach past ``start``
+    return i > 0 and ends[i - 1] > start
+
+
+def _empty_stats() -> Dict[str, float]:
+    return {'scans': 0, 'skipped': 0, 'matches': 0, 'seconds': 0.0}
+
+
+def _merge_stats(target: Dict[str, Dict[str, float]], source: Dict[str, Dict[str, float]]) -> None:
+    for name, entry in source.items():
+        total = target.setdefault(name, _empty_stats())
+        for key, value in entry.items():
+            total[key] += value
+
+
+# Compiled sets shared by the whole process (singleton registry)
+_compiled_sets: Dict[str, CompiledPatternSet] = {}
+_compiled_sets_lock = threading.Lock()
+
+
+def get_pattern_set(name: str, specs: Sequence[PatternSpec]) -> CompiledPatternSet:
+    """
+    Get the process-wide compiled set registered under ``name``.
+
+    The specs are compiled on first use only; later calls return the same set.
+    """
+    compiled = _compiled_sets.get(name)
+    if compiled is None:
+        with _compiled_sets_lock:
+            compiled = _compiled_sets.get(name)
+            if compiled is None:
+                compiled = CompiledPatternSet(name, specs)
+                _compiled_sets[name] = compiled
+    return compiled
@@ -1,8 +1,34 @@
 """Temporal and causal relationship extraction tools."""
 
+import re
+
 from .context import ProcessorContext
+from .patterns import IntervalSet, PatternSpec, get_pattern_set
 from .result import ProcessingResult
 
+# Regex patterns for temporal expressions, in priority order: a match
+# overlapping an earlier (or spaCy DATE) span is dropped.
+TEMPORAL_PATTERNS = (
+    # Years (1900s, 2020, etc.)
+    PatternSpec('YEAR', r'\b(1[6-9]\d{2}|20[0-2]\d)\b', re.IGNORECASE),
+    # Decades (1950s, 1960's, etc.)
+    PatternSpec('DECADE', r'\b(1[6-9]\d{2}|20[0-2]\d)s\b', re.IGNORECASE),
+    # Century markers (19th century, twentieth century)
+    PatternSpec('CENTURY', r'\b(\d{1,2}(?:st|nd|rd|th)\s+century|(?:eighteenth|nineteenth|twentieth|twenty-first)\s+century)\b',
+                re.IGNORECASE),
+    # Periods (early/mid/late X)
+    PatternSpec('PERIOD', r'\b(early|mid|late|middle)\s+(1[6-9]\d{2}|20[0-2]\d)s?\b', re.IGNORECASE),
+    # Historical periods
+    PatternSpec('HISTORICAL_PERIOD', r'\b(Industrial Revolution|Renaissance|Victorian era|Cold War|World War (I|II|1|2))\b',
+                re.IGNORECASE),
+    # Relative time
+    PatternSpec('RELATIVE', r'\b(recently|lately|nowadays|currently|presently|historically|traditionally)\b',
+                re.IGNORECASE),
+    # Temporal markers
+    PatternSpec('TEMPORAL_MARKER', r'\b(before|after|during|since|until|from|throughout|between)\s+(\d{4}|\d{4}s)\b',
+                re.IGNORECASE),
+)
+
 
 class RelationshipExtractionTools(ProcessorContext):
     def extract_temporal(self, text: str) -> ProcessingResult:
@@ -27,14 +53,38 @@ class RelationshipExtractionTools(ProcessorContext):
             - normalized: normalized form if parseable
         """
         try:
-            import spacy
-            import re
             from datetime import datetime
+            from app.services.windowed_nlp import get_windowed_nlp_runner
             from dateutil import parser as date_parser
 
-            # Load spaCy model
+            temporal_expressions = []
+            seen_positions = IntervalSet()
+
+            # Extract DATE entities from spaCy (shared parse for short texts,
+            # sentence-aligned windows for long ones)
             try:
-                nlp = spacy.load('en_core_web_sm')
+                for offset, doc in get_windowed_nlp_runner().docs(text):
+                    for ent in doc.ents:
+                        if ent.label_ == 'DATE':
+                            # Try to normalize the date
+                            normalized = None
+                            try:
+                                parsed_date = date_parser.parse(ent.text, fuzzy=True)
+                                normalized = parsed_date.isoformat()
+                            except:
+                                normalized = ent.text
+
+                            start_char = offset + ent.start_char
+                            end_char = offset + ent.end_char
+                            temporal_expressions.append({
+                                'text': ent.text,
+                                'type': 'DATE',
+                                'start': start_char,
+                                'end': end_char,
+                                'normalized': normalized,
+                                'confidence': 0.85
+                            })
+                            seen_positions.add(start_char, end_char)
             except OSError:
                 return ProcessingResult(
                     tool_name="extract_temporal",
@@ -44,88 +94,43 @@ class RelationshipExtractionTools(ProcessorContext):
                     provenance=self._generate_provenance("extract_temporal")
                 )
 
-            # Process text with spaCy
-            doc = nlp(text)
+            # Apply regex patterns (compiled once per process)
+            pattern_stats = {}
+            for spec, match in get_pattern_set('temporal', TEMPORAL_PATTERNS).scan(text, stats=pattern_stats):
+                temp_type = spec.name
+                start_pos = match.start()
+                end_pos = match.end()
 
-            temporal_expressions = []
-            seen_positions = set()
+                # Skip if this span overlaps spaCy or a higher-priority pattern
+                if seen_positions.overlaps(start_pos, end_pos):
+                    continue
+
+                matched_text = match.group()
+                normalized = matched_text
 
-            # Extract DATE entities from spaCy
-            for ent in doc.ents:
-                if ent.label_ == 'DATE':
-                    # Try to normalize the date
-                    normalized = None
+                # Try to normalize specific types
+                if temp_type in ['YEAR', 'DECADE']:
                     try:
-                        parsed_date = date_parser.parse(ent.text, fuzzy=True)
-                        normalized = parsed_date.isoformat()
+                        # Extract year number
+                        year_match = re.search(r'\d{4}', matched_text)
+                        if year_match:
+                            year = int(year_match.group())
+                            if temp_type == 'DECADE':
+                                normalized = f"{year}-{year+9}"
+                            else:
+                                normalized = str(year)
                     except:
-                        normalized = ent.text
-
-                    temporal_expressions.append({
-                        'text': ent.text,
-                        'type': 'DATE',
-                        'start': ent.start_char,
-                        'end': ent.end_char,
-                        'normalized': normalized,
-                        'confidence': 0.85
-                    })
-                    seen_positions.add((ent.start_char, ent.end_char))
-
-            # Define regex patterns for temporal expressions
-            temporal_patterns = [
-                # Years (1900s, 2020, etc.)
-                (r'\b(1[6-9]\d{2}|20[0-2]\d)\b', 'YEAR'),
-                # Decades (1950s, 1960's, etc.)
-                (r'\b(1[6-9]\d{2}|20[0-2]\d)s\b', 'DECADE'),
-                # Century markers (19th century, twentieth century)
-                (r'\b(\d{1,2}(?:st|nd|rd|th)\s+century|(?:eighteenth|nineteenth|twentieth|twenty-first)\s+century)\b', 'CENTURY'),
-                # Periods (early/mid/late X)
-                (r'\b(early|mid|late|middle)\s+(1[6-9]\d{2}|20[0-2]\d)s?\b', 'PERIOD'),
-                # Historical periods
-                (r'\b(Industrial Revolution|Renaissance|Victorian era|Cold War|World War (I|II|1|2))\b', 'HISTORICAL_PERIOD'),
-                # Relative time
-                (r'\b(recently|lately|nowadays|currently|presently|historically|traditionally)\b', 'RELATIVE'),
-                # Temporal markers
-                (r'\b(before|after|during|since|until|from|throughout|between)\s+(\d{4}|\d{4}s)\b', 'TEMPORAL_MARKER'),
-            ]
-
-            # Apply regex patterns
-            for pattern, temp_type in temporal_patterns:
-                for match in re.finditer(pattern, text, re.IGNORECASE):
-                    start_pos = match.start()
-                    end_pos = match.end()
-
-                    # Skip if this position is already covered by spaCy
-                    if any(start <= start_pos < end or start < end_pos <= end
-                           for start, end in seen_positions):
-                        continue
-
-                    matched_text = match.group()
-                    normalized = matched_text
-
-                    # Try to normalize specific types
-                    if temp_type in ['YEAR', 'DECADE']:
-                        try:
-                            # Extract year number
-                            year_match = re.search(r'\d{4}', matched_text)
-                            if year_match:
-                                year = int(year_match.group())
-                                if temp_type == 'DECADE':
-                                    normalized = f"{year}-{year+9}"
-                                else:
-                                    normalized = str(year)
-                        except:
-                            pass
-
-                    temporal_expressions.append({
-                        'text': matched_text,
-                        'type': temp_type,
-                        'start': start_pos,
-                        'end': end_pos,
-                        'normalized': normalized,
-                        'confidence': 0.75
-                    })
-                    seen_positions.add((start_pos, end_pos))
+                        pass
+
+                temporal_expressions.append({
+                    'text': matched_text,
+                    'type': temp_type,
+                    'start': start_pos,
+                    'end': end_pos,
+                    'normalized': normalized,
+                    'confidence': 0.75
+                })
+                seen_positions.add(start_pos, end_pos)
 
             # Sort by position in text
             temporal_expressions.sort(key=lambda x: x['start'])
@@ -140,6 +145,7 @@ class RelationshipExtractionTools(ProcessorContext):
                 "expression_types": type_counts,
                 "unique_types": len(type_counts),
                 "method": "spacy_ner_plus_regex",
+                "pattern_stats": pattern_stats,
                 "text_length": len(text)
             }
 
@@ -191,23 +197,9 @@ class RelationshipExtractionTools(ProcessorContext):
             - end: character end position
         """
         try:
-            import spacy
             import re
-
-            # Load spaCy model
-            try:
-                nlp = spacy.load('en_core_web_sm')
-            except OSError:
-                return ProcessingResult(
-                    tool_name="extract_causal",
-                    status="error",
-                    data=[],
-                    metadata={"error": "spaCy model not found. Run: python -m spacy download en_core_web_sm"},
-                    provenance=self._generate_provenance("extract_causal")
-                )
-
-            # Process text
-            doc = nlp(text)
+            from app.services.spacy_annotation_store import SYNTAX_ONLY_EXCLUDE
+            from app.services.windowed_nlp import get_windowed_nlp_runner
 
             causal_relations = []
 
@@ -232,116 +224,134 @@ class RelationshipExtractionTools(ProcessorContext):
                 ]
             }
 
-            # Process sentences
-            for sent in doc.sents:
-                sent_text = sent.text.strip()
-
-                # Pattern 1: Backward causation (Effect because Cause)
-                for marker in causal_markers['backward']:
-                    pattern = r'(.+?)\s+' + re.escape(marker) + r'\s+(.+?)(?:[.;]|$)'
-                    matches = re.finditer(pattern, sent_text, re.IGNORECASE)
-
-                    for match in matches:
-                        effect = match.group(1).strip()
-                        cause = match.group(2).strip()
-
-                        if len(cause) > 10 and len(effect) > 10:  # Filter very short matches
-                            causal_relations.append({
-                                'cause': cause,
-                                'effect': effect,
-                                'marker': marker,
-                                'type': 'backward',
-                                'confidence': 0.75,
-                                'start': sent.start_char + match.start(),
-                                'end': sent.start_char + match.end(),
-                                'sentence': sent_text
-                            })
+            dependency_relations = []
+            sentences_analyzed = 0
 
-                # Pattern 2: Forward causation (Cause therefore Effect)
-                for marker in causal_markers['forward']:
-                    # Build regex pattern
-                    pattern = r'(.+?)\s+' + re.escape(marker) + r'\s+(.+?)(?:[.;]|$)'
-                    matches = re.finditer(pattern, sent_text, re.IGNORECASE)
-
-                    for match in matches:
-                        cause = match.group(1).strip()
-                        effect = match.group(2).strip()
-
-                        if len(cause) > 10 and len(effect) > 10:
-                            causal_relations.append({
-                                'cause': cause,
-                                'effect': effect,
-                                'marker': marker,
-                                'type': 'forward',
-                                'confidence': 0.75,
-                                'start': sent.start_char + match.start(),
-                                'end': sent.start_char + match.end(),
-                                'sentence': sent_text
-                            })
-
-                # Pattern 3: Conditional causation (If Cause then Effect)
-                # Use [^,]+ to greedily match condition up to comma
-                if_then_pattern = r'(?:if|when)\s+([^,]+),\s*(?:then\s+)?(.+?)(?:[.;]|$)'
-                matches = re.finditer(if_then_pattern, sent_text, re.IGNORECASE)
-
-                for match in matches:
-                    condition = match.group(1).strip()
-                    consequence = match.group(2).strip()
-
-                    if len(condition) > 10 and len(consequence) > 10:
-                        causal_relations.append({
-                            'cause': condition,
-                            'effect': consequence,
-                            'marker': 'if-then',
-                            'type': 'conditional',
-                            'confidence': 0.70,
-                            'start': sent.start_char + match.start(),
-                            'end': sent.start_char + match.end(),
-                            'sentence': sent_text
-                        })
-
-            # Use dependency parsing to find additional causal relationships
-            for sent in doc.sents:
-                for token in sent:
-                    # Look for causal dependency relations
-                    if token.dep_ in ['advcl', 'mark'] and token.lower_ in [
-                        'because', 'since', 'if', 'when', 'as'
-                    ]:
-                        # Find the head (main clause) and the dependent clause
-                        head = token.head
-                        dependent_clause = ' '.join([t.text for t in token.subtree])
-                        main_clause = ' '.join([t.text for t in head.subtree if t not in token.subtree])
-
-                        if len(dependent_clause) > 10 and len(main_clause) > 10:
-                            # Determine if it's backward or forward causation
-                            is_backward = token.lower_ in ['because', 'since', 'as']
-
-                            if is_backward:
-                                cause = dependent_clause
-                                effect = main_clause
-                            else:
-                                cause = main_clause
-                                effect = dependent_clause
-
-                            # Check if we already have this relation (avoid duplicates)
-                            is_duplicate = any(
-                                rel['cause'].lower() == cause.lower() and
-                                rel['effect'].lower() == effect.lower()
-                                for rel in causal_relations
-                            )
-
-                            if not is_duplicate:
+            # Long texts are parsed in sentence-aligned windows; offsets are
+            # shifted back to positions in the full text
+            try:
+                windows = get_windowed_nlp_runner().docs(text, exclude=SYNTAX_ONLY_EXCLUDE)
+                for offset, doc in windows:
+                    # Process sentences
+                    for sent in doc.sents:
+                        sentences_analyzed += 1
+                        sent_text = sent.text.strip()
+
+                        # Pattern 1: Backward causation (Effect because Cause)
+                        for marker in causal_markers['backward']:
+                            pattern = r'(.+?)\s+' + re.escape(marker) + r'\s+(.+?)(?:[.;]|$)'
+                            matches = re.finditer(pattern, sent_text, re.IGNORECASE)
+
+                            for match in matches:
+                                effect = match.group(1).strip()
+                                cause = match.group(2).strip()
+
+                                if len(cause) > 10 and len(effect) > 10:  # Filter very short matches
+                                    causal_relations.append({
+                                        'cause': cause,
+                                        'effect': effect,
+                                        'marker': marker,
+                                        'type': 'backward',
+                                        'confidence': 0.75,
+                                        'start': offset + sent.start_char + match.start(),
+                                        'end': offset + sent.start_char + match.end(),
+                                        'sentence': sent_text
+                                    })
+
+                        # Pattern 2: Forward causation (Cause therefore Effect)
+                        for marker in causal_markers['forward']:
+                            # Build regex pattern
+                            pattern = r'(.+?)\s+' + re.escape(marker) + r'\s+(.+?)(?:[.;]|$)'
+                            matches = re.finditer(pattern, sent_text, re.IGNORECASE)
+
+                            for match in matches:
+                                cause = match.group(1).strip()
+                                effect = match.group(2).strip()
+
+                                if len(cause) > 10 and len(effect) > 10:
+                                    causal_relations.append({
+                                        'cause': cause,
+                                        'effect': effect,
+                                        'marker': marker,
+                                        'type': 'forward',
+                                        'confidence': 0.75,
+                                        'start': offset + sent.start_char + match.start(),
+                                        'end': offset + sent.start_char + match.end(),
+                                        'sentence': sent_text
+                                    })
+
+                        # Pattern 3: Conditional causation (If Cause then Effect)
+                        # Use [^,]+ to greedily match condition up to comma
+                        if_then_pattern = r'(?:if|when)\s+([^,]+),\s*(?:then\s+)?(.+?)(?:[.;]|$)'
+                        matches = re.finditer(if_then_pattern, sent_text, re.IGNORECASE)
+
+                        for match in matches:
+                            condition = match.group(1).strip()
+                            consequence = match.group(2).strip()
+
+                            if len(condition) > 10 and len(consequence) > 10:
                                 causal_relations.append({
-                                    'cause': cause,
-                                    'effect': effect,
-                                    'marker': token.text,
-                                    'type': 'dependency',
-                                    'confidence': 0.80,
-                                    'start': sent.start_char,
-                                    'end': sent.end_char,
-                                    'sentence': sent.text
+                                    'cause': condition,
+                                    'effect': consequence,
+                                    'marker': 'if-then',
+                                    'type': 'conditional',
+                                    'confidence': 0.70,
+                                    'start': offset + sent.start_char + match.start(),
+                                    'end': offset + sent.start_char + match.end(),
+                                    'sentence': sent_text
                                 })
 
+                    # Use dependency parsing to find additional causal relationships
+                    for sent in doc.sents:
+                        for token in sent:
+                            # Look for causal dependency relations
+                            if token.dep_ in ['advcl', 'mark'] and token.lower_ in [
+                                'because', 'since', 'if', 'when', 'as'
+                            ]:
+                                # Find the head (main clause) and the dependent clause
+                                head = token.head
+                                dependent_clause = ' '.join([t.text for t in token.subtree])
+                                main_clause = ' '.join([t.text for t in head.subtree if t not in token.subtree])
+
+                                if len(dependent_clause) > 10 and len(main_clause) > 10:
+                                    # Determine if it's backward or forward causation
+                                    is_backward = token.lower_ in ['because', 'since', 'as']
+
+                                    if is_backward:
+                                        cause = dependent_clause
+                                        effect = main_clause
+                                    else:
+                                        cause = main_clause
+                                        effect = dependent_clause
+
+                                    # Deduplicated against all other relations below
+                                    dependency_relations.append({
+                                        'cause': cause,
+                                        'effect': effect,
+                                        'marker': token.text,
+                                        'type': 'dependency',
+                                        'confidence': 0.80,
+                                        'start': offset + sent.start_char,
+                                        'end': offset + sent.end_char,
+                                        'sentence': sent.text
+                                    })
+            except OSError:
+                return ProcessingResult(
+                    tool_name="extract_causal",
+                    status="error",
+                    data=[],
+                    metadata={"error": "spaCy model not found. Run: python -m spacy download en_core_web_sm"},
+                    provenance=self._generate_provenance("extract_causal")
+                )
+
+            # Dependency relations already found by the patterns (or earlier) are dropped
+            seen_relations = {(rel['cause'].lower(), rel['effect'].lower()) for rel in causal_relations}
+            for rel in dependency_relations:
+                key = (rel['cause'].lower(), rel['effect'].lower())
+                if key not in seen_relations:
+                    seen_relations.add(key)
+                    causal_relations.append(rel)
+
             # Sort by position in text
             causal_relations.sort(key=lambda x: x['start'])
 
@@ -356,7 +366,7 @@ class RelationshipExtractionTools(ProcessorContext):
                 "unique_types": len(type_counts),
                 "method": "pattern_matching_plus_dependency_parsing",
                 "text_length": len(text),
-                "sentences_analyzed": len(list(doc.sents))
+                "sentences_analyzed": sentences_analyzed
             }
 
             return ProcessingResult(
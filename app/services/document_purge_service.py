@@ -1,17 +1,196 @@
-"""Administrative purge of all documents and dependent records."""
+"""
+Administrative purge of all documents and dependent records.
+
+The purge runs as a resumable job (``DocumentPurgeJob``). Each step empties
+one dependent table in keyset-ordered batches of ``DOCUMENT_PURGE_BATCH_SIZE``
+rows, committing every batch together with the job's cursor, so no
+transaction holds locks on more than one batch and an interrupted purge
+resumes where it stopped. Files are unlinked only after the batch that
+deleted their documents has committed; their paths are saved on the job
+first, so a crash between commit and unlink cannot orphan them.
+
+With ``DOCUMENT_PURGE_BACKGROUND`` enabled the job runs in a Celery worker
+and the request returns immediately; otherwise it runs inline.
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy import text
 
 from app import db
 from app.models import Experiment
 from app.models.document import Document
-from app.models.experiment_document import ExperimentDocument
-from app.models.experiment_processing import (
-    ExperimentDocumentProcessing,
-    ProcessingArtifact,
+from app.models.document_purge_job import DocumentPurgeJob
+
+# A running job not updated for this long is assumed dead and resumed
+STALE_JOB_AFTER = timedelta(minutes=5)
+
+
+@dataclass(frozen=True)
+class PurgeStep:
+    """One table emptied (or updated) in keyset-ordered batches."""
+
+    name: str
+    table: str
+    key: Tuple[str, ...] = ('id',)
+    where: Optional[str] = None
+    update: Optional[str] = None  # SET clause; the step updates instead of deleting
+    file_column: Optional[str] = None  # Column holding a file to unlink after commit
+
+
+# Cross-table FK order: dependents first, documents last
+DOCUMENT_PURGE_STEPS: Tuple[PurgeStep, ...] = (
+    PurgeStep('provenance_entities', 'provenance_entities', where='document_id IS NOT NULL'),
+    PurgeStep('processing_artifacts', 'processing_artifacts'),
+    PurgeStep('processing_artifact_groups', 'processing_artifact_groups'),
+    PurgeStep('document_processing_index', 'document_processing_index'),
+    PurgeStep('experiment_document_processing', 'experiment_document_processing'),
+    PurgeStep('experiment_documents_v2', 'experiment_documents_v2'),
+    PurgeStep('experiment_references', 'experiment_references', key=('experiment_id', 'reference_id')),
+    PurgeStep('semantic_event_documents', 'semantic_event_documents', key=('semantic_event_id', 'document_id')),
+    PurgeStep('orchestration_decisions', 'orchestration_decisions'),
+    PurgeStep('version_changelog', 'version_changelog'),
+    PurgeStep('document_temporal_metadata', 'document_temporal_metadata'),
+    PurgeStep('term_disciplinary_definitions', 'term_disciplinary_definitions'),
+    PurgeStep('semantic_shift_analysis', 'semantic_shift_analysis'),
+    # Self-referencing rows are detached first: a parent's batch may precede its child's
+    PurgeStep(
+        'detach_processing_jobs', 'processing_jobs',
+        where='parent_job_id IS NOT NULL', update='parent_job_id = NULL',
+    ),
+    PurgeStep('processing_jobs', 'processing_jobs'),
+    PurgeStep(
+        'detach_text_segments', 'text_segments',
+        where='parent_segment_id IS NOT NULL', update='parent_segment_id = NULL',
+    ),
+    PurgeStep('text_segments', 'text_segments'),
+    PurgeStep(
+        'detach_document_versions', 'documents',
+        where='source_document_id IS NOT NULL OR parent_document_id IS NOT NULL',
+        update='source_document_id = NULL, parent_document_id = NULL',
+    ),
+    PurgeStep('documents', 'documents', file_column='file_path'),
 )
-from app.models.processing_job import ProcessingJob
-from app.models.provenance import ProvenanceEntity
+
+
+def _json_key(values: Sequence[Any]) -> List[Any]:
+    return [value if isinstance(value, (int, float, str)) or value is None else str(value) for value in values]
+
+
+class DocumentPurgeEngine:
+    """Run ``PurgeStep``s for a ``DocumentPurgeJob`` in bounded, resumable batches."""
+
+    def __init__(self, steps: Sequence[PurgeStep] = DOCUMENT_PURGE_STEPS, logger=None):
+        self.steps = tuple(steps)
+        self.logger = logger
+
+    def run(self, job: DocumentPurgeJob) -> DocumentPurgeJob:
+        """Run (or resume) a job to completion; marks it failed and re-raises on error."""
+        if job.status == 'completed':
+            return job
+        job.status = 'running'
+        job.started_at = job.started_at or datetime.utcnow()
+        job.error_message = None
+        self._touch(job)
+        db.session.commit()
+        try:
+            self._unlink_pending(job)
+            self._align_step_index(job)
+            while job.step_index < len(self.steps):
+                self._run_step(job, self.steps[job.step_index])
+                job.step_index += 1
+                job.cursor = None
+                self._touch(job)
+                db.session.commit()
+            job.status = 'completed'
+            job.step = None
+            job.completed_at = datetime.utcnow()
+            self._touch(job)
+            db.session.commit()
+            return job
+        except Exception as exc:
+            db.session.rollback()
+            job = db.session.get(DocumentPurgeJob, job.id)
+            if job is not None:
+                job.status = 'failed'
+                job.error_message = str(exc)
+                self._touch(job)
+                db.session.commit()
+            raise
+
+    def _align_step_index(self, job: DocumentPurgeJob) -> None:
+        """Resume by step name, in case steps were added since the job was interrupted."""
+        names = [step.name for step in self.steps]
+        if job.step in names and names.index(job.step) != job.step_index:
+            job.step_index = names.index(job.step)
+
+    def _run_step(self, job: DocumentPurgeJob, step: PurgeStep) -> None:
+        job.step = step.name
+        while True:
+            rows = self._run_batch(step, job.cursor, job.batch_size)
+            if rows:
+                job.cursor = _json_key(max(tuple(row[:len(step.key)]) for row in rows))
+                job.counts = dict(job.counts or {}, **{step.name: (job.counts or {}).get(step.name, 0) + len(rows)})
+            if step.file_column:
+                job.pending_files = [row[-1] for row in rows if row[-1]]
+            self._touch(job)
+            db.session.commit()
+            self._log(f"Purge {job.id}: {step.name} +{len(rows)} rows")
+
+            # File IO happens after the batch's transaction has committed
+            self._unlink_pending(job)
+            if len(rows) < job.batch_size:
+                return
+
+    @staticmethod
+    def _run_batch(step: PurgeStep, cursor: Optional[List[Any]], batch_size: int):
+        keys = ', '.join(step.key)
+        conditions = [f"({step.where})"] if step.where else []
+        params: Dict[str, Any] = {'batch_size': batch_size}
+        if cursor is not None:
+            placeholders = ', '.join(f":cursor_{i}" for i in range(len(step.key)))
+            conditions.append(f"({keys}) > ({placeholders})")
+            params.update({f"cursor_{i}": value for i, value in enumerate(cursor)})
+        batch = (
+            f"SELECT {keys} FROM {step.table} WHERE {' AND '.join(conditions) or 'TRUE'} "
+            f"ORDER BY {keys} LIMIT :batch_size"
+        )
+        returning = keys + (f", {step.file_column}" if step.file_column else '')
+        if step.update:
+            sql = f"UPDATE {step.table} SET {step.update} WHERE ({keys}) IN ({batch}) RETURNING {returning}"
+        else:
+            sql = f"DELETE FROM {step.table} WHERE ({keys}) IN ({batch}) RETURNING {returning}"
+        return db.session.execute(text(sql), params).fetchall()
+
+    def _unlink_pending(self, job: DocumentPurgeJob) -> None:
+        if not job.pending_files:
+            return
+        deleted = failed = 0
+        for path in job.pending_files:
+            try:
+                os.remove(path)
+                deleted += 1
+            except FileNotFoundError:
+                deleted += 1  # Already gone (e.g. unlinked before an interruption)
+            except OSError as exc:
+                failed += 1
+                self._log(f"Error deleting file {path}: {exc}", error=True)
+        job.files_deleted += deleted
+        job.files_failed += failed
+        job.pending_files = []
+        self._touch(job)
+        db.session.commit()
+
+    @staticmethod
+    def _touch(job: DocumentPurgeJob) -> None:
+        job.updated_at = datetime.utcnow()
+
+    def _log(self, message: str, error: bool = False) -> None:
+        if self.logger is not None:
+            (self.logger.error if error else self.logger.debug)(message)
 
 
 class DocumentPurgeService:
@@ -22,7 +201,8 @@ class DocumentPurgeService:
         db.session.rollback()
 
     @staticmethod
-    def purge_all(user_id, logger):
+    def referencing_experiments_error():
+        """409 result when experiments still reference documents, else None."""
         experiments = db.session.execute(text('''
             SELECT DISTINCT e.id, e.name
             FROM experiments e
@@ -36,82 +216,100 @@ class DocumentPurgeService:
             LIMIT 5
         ''')).fetchall()
 
-        if experiments:
-            total = Experiment.query.count()
-            names = ', '.join(f'"{exp.name}"' for exp in experiments[:3])
-            if len(experiments) > 3:
-                names += f' and {total - 3} more'
-            return {
-                'success': False,
-                'status': 409,
-                'error': (
-                    f'Cannot delete documents: {total} experiment(s) still '
-                    f'reference documents. Please delete experiments first: {names}'
-                ),
-                'experiments': [
-                    {'id': exp.id, 'name': exp.name} for exp in experiments
-                ],
-            }
-
-        total_documents = Document.query.count()
-        logger.warning(
-            f"Admin {user_id} initiating deletion of ALL {total_documents} documents"
-        )
+        if not experiments:
+            return None
+        total = Experiment.query.count()
+        names = ', '.join(f'"{exp.name}"' for exp in experiments[:3])
+        if len(experiments) > 3:
+            names += f' and {total - 3} more'
+        return {
+            'success': False,
+            'status': 409,
+            'error': (
+                f'Cannot delete documents: {total} experiment(s) still '
+                f'reference documents. Please delete experiments first: {names}'
+            ),
+            'experiments': [
+                {'id': exp.id, 'name': exp.name} for exp in experiments
+            ],
+        }
 
-        provenance_count = ProvenanceEntity.query.filter(
-            ProvenanceEntity.document_id.isnot(None)
-        ).count()
-        ProvenanceEntity.query.filter(
-            ProvenanceEntity.document_id.isnot(None)
-        ).delete(synchronize_session=False)
-
-        artifact_count = ProcessingArtifact.query.count()
-        ProcessingArtifact.query.delete(synchronize_session=False)
-        db.session.execute(text('DELETE FROM processing_artifact_groups'))
-        db.session.execute(text('DELETE FROM document_processing_index'))
-        ExperimentDocumentProcessing.query.delete(synchronize_session=False)
-
-        experiment_relationships = ExperimentDocument.query.count()
-        ExperimentDocument.query.delete(synchronize_session=False)
-        db.session.execute(text('DELETE FROM experiment_documents_v2'))
-        db.session.execute(text('DELETE FROM experiment_references'))
-        db.session.execute(text('DELETE FROM orchestration_decisions'))
-        db.session.execute(text('DELETE FROM version_changelog'))
-        db.session.execute(text('DELETE FROM document_temporal_metadata'))
-        db.session.execute(text('DELETE FROM term_disciplinary_definitions'))
-        db.session.execute(text('DELETE FROM semantic_shift_analysis'))
-        ProcessingJob.query.delete(synchronize_session=False)
-        db.session.execute(text('DELETE FROM text_segments'))
-
-        documents = Document.query.all()
-        deleted_files = 0
-        for document in documents:
-            try:
-                document.delete_file()
-                deleted_files += 1
-            except Exception as exc:
-                logger.error(
-                    f"Error deleting file for document {document.id}: {exc}"
-                )
-
-        db.session.execute(text(
-            'UPDATE documents '
-            'SET source_document_id = NULL, parent_document_id = NULL'
-        ))
-        Document.query.delete(synchronize_session=False)
-        db.session.commit()
+    @classmethod
+    def start_purge(cls, user_id, logger, background=True, batch_size=1000):
+        """
+        Start (or resume) the purge of all documents.
+
+        An unfinished job is resumed rather than starting a new one; a job
+        still actively running in a worker is only reported.
+
+        Returns:
+            409 result if experiments reference documents; with ``background``
+            a 202 result carrying the job; otherwise the completed purge
+            details
+        """
+        blocked = cls.referencing_experiments_error()
+        if blocked:
+            return blocked
 
+        job = DocumentPurgeJob.query.filter(
+            DocumentPurgeJob.status.in_(['pending', 'running', 'failed'])
+        ).order_by(DocumentPurgeJob.created_at.desc()).first()
+        if job is not None and job.status == 'running' and (
+            datetime.utcnow() - job.updated_at < STALE_JOB_AFTER
+        ):
+            return {'success': True, 'status': 202, 'job': job.to_dict()}
+
+        if job is None:
+            job = DocumentPurgeJob(
+                requested_by=user_id,
+                batch_size=batch_size,
+                total_documents=Document.query.count(),
+                counts={},
+                pending_files=[],
+            )
+            db.session.add(job)
+            db.session.commit()
+            logger.warning(
+                f"Admin {user_id} initiating deletion of ALL {job.total_documents} documents (job {job.id})"
+            )
+        else:
+            logger.warning(f"Admin {user_id} resuming document purge job {job.id} ({job.status})")
+
+        if background:
+            from app.tasks.purge import run_document_purge_task
+
+            task = run_document_purge_task.delay(str(job.id))
+            job.celery_task_id = task.id
+            db.session.commit()
+            return {'success': True, 'status': 202, 'job': job.to_dict()}
+
+        job = DocumentPurgeEngine(logger=logger).run(job)
+        return cls._completed_result(job, logger)
+
+    @classmethod
+    def purge_all(cls, user_id, logger):
+        """Purge all documents inline (see ``start_purge``)."""
+        return cls.start_purge(user_id, logger, background=False)
+
+    @staticmethod
+    def get_job(job_id):
+        return db.session.get(DocumentPurgeJob, job_id)
+
+    @staticmethod
+    def _completed_result(job, logger):
+        counts = job.counts or {}
         logger.warning(
-            f"Successfully deleted ALL documents: {total_documents} documents, "
-            f"{deleted_files} files, {provenance_count} provenance records"
+            f"Successfully deleted ALL documents: {counts.get('documents', 0)} documents, "
+            f"{job.files_deleted} files, {counts.get('provenance_entities', 0)} provenance records"
         )
         return {
             'success': True,
             'details': {
-                'documents': total_documents,
-                'files': deleted_files,
-                'provenance_records': provenance_count,
-                'processing_artifacts': artifact_count,
-                'experiment_relationships': experiment_relationships,
+                'documents': counts.get('documents', 0),
+                'files': job.files_deleted,
+                'provenance_records': counts.get('provenance_entities', 0),
+                'processing_artifacts': counts.get('processing_artifacts', 0),
+                'experiment_relationships': counts.get('experiment_documents_v2', 0),
             },
+            'job': job.to_dict(),
         }
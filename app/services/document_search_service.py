@@ -0,0 +1,269 @@
+"""
+Ranked full-text search over documents and references.
+
+Queries run against the GIN-indexed, trigger-maintained
+``documents.search_vector`` (see ``app.models.document_search``) instead of
+loading and scanning content in Python. Only the top hits get
+``ts_headline`` snippets, and each snippet comes with the character offsets
+of its highlighted matches in the document content.
+
+Query strings use ``websearch_to_tsquery`` syntax (``"exact phrase"``,
+``or``, ``-excluded``). On databases other than PostgreSQL, and for queries
+made only of stop words (which parse to an empty tsquery), the service falls
+back to a case-insensitive substring match (no ranking).
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, func, text
+
+from app import db
+from app.models.document import Document
+from app.models.document_search import SEARCH_MAX_CHARS, historical_variants, search_config_function_sql
+from app.models.experiment_corpus import ExperimentCorpusMember
+
+# Highlight markers and fragment delimiter: control characters that do not
+# occur in extracted text, so snippets can be mapped back onto the content
+_START, _STOP, _DELIMITER = '\x02', '\x03', '\x1e'
+
+_CONFIG_NAME = re.compile(r'^[a-z_][a-z0-9_.]*$')
+
+
+@dataclass
+class SearchHit:
+    """One ranked document match."""
+
+    document_id: int
+    title: str
+    rank: float
+    snippets: List[str] = field(default_factory=list)
+    # (start, end) character offsets of each highlighted match in the content
+    offsets: List[Tuple[int, int]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'document_id': self.document_id,
+            'title': self.title,
+            'rank': self.rank,
+            'snippets': self.snippets,
+            'offsets': [list(offset) for offset in self.offsets],
+        }
+
+
+def _map_headline(headline: str, positions: List[int]) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split a marked-up headline into plain snippets and the content offsets of
+    its highlights, given each fragment's 1-based position in the content
+    (0 when not found).
+    """
+    snippets, offsets = [], []
+    for fragment, found_at in zip((headline or '').split(_DELIMITER), positions or []):
+        plain = fragment.replace(_START, '').replace(_STOP, '')
+        if not plain.strip():
+            continue
+        snippets.append(plain.strip())
+        if not found_at:
+            continue
+        base, position, start = found_at - 1, 0, None
+        for char in fragment:
+            if char == _START:
+                start = position
+            elif char == _STOP:
+                if start is not None:
+                    offsets.append((base + start, base + position))
+                start = None
+            else:
+                position += 1
+    return snippets, sorted(set(offsets))
+
+
+class DocumentSearchService:
+    """Ranked document search with snippets over the full-text index."""
+
+    def search(
+        self,
+        query: str,
+        document_ids: Optional[Iterable[int]] = None,
+        experiment_id: Optional[int] = None,
+        role: Optional[str] = None,
+        document_type: Optional[str] = None,
+        limit: Optional[int] = 20,
+        headlines: bool = True,
+        max_fragments: int = 3,
+    ) -> List[SearchHit]:
+        """
+        Find documents matching ``query``, best first.
+
+        Args:
+            query: Search terms (websearch syntax)
+            document_ids: Restrict to these documents
+            experiment_id: Restrict to this experiment's corpus
+            role: With ``experiment_id``, 'document' or 'reference'
+            document_type: Restrict to 'document' or 'reference'
+            limit: Maximum hits (None for all)
+            headlines: Compute snippets and offsets for the hits
+            max_fragments: Snippets per hit
+
+        Returns:
+            List of SearchHit ordered by rank
+        """
+        query = (query or '').strip()
+        if not query:
+            return []
+        if document_ids is not None:
+            document_ids = list(document_ids)
+            if not document_ids:
+                return []
+        if db.session.get_bind().dialect.name != 'postgresql' or not self._has_lexemes(query):
+            return self._substring_search(query, document_ids, experiment_id, role, document_type, limit)
+
+        tsquery = func.ontextract_search_query(func.ontextract_search_config(), query)
+        rank = func.ts_rank_cd(Document.search_vector, tsquery, 32).label('rank')
+        rows = self._filtered(
+            db.session.query(Document.id, Document.title, rank).filter(Document.search_vector.op('@@')(tsquery)),
+            document_ids, experiment_id, role, document_type,
+        ).order_by(rank.desc(), Document.id).limit(limit).all()
+
+        hits = [SearchHit(row.id, row.title, float(row.rank)) for row in rows]
+        if headlines and hits:
+            self._add_headlines(hits, query, max_fragments)
+        return hits
+
+    def matching_ids(self, query: str, **filters) -> List[int]:
+        """
+        Ids of all documents matching ``query``, best first.
+
+        Content past ``SEARCH_MAX_CHARS`` is not indexed; documents whose
+        unindexed tail contains every query word follow the ranked hits.
+        """
+        filters.setdefault('limit', None)
+        ids = [hit.document_id for hit in self.search(query, headlines=False, **filters)]
+        if db.session.get_bind().dialect.name == 'postgresql' and self._has_lexemes(query):
+            ids.extend(self._tail_matches(query, ids, **filters))
+        return ids if filters['limit'] is None else ids[:filters['limit']]
+
+    def reindex(self, config: Optional[str] = None, batch_size: int = 500) -> int:
+        """
+        Recompute every document's search vector, optionally switching the
+        text search configuration first (e.g. 'english', 'simple',
+        'ontextract_historical'). Commits per batch; returns rows updated.
+        """
+        if config:
+            if not _CONFIG_NAME.match(config):
+                raise ValueError(f'Invalid text search configuration name: {config}')
+            db.session.execute(text('SELECT CAST(:config AS regconfig)'), {'config': config})
+            db.session.execute(text(search_config_function_sql(config)))
+            db.session.commit()
+
+        updated, last_id = 0, 0
+        statement = text(
+            "UPDATE documents SET search_vector = "
+            "ontextract_search_vector(ontextract_search_config(), title, content) "
+            "WHERE id IN (SELECT id FROM documents WHERE id > :last_id ORDER BY id LIMIT :batch_size) "
+            "RETURNING id"
+        )
+        while True:
+            ids = [row[0] for row in db.session.execute(statement, {'last_id': last_id, 'batch_size': batch_size})]
+            db.session.commit()
+            if not ids:
+                return updated
+            updated += len(ids)
+            last_id = max(ids)
+
+    @staticmethod
+    def _filtered(query, document_ids, experiment_id, role, document_type):
+        if document_ids is not None:
+            query = query.filter(Document.id.in_(document_ids))
+        if document_type:
+            query = query.filter(Document.document_type == document_type)
+        if experiment_id is not None:
+            query = query.join(ExperimentCorpusMember, ExperimentCorpusMember.document_id == Document.id).filter(
+                ExperimentCorpusMember.experiment_id == experiment_id
+            )
+            if role:
+                query = query.filter(ExperimentCorpusMember.role == role)
+        return query
+
+    @staticmethod
+    def _add_headlines(hits: List[SearchHit], query: str, max_fragments: int) -> None:
+        # Headlines run on the raw content, which the folded query cannot
+        # highlight where the folding changed a spelling; the raw query and
+        # the historical variants of its words (music -> musick) cover those.
+        # Fragment positions are found in SQL so content stays there
+        statement = text(
+            "SELECT h.id, h.headline, ARRAY("
+            "  SELECT strpos(h.body, translate(f.fragment, chr(2) || chr(3), '')) "
+            "  FROM unnest(string_to_array(h.headline, chr(30))) WITH ORDINALITY AS f(fragment, n) ORDER BY n"
+            ") AS positions "
+            "FROM (SELECT id, left(content, :max_chars) AS body, ts_headline("
+            "  ontextract_search_config(), left(content, :max_chars), "
+            "  ontextract_search_query(ontextract_search_config(), :query) "
+            "  || websearch_to_tsquery(ontextract_search_config(), :query) "
+            "  || websearch_to_tsquery(ontextract_search_config(), :variants), "
+            "  :options) AS headline "
+            "  FROM documents WHERE id IN :ids AND content IS NOT NULL) AS h"
+        ).bindparams(bindparam('ids', expanding=True))
+        options = (
+            f'StartSel={_START}, StopSel={_STOP}, FragmentDelimiter={_DELIMITER}, '
+            f'MaxFragments={max_fragments}, MaxWords=35, MinWords=15'
+        )
+        rows = db.session.execute(statement, {
+            'max_chars': SEARCH_MAX_CHARS, 'query': query, 'options': options,
+            'variants': ' or '.join(historical_variants(query)),
+            'ids': [hit.document_id for hit in hits],
+        })
+        by_id = {hit.document_id: hit for hit in hits}
+        for row in rows:
+            by_id[row.id].snippets, by_id[row.id].offsets = _map_headline(row.headline, row.positions)
+
+    @staticmethod
+    def _has_lexemes(query: str) -> bool:
+        return bool(db.session.execute(
+            text("SELECT numnode(ontextract_search_query(ontextract_search_config(), :query)) > 0"),
+            {'query': query},
+        ).scalar())
+
+    @staticmethod
+    def _tail_matches(query, exclude, document_ids=None, experiment_id=None, role=None,
+                      document_type=None, limit=None) -> List[int]:
+        tail = func.substr(Document.content, SEARCH_MAX_CHARS + 1)
+        terms = [term for term in re.findall(r'\w+', query.lower()) if term]
+        rows = DocumentSearchService._filtered(
+            db.session.query(Document.id).filter(
+                func.length(Document.content) > SEARCH_MAX_CHARS,
+                Document.id.notin_(exclude or [-1]),
+                *[tail.ilike(f'%{term}%') for term in terms]
+            ),
+            document_ids, experiment_id, role, document_type,
+        ).order_by(Document.id).limit(limit).all()
+        return [row.id for row in rows]
+
+    @staticmethod
+    def _substring_search(query, document_ids, experiment_id, role, document_type, limit):
+        terms = [term for term in re.findall(r'\w+', query.lower()) if term]
+        documents = DocumentSearchService._filtered(
+            Document.query.filter(*[Document.content.ilike(f'%{term}%') for term in terms]),
+            document_ids, experiment_id, role, document_type,
+        ).order_by(Document.id).limit(limit).all()
+        hits = []
+        for document in documents:
+            lowered = document.content.lower()
+            offsets = sorted(
+                (match.start(), match.end())
+                for term in terms for match in re.finditer(re.escape(term), lowered)
+            )
+            hits.append(SearchHit(document.id, document.title, 1.0, offsets=offsets))
+        return hits
+
+
+_document_search_service = None
+
+
+def get_document_search_service() -> DocumentSearchService:
+    """Return the process-wide document search service instance."""
+    global _document_search_service
+    if _document_search_service is None:
+        _document_search_service = DocumentSearchService()
+    return _document_search_service
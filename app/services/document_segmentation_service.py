@@ -2,8 +2,7 @@
 
 from app import db
 from app.models.document import Document
-from app.models.experiment import Experiment, experiment_documents
-from app.models.experiment_document import ExperimentDocument
+from app.models.experiment import Experiment
 from app.models.processing_job import ProcessingJob
 from app.models.text_segment import TextSegment
 from app.models.user import User
@@ -13,6 +12,7 @@ from app.services.base_service import (
     ServiceError,
     ValidationError,
 )
+from app.services.experiment_corpus_service import ExperimentCorpusService
 from app.services.inheritance_versioning_service import InheritanceVersioningService
 
 
@@ -169,27 +169,11 @@ class DocumentSegmentationService:
 
     @staticmethod
     def _family_is_linked(experiment_id, document):
-        root = document.get_root_document()
-        family_ids = [root.id]
-        family_ids.extend(
-            version.id
-            for version in Document.query.filter_by(
-                source_document_id=root.id
-            ).all()
-        )
         if document.experiment_id == experiment_id:
             return True
-        if ExperimentDocument.query.filter(
-            ExperimentDocument.experiment_id == experiment_id,
-            ExperimentDocument.document_id.in_(family_ids),
-        ).first():
-            return True
-        return db.session.execute(
-            db.select(experiment_documents.c.document_id).where(
-                experiment_documents.c.experiment_id == experiment_id,
-                experiment_documents.c.document_id.in_(family_ids),
-            ).limit(1)
-        ).first() is not None
+        return ExperimentCorpusService.family_is_linked(
+            experiment_id, document.get_root_document().id
+        )
 
     @staticmethod
     def _can_edit_document(actor, document):
@@ -15,7 +15,6 @@ from sqlalchemy import func
 
 from app import db
 from app.models import Experiment
-from app.models.experiment_document import ExperimentDocument
 from app.models.term import Term
 from app.models.user import User
 from app.services.base_service import (
@@ -25,6 +24,7 @@ from app.services.base_service import (
     ServiceError,
     ValidationError,
 )
+from app.services.experiment_corpus_service import ExperimentCorpusService
 
 logger = logging.getLogger(__name__)
 
@@ -301,37 +301,14 @@ class EvolutionService(BaseService):
 
     @staticmethod
     def _analysis_documents(experiment):
-        associations = ExperimentDocument.query.filter_by(
-            experiment_id=experiment.id
-        ).all()
-        families = {}
-        for association in associations:
-            document = association.document
-            root_id = document.source_document_id or document.id
-            families.setdefault(root_id, []).append(document)
-        documents = [
-            max(
-                family,
-                key=lambda item: (item.version_number or 0, item.id),
-            )
-            for family in families.values()
-        ]
-        if not associations:
-            documents.extend(list(experiment.documents))
-        seen = {document.id for document in documents}
-        for reference in experiment.references:
-            if reference.id not in seen:
-                seen.add(reference.id)
-                documents.append(reference)
-        documents.sort(key=lambda item: item.id)
-        return documents
+        return ExperimentCorpusService.analysis_documents(experiment.id)
 
     @staticmethod
     def _default_temporal_service():
-        from shared_services.ontology.ontology_importer import OntologyImporter
+        from shared_services.ontology.ontology_importer import get_ontology_importer
         from shared_services.temporal import TemporalAnalysisService
 
-        return TemporalAnalysisService(OntologyImporter())
+        return TemporalAnalysisService(get_ontology_importer())
 
     def _get_term_versions(self, term_id: int) -> List:
         """
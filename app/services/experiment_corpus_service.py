@@ -0,0 +1,101 @@
+"""Query API over the trigger-maintained experiment corpus membership table."""
+
+from sqlalchemy import and_, exists, or_, select, text
+
+from app import db
+from app.models import Document, ExperimentDocument
+from app.models.experiment_corpus import ExperimentCorpusMember
+
+
+class ExperimentCorpusService:
+    """Resolve an experiment's documents, versions and references in one query."""
+
+    @staticmethod
+    def members(experiment_id, role=None, latest_only=False):
+        """
+        Query corpus rows joined to their documents.
+
+        Args:
+            experiment_id: Experiment to resolve
+            role: 'document' or 'reference' to restrict the role
+            latest_only: Only the latest associated version of each family
+
+        Returns:
+            Query yielding ``(ExperimentCorpusMember, Document)`` ordered by document id
+        """
+        query = db.session.query(ExperimentCorpusMember, Document).join(
+            Document, Document.id == ExperimentCorpusMember.document_id
+        ).filter(ExperimentCorpusMember.experiment_id == experiment_id)
+        if role:
+            query = query.filter(ExperimentCorpusMember.role == role)
+        if latest_only:
+            query = query.filter(ExperimentCorpusMember.is_latest.is_(True))
+        return query.order_by(Document.id)
+
+    @classmethod
+    def documents(cls, experiment_id, role=None, latest_only=False):
+        return [document for _, document in cls.members(experiment_id, role, latest_only)]
+
+    @classmethod
+    def documents_and_references(cls, experiment_id):
+        """All linked documents and references, each ordered by id."""
+        documents, references = [], []
+        for member, document in cls.members(experiment_id):
+            (references if member.role == 'reference' else documents).append(document)
+        return documents, references
+
+    @staticmethod
+    def latest_associations(experiment_id):
+        """``(ExperimentDocument, Document)`` for the latest associated version of each family."""
+        return db.session.query(ExperimentDocument, Document).join(
+            ExperimentCorpusMember,
+            ExperimentCorpusMember.experiment_document_id == ExperimentDocument.id,
+        ).join(
+            Document, Document.id == ExperimentDocument.document_id
+        ).filter(
+            ExperimentCorpusMember.experiment_id == experiment_id,
+            ExperimentCorpusMember.is_latest.is_(True),
+        ).order_by(Document.id).all()
+
+    @staticmethod
+    def analysis_documents(experiment_id):
+        """
+        Documents an analysis runs over: the latest associated version of each
+        family (or the legacy links when the experiment has no associations)
+        plus every reference.
+        """
+        member = ExperimentCorpusMember
+        has_associations = exists().where(
+            member.experiment_id == experiment_id,
+            member.experiment_document_id.isnot(None),
+        )
+        return Document.query.join(
+            member, member.document_id == Document.id
+        ).filter(
+            member.experiment_id == experiment_id,
+            or_(
+                member.is_latest.is_(True),
+                member.role == 'reference',
+                and_(member.legacy.is_(True), ~has_associations),
+            ),
+        ).order_by(Document.id).all()
+
+    @staticmethod
+    def family_is_linked(experiment_id, root_document_id):
+        """Whether any version of the family rooted at ``root_document_id`` is linked."""
+        member = ExperimentCorpusMember
+        return db.session.execute(
+            select(member.document_id).where(
+                member.experiment_id == experiment_id,
+                member.root_document_id == root_document_id,
+                or_(member.experiment_document_id.isnot(None), member.legacy.is_(True)),
+            ).limit(1)
+        ).first() is not None
+
+    @staticmethod
+    def refresh(experiment_ids):
+        """Recompute membership for experiments (repair or backfill; triggers keep it current)."""
+        db.session.execute(
+            text('SELECT refresh_experiment_corpus(CAST(:ids AS integer[]))'),
+            {'ids': list(experiment_ids)},
+        )
@@ -14,6 +14,7 @@ from app.models.experiment_processing import (
     ProcessingArtifact,
 )
 from app.services.base_service import NotFoundError
+from app.services.experiment_corpus_service import ExperimentCorpusService
 
 
 logger = logging.getLogger(__name__)
@@ -33,8 +34,7 @@ class ExperimentDetailReadService:
     @classmethod
     def get_detail_context(cls, experiment_id):
         experiment = cls._get_experiment(experiment_id)
-        experiment_documents = cls._experiment_documents(experiment_id)
-        latest_documents = cls._latest_family_members(experiment_documents)
+        latest_documents = ExperimentCorpusService.latest_associations(experiment_id)
         processing_summary = cls._artifact_summary(experiment_id)
         context = {
             'experiment': experiment,
@@ -54,8 +54,7 @@ class ExperimentDetailReadService:
     @classmethod
     def get_manual_results_context(cls, experiment_id):
         experiment = cls._get_experiment(experiment_id)
-        experiment_documents = cls._experiment_documents(experiment_id)
-        latest_documents = cls._latest_family_members(experiment_documents)
+        latest_documents = ExperimentCorpusService.latest_associations(experiment_id)
         processing_summary = cls._artifact_summary(experiment_id)
         return {
             'experiment': experiment,
@@ -82,28 +81,6 @@ class ExperimentDetailReadService:
             raise NotFoundError(f'Experiment {experiment_id} not found')
         return experiment
 
-    @staticmethod
-    def _experiment_documents(experiment_id):
-        return ExperimentDocument.query.filter_by(
-            experiment_id=experiment_id
-        ).all()
-
-    @staticmethod
-    def _latest_family_members(experiment_documents):
-        families = {}
-        for association in experiment_documents:
-            document = association.document
-            root_id = document.source_document_id or document.id
-            families.setdefault(root_id, []).append((association, document))
-        latest = []
-        for family in families.values():
-            latest.append(max(
-                family,
-                key=lambda item: (item[1].version_number or 0, item[1].id),
-            ))
-        latest.sort(key=lambda item: item[1].id)
-        return latest
-
     @classmethod
     def _artifact_summary(cls, experiment_id):
         counts = db.session.query(
@@ -1,8 +1,76 @@
+import copy
+import hashlib
 import json
-from collections import defaultdict
-from typing import Dict, List, Tuple, Any
+import logging
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
 
 from app.models.document import Document
+from app.services.anchor_embedding_index import model_key
+
+logger = logging.getLogger(__name__)
+
+AGGREGATIONS = ("concatenated", "centroid", "mean_pairwise")
+
+# Model names that stand for random vectors; results computed with them are never cached
+_UNCACHEABLE_MODEL_PREFIXES = ("fallback:",)
+
+
+class DomainComparisonCache:
+    """Bounded in-process cache of domain-comparison results, keyed by input hash."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Args:
+            max_entries: Results kept (``DOMAIN_COMPARISON_CACHE_SIZE``, default 32)
+        """
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.environ.get("DOMAIN_COMPARISON_CACHE_SIZE", 32)
+        )
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        results, summary = entry
+        return copy.deepcopy(results), summary
+
+    def put(self, key: str, results: Dict[str, Any], summary: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (copy.deepcopy(results), summary)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_domain_comparison_cache: Optional[DomainComparisonCache] = None
+
+
+def get_domain_comparison_cache() -> DomainComparisonCache:
+    """
+    Get the process-wide domain-comparison result cache.
+
+    Returns:
+        The shared DomainComparisonCache instance
+    """
+    global _domain_comparison_cache
+    if _domain_comparison_cache is None:
+        _domain_comparison_cache = DomainComparisonCache()
+    return _domain_comparison_cache
 
 
 class DomainComparisonService:
@@ -15,18 +83,23 @@ class DomainComparisonService:
           "target_terms": ["ontology", "agent"],
           "discipline_assignments": { "Philosophy": [docId, ...], "Engineering": [docId, ...] },
           "discipline_fallback": "journal|context|none",
+          "similarity_aggregation": "concatenated|centroid|mean_pairwise",
           "design": {
             "type": "experimental|quasi-experimental|survey|observational",
             "variables": {"independent": [{"name": str, "levels": [str, ...]}]},
             "groups": [{"name": str}]
           }
         }
-      Defaults: target_terms -> ["ontology", "agent"].
+      Defaults: target_terms -> ["ontology", "agent"], similarity_aggregation -> "concatenated".
       If no design grouping is provided, will group by disciplines inferred from metadata.
     - Scope: All experiment.references are considered.
-    - Output: (results_dict, human_summary)
+    - Output: (results_dict, human_summary); results are cached against a hash
+      of the configuration, the references' content and the embedding model.
     """
 
+    def __init__(self, cache: Optional[DomainComparisonCache] = None):
+        self.cache = cache or get_domain_comparison_cache()
+
     def run(self, experiment, text_service) -> Tuple[Dict[str, Any], str]:
         # Parse configuration
         try:
@@ -120,23 +193,17 @@ class DomainComparisonService:
                     per_term_data[term][bucket_name] = entries
 
         # Compute similarity matrices per term across buckets
-        similarity_matrices: Dict[str, Dict[str, Dict[str, float]]] = {}
-        for term, bucket_entries in per_term_data.items():
-            names = sorted(bucket_entries.keys())
-            matrix: Dict[str, Dict[str, float]] = {n: {} for n in names}
-            for i, n1 in enumerate(names):
-                text1 = self._concat_snippets(bucket_entries[n1])
-                for j, n2 in enumerate(names):
-                    if j < i:
-                        matrix[n1][n2] = matrix[n2][n1]
-                        continue
-                    text2 = self._concat_snippets(bucket_entries[n2])
-                    if n1 == n2:
-                        sim = 1.0
-                    else:
-                        sim = text_service.calculate_similarity(text1, text2)
-                    matrix[n1][n2] = float(sim)
-            similarity_matrices[term] = matrix
+        aggregation = self._aggregation(cfg)
+        embedding_service = self._embedding_service(text_service)
+        model = model_key(embedding_service) if embedding_service is not None else None
+        cache_key = self._cache_key(cfg, buckets, aggregation, model)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        similarity_matrices, cacheable = self._similarity_matrices(
+            per_term_data, aggregation, text_service, embedding_service
+        )
 
         # Build human summary
         bucket_count = len(buckets)
@@ -155,10 +222,174 @@ class DomainComparisonService:
             "grouping_label": grouping_label,
             "per_term_data": per_term_data,
             "similarity_matrices": similarity_matrices,
+            "similarity_aggregation": aggregation,
+            "similarity_model": model,
         }
 
+        if cacheable and (model is None or not model.startswith(_UNCACHEABLE_MODEL_PREFIXES)):
+            self.cache.put(cache_key, results, summary)
         return results, summary
 
+    @staticmethod
+    def _aggregation(cfg: Dict[str, Any]) -> str:
+        aggregation = cfg.get("similarity_aggregation") or "concatenated"
+        if aggregation not in AGGREGATIONS:
+            logger.warning(f"Unknown similarity_aggregation {aggregation!r}, using 'concatenated'")
+            return "concatenated"
+        return aggregation
+
+    @staticmethod
+    def _embedding_service(text_service):
+        """Embedding service behind ``text_service``, or None when only word overlap is available."""
+        if not getattr(text_service, "enhanced_features_enabled", False):
+            return None
+        enhanced = getattr(text_service, "enhanced", None)
+        if enhanced is None or not getattr(enhanced, "enabled", True):
+            return None
+        service = getattr(enhanced, "embedding_service", None)
+        return service if callable(getattr(service, "embed_documents", None)) else None
+
+    def _cache_key(self, cfg: Dict[str, Any], buckets: Dict[str, List[Document]],
+                   aggregation: str, model: Optional[str]) -> str:
+        """Hash of everything the results depend on: configuration, corpus and embedding model."""
+        corpus = {
+            name: [
+                [
+                    doc.id,
+                    doc.title,
+                    doc.reference_subtype,
+                    doc.source_metadata or {},
+                    hashlib.sha256((doc.content or "").encode("utf-8")).hexdigest(),
+                ]
+                for doc in docs
+            ]
+            for name, docs in buckets.items()
+        }
+        payload = json.dumps(
+            {"configuration": cfg, "corpus": corpus, "aggregation": aggregation, "model": model},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _similarity_matrices(self, per_term_data, aggregation, text_service,
+                             embedding_service) -> Tuple[Dict[str, Dict[str, Dict[str, float]]], bool]:
+        """
+        Bucket-by-bucket similarity matrix of every term.
+
+        Every text the chosen aggregation needs, across all terms, is embedded
+        in one batch, and each term's matrix is one product of normalized
+        vectors:
+
+        - ``concatenated``: cosine of each bucket's concatenated snippets
+        - ``centroid``: cosine of the mean snippet vectors of each bucket
+        - ``mean_pairwise``: mean cosine over all snippet pairs across two buckets
+
+        Buckets whose text fails to embed (or every bucket, without an
+        embedding service) fall back to ``text_service.calculate_similarity``
+        on the concatenated snippets.
+
+        Returns:
+            The matrices, and whether they may be cached: False when an
+            embedding service is present but some bucket had to fall back,
+            since that similarity may come from another provider or random
+            vectors
+        """
+        texts: Dict[str, Dict[str, List[str]]] = {}
+        for term, bucket_entries in per_term_data.items():
+            texts[term] = {}
+            for name, entries in bucket_entries.items():
+                if aggregation == "concatenated":
+                    texts[term][name] = [self._concat_snippets(entries)]
+                else:
+                    texts[term][name] = [e["snippet"] for e in entries if e.get("snippet")]
+
+        vectors = self._embed(
+            embedding_service,
+            [text for by_bucket in texts.values() for group in by_bucket.values() for text in group],
+        )
+
+        similarity_matrices: Dict[str, Dict[str, Dict[str, float]]] = {}
+        cacheable = True
+        for term, bucket_entries in per_term_data.items():
+            names = sorted(bucket_entries.keys())
+            groups = {name: [vectors.get(text) for text in texts[term][name]] for name in names}
+            embedded = [
+                name for name in names
+                if groups[name] and all(vector is not None for vector in groups[name])
+            ]
+            scores = self._embedded_similarities([groups[name] for name in embedded], aggregation)
+            position = {name: i for i, name in enumerate(embedded)}
+
+            matrix: Dict[str, Dict[str, float]] = {n: {} for n in names}
+            for i, n1 in enumerate(names):
+                for j, n2 in enumerate(names):
+                    if j < i:
+                        matrix[n1][n2] = matrix[n2][n1]
+                    elif n1 == n2:
+                        matrix[n1][n2] = 1.0
+                    elif n1 in position and n2 in position:
+                        matrix[n1][n2] = float(scores[position[n1], position[n2]])
+                    else:
+                        cacheable = cacheable and embedding_service is None
+                        matrix[n1][n2] = float(text_service.calculate_similarity(
+                            self._concat_snippets(bucket_entries[n1]),
+                            self._concat_snippets(bucket_entries[n2]),
+                        ))
+            similarity_matrices[term] = matrix
+        return similarity_matrices, cacheable
+
+    @staticmethod
+    def _embed(embedding_service, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Unit vectors of the distinct ``texts``; texts that fail to embed are left out.
+
+        With ``embed_primary`` only vectors of the keyed model are used;
+        ``embed_documents`` may fill failures from other providers or noise.
+        """
+        unique = list(dict.fromkeys(text for text in texts if text and text.strip()))
+        if embedding_service is None or not unique:
+            return {}
+        encode = getattr(embedding_service, "embed_primary", None)
+        if not callable(encode):
+            encode = embedding_service.embed_documents
+        try:
+            embeddings = encode(unique)
+        except Exception as e:
+            logger.warning(f"Batch embedding of domain-comparison snippets failed: {e}")
+            return {}
+        if len(embeddings) != len(unique):
+            return {}
+        vectors = {}
+        for text, embedding in zip(unique, embeddings):
+            if embedding is None:
+                continue
+            vector = np.asarray(embedding, dtype=np.float64).ravel()
+            norm = float(np.linalg.norm(vector)) if vector.size and np.all(np.isfinite(vector)) else 0.0
+            # A zero vector is what providers return on failure
+            if norm:
+                vectors[text] = vector / norm
+        return vectors
+
+    @staticmethod
+    def _embedded_similarities(groups: List[List[np.ndarray]], aggregation: str) -> np.ndarray:
+        """Bucket similarity matrix from each bucket's unit vectors."""
+        if not groups or len({vector.shape[0] for group in groups for vector in group}) != 1:
+            return np.zeros((len(groups), len(groups)))
+        if aggregation == "mean_pairwise":
+            snippets = np.vstack([vector for group in groups for vector in group])
+            # Row b of ``weights`` averages the snippets of bucket b
+            weights = np.zeros((len(groups), len(snippets)))
+            start = 0
+            for b, group in enumerate(groups):
+                weights[b, start:start + len(group)] = 1.0 / len(group)
+                start += len(group)
+            return weights @ (snippets @ snippets.T) @ weights.T
+        representations = np.vstack([np.mean(group, axis=0) for group in groups])
+        norms = np.linalg.norm(representations, axis=1, keepdims=True)
+        representations = representations / np.where(norms > 0, norms, 1.0)
+        return representations @ representations.T
+
     def _infer_discipline(self, ref: Document, fallback: str = "journal") -> str:
         meta = ref.source_metadata or {}
         if fallback == "context" and meta.get("context"):
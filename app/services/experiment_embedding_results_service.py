@@ -3,7 +3,6 @@
 from app import db
 from app.models.document import Document
 from app.models.experiment import Experiment
-from app.models.experiment_document import ExperimentDocument
 from app.models.experiment_orchestration_run import ExperimentOrchestrationRun
 from app.models.experiment_processing import (
     ExperimentDocumentProcessing,
@@ -11,6 +10,7 @@ from app.models.experiment_processing import (
 )
 from app.models.processing_job import ProcessingJob
 from app.services.base_service import NotFoundError
+from app.services.experiment_corpus_service import ExperimentCorpusService
 
 
 class ExperimentEmbeddingResultsService:
@@ -52,23 +52,7 @@ class ExperimentEmbeddingResultsService:
 
     @staticmethod
     def _latest_experiment_documents(experiment_id):
-        associations = ExperimentDocument.query.filter_by(
-            experiment_id=experiment_id
-        ).all()
-        families = {}
-        for association in associations:
-            document = association.document
-            root_id = document.source_document_id or document.id
-            families.setdefault(root_id, []).append((association, document))
-        selected = [
-            max(
-                family,
-                key=lambda item: (item[1].version_number or 0, item[1].id),
-            )
-            for family in families.values()
-        ]
-        selected.sort(key=lambda item: item[1].id)
-        return selected
+        return ExperimentCorpusService.latest_associations(experiment_id)
 
     @classmethod
     def _canonical_info(cls, association, document, orchestration_ids):
@@ -13,19 +13,29 @@ os.environ["HF_HUB_OFFLINE"] = "1"
 os.environ["TRANSFORMERS_OFFLINE"] = "1"
 
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 
+from shared_services.embedding.memo_store import (
+    MemoKey,
+    get_embedding_memo_store,
+    model_revision,
+    sentence_transformer_key,
+)
+from shared_services.metrics import record_embedding, record_embedding_error
+
 logger = logging.getLogger(__name__)
 
 
 class ExperimentEmbeddingService:
     """Simple embedding service for experiment processing"""
 
-    def __init__(self):
+    def __init__(self, memo_store=None):
         self.openai_client = None
         self.local_model = None
         self._model_cache = {}  # Cache for period-specific models
+        self.memo_store = memo_store or get_embedding_memo_store()
 
         # Initialize OpenAI client if API key is available
         try:
@@ -60,71 +70,127 @@ class ExperimentEmbeddingService:
         Returns:
             Dict containing vector, dimensions, and metadata
         """
-        if method == 'local':
-            return self._generate_local_embeddings(text)
-        elif method == 'openai':
-            return self._generate_openai_embeddings(text)
-        elif method == 'period_aware':
-            return self._generate_period_aware_embeddings(text, year)
-        else:
-            raise ValueError(f"Unknown embedding method: {method}")
+        return self.generate_embeddings_batch([text], method, year)[0]
+
+    def generate_embeddings_batch(self, texts: List[str], method: str = 'local',
+                                  year: int = None) -> List[Dict[str, Any]]:
+        """
+        Generate embeddings for several texts with one model.
+
+        Texts this model has embedded before (in this or an earlier run) are
+        read from the embedding memo; the rest are encoded in one batch.
+
+        Args:
+            texts: Texts to embed
+            method: 'local', 'openai', or 'period_aware'
+            year: Optional document year for period-aware embedding
+
+        Returns:
+            One dict per text, in input order, as returned by ``generate_embeddings``
+        """
+        started = time.perf_counter()
+        try:
+            if method == 'local':
+                results, encoded = self._generate_local_embeddings(texts)
+            elif method == 'openai':
+                results, encoded = self._generate_openai_embeddings(texts)
+            elif method == 'period_aware':
+                results, encoded = self._generate_period_aware_embeddings(texts, year)
+            else:
+                raise ValueError(f"Unknown embedding method: {method}")
+        except Exception:
+            record_embedding_error(method)
+            raise
+        if encoded and results:
+            record_embedding(method, str(results[0].get('model', 'unknown')), time.perf_counter() - started,
+                             texts=len(encoded), characters=sum(len(text) for text in encoded))
+        return results
+
+    def _memoized(self, texts: List[str], key: MemoKey, encode) -> Tuple[List[List[float]], List[str]]:
+        """Vectors for ``texts`` from the memo or ``encode``; also returns the texts encoded."""
+        encoded = []
+
+        def encode_misses(missing):
+            encoded.extend(missing)
+            return encode(missing)
 
-    def _generate_local_embeddings(self, text: str) -> Dict[str, Any]:
+        return self.memo_store.embed(texts, key, encode_misses), encoded
+
+    @staticmethod
+    def _sentence_transformer_encoder(model):
+        return lambda texts: [vector.tolist() for vector in model.encode(texts)]
+
+    def _generate_local_embeddings(self, texts: List[str]):
         """Generate embeddings using local sentence transformer model"""
         if not self.local_model:
             raise RuntimeError("Local embedding model not available")
 
         try:
-            # Generate embedding
-            embedding = self.local_model.encode(text)
-
-            # Convert to list for JSON serialization
-            vector = embedding.tolist()
-
-            return {
-                'vector': vector,
-                'dimensions': len(vector),
-                'method': 'local',
-                'model': 'all-MiniLM-L6-v2',
-                'text_length': len(text),
-                'success': True
-            }
+            vectors, encoded = self._memoized(
+                texts,
+                sentence_transformer_key('all-MiniLM-L6-v2', self.local_model),
+                self._sentence_transformer_encoder(self.local_model),
+            )
+            return [
+                {
+                    'vector': vector,
+                    'dimensions': len(vector),
+                    'method': 'local',
+                    'model': 'all-MiniLM-L6-v2',
+                    'text_length': len(text),
+                    'success': True
+                }
+                for text, vector in zip(texts, vectors)
+            ], encoded
 
         except Exception as e:
             logger.error(f"Error generating local embeddings: {str(e)}")
             raise
 
-    def _generate_openai_embeddings(self, text: str) -> Dict[str, Any]:
+    def _generate_openai_embeddings(self, texts: List[str]):
         """Generate embeddings using OpenAI API"""
         if not self.openai_client:
             raise RuntimeError("OpenAI client not available - check API key")
 
+        tokens = {}
+
+        def encode(missing):
+            vectors = []
+            for text in missing:
+                # Use OpenAI's text-embedding-3-large model
+                response = self.openai_client.embeddings.create(
+                    model="text-embedding-3-large",
+                    input=text,
+                    encoding_format="float"
+                )
+                tokens[text] = response.usage.total_tokens
+                vectors.append(response.data[0].embedding)
+            return vectors
+
         try:
-            # Use OpenAI's text-embedding-3-large model
-            response = self.openai_client.embeddings.create(
-                model="text-embedding-3-large",
-                input=text,
-                encoding_format="float"
+            vectors, encoded = self._memoized(
+                texts,
+                MemoKey('openai:text-embedding-3-large', model_revision('api'), 'api'),
+                encode,
             )
-
-            # Extract the embedding vector
-            embedding = response.data[0].embedding
-
-            return {
-                'vector': embedding,
-                'dimensions': len(embedding),
-                'method': 'openai',
-                'model': 'text-embedding-3-large',
-                'text_length': len(text),
-                'tokens_used': response.usage.total_tokens,
-                'success': True
-            }
+            return [
+                {
+                    'vector': vector,
+                    'dimensions': len(vector),
+                    'method': 'openai',
+                    'model': 'text-embedding-3-large',
+                    'text_length': len(text),
+                    'tokens_used': tokens.get(text, 0),  # Memoized vectors cost no tokens
+                    'success': True
+                }
+                for text, vector in zip(texts, vectors)
+            ], encoded
 
         except Exception as e:
             logger.error(f"Error generating OpenAI embeddings: {str(e)}")
             raise
 
-    def _generate_period_aware_embeddings(self, text: str, year: int = None) -> Dict[str, Any]:
+    def _generate_period_aware_embeddings(self, texts: List[str], year: int = None):
         """
         Generate period-aware embeddings using period-specific model selection.
 
@@ -183,34 +249,40 @@ class ExperimentEmbeddingService:
                         logger.info(f"Loading and caching period-specific model: {selected_model}")
                         period_model = SentenceTransformer(selected_model)
                         self._model_cache[model_name_short] = period_model
-                    embedding = period_model.encode(text)
                     actual_model = model_name_short
                 else:
                     # Use the default local model
                     if not self.local_model:
                         raise RuntimeError("Local embedding model not available")
-                    embedding = self.local_model.encode(text)
+                    period_model = self.local_model
                     actual_model = 'all-MiniLM-L6-v2'
 
-                vector = embedding.tolist()
-
-                return {
-                    'vector': vector,
-                    'dimensions': len(vector),
-                    'method': 'period_aware',
-                    'model': actual_model,
-                    'model_full': selected_model,
-                    'model_description': model_description,
-                    'expected_dimension': expected_dimension,
-                    'handles_archaic': handles_archaic,
-                    'era': era,
-                    'period_category': period_category,
-                    'document_year': year,
-                    'selection_reason': model_info.get('selection_reason', ''),
-                    'selection_confidence': model_info.get('selection_confidence', 0.5),
-                    'text_length': len(text),
-                    'success': True
-                }
+                vectors, encoded = self._memoized(
+                    texts,
+                    sentence_transformer_key(actual_model, period_model),
+                    self._sentence_transformer_encoder(period_model),
+                )
+
+                return [
+                    {
+                        'vector': vector,
+                        'dimensions': len(vector),
+                        'method': 'period_aware',
+                        'model': actual_model,
+                        'model_full': selected_model,
+                        'model_description': model_description,
+                        'expected_dimension': expected_dimension,
+                        'handles_archaic': handles_archaic,
+                        'era': era,
+                        'period_category': period_category,
+                        'document_year': year,
+                        'selection_reason': model_info.get('selection_reason', ''),
+                        'selection_confidence': model_info.get('selection_confidence', 0.5),
+                        'text_length': len(text),
+                        'success': True
+                    }
+                    for text, vector in zip(texts, vectors)
+                ], encoded
 
             except Exception as model_error:
                 # Fall back to local model if period-specific model fails
@@ -220,28 +292,34 @@ class ExperimentEmbeddingService:
                 if not self.local_model:
                     raise RuntimeError("Local embedding model not available for period-aware embeddings")
 
-                embedding = self.local_model.encode(text)
-                vector = embedding.tolist()
-
-                return {
-                    'vector': vector,
-                    'dimensions': len(vector),
-                    'method': 'period_aware',
-                    'model': 'all-MiniLM-L6-v2',
-                    'model_full': 'sentence-transformers/all-MiniLM-L6-v2',
-                    'model_description': f'Fallback model (intended: {model_description})',
-                    'intended_model': selected_model,
-                    'expected_dimension': expected_dimension,
-                    'handles_archaic': handles_archaic,
-                    'era': era,
-                    'period_category': period_category,
-                    'document_year': year,
-                    'selection_reason': model_info.get('selection_reason', '') + ' (using fallback)',
-                    'selection_confidence': model_info.get('selection_confidence', 0.5) * 0.8,  # Lower confidence for fallback
-                    'text_length': len(text),
-                    'fallback_used': True,
-                    'success': True
-                }
+                vectors, encoded = self._memoized(
+                    texts,
+                    sentence_transformer_key('all-MiniLM-L6-v2', self.local_model),
+                    self._sentence_transformer_encoder(self.local_model),
+                )
+
+                return [
+                    {
+                        'vector': vector,
+                        'dimensions': len(vector),
+                        'method': 'period_aware',
+                        'model': 'all-MiniLM-L6-v2',
+                        'model_full': 'sentence-transformers/all-MiniLM-L6-v2',
+                        'model_description': f'Fallback model (intended: {model_description})',
+                        'intended_model': selected_model,
+                        'expected_dimension': expected_dimension,
+                        'handles_archaic': handles_archaic,
+                        'era': era,
+                        'period_category': period_category,
+                        'document_year': year,
+                        'selection_reason': model_info.get('selection_reason', '') + ' (using fallback)',
+                        'selection_confidence': model_info.get('selection_confidence', 0.5) * 0.8,  # Lower confidence for fallback
+                        'text_length': len(text),
+                        'fallback_used': True,
+                        'success': True
+                    }
+                    for text, vector in zip(texts, vectors)
+                ], encoded
 
         except Exception as e:
             logger.error(f"Error generating period-aware embeddings: {str(e)}")
@@ -13,7 +13,9 @@ from datetime import datetime
 from app.services.processing_tools import DocumentProcessor, ProcessingResult
 from app.services.processing_registry_service import processing_registry_service
 from app import db
+from shared_services.metrics import record_tool, span
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +147,7 @@ class ToolExecutor:
     async def execute(self, document_text: str, document_id: Optional[int] = None,
                       orchestration_run_id: Optional[str] = None,
                       experiment_document_id: Optional[int] = None,
+                      checkpoint=None,
                       **kwargs) -> Dict[str, Any]:
         """
         Execute the tool on document text and store results in database.
@@ -157,11 +160,24 @@ class ToolExecutor:
             document_id: Document ID for storing artifacts
             orchestration_run_id: Optional orchestration run ID for provenance tracking
             experiment_document_id: Optional ExperimentDocument ID for linking processing
+            checkpoint: Optional OrchestrationToolCheckpoint completed in the same
+                transaction as the stored artifacts
             **kwargs: Additional tool-specific parameters
 
         Returns:
             Processing results summary (data is stored in DB, not returned in full)
         """
+        started = time.perf_counter()
+        with span('tool.execute', tool=self.tool_name, document_id=document_id,
+                  orchestration_run_id=orchestration_run_id):
+            summary = await self._execute(document_text, document_id, orchestration_run_id,
+                                          experiment_document_id, checkpoint, **kwargs)
+        record_tool(self.tool_name, time.perf_counter() - started, summary.get('status', 'unknown'))
+        return summary
+
+    async def _execute(self, document_text: str, document_id: Optional[int],
+                       orchestration_run_id: Optional[str], experiment_document_id: Optional[int],
+                       checkpoint, **kwargs) -> Dict[str, Any]:
         processor = self._get_processor()
 
         # Map tool name to processor method
@@ -245,6 +261,18 @@ class ToolExecutor:
                                 metadata=operation_metadata
                             )
 
+                        if checkpoint is not None:
+                            # Committed with the artifacts so a crash can never leave
+                            # stored artifacts behind an unfinished checkpoint
+                            checkpoint.mark_completed({
+                                'tool': self.tool_name,
+                                'status': 'executed',
+                                'count': result_count,
+                                'artifacts_stored': artifacts_created,
+                                'processing_id': str(processing_id),
+                                'success': True
+                            })
+
                         db.session.commit()
                         logger.info(
                             f"Stored {artifacts_created} {artifact_type} artifacts for document {document_id}, "
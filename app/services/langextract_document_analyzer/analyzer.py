@@ -60,8 +60,8 @@ class LangExtractDocumentAnalyzer:
         if not self.preprocessor.validate_text(text):
             raise ValueError("Document text too short for meaningful analysis")
 
-        # Clean text for processing
-        clean_text, was_truncated = self.preprocessor.clean_text(text)
+        # Clean text for processing; extraction is windowed, so keep it whole
+        clean_text, was_truncated = self.preprocessor.clean_text(text, max_length=None)
 
         # Perform structured extraction
         extraction_result = self.extractor.extract_structured_information(clean_text)
@@ -85,6 +85,7 @@ class LangExtractDocumentAnalyzer:
             'text_truncated': was_truncated,
             'extraction_method': extraction_method,
             'model_used': extraction_result.get('model_used'),
+            'chunking': extraction_result.get('chunking'),
             'structured_extractions': structured_extractions,
             'orchestration_ready': True
         }
@@ -0,0 +1,195 @@
+"""
+Chunked Extraction Module
+
+Runs LangExtract over full-length documents as a map-reduce:
+
+1. Split the text into overlapping, position-preserving windows that end on
+   paragraph or sentence boundaries where possible
+2. Extract each window concurrently, taking tokens from the shared rate
+   limiter before every call
+3. Shift each window's extractions (char intervals and ``position`` attributes)
+   to global document offsets and drop duplicates from the overlaps
+"""
+
+import copy
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Boundaries tried (in order) when choosing where a window ends
+_BOUNDARIES = ('\n\n', '\n', '. ', '? ', '! ', '; ', ' ')
+
+
+@dataclass(frozen=True)
+class TextWindow:
+    """A slice of the document with its global character offset."""
+    index: int
+    start: int
+    end: int
+    text: str
+
+
+def split_windows(text: str, window_chars: int = 8000, overlap_chars: int = 400) -> List[TextWindow]:
+    """
+    Split text into overlapping windows that cover it completely.
+
+    Args:
+        text: Full document text
+        window_chars: Target window length
+        overlap_chars: Characters shared by consecutive windows, so
+            extractions spanning a cut are seen whole by one window
+
+    Returns:
+        Windows in document order; ``text[w.start:w.end] == w.text``
+    """
+    if window_chars <= overlap_chars:
+        raise ValueError("window_chars must be larger than overlap_chars")
+    windows: List[TextWindow] = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = min(start + window_chars, length)
+        if end < length:
+            end = _boundary_before(text, start + window_chars // 2, end)
+        windows.append(TextWindow(len(windows), start, end, text[start:end]))
+        if end >= length:
+            break
+        start = max(end - overlap_chars, start + 1)
+    return windows
+
+
+def _boundary_before(text: str, lower: int, upper: int) -> int:
+    for boundary in _BOUNDARIES:
+        cut = text.rfind(boundary, lower, upper)
+        if cut != -1:
+            return cut + len(boundary)
+    return upper
+
+
+class ChunkedLangExtractRunner:
+    """Map-reduce LangExtract execution over document windows."""
+
+    def __init__(self, extract_window: Callable[[str], Any], rate_limiter=None,
+                 window_chars: int = 8000, overlap_chars: int = 400, max_workers: int = 4,
+                 chars_per_request: int = 2000, acquire_timeout: Optional[float] = 600):
+        """
+        Args:
+            extract_window: Callable running LangExtract on one window's text and
+                returning an annotated document (``.extractions``)
+            rate_limiter: Token bucket (``acquire(tokens, timeout)``); None disables limiting
+            window_chars: Target window length
+            overlap_chars: Overlap between consecutive windows
+            max_workers: Windows extracted concurrently by this process
+            chars_per_request: LangExtract's ``max_char_buffer``; one token is
+                taken per LLM request a window will make
+            acquire_timeout: Seconds a window may wait for rate-limit tokens
+        """
+        self.extract_window = extract_window
+        self.rate_limiter = rate_limiter
+        self.window_chars = window_chars
+        self.overlap_chars = overlap_chars
+        self.max_workers = max(1, max_workers)
+        self.chars_per_request = max(1, chars_per_request)
+        self.acquire_timeout = acquire_timeout
+
+    def run(self, text: str) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Extract the full text window by window.
+
+        Returns:
+            Tuple of (extractions with global offsets, run statistics)
+
+        Raises:
+            RuntimeError: If every window failed
+        """
+        windows = split_windows(text, self.window_chars, self.overlap_chars)
+        workers = min(self.max_workers, len(windows)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(self._run_window, windows))
+
+        extractions = []
+        seen = set()
+        failed = []
+        waited = 0.0
+        for window, (annotated_doc, error, wait) in zip(windows, outcomes):
+            waited += wait
+            if error is not None:
+                failed.append({'window': window.index, 'start': window.start, 'error': error})
+                continue
+            for extraction in getattr(annotated_doc, 'extractions', None) or []:
+                shifted = _shift_extraction(extraction, window.start)
+                key = _dedupe_key(shifted)
+                if key is not None and key in seen:
+                    continue
+                seen.add(key)
+                extractions.append(shifted)
+
+        if windows and len(failed) == len(windows):
+            raise RuntimeError(f"All {len(windows)} LangExtract windows failed: {failed[0]['error']}")
+
+        stats = {
+            'windows': len(windows),
+            'failed_windows': failed,
+            'max_workers': workers,
+            'rate_limit_wait_seconds': round(waited, 3),
+        }
+        return extractions, stats
+
+    def _run_window(self, window: TextWindow):
+        wait = 0.0
+        try:
+            if self.rate_limiter is not None:
+                requests = math.ceil(len(window.text) / self.chars_per_request)
+                wait = self.rate_limiter.acquire(requests, timeout=self.acquire_timeout)
+            return self.extract_window(window.text), None, wait
+        except Exception as e:
+            logger.warning(f"LangExtract window {window.index} ({window.start}-{window.end}) failed: {e}")
+            return None, str(e), wait
+
+
+def _shift_extraction(extraction: Any, offset: int) -> Any:
+    """Copy an extraction with its positions moved to document offsets."""
+    shifted = copy.copy(extraction)
+    interval = getattr(extraction, 'char_interval', None)
+    if interval is not None and offset:
+        interval = copy.copy(interval)
+        if interval.start_pos is not None:
+            interval.start_pos += offset
+        if interval.end_pos is not None:
+            interval.end_pos += offset
+        shifted.char_interval = interval
+    attributes = getattr(extraction, 'attributes', None)
+    if isinstance(attributes, dict) and offset:
+        shifted.attributes = {key: _shift_positions(value, offset) for key, value in attributes.items()}
+    return shifted
+
+
+def _shift_positions(value: Any, offset: int) -> Any:
+    # Model-reported ``position: [start, end]`` entries inside attribute lists
+    if isinstance(value, list):
+        return [_shift_positions(item, offset) for item in value]
+    if isinstance(value, dict):
+        shifted = dict(value)
+        position = value.get('position')
+        if (isinstance(position, (list, tuple)) and len(position) == 2
+                and all(isinstance(p, int) for p in position)):
+            shifted['position'] = [position[0] + offset, position[1] + offset]
+        return shifted
+    return value
+
+
+def _dedupe_key(extraction: Any):
+    """Grounded extractions repeated by overlapping windows share this key."""
+    interval = getattr(extraction, 'char_interval', None)
+    if interval is None or interval.start_pos is None:
+        return None
+    return (
+        getattr(extraction, 'extraction_class', None),
+        getattr(extraction, 'extraction_text', None),
+        interval.start_pos,
+        interval.end_pos,
+    )
@@ -6,14 +6,27 @@ Uses task-specific models from application config for optimal performance/cost.
 """
 
 import logging
+import os
 from typing import Dict, Any, Optional
 from datetime import datetime
 import langextract as lx
+from flask import current_app, has_app_context
 from langextract import data
 from app.llm_config import get_llm_config, LLMTaskType
+from app.services.llm_rate_limiter import get_langextract_rate_limiter
+from .chunked_extraction import ChunkedLangExtractRunner
 
 logger = logging.getLogger(__name__)
 
+# Characters LangExtract sends per LLM request (its max_char_buffer)
+MAX_CHAR_BUFFER = 2000
+
+
+def _config(key: str, default: Any) -> Any:
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return os.environ.get(key, default)
+
 
 class LangExtractExtractor:
     """
@@ -71,12 +84,46 @@ class LangExtractExtractor:
         """
         Use LangExtract to extract structured information for orchestration
 
+        The full text is split into overlapping windows that are extracted
+        concurrently under the shared LangExtract rate limit; extractions are
+        merged with document-level character offsets.
+
         Args:
             text: Cleaned document text
 
         Returns:
             Structured extraction results
         """
+        runner = ChunkedLangExtractRunner(
+            self._extract_window,
+            rate_limiter=get_langextract_rate_limiter(),
+            window_chars=int(_config('LANGEXTRACT_WINDOW_CHARS', 8000)),
+            overlap_chars=int(_config('LANGEXTRACT_WINDOW_OVERLAP', 400)),
+            max_workers=int(_config('LANGEXTRACT_MAX_WORKERS', 4)),
+            chars_per_request=MAX_CHAR_BUFFER,
+        )
+
+        try:
+            extractions, chunking = runner.run(text)
+
+            return {
+                'success': True,
+                'annotated_doc': data.AnnotatedDocument(extractions=extractions, text=text),
+                'extraction_method': f'langextract_{self.provider}',
+                'model_used': self.model_id,
+                'chunking': chunking
+            }
+
+        except Exception as e:
+            logger.error(f"LangExtract processing failed: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'extraction_method': f'langextract_{self.provider}_failed'
+            }
+
+    def _extract_window(self, text: str):
+        """Run LangExtract on one window of the document."""
         # Define extraction schema matching section 3.1 claims
         prompt_description = """
         Extract structured information from this document to guide analytical tool selection.
@@ -124,39 +171,24 @@ class LangExtractExtractor:
             )
         ]
 
-        try:
-            # Perform LangExtract extraction with timeout and optimized settings
-            annotated_doc = lx.extract(
-                text_or_documents=text,
-                prompt_description=prompt_description,
-                examples=examples,
-                model_id=self.model_id,
-                api_key=self.api_key,
-                language_model_type=self.language_model_type,
-                format_type=data.FormatType.JSON,
-                temperature=0.2,  # Low temperature for consistent analysis
-                fence_output=False,
-                use_schema_constraints=True,
-                extraction_passes=1,  # Single pass to prevent timeout
-                max_char_buffer=2000,  # Optimized buffer size
-                batch_length=2,  # Reduced batch size
-                max_workers=1  # Single worker to avoid rate limiting
-            )
-
-            return {
-                'success': True,
-                'annotated_doc': annotated_doc,
-                'extraction_method': f'langextract_{self.provider}',
-                'model_used': self.model_id
-            }
-
-        except Exception as e:
-            logger.error(f"LangExtract processing failed: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'extraction_method': f'langextract_{self.provider}_failed'
-            }
+        # Windows run concurrently under the shared rate limiter, so each
+        # window's own requests stay sequential (one token per request)
+        return lx.extract(
+            text_or_documents=text,
+            prompt_description=prompt_description,
+            examples=examples,
+            model_id=self.model_id,
+            api_key=self.api_key,
+            language_model_type=self.language_model_type,
+            format_type=data.FormatType.JSON,
+            temperature=0.2,  # Low temperature for consistent analysis
+            fence_output=False,
+            use_schema_constraints=True,
+            extraction_passes=1,  # Single pass to prevent timeout
+            max_char_buffer=MAX_CHAR_BUFFER,
+            batch_length=2,
+            max_workers=1
+        )
 
     def extract_entities_with_positions(self, text: str) -> Dict[str, Any]:
         """
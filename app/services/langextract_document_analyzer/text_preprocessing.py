@@ -5,7 +5,7 @@ Handles text cleaning and preparation for LangExtract processing.
 """
 
 import logging
-from typing import Tuple
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +14,14 @@ class TextPreprocessor:
     """Clean and prepare text for LangExtract analysis"""
 
     @staticmethod
-    def clean_text(text: str, max_length: int = 50000) -> Tuple[str, bool]:
+    def clean_text(text: str, max_length: Optional[int] = 50000) -> Tuple[str, bool]:
         """
         Clean text for LangExtract processing
 
         Args:
             text: Raw document text
-            max_length: Maximum character length (default 50,000)
+            max_length: Maximum character length (default 50,000); None keeps
+                the full text for chunked extraction
 
         Returns:
             Tuple of (cleaned_text, was_truncated)
@@ -33,7 +34,7 @@ class TextPreprocessor:
 
         # Track if we need to truncate
         was_truncated = False
-        if len(text) > max_length:
+        if max_length is not None and len(text) > max_length:
             text = text[:max_length]
             was_truncated = True
             logger.warning(f"Text truncated to {max_length:,} characters for processing")
@@ -0,0 +1,335 @@
+"""
+Batched WordNet path similarity over a compact, precomputed synset index.
+
+``Synset.path_similarity`` recomputes both synsets' hypernym closures on every
+call, and comparing two words means comparing every sense of one with every
+sense of the other. Scoring dozens of terms against a set of context anchors
+that way repeats the same graph walks thousands of times.
+
+``WordNetIndex`` walks WordNet once per process and keeps it as arrays:
+synset names and parts of speech plus the hypernym graph (hypernyms and
+instance hypernyms) in CSR form. It is saved as ``.npz`` so later processes
+skip the walk. ``LexicalSimilarityEngine`` caches each word's synset IDs and
+each synset's hypernym closure (ancestor IDs and distances). A batch is then
+one min-plus reduction per term sense over the anchors' shared ancestors.
+
+Scores match NLTK's ``path_similarity`` with its default ``simulate_root``:
+``1 / (shortest path + 1)``, where a virtual root joins the taxonomies unless
+both senses are nouns. Words or sense pairs with no path score 0.
+
+Configuration:
+
+    WORDNET_INDEX_CACHE_DIR   directory for the saved index
+                              (default: ./wordnet_cache)
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when the saved array layout changes
+INDEX_FORMAT_VERSION = 1
+
+_NOUN = 'n'
+_UNREACHABLE = np.iinfo(np.int32).max // 4
+
+
+@dataclass
+class WordNetIndex:
+    """WordNet synsets as arrays: names, POS and the hypernym graph in CSR form."""
+
+    names: np.ndarray
+    pos: np.ndarray
+    parent_offsets: np.ndarray
+    parent_ids: np.ndarray
+    version: str = ''
+
+    def __post_init__(self):
+        self.ids = {name: i for i, name in enumerate(self.names.tolist())}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_reader(cls, reader) -> 'WordNetIndex':
+        """Walk every synset of an NLTK WordNet reader once."""
+        synsets = list(reader.all_synsets())
+        ids = {synset.name(): i for i, synset in enumerate(synsets)}
+        offsets = np.zeros(len(synsets) + 1, dtype=np.int32)
+        parents: List[int] = []
+        for i, synset in enumerate(synsets):
+            for parent in synset.hypernyms() + synset.instance_hypernyms():
+                parents.append(ids[parent.name()])
+            offsets[i + 1] = len(parents)
+        return cls(
+            names=np.array([s.name() for s in synsets], dtype=object),
+            pos=np.array([s.pos() for s in synsets], dtype='<U1'),
+            parent_offsets=offsets,
+            parent_ids=np.array(parents, dtype=np.int32),
+            version=str(reader.get_version()),
+        )
+
+    def parents(self, synset_id: int) -> np.ndarray:
+        return self.parent_ids[self.parent_offsets[synset_id]:self.parent_offsets[synset_id + 1]]
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(
+                f,
+                names=self.names.astype(str),
+                pos=self.pos,
+                parent_offsets=self.parent_offsets,
+                parent_ids=self.parent_ids,
+                meta=np.array([INDEX_FORMAT_VERSION, self.version], dtype=object).astype(str),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['WordNetIndex']:
+        """Saved index, or None if it is missing or from another format version."""
+        try:
+            with np.load(path) as data:
+                format_version, version = data['meta'].tolist()
+                if int(format_version) != INDEX_FORMAT_VERSION:
+                    return None
+                return cls(
+                    names=data['names'].astype(object),
+                    pos=data['pos'],
+                    parent_offsets=data['parent_offsets'],
+                    parent_ids=data['parent_ids'],
+                    version=version,
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable WordNet index {path}: {e}")
+            return None
+
+
+@dataclass
+class _Closure:
+    """Ancestors of a synset (itself included) with their hypernym distances."""
+
+    ancestors: np.ndarray
+    distances: np.ndarray
+    root_distance: int  # distance to the simulated root
+
+
+class LexicalSimilarityEngine:
+    """Many-to-many WordNet path similarity with per-word and per-synset caches."""
+
+    def __init__(self, reader, index: Optional[WordNetIndex] = None, max_cached_words: int = 10000):
+        """
+        Args:
+            reader: NLTK WordNet corpus reader (lemma lookup and synset details)
+            index: Precomputed index (default: built from ``reader``)
+            max_cached_words: Words whose synset IDs are kept
+        """
+        self.reader = reader
+        self.index = index or WordNetIndex.from_reader(reader)
+        self.max_cached_words = max_cached_words
+        self._word_synsets: 'OrderedDict[str, Tuple[int, ...]]' = OrderedDict()
+        self._closures: Dict[int, _Closure] = {}
+        self._lock = threading.Lock()
+
+    def synset_ids(self, word: str) -> Tuple[int, ...]:
+        """IDs of a word's synsets in WordNet sense order (cached)."""
+        word = word.strip().lower()
+        with self._lock:
+            cached = self._word_synsets.get(word)
+            if cached is not None:
+                self._word_synsets.move_to_end(word)
+                return cached
+        ids = tuple(
+            self.index.ids[synset.name()]
+            for synset in self.reader.synsets(word.replace(' ', '_'))
+            if synset.name() in self.index.ids
+        ) if word else ()
+        with self._lock:
+            self._word_synsets[word] = ids
+            while len(self._word_synsets) > self.max_cached_words:
+                self._word_synsets.popitem(last=False)
+        return ids
+
+    def closure(self, synset_id: int) -> _Closure:
+        """Breadth-first hypernym closure of a synset (cached)."""
+        closure = self._closures.get(synset_id)
+        if closure is not None:
+            return closure
+        distances: Dict[int, int] = {}
+        queue = deque([(synset_id, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            if current in distances:
+                continue
+            distances[current] = depth
+            queue.extend((int(parent), depth + 1) for parent in self.index.parents(current))
+        ancestors = np.fromiter(distances.keys(), dtype=np.int32, count=len(distances))
+        depths = np.fromiter(distances.values(), dtype=np.int32, count=len(distances))
+        closure = _Closure(ancestors, depths, int(depths.max()) + 1)
+        self._closures[synset_id] = closure
+        return closure
+
+    def synset_similarity_matrix(self, left: Sequence[int], right: Sequence[int]) -> np.ndarray:
+        """Path similarity of every synset in ``left`` with every synset in ``right``."""
+        scores = np.zeros((len(left), len(right)), dtype=np.float64)
+        if not len(left) or not len(right):
+            return scores
+
+        # Column per ancestor of any right-hand synset; distance matrix over those
+        right_closures = [self.closure(s) for s in right]
+        columns: Dict[int, int] = {}
+        for closure in right_closures:
+            for ancestor in closure.ancestors.tolist():
+                columns.setdefault(ancestor, len(columns))
+        right_dist = np.full((len(right), len(columns)), _UNREACHABLE, dtype=np.int32)
+        for row, closure in enumerate(right_closures):
+            right_dist[row, [columns[a] for a in closure.ancestors.tolist()]] = closure.distances
+        right_root = np.array([c.root_distance for c in right_closures], dtype=np.int32)
+        right_noun = self.index.pos[np.asarray(right, dtype=np.int64)] == _NOUN
+
+        for row, synset_id in enumerate(left):
+            closure = self.closure(synset_id)
+            shared = [(columns[a], d) for a, d in zip(closure.ancestors.tolist(), closure.distances.tolist())
+                      if a in columns]
+            if shared:
+                cols, dists = zip(*shared)
+                path = (right_dist[:, list(cols)] + np.array(dists, dtype=np.int32)).min(axis=1)
+            else:
+                path = np.full(len(right), _UNREACHABLE, dtype=np.int32)
+            # A virtual root joins the taxonomies unless both senses are nouns
+            if self.index.pos[synset_id] != _NOUN:
+                path = np.minimum(path, closure.root_distance + right_root)
+            else:
+                path = np.where(right_noun, path, np.minimum(path, closure.root_distance + right_root))
+            reachable = path < _UNREACHABLE
+            scores[row, reachable] = 1.0 / (path[reachable] + 1.0)
+        return scores
+
+    def similarity_matrix(self, terms: Sequence[str], anchors: Sequence[str]
+                          ) -> Tuple[np.ndarray, List[List[Optional[Tuple[str, str]]]]]:
+        """
+        Best path similarity of every term with every anchor.
+
+        Returns:
+            (scores, best_pairs): a ``len(terms) x len(anchors)`` array and, per
+            cell, the synset names that scored best (None when unrelated)
+        """
+        term_senses = [self.synset_ids(term) for term in terms]
+        anchor_senses = [self.synset_ids(anchor) for anchor in anchors]
+        left = [s for senses in term_senses for s in senses]
+        right = [s for senses in anchor_senses for s in senses]
+        sense_scores = self.synset_similarity_matrix(left, right)
+
+        scores = np.zeros((len(terms), len(anchors)), dtype=np.float64)
+        best_pairs: List[List[Optional[Tuple[str, str]]]] = [[None] * len(anchors) for _ in terms]
+        row_start = 0
+        for i, row_senses in enumerate(term_senses):
+            col_start = 0
+            for j, col_senses in enumerate(anchor_senses):
+                block = sense_scores[row_start:row_start + len(row_senses), col_start:col_start + len(col_senses)]
+                if block.size and block.max() > 0:
+                    # First maximal pair in sense order, as the nested-loop version picked
+                    r, c = np.unravel_index(int(block.argmax()), block.shape)
+                    scores[i, j] = block[r, c]
+                    best_pairs[i][j] = (self.index.names[row_senses[r]], self.index.names[col_senses[c]])
+                col_start += len(col_senses)
+            row_start += len(row_senses)
+        return scores, best_pairs
+
+    def score_terms(self, terms: Sequence[str], anchors: Sequence[str], top_k: Optional[int] = None,
+                    min_score: float = 0.0) -> Dict[str, Any]:
+        """
+        Score a term list against context anchors in one pass.
+
+        Args:
+            terms: Terms to score
+            anchors: Context anchor terms
+            top_k: Keep only each term's best anchors
+            min_score: Drop anchors scoring below this
+
+        Returns:
+            {'terms': [{term, found, anchors: [{anchor, similarity, synset1, synset2}]}],
+             'anchors': [{anchor, found}]}
+        """
+        scores, best_pairs = self.similarity_matrix(terms, anchors)
+        results = []
+        for i, term in enumerate(terms):
+            matches = []
+            for j in np.argsort(-scores[i], kind='stable').tolist():
+                if scores[i, j] <= 0 or scores[i, j] < min_score:
+                    continue
+                synset1, synset2 = best_pairs[i][j]
+                matches.append({
+                    'anchor': anchors[j],
+                    'similarity': float(scores[i, j]),
+                    'synset1': synset1,
+                    'synset2': synset2,
+                })
+            results.append({
+                'term': term,
+                'found': bool(self.synset_ids(term)),
+                'anchors': matches[:top_k] if top_k else matches,
+            })
+        return {
+            'terms': results,
+            'anchors': [{'anchor': anchor, 'found': bool(self.synset_ids(anchor))} for anchor in anchors],
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'synsets': len(self.index),
+            'cached_words': len(self._word_synsets),
+            'cached_closures': len(self._closures),
+        }
+
+
+def _default_reader():
+    from nltk.corpus import wordnet
+
+    return wordnet
+
+
+def _index_path(reader) -> str:
+    directory = os.environ.get('WORDNET_INDEX_CACHE_DIR') or os.path.join(os.getcwd(), 'wordnet_cache')
+    return os.path.join(directory, f"wordnet-{reader.get_version()}-v{INDEX_FORMAT_VERSION}.npz")
+
+
+# Global engine instance (singleton pattern)
+_global_engine: Optional[LexicalSimilarityEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_lexical_similarity_engine() -> LexicalSimilarityEngine:
+    """
+    Get the process-wide similarity engine, loading the saved index if present.
+
+    Raises:
+        LookupError: If the NLTK WordNet data is not installed
+    """
+    global _global_engine
+    if _global_engine is None:
+        with _engine_lock:
+            if _global_engine is None:
+                reader = _default_reader()
+                path = _index_path(reader)
+                index = WordNetIndex.load(path)
+                if index is None:
+                    logger.info("Building WordNet similarity index")
+                    index = WordNetIndex.from_reader(reader)
+                    try:
+                        index.save(path)
+                    except OSError as e:
+                        logger.warning(f"Could not save WordNet index to {path}: {e}")
+                _global_engine = LexicalSimilarityEngine(reader, index)
+    return _global_engine
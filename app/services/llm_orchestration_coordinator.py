@@ -13,6 +13,7 @@ from datetime import datetime
 # Import shared services for multi-provider LLM access
 from app.services.langextract_document_analyzer import LangExtractDocumentAnalyzer
 from app.llm_config import get_llm_config, LLMTaskType
+from shared_services.llm.gateway import get_llm_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -304,22 +305,34 @@ class LLMOrchestrationCoordinator:
         """
         
         try:
+            messages = [{"role": "user", "content": orchestration_prompt}]
             if hasattr(self.orchestrator_llm, 'messages'):  # Anthropic
-                message = self.orchestrator_llm.messages.create(
-                    model="claude-sonnet-4-5-20250929",
-                    max_tokens=4000,
-                    temperature=0.3,  # Balanced creativity and consistency
-                    messages=[{"role": "user", "content": orchestration_prompt}]
-                )
-                response_text = message.content[0].text.strip()
+                provider, model = 'anthropic', "claude-sonnet-4-5-20250929"
+
+                def call():
+                    message = self.orchestrator_llm.messages.create(
+                        model=model,
+                        max_tokens=4000,
+                        temperature=0.3,  # Balanced creativity and consistency
+                        messages=messages
+                    )
+                    return message.content[0].text
             else:  # OpenAI fallback
-                response = self.orchestrator_llm.chat.completions.create(
-                    model="gpt-4",
-                    messages=[{"role": "user", "content": orchestration_prompt}],
-                    max_tokens=4000,
-                    temperature=0.3
-                )
-                response_text = response.choices[0].message.content.strip()
+                provider, model = 'openai', "gpt-4"
+
+                def call():
+                    response = self.orchestrator_llm.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=4000,
+                        temperature=0.3
+                    )
+                    return response.choices[0].message.content
+
+            response_text = get_llm_gateway().complete(
+                provider=provider, model=model, messages=messages, call=call,
+                max_tokens=4000, temperature=0.3
+            ).strip()
             
             # Parse JSON response
             if response_text.startswith('```'):
@@ -0,0 +1,184 @@
+"""
+Token-bucket rate limiting for outbound LLM calls.
+
+``RedisTokenBucket`` keeps the bucket in Redis and refills/debits it in one
+Lua script, so every web and Celery worker draws from the same budget.
+``LocalTokenBucket`` is process-local (single-process development and tests).
+
+Backends:
+
+- ``redis`` fails closed: if Redis is unreachable, acquiring raises instead
+  of letting calls through. Use it whenever the provider limit must hold
+  across workers.
+- ``auto`` uses Redis when reachable and otherwise falls back, with a
+  warning, to a per-process bucket; with N workers the effective rate is
+  then N times the configured one.
+- ``memory`` is always per-process.
+
+Configuration (app config or environment):
+
+    LANGEXTRACT_RATE_LIMIT_BACKEND      'redis', 'memory' or 'auto' (default)
+    LANGEXTRACT_RATE_LIMIT_CAPACITY     burst size in LLM requests (default 8)
+    LANGEXTRACT_RATE_LIMIT_PER_SECOND   sustained requests per second (default 2)
+"""
+
+import abc
+import logging
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+
+def _config(key: str, default: Any) -> Any:
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return os.environ.get(key, default)
+
+
+class RateLimitTimeout(Exception):
+    """Raised when tokens could not be acquired within the timeout."""
+
+
+class TokenBucket(abc.ABC):
+    """Blocking acquire on top of a backend-specific ``_reserve``."""
+
+    def __init__(self, capacity: float, refill_per_second: float,
+                 clock=time.monotonic, sleep=time.sleep):
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("Token bucket capacity and refill rate must be positive")
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.clock = clock
+        self.sleep = sleep
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> float:
+        """
+        Block until ``tokens`` are available and take them.
+
+        Requests larger than the bucket are clamped to its capacity.
+
+        Args:
+            tokens: Tokens to take (e.g. LLM requests about to be made)
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitTimeout: If the timeout elapsed first
+        """
+        tokens = min(float(tokens), self.capacity)
+        started = self.clock()
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return self.clock() - started
+            if timeout is not None and self.clock() - started + wait > timeout:
+                raise RateLimitTimeout(f"Could not acquire {tokens:g} tokens within {timeout}s")
+            self.sleep(wait)
+
+    @abc.abstractmethod
+    def _reserve(self, tokens: float) -> float:
+        """Take ``tokens`` and return 0, or return the seconds until they exist."""
+
+
+class LocalTokenBucket(TokenBucket):
+    """Process-local token bucket."""
+
+    def __init__(self, capacity, refill_per_second, clock=time.monotonic, sleep=time.sleep):
+        super().__init__(capacity, refill_per_second, clock, sleep)
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _reserve(self, tokens: float) -> float:
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.refill_per_second
+
+
+# Refill from elapsed server time, then debit if enough tokens are present.
+# Returns the wait as a string because Redis truncates Lua numbers to integers.
+_REDIS_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= requested then
+  tokens = tokens - requested
+else
+  wait = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket(TokenBucket):
+    """Token bucket shared by all processes through Redis."""
+
+    PREFIX = 'ontextract:ratelimit:'
+
+    def __init__(self, client, name: str, capacity, refill_per_second,
+                 clock=time.monotonic, sleep=time.sleep):
+        super().__init__(capacity, refill_per_second, clock, sleep)
+        self.client = client
+        self.key = self.PREFIX + name
+        self._script = client.register_script(_REDIS_BUCKET_SCRIPT)
+
+    def _reserve(self, tokens: float) -> float:
+        reply = self._script(keys=[self.key], args=[self.capacity, self.refill_per_second, tokens])
+        if isinstance(reply, bytes):
+            reply = reply.decode('utf-8')
+        return float(reply)
+
+
+def _build_bucket(name: str) -> TokenBucket:
+    capacity = float(_config('LANGEXTRACT_RATE_LIMIT_CAPACITY', 8))
+    rate = float(_config('LANGEXTRACT_RATE_LIMIT_PER_SECOND', 2))
+    backend = str(_config('LANGEXTRACT_RATE_LIMIT_BACKEND', 'auto')).lower()
+    if backend in ('redis', 'auto'):
+        try:
+            import redis
+
+            client = redis.from_url(_config('REDIS_URL', 'redis://localhost:6379/0'))
+            client.ping()
+            return RedisTokenBucket(client, name, capacity, rate)
+        except Exception as e:
+            if backend == 'redis':
+                raise
+            logger.warning(
+                f"Redis unavailable for LLM rate limiting ({e}); falling back to a per-process "
+                f"bucket, so each worker may send up to {rate:g} requests/s. Set "
+                f"LANGEXTRACT_RATE_LIMIT_BACKEND=redis to fail closed instead."
+            )
+    return LocalTokenBucket(capacity, rate)
+
+
+# Global instance (singleton pattern)
+_langextract_bucket: Optional[TokenBucket] = None
+
+
+def get_langextract_rate_limiter() -> TokenBucket:
+    """Get the token bucket shared by all LangExtract calls."""
+    global _langextract_bucket
+    if _langextract_bucket is None:
+        _langextract_bucket = _build_bucket('langextract')
+    return _langextract_bucket
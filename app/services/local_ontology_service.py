@@ -1,7 +1,8 @@
 """
 Local ontology metadata service for JCDL demo.
 
-Reads semantic-change-ontology-v2.ttl directly from disk using rdflib.
+Reads semantic-change-ontology-v2.ttl directly from disk using rdflib
+(parsed once per process via the shared ontology graph cache).
 No runtime dependency on OntServe.
 
 Post-conference: Replace with OntServeClient for full integration.
@@ -13,6 +14,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+SEMANTIC_CHANGE_EVENT = 'http://ontextract.org/sco#SemanticChangeEvent'
+SKOS_DEFINITION = 'http://www.w3.org/2004/02/skos/core#definition'
+SKOS_EXAMPLE = 'http://www.w3.org/2004/02/skos/core#example'
+DCTERMS_CITATION = 'http://purl.org/dc/terms/bibliographicCitation'
+
 @dataclass
 class SemanticChangeEventType:
     """Event type metadata from ontology"""
@@ -45,21 +51,22 @@ class LocalOntologyService:
 
         self.ontology_path = ontology_path
         self.graph = None
+        self._parsed = None
         self._event_types_cache = None
 
         # Lazy load on first access
 
     def _load_ontology(self):
-        """Load ontology with rdflib (lazy initialization)"""
+        """Load ontology through the shared parsed-graph cache (lazy initialization)"""
         if self.graph is not None:
             return
 
         try:
-            from rdflib import Graph
-            self.graph = Graph()
+            from shared_services.ontology.graph_cache import get_ontology_graph_cache
 
             logger.info(f"Loading ontology from {self.ontology_path}")
-            self.graph.parse(str(self.ontology_path), format='turtle')
+            self._parsed = get_ontology_graph_cache().load_file(self.ontology_path, format='turtle')
+            self.graph = self._parsed.graph
             logger.info(f"Loaded ontology: {len(self.graph)} triples")
 
         except ImportError:
@@ -83,44 +90,28 @@ class LocalOntologyService:
 
         self._load_ontology()
 
-        # SPARQL query to get event types
-        # Use GROUP BY to avoid duplicates when classes have multiple examples
-        query = """
-        PREFIX sco: <http://ontextract.org/sco#>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
-        PREFIX dcterms: <http://purl.org/dc/terms/>
-        PREFIX owl: <http://www.w3.org/2002/07/owl#>
-
-        SELECT ?uri ?label ?definition (SAMPLE(?ex) AS ?example) (SAMPLE(?cit) AS ?citation) ?parent
-        WHERE {
-            ?uri a owl:Class ;
-                 rdfs:subClassOf ?parent ;
-                 rdfs:label ?label ;
-                 skos:definition ?definition .
-
-            # Only get direct subclasses of SemanticChangeEvent
-            FILTER(?parent = sco:SemanticChangeEvent)
-
-            OPTIONAL { ?uri skos:example ?ex }
-            OPTIONAL { ?uri dcterms:bibliographicCitation ?cit }
-        }
-        GROUP BY ?uri ?label ?definition ?parent
-        ORDER BY ?label
-        """
-
-        results = self.graph.query(query)
-
+        # Direct subclasses of sco:SemanticChangeEvent with a label and definition,
+        # read from the precomputed indexes instead of a SPARQL query
+        parsed = self._parsed
         event_types = []
-        for row in results:
-            event_types.append(SemanticChangeEventType(
-                uri=str(row.uri),
-                label=str(row.label),
-                definition=str(row.definition),
-                example=str(row.example) if row.example else None,
-                citation=str(row.citation) if row.citation else None,
-                parent_class=str(row.parent) if row.parent else None
-            ))
+        for uri in parsed.direct_subclasses(SEMANTIC_CHANGE_EVENT):
+            labels = parsed.labels.get(uri, [])
+            definitions = parsed.values(uri, SKOS_DEFINITION)
+            if not labels or not definitions:
+                continue
+            examples = parsed.values(uri, SKOS_EXAMPLE)
+            citations = parsed.values(uri, DCTERMS_CITATION)
+            for label in labels:
+                for definition in definitions:
+                    event_types.append(SemanticChangeEventType(
+                        uri=uri,
+                        label=label,
+                        definition=definition,
+                        example=min(examples) if examples else None,
+                        citation=min(citations) if citations else None,
+                        parent_class=SEMANTIC_CHANGE_EVENT
+                    ))
+        event_types.sort(key=lambda et: et.label)
 
         # Cache results
         self._event_types_cache = event_types
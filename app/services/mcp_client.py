@@ -17,7 +17,8 @@ import json
 import logging
 from typing import Dict, List, Any, Optional
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+
+from .ontology_lookup_cache import CachedLookupFailure, OntologyLookupCache, get_ontology_lookup_cache
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +46,8 @@ class MCPClient:
         mcp_url: str = None,
         http_fallback_url: str = None,
         timeout: int = 30,
-        max_retries: int = 2
+        max_retries: int = 2,
+        cache: Optional[OntologyLookupCache] = None
     ):
         """
         Initialize MCP client with fallback.
@@ -55,6 +57,7 @@ class MCPClient:
             http_fallback_url: OntServe web server URL (REST)
             timeout: Request timeout in seconds
             max_retries: Number of retry attempts before fallback
+            cache: Lookup cache (default: the shared two-tier ontology cache)
         """
         self.mcp_url = mcp_url or os.environ.get('ONTSERVE_MCP_URL', 'http://localhost:8083')
         self.http_fallback_url = http_fallback_url or os.environ.get('ONTSERVE_WEB_URL', 'http://localhost:5003')
@@ -63,8 +66,7 @@ class MCPClient:
         self.session = None
         self._request_id = 1
         self._use_mcp = None  # Determined on first request
-        self._cache = {}  # Simple in-memory cache
-        self._cache_ttl = timedelta(hours=1)
+        self.cache = cache or get_ontology_lookup_cache()
 
         logger.info(f"MCP client initialized - MCP: {self.mcp_url}, Fallback: {self.http_fallback_url}")
 
@@ -216,6 +218,12 @@ class MCPClient:
         """
         Call MCP method with automatic fallback.
 
+        Results come from the shared ontology lookup cache when present; stale
+        results are returned immediately and refreshed in the background.
+        A ``None`` result is cached and returned like any other. Failures are
+        remembered for the cache's short failure TTL, so an unreachable
+        OntServe is not retried on every lookup.
+
         Args:
             method: MCP method name
             params: Method parameters
@@ -226,6 +234,31 @@ class MCPClient:
         Raises:
             MCPClientError: If both MCP and fallback fail
         """
+        cache_key = self.cache_key(method, params)
+        try:
+            result = await self.cache.aget_or_load(
+                cache_key,
+                lambda: self._call_uncached(method, params),
+                refresh=lambda: self._refresh_detached(method, params),
+            )
+        except CachedLookupFailure as e:
+            raise MCPClientError(f"{method} failed recently ({e}); not retrying until the failure entry expires")
+        except MCPClientError as e:
+            self.cache.put_failure(cache_key, str(e))
+            raise
+        return result
+
+    @staticmethod
+    def cache_key(method: str, params: Dict[str, Any]) -> str:
+        """Lookup cache key for an MCP call."""
+        return f"mcp:{method}:{json.dumps(params, sort_keys=True)}"
+
+    def prime(self, method: str, params: Dict[str, Any], result: Dict[str, Any], ttl: Optional[float] = None):
+        """Seed the lookup cache with a known result for an MCP call."""
+        self.cache.put(self.cache_key(method, params), result, ttl=ttl)
+
+    async def _call_uncached(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the MCP server, falling back to the HTTP API."""
         # Determine communication method on first call
         if self._use_mcp is None:
             self._use_mcp = await self.check_mcp_available()
@@ -234,14 +267,6 @@ class MCPClient:
             else:
                 logger.info("MCP server unavailable, using HTTP REST fallback")
 
-        # Check cache first
-        cache_key = f"{method}:{json.dumps(params, sort_keys=True)}"
-        if cache_key in self._cache:
-            cached_data, cached_time = self._cache[cache_key]
-            if datetime.now() - cached_time < self._cache_ttl:
-                logger.debug(f"Cache hit for {method}")
-                return cached_data
-
         # Try primary method
         result = None
         primary_error = None
@@ -263,12 +288,24 @@ class MCPClient:
                 error_msg = f"Both MCP and HTTP failed. MCP: {primary_error}, HTTP: {e}"
                 raise MCPClientError(error_msg)
 
-        # Cache successful result
-        if result is not None:
-            self._cache[cache_key] = (result, datetime.now())
-
         return result
 
+    def _refresh_detached(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Re-run a call from the cache's refresh thread.
+
+        The aiohttp session belongs to the caller's event loop, so the refresh
+        uses a short-lived client with its own loop and session.
+        """
+        client = MCPClient(self.mcp_url, self.http_fallback_url, self.timeout, self.max_retries, cache=self.cache)
+        client._use_mcp = self._use_mcp
+
+        async def run():
+            async with client.managed_session():
+                return await client._call_uncached(method, params)
+
+        return asyncio.run(run())
+
     async def close(self):
         """Close HTTP session and cleanup resources."""
         if self.session:
@@ -307,12 +344,24 @@ def get_mcp_client() -> MCPClient:
     return _global_mcp_client
 
 
-async def warmup_mcp_client():
+async def warmup_mcp_client(prefill: bool = True):
     """
     Warmup MCP client (check availability, populate cache).
     Call this on application startup.
+
+    Args:
+        prefill: Seed the lookup cache with answers computed from the local
+            ``ontologies/`` files, so the first lookups do not wait on OntServe
     """
     client = get_mcp_client()
+    if prefill:
+        try:
+            from .ontserve_client import get_ontserve_client
+
+            primed = get_ontserve_client().prefill_from_local_ontology()
+            logger.info(f"Prefilled ontology lookup cache with {primed} local results")
+        except Exception as e:
+            logger.warning(f"Ontology lookup cache prefill failed: {e}")
     try:
         available = await client.check_mcp_available()
         logger.info(f"MCP client warmup complete - Available: {available}")
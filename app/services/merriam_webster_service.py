@@ -6,6 +6,7 @@ from urllib.parse import quote
 import requests
 
 from app.services.base_service import ServiceError, ValidationError
+from shared_services.http_client import get_http_pool
 
 
 class MerriamWebsterConfigurationError(ServiceError):
@@ -49,7 +50,7 @@ class MerriamWebsterService:
             'thesaurus': thesaurus_key,
         }
         self.timeout = float(timeout)
-        self.http_client = http_client or requests
+        self.http_client = http_client or get_http_pool().session()
         self.clock = clock or datetime.now
 
     def search_dictionary(self, term):
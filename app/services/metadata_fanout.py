@@ -0,0 +1,172 @@
+"""
+Concurrent Metadata Source Lookup
+
+Queries independent bibliographic sources (Semantic Scholar, CrossRef,
+Zotero) at the same time for an uploaded PDF instead of one after another.
+
+- Every lookup runs in its own worker thread under one total latency budget
+- Outcomes are reported as they arrive so the upload SSE stream can show them
+- The highest-precedence confident match wins, as in the sequential cascade:
+  once a confident match arrives, only lookups that would outrank it are
+  still awaited (within the budget); lower-precedence lookups still queued
+  are cancelled and those in flight are abandoned (their results are ignored)
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceLookup:
+    """A single metadata source query.
+
+    ``precedence`` mirrors the order of the sequential cascade (lower wins)
+    and decides how results from several sources are merged.
+    """
+    name: str
+    source: str
+    label: str
+    precedence: int
+    fetch: Callable[[], Optional[Dict[str, Any]]]
+
+
+@dataclass
+class SourceOutcome:
+    """Result of running one SourceLookup."""
+    lookup: SourceLookup
+    metadata: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    @property
+    def found(self) -> bool:
+        return bool(self.metadata)
+
+    @property
+    def confident(self) -> bool:
+        return self.found and self.metadata.get('confidence_level', 'high') != 'low'
+
+    def to_event(self) -> Dict[str, Any]:
+        """Serializable summary for progress streams."""
+        return {
+            'source': self.lookup.name,
+            'label': self.lookup.label,
+            'found': self.found,
+            'confident': self.confident,
+            'error': self.error,
+            'elapsed_ms': round(self.elapsed_ms, 1),
+            'metadata': self.metadata if self.found else None,
+        }
+
+
+@dataclass
+class FanoutResult:
+    """Collected outcomes of a fan-out run."""
+    primary: Optional[SourceOutcome] = None
+    outcomes: List[SourceOutcome] = field(default_factory=list)
+    abandoned: List[SourceLookup] = field(default_factory=list)
+
+    @property
+    def accepted(self) -> List[SourceOutcome]:
+        """Primary outcome and other confident matches, strictly by precedence."""
+        if self.primary is None:
+            return []
+        return sorted(
+            [self.primary] + [o for o in self.outcomes if o is not self.primary and o.confident],
+            key=lambda o: o.lookup.precedence,
+        )
+
+
+class MetadataFanout:
+    """Run metadata source lookups concurrently under a latency budget."""
+
+    def __init__(self, budget_seconds: float = 8.0, max_workers: int = 4):
+        """
+        Args:
+            budget_seconds: Total time to wait for a confident match
+            max_workers: Maximum concurrent lookups
+        """
+        self.budget_seconds = budget_seconds
+        self.max_workers = max_workers
+
+    def run(self, lookups: List[SourceLookup],
+            on_outcome: Optional[Callable[[SourceOutcome], None]] = None) -> FanoutResult:
+        """
+        Query all sources and return as soon as a confident match arrives
+        that no unfinished lookup can outrank.
+
+        Args:
+            lookups: Sources to query
+            on_outcome: Called (in the caller's thread) for each finished lookup
+
+        Returns:
+            FanoutResult with the primary match and every outcome received
+        """
+        result = FanoutResult()
+        if not lookups:
+            return result
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(lookups), self.max_workers),
+            thread_name_prefix='metadata-fanout',
+        )
+        futures = {executor.submit(self._run_lookup, lookup): lookup for lookup in lookups}
+        pending = set(futures)
+        deadline = time.monotonic() + self.budget_seconds
+
+        def outranks_primary(future) -> bool:
+            return result.primary is None or futures[future].precedence < result.primary.lookup.precedence
+
+        try:
+            while any(outranks_primary(future) for future in pending):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: futures[f].precedence):
+                    outcome = future.result()
+                    result.outcomes.append(outcome)
+                    if on_outcome:
+                        on_outcome(outcome)
+                    if outcome.confident and outranks_primary(future):
+                        result.primary = outcome
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        result.abandoned = sorted((futures[f] for f in pending), key=lambda l: l.precedence)
+
+        if result.primary is None:
+            # No confident match: fall back to the highest-precedence hit (e.g. low-confidence CrossRef)
+            found = sorted((o for o in result.outcomes if o.found), key=lambda o: o.lookup.precedence)
+            if found:
+                result.primary = found[0]
+
+        if result.abandoned:
+            logger.info(
+                "Metadata fan-out stopped waiting for: %s",
+                ', '.join(lookup.name for lookup in result.abandoned),
+            )
+        return result
+
+    @staticmethod
+    def _run_lookup(lookup: SourceLookup) -> SourceOutcome:
+        started = time.perf_counter()
+        try:
+            metadata = lookup.fetch()
+            error = None
+        except Exception as e:
+            logger.warning(f"Metadata source {lookup.name} failed: {e}")
+            metadata, error = None, str(e)
+        return SourceOutcome(
+            lookup=lookup,
+            metadata=metadata,
+            error=error,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
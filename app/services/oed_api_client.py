@@ -2,9 +2,10 @@ import os
 import time
 from typing import Any, Dict, Optional
 
-import httpx
 from flask import current_app
 
+from shared_services.http_client import get_http_pool
+
 class OEDApiError(Exception):
     pass
 
@@ -33,7 +34,8 @@ class OEDApiClient:
             # Docs site doesn’t expose explicit base; allow env-based override for now
             raise OEDApiError("OED API base URL not configured: set OED_API_BASE_URL in env")
 
-        self._client = httpx.Client(timeout=self.timeout)
+        # Shared keep-alive client; OED's own timeout is applied per request
+        self._client = get_http_pool().httpx_client()
 
     def _headers(self) -> Dict[str, str]:
         # Per docs: headers are app_id and app_key
@@ -47,7 +49,7 @@ class OEDApiClient:
 
     def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self.base_url}/{path.lstrip('/')}"
-        resp = self._client.get(url, headers=self._headers(), params=params or {})
+        resp = self._client.get(url, headers=self._headers(), params=params or {}, timeout=self.timeout)
         if resp.status_code == 401:
             raise OEDApiError("Unauthorized: check OED_APP_ID / OED_ACCESS_KEY")
         if resp.status_code == 429:
@@ -0,0 +1,265 @@
+"""
+Background OED PDF ingestion.
+
+Uploading an OED entry PDF creates an ``OEDParseJob`` and returns at once;
+the job runs in a Celery worker (``OED_PARSE_BACKGROUND``) or inline:
+
+1. A completed job for the same file (by SHA-256) already holds the
+   structured result: it is reused and nothing is re-extracted or re-sent
+   to the LLM, unless the upload asks for a re-parse.
+2. ``extracting``: a single pdfplumber pass over the pages not yet in the
+   page layout cache (``OEDPdfPageLayout``). Each page is committed with the
+   job's progress, so an interrupted job resumes at the next page and
+   re-parses of the same PDF skip extraction entirely.
+3. ``parsing``: the cached layout goes to ``OEDParser.parse_pages``
+   (LangExtract or Anthropic).
+
+Progress events go to the shared progress channel (see
+``orchestration_progress_service``) for the job's SSE stream.
+"""
+
+import hashlib
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from flask import current_app
+
+from app import db
+from app.models.oed_parse_job import OEDParseJob, OEDPdfPageLayout
+from app.services.base_service import BaseService, ValidationError
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _default_parser_class():
+    # Looked up per call so the parser (and its API keys) load only when needed
+    from app.services import oed_parser_final
+
+    return oed_parser_final.OEDParser
+
+
+class OEDParseJobService(BaseService):
+    """Create and run OED PDF parse jobs."""
+
+    def __init__(self, parser_class: Optional[Callable[[], Any]] = None, channel=None):
+        super().__init__()
+        self._parser_class = parser_class
+        self._channel = channel
+
+    @property
+    def parser_class(self):
+        return self._parser_class or _default_parser_class()
+
+    @property
+    def channel(self):
+        if self._channel is None:
+            from app.services.orchestration_progress_service import get_progress_channel
+
+            self._channel = get_progress_channel()
+        return self._channel
+
+    def submit(self, file_storage, user_id=None, background=True, force=False) -> OEDParseJob:
+        """
+        Store an uploaded PDF and start its parse job.
+
+        Args:
+            file_storage: Uploaded file (werkzeug ``FileStorage``)
+            user_id: Requesting user
+            background: Run in a Celery worker instead of inline
+            force: Re-run the structured extraction even if a completed job
+                for the same file exists (the page layout cache is still used)
+
+        Returns:
+            The job; completed or failed when run inline
+        """
+        filename = file_storage.filename or ''
+        if not filename.lower().endswith('.pdf'):
+            raise ValidationError('Only PDF files are supported')
+
+        file_hash, file_path = self._store_upload(file_storage)
+        job = OEDParseJob(
+            requested_by=user_id,
+            file_hash=file_hash,
+            file_path=file_path,
+            original_filename=filename,
+            status='pending',
+            force_reparse=force,
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        if background:
+            from app.tasks.oed import run_oed_parse_job_task
+
+            task = run_oed_parse_job_task.delay(str(job.id))
+            job.celery_task_id = task.id
+            db.session.commit()
+            return job
+        return self.run(job)
+
+    def run(self, job: OEDParseJob) -> OEDParseJob:
+        """Run (or resume) a parse job; failures are recorded on the job."""
+        if job.status == 'completed':
+            return job
+        job.status = 'running'
+        job.error_message = None
+        job.started_at = job.started_at or datetime.utcnow()
+        self._set_stage(job, 'extracting')
+
+        try:
+            previous = None if job.force_reparse else self._completed_job_for(job)
+            if previous is not None:
+                job.result = previous.result
+                job.result_reused_from = previous.id
+                job.layout_cached = True
+                job.pages_total = job.pages_done = previous.pages_total
+            else:
+                pages = self._extract_pages(job)
+                self._set_stage(job, 'parsing')
+                job.result = self.parser_class().parse_pages(pages)
+        except Exception as e:
+            db.session.rollback()
+            self.logger.error(f"OED parse job {job.id} failed: {e}", exc_info=True)
+            job.status = 'failed'
+            job.error_message = str(e)
+            job.updated_at = datetime.utcnow()
+            db.session.commit()
+            self._publish_status(job)
+            return job
+
+        job.status = 'completed'
+        job.stage = None
+        job.completed_at = job.updated_at = datetime.utcnow()
+        self._remove_upload(job)
+        db.session.commit()
+        self._publish_status(job)
+        return job
+
+    @staticmethod
+    def get_job(job_id) -> Optional[OEDParseJob]:
+        return db.session.get(OEDParseJob, job_id)
+
+    def job_status(self, job_id) -> Dict[str, Any]:
+        """Status payload for polling and the progress stream."""
+        job = self.get_job(job_id)
+        if job is None:
+            return {'status': 'failed', 'error_message': 'Job not found'}
+        return job.to_dict()
+
+    def _extract_pages(self, job: OEDParseJob) -> List[Dict[str, Any]]:
+        cached = OEDPdfPageLayout.query.filter_by(file_hash=job.file_hash).order_by(
+            OEDPdfPageLayout.page_number
+        ).all()
+        if cached and len(cached) == cached[0].page_count:
+            job.layout_cached = True
+            job.pages_total = job.pages_done = len(cached)
+            db.session.commit()
+            return [page.to_layout() for page in cached]
+
+        if not job.file_path or not os.path.exists(job.file_path):
+            raise ValueError('The uploaded PDF is no longer available; upload it again')
+
+        pages = [page.to_layout() for page in cached]
+        job.pages_done = len(pages)
+        try:
+            for page_number, page_count, layout in self.parser_class.iter_pdf_pages(
+                job.file_path, start_page=len(pages) + 1
+            ):
+                # merge: a concurrent job for the same file may have cached the page
+                db.session.merge(OEDPdfPageLayout(
+                    file_hash=job.file_hash,
+                    page_number=page_number,
+                    page_count=page_count,
+                    width=layout.get('width'),
+                    height=layout.get('height'),
+                    lines=layout.get('lines') or [],
+                    text=layout.get('text'),
+                ))
+                pages.append(layout)
+                job.pages_total = page_count
+                job.pages_done = page_number
+                job.updated_at = datetime.utcnow()
+                db.session.commit()
+                self.channel.publish(job.id, {
+                    'type': 'progress',
+                    'job_id': str(job.id),
+                    'stage': job.stage,
+                    'pages_done': job.pages_done,
+                    'pages_total': job.pages_total,
+                })
+        except Exception as e:
+            raise ValueError(f"Could not extract text from PDF: {e}") from e
+        return pages
+
+    @staticmethod
+    def _completed_job_for(job: OEDParseJob) -> Optional[OEDParseJob]:
+        return OEDParseJob.query.filter(
+            OEDParseJob.file_hash == job.file_hash,
+            OEDParseJob.status == 'completed',
+            OEDParseJob.result.isnot(None),
+            OEDParseJob.id != job.id,
+        ).order_by(OEDParseJob.completed_at.desc()).first()
+
+    def _set_stage(self, job: OEDParseJob, stage: str) -> None:
+        job.stage = stage
+        job.updated_at = datetime.utcnow()
+        db.session.commit()
+        self._publish_status(job)
+
+    def _publish_status(self, job: OEDParseJob) -> None:
+        self.channel.publish(job.id, {
+            'type': 'status',
+            'job_id': str(job.id),
+            'status': job.status,
+            'stage': job.stage,
+            'timestamp': datetime.utcnow().isoformat(),
+        })
+
+    @staticmethod
+    def _store_upload(file_storage):
+        """Save the upload under UPLOAD_FOLDER/oed, named by its SHA-256."""
+        folder = os.path.join(current_app.config.get('UPLOAD_FOLDER', 'uploads'), 'oed')
+        os.makedirs(folder, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(suffix='.pdf', dir=folder)
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                for chunk in iter(lambda: file_storage.stream.read(_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    out.write(chunk)
+            file_hash = digest.hexdigest()
+            file_path = os.path.join(folder, f'{file_hash}.pdf')
+            os.replace(temp_path, file_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return file_hash, file_path
+
+    @staticmethod
+    def _remove_upload(job: OEDParseJob) -> None:
+        # Other pending jobs for the same file still need it
+        if not job.file_path or OEDParseJob.query.filter(
+            OEDParseJob.file_path == job.file_path,
+            OEDParseJob.status.in_(('pending', 'running')),
+            OEDParseJob.id != job.id,
+        ).count():
+            return
+        try:
+            os.remove(job.file_path)
+        except OSError:
+            pass
+        job.file_path = None
+
+
+_oed_parse_job_service = None
+
+
+def get_oed_parse_job_service() -> OEDParseJobService:
+    """Return the process-wide OED parse job service instance."""
+    global _oed_parse_job_service
+    if _oed_parse_job_service is None:
+        _oed_parse_job_service = OEDParseJobService()
+    return _oed_parse_job_service
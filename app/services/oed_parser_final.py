@@ -51,20 +51,29 @@ class OEDParser:
         Returns:
             Dictionary with extracted OED entry data
         """
-        # Step 1: Extract text (and layout if available) from PDF
+        # Step 1: Extract text and layout from PDF in a single pass
         try:
-            if PDFPLUMBER_AVAILABLE:
-                layout = self._extract_pdf_layout(pdf_path)
-                text = self._serialize_structured_text(layout)
-                quote_candidates = self._extract_quote_candidates(layout)
-            else:
-                text = self._extract_pdf_text(pdf_path)
-                quote_candidates = []
+            pages = [layout for _, _, layout in self.iter_pdf_pages(pdf_path)]
         except Exception as e:
             logger.error(f"Failed to extract text from PDF: {e}")
             raise ValueError(f"Could not extract text from PDF: {e}")
         
-        if not text:
+        return self.parse_pages(pages)
+    
+    def parse_pages(self, pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Extract structured data from page layouts produced by ``iter_pdf_pages``
+        (or cached from an earlier extraction of the same PDF).
+        """
+        if any(page.get('lines') for page in pages):
+            text = self._serialize_structured_text(pages)
+            quote_candidates = self._extract_quote_candidates(pages)
+        else:
+            # Extracted without pdfplumber: plain text, no column geometry
+            text = ''.join(page.get('text') or '' for page in pages)
+            quote_candidates = []
+        
+        if not text.strip():
             raise ValueError("No text could be extracted from PDF")
         
         # Step 2: Parse with LangExtract or fallback
@@ -81,24 +90,36 @@ class OEDParser:
         
         return result
     
-    def _extract_pdf_text(self, pdf_path: str) -> str:
-        """Extract text from PDF using pypdf (successor of PyPDF2)"""
-        text = ""
-        try:
+    @staticmethod
+    def iter_pdf_pages(pdf_path: str, start_page: int = 1):
+        """
+        Yield ``(page_number, page_count, layout)`` for each page from
+        ``start_page`` on, opening the PDF once. Layouts come from pdfplumber
+        (see ``_page_layout``); without it, pages carry pypdf text only.
+        """
+        if not PDFPLUMBER_AVAILABLE:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = pypdf.PdfReader(file)
-                num_pages = len(pdf_reader.pages)
-                
-                for page_num in range(num_pages):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() or ""
-            
-            # Clean null characters that break PostgreSQL
-            text = text.replace('\x00', '')
-            return text
-        except Exception as e:
-            logger.error(f"Error extracting text from PDF: {e}")
-            raise
+                page_count = len(pdf_reader.pages)
+                for page_number in range(start_page, page_count + 1):
+                    text = pdf_reader.pages[page_number - 1].extract_text() or ""
+                    # Clean null characters that break PostgreSQL
+                    yield page_number, page_count, {
+                        'width': None, 'height': None, 'lines': [], 'text': text.replace('\x00', ''),
+                    }
+            return
+        
+        import importlib
+        pdfplumber = importlib.import_module("pdfplumber")
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+            for page_number in range(start_page, page_count + 1):
+                page = pdf.pages[page_number - 1]
+                try:
+                    yield page_number, page_count, OEDParser._page_layout(page)
+                finally:
+                    # Drop pdfplumber's per-page object cache as we go
+                    page.close()
     
     def _parse_with_langextract(self, text: str) -> Dict[str, Any]:
         """Parse OED text using LangExtract for structured extraction"""
@@ -170,50 +191,30 @@ class OEDParser:
             # Fall back to simple extraction
             return self._simple_extraction_fallback(text)
 
-    def _extract_pdf_layout(self, pdf_path: str) -> List[Dict[str, Any]]:
-        """Extract layout-aware text using pdfplumber: words with coordinates grouped into lines/columns.
-        Returns a list of pages; each page has 'width', 'height', and 'lines':
-          line: { 'y': float, 'left': str, 'right': str }
-        where 'left' is text of the left column segment (e.g., dates) and 'right' is the remaining text.
-        """
-        import importlib
-        if not PDFPLUMBER_AVAILABLE:
-            raise RuntimeError("pdfplumber not available")
-        pdfplumber = importlib.import_module("pdfplumber")
-
-        pages = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                width = page.width
-                mid_x = width / 2.0
-                words = page.extract_words(use_text_flow=True, keep_blank_chars=False)
-                # Group by line using y0 within tolerance
-                lines_map: Dict[int, List[Dict[str, Any]]] = {}
-                tol = 2  # pixels
-                for w in words:
-                    y = int(round(w['top']))
-                    bucket = None
-                    for key in (y, y-1, y+1, y-2, y+2):
-                        if key in lines_map:
-                            bucket = key
-                            break
-                    if bucket is None:
-                        lines_map[y] = [w]
-                    else:
-                        lines_map[bucket].append(w)
-                # Assemble lines
-                lines = []
-                for y, ws in sorted(lines_map.items(), key=lambda kv: kv[0]):
-                    left_tokens = []
-                    right_tokens = []
-                    for w in sorted(ws, key=lambda d: d['x0']):
-                        (left_tokens if w['x1'] < mid_x * 0.9 else right_tokens).append(w['text'])
-                    left_text = ' '.join(left_tokens).strip()
-                    right_text = ' '.join(right_tokens).strip()
-                    if left_text or right_text:
-                        lines.append({'y': y, 'left': left_text, 'right': right_text})
-                pages.append({'width': width, 'height': page.height, 'lines': lines})
-        return pages
+    @staticmethod
+    def _page_layout(page, tol: int = 2) -> Dict[str, Any]:
+        """Group one pdfplumber page's words into lines split at the left date column."""
+        width = page.width
+        mid_x = width / 2.0
+        words = page.extract_words(use_text_flow=True, keep_blank_chars=False)
+        # Sort by rounded top once; a line collects words within ``tol`` points of its first word
+        grouped: List[List[Any]] = []
+        for y, w in sorted(((int(round(w['top'])), w) for w in words), key=lambda item: item[0]):
+            if grouped and y - grouped[-1][0] <= tol:
+                grouped[-1][1].append(w)
+            else:
+                grouped.append([y, [w]])
+        lines = []
+        for y, ws in grouped:
+            left_tokens = []
+            right_tokens = []
+            for w in sorted(ws, key=lambda d: d['x0']):
+                (left_tokens if w['x1'] < mid_x * 0.9 else right_tokens).append(w['text'])
+            left_text = ' '.join(left_tokens).strip()
+            right_text = ' '.join(right_tokens).strip()
+            if left_text or right_text:
+                lines.append({'y': y, 'left': left_text, 'right': right_text})
+        return {'width': width, 'height': page.height, 'lines': lines}
 
     def _extract_quote_candidates(self, pages: List[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Detect quote lines pairing dates (left column) with text (right column)."""
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+from functools import wraps
 from typing import Any, Dict, Optional
 from flask import current_app
 
+from shared_services.metrics import observe_oed
+
 from .oed_api_client import OEDApiClient, OEDApiError
 
+
+def _observed(operation: str):
+    """Time an OEDService call; results with success=False count as errors."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with observe_oed(operation) as outcome:
+                result = func(*args, **kwargs)
+                if not result.get("success"):
+                    outcome["value"] = "error"
+                return result
+        return wrapper
+    return decorator
+
 class OEDService:
     """Facade selecting between local PDF parsing and OED API, based on config.
 
@@ -15,6 +32,7 @@ class OEDService:
     def __init__(self) -> None:
         self.use_api = bool(current_app.config.get('OED_USE_API'))
 
+    @_observed("get_entry")
     def get_entry(self, headword: str) -> Dict[str, Any]:
         if self.use_api:
             try:
@@ -27,6 +45,7 @@ class OEDService:
         # Fallback: return structured result from local PDF extraction not implemented here
         return {"success": False, "error": "Local fallback requires PDF; not available for headword lookup"}
 
+    @_observed("parse_pdf_entry")
     def parse_pdf_entry(self, pdf_path: str) -> Dict[str, Any]:
         if self.use_api:
             return {"success": False, "error": "Configured to use API; PDF parsing disabled for OED"}
@@ -36,6 +55,7 @@ class OEDService:
         data = parser.parse_pdf(pdf_path)
         return {"success": True, "data": data}
 
+    @_observed("get_word")
     def get_word(self, entry_id: str) -> Dict[str, Any]:
         if not self.use_api:
             return {"success": False, "error": "OED API is disabled"}
@@ -48,6 +68,7 @@ class OEDService:
         except OEDApiError as e:
             return {"success": False, "error": str(e)}
 
+    @_observed("get_quotations")
     def get_quotations(self, entry_id: str, *, limit: Optional[int] = None, offset: Optional[int] = None) -> Dict[str, Any]:
         if not self.use_api:
             return {"success": False, "error": "OED API is disabled"}
@@ -58,6 +79,7 @@ class OEDService:
         except OEDApiError as e:
             return {"success": False, "error": str(e)}
 
+    @_observed("suggest_ids")
     def suggest_ids(self, headword: str, *, limit: int = 6) -> Dict[str, Any]:
         """Heuristically suggest likely OED entry_ids for a headword.
 
@@ -179,6 +201,7 @@ class OEDService:
             unique.append(s)
         return unique
 
+    @_observed("get_variants")
     def get_variants(self, headword: str, *, limit: int = 6) -> Dict[str, Any]:
         """Retrieve multiple POS variants (entry_ids) for a base headword and return minimal metadata.
 
@@ -0,0 +1,392 @@
+"""
+Shared two-tier cache for ontology lookups (OntServe / MCP queries).
+
+Lookups are served from a bounded in-process LRU first, then from Redis, so
+results survive Celery child recycles and are shared by every web and worker
+process. Each entry has two deadlines:
+
+- ``fresh_until``: served as-is
+- ``stale_until``: still served, but a background refresh is scheduled
+  (stale-while-revalidate), so a slow or unreachable OntServe never blocks a
+  page view that already has an answer
+
+Loaders that return ``None`` are cached as negative entries for the shorter
+negative TTL, so repeated lookups of missing entities do not hit the network
+on every call; the ``None`` is returned to callers like any other value.
+Failed lookups are stored separately (``put_failure``) for a short failure
+TTL, during which reads raise ``CachedLookupFailure`` instead of calling an
+unreachable server again.
+
+Cached values are shared between callers and must be treated as read-only.
+Values stored in Redis must be JSON-serializable.
+
+Configuration (app config or environment):
+
+    ONTOLOGY_LOOKUP_CACHE_BACKEND       'redis', 'memory' or 'auto' (default)
+    ONTOLOGY_LOOKUP_CACHE_MAX_ENTRIES   in-process LRU size (default 1024)
+    ONTOLOGY_LOOKUP_CACHE_TTL           seconds an entry is fresh (default 3600)
+    ONTOLOGY_LOOKUP_CACHE_STALE_TTL     seconds a stale entry may still be served
+                                        while it is refreshed (default 86400)
+    ONTOLOGY_LOOKUP_CACHE_NEGATIVE_TTL  seconds a missing (None) result is
+                                        remembered (default 300)
+    ONTOLOGY_LOOKUP_CACHE_FAILURE_TTL   seconds a failed lookup is remembered
+                                        before it is retried (default 15)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+
+def _config(key: str, default: Any) -> Any:
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return os.environ.get(key, default)
+
+
+class CachedLookupFailure(Exception):
+    """Raised when a lookup failed recently and its failure entry has not expired."""
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+    missing: bool = False
+    error: Optional[str] = None  # Set on failure entries (see ``put_failure``)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'value': self.value,
+            'fresh_until': self.fresh_until,
+            'stale_until': self.stale_until,
+            'missing': self.missing,
+            'error': self.error,
+        })
+
+    @classmethod
+    def from_json(cls, raw) -> 'CacheEntry':
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+        data = json.loads(raw)
+        return cls(
+            data['value'], data['fresh_until'], data['stale_until'],
+            data.get('missing', False), data.get('error'),
+        )
+
+
+class RedisLookupTier:
+    """Second cache tier shared by all processes through Redis."""
+
+    PREFIX = 'ontextract:ontology:'
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raw = self.client.get(self.PREFIX + key)
+        return CacheEntry.from_json(raw) if raw is not None else None
+
+    def set(self, key: str, entry: CacheEntry, expire_seconds: float) -> None:
+        self.client.set(self.PREFIX + key, entry.to_json(), ex=max(1, int(expire_seconds + 0.5)))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.PREFIX + key)
+
+
+class OntologyLookupCache:
+    """Bounded LRU in front of an optional Redis tier, with background refresh."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 3600,
+        stale_ttl: float = 86400,
+        negative_ttl: float = 300,
+        failure_ttl: float = 15,
+        remote: Optional[RedisLookupTier] = None,
+        clock: Callable[[], float] = time.time,
+        executor=None,
+    ):
+        """
+        Args:
+            max_entries: Entries kept in the in-process LRU
+            ttl: Seconds an entry is served without refreshing
+            stale_ttl: Further seconds a stale entry is served while refreshing
+            negative_ttl: Seconds a ``None`` (missing) result is remembered
+            failure_ttl: Seconds a failed lookup is remembered (see ``put_failure``)
+            remote: Shared second tier (None keeps the cache per process)
+            clock: Wall-clock source; shared with other processes via Redis
+            executor: Runs background refreshes (default: small thread pool)
+        """
+        if max_entries <= 0:
+            raise ValueError("Ontology lookup cache needs at least one entry")
+        self.max_entries = int(max_entries)
+        self.ttl = float(ttl)
+        self.stale_ttl = float(stale_ttl)
+        self.negative_ttl = float(negative_ttl)
+        self.failure_ttl = float(failure_ttl)
+        self.remote = remote
+        self.clock = clock
+        self._executor = executor
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0, 'remote_hits': 0, 'misses': 0, 'stale_hits': 0,
+            'negative_hits': 0, 'failure_hits': 0, 'loads': 0, 'refreshes': 0, 'refresh_errors': 0,
+            'evictions': 0, 'remote_errors': 0,
+        }
+
+    # -- public API -------------------------------------------------------
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], refresh: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Return the cached value for ``key``, calling ``loader`` on a miss.
+
+        Stale entries are returned immediately and refreshed in the background
+        with ``refresh`` (default: ``loader``). Loader exceptions propagate and
+        are not cached.
+
+        Raises:
+            CachedLookupFailure: If a failure entry is stored for ``key``
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self._raise_failure(entry)
+            self._maybe_refresh(key, entry, refresh or loader)
+            return entry.value
+        self._count('loads')
+        return self.put(key, loader())
+
+    async def aget_or_load(self, key: str, loader: Callable[[], Awaitable[Any]],
+                           refresh: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Async variant of ``get_or_load`` for coroutine loaders.
+
+        ``refresh`` is a synchronous callable run on the refresh thread; the
+        coroutine loader cannot be reused there because it is bound to the
+        caller's event loop. Without it, stale entries are reloaded inline.
+
+        Raises:
+            CachedLookupFailure: If a failure entry is stored for ``key``
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self._raise_failure(entry)
+        if entry is not None and (refresh is not None or not self._is_stale(entry)):
+            self._maybe_refresh(key, entry, refresh)
+            return entry.value
+        self._count('loads')
+        return self.put(key, await loader())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value (fresh or stale) without loading; ``default`` if absent, missing or failed."""
+        entry = self._lookup(key)
+        if entry is None or entry.missing or entry.error is not None:
+            return default
+        return entry.value
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> Any:
+        """Store ``value`` (``None`` stores a negative entry) and return it."""
+        now = self.clock()
+        if value is None:
+            fresh = self.negative_ttl if ttl is None else ttl
+            entry = CacheEntry(None, now + fresh, now + fresh, missing=True)
+        else:
+            fresh = self.ttl if ttl is None else ttl
+            entry = CacheEntry(value, now + fresh, now + fresh + self.stale_ttl)
+        self._store_local(key, entry)
+        self._store_remote(key, entry)
+        return value
+
+    def put_failure(self, key: str, error: str, ttl: Optional[float] = None) -> None:
+        """Remember that loading ``key`` failed, so reads raise instead of retrying until ``ttl``."""
+        now = self.clock()
+        until = now + (self.failure_ttl if ttl is None else ttl)
+        entry = CacheEntry(None, until, until, missing=True, error=str(error) or 'lookup failed')
+        self._store_local(key, entry)
+        self._store_remote(key, entry)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.remote is not None:
+            try:
+                self.remote.delete(key)
+            except Exception as e:
+                self._remote_error(e)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (the Redis tier expires on its own)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(
+                size=len(self._entries),
+                max_entries=self.max_entries,
+                backend='redis' if self.remote is not None else 'memory',
+            )
+        lookups = stats['memory_hits'] + stats['remote_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['remote_hits']) / lookups if lookups else 0.0
+        return stats
+
+    # -- internals --------------------------------------------------------
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stale_until <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats['memory_hits'] += 1
+        if entry is None:
+            entry = self._lookup_remote(key, now)
+        if entry is None:
+            self._count('misses')
+            return None
+        if entry.error is not None:
+            self._count('failure_hits')
+        elif entry.missing:
+            self._count('negative_hits')
+        elif entry.fresh_until <= now:
+            self._count('stale_hits')
+        return entry
+
+    def _lookup_remote(self, key: str, now: float) -> Optional[CacheEntry]:
+        if self.remote is None:
+            return None
+        try:
+            entry = self.remote.get(key)
+        except Exception as e:
+            self._remote_error(e)
+            return None
+        if entry is None or entry.stale_until <= now:
+            return None
+        self._count('remote_hits')
+        self._store_local(key, entry)
+        return entry
+
+    def _store_local(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def _store_remote(self, key: str, entry: CacheEntry) -> None:
+        if self.remote is None:
+            return
+        try:
+            self.remote.set(key, entry, entry.stale_until - self.clock())
+        except Exception as e:
+            self._remote_error(e)
+
+    @staticmethod
+    def _raise_failure(entry: CacheEntry) -> None:
+        if entry.error is not None:
+            raise CachedLookupFailure(entry.error)
+
+    def _is_stale(self, entry: CacheEntry) -> bool:
+        return entry.fresh_until <= self.clock()
+
+    def _maybe_refresh(self, key: str, entry: CacheEntry, refresh: Optional[Callable[[], Any]]) -> None:
+        if refresh is None or not self._is_stale(entry):
+            return
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        try:
+            self._get_executor().submit(self._refresh, key, entry, refresh)
+        except RuntimeError as e:  # executor shut down at interpreter exit
+            with self._lock:
+                self._refreshing.discard(key)
+            logger.debug(f"Could not schedule refresh of {key[:80]}: {e}")
+
+    def _refresh(self, key: str, entry: CacheEntry, refresh: Callable[[], Any]) -> None:
+        try:
+            value = refresh()
+            if value is None and not entry.missing:
+                # A refresh that comes back empty keeps the last good answer
+                raise LookupError("refresh returned no result")
+            self.put(key, value)
+            self._count('refreshes')
+        except Exception as e:
+            self._count('refresh_errors')
+            logger.warning(f"Ontology lookup refresh failed for {key[:80]}: {e}")
+            # Back off: keep serving the stale value without retrying on every read
+            retry_at = min(self.clock() + self.negative_ttl, entry.stale_until)
+            self._store_local(key, CacheEntry(entry.value, retry_at, entry.stale_until, entry.missing))
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _get_executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ontology-cache-refresh')
+        return self._executor
+
+    def _remote_error(self, error: Exception) -> None:
+        self._count('remote_errors')
+        logger.debug(f"Ontology lookup cache Redis tier unavailable: {error}")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+def _build_cache() -> OntologyLookupCache:
+    backend = str(_config('ONTOLOGY_LOOKUP_CACHE_BACKEND', 'auto')).lower()
+    remote = None
+    if backend in ('redis', 'auto'):
+        try:
+            import redis
+
+            client = redis.from_url(_config('REDIS_URL', 'redis://localhost:6379/0'))
+            client.ping()
+            remote = RedisLookupTier(client)
+        except Exception as e:
+            if backend == 'redis':
+                raise
+            logger.info(f"Redis unavailable for ontology lookups ({e}); using a per-process cache")
+    return OntologyLookupCache(
+        max_entries=int(_config('ONTOLOGY_LOOKUP_CACHE_MAX_ENTRIES', 1024)),
+        ttl=float(_config('ONTOLOGY_LOOKUP_CACHE_TTL', 3600)),
+        stale_ttl=float(_config('ONTOLOGY_LOOKUP_CACHE_STALE_TTL', 86400)),
+        negative_ttl=float(_config('ONTOLOGY_LOOKUP_CACHE_NEGATIVE_TTL', 300)),
+        failure_ttl=float(_config('ONTOLOGY_LOOKUP_CACHE_FAILURE_TTL', 15)),
+        remote=remote,
+    )
+
+
+# Global instance (singleton pattern)
+_global_lookup_cache: Optional[OntologyLookupCache] = None
+
+
+def get_ontology_lookup_cache() -> OntologyLookupCache:
+    """Get the ontology lookup cache shared by the MCP and OntServe clients."""
+    global _global_lookup_cache
+    if _global_lookup_cache is None:
+        _global_lookup_cache = _build_cache()
+    return _global_lookup_cache
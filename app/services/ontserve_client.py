@@ -6,9 +6,10 @@ Provides domain-specific methods for semantic change event types,
 SPARQL queries, and ontology validation.
 """
 
+import json
 import logging
+from pathlib import Path
 from typing import List, Dict, Any, Optional
-from functools import lru_cache
 from .mcp_client import get_mcp_client, MCPClientError
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,11 @@ class OntServeClient:
     - Execute SPARQL queries
     - Validate URIs
     - Get property definitions
+
+    Results are cached by the shared ontology lookup cache, not per method:
+    an ``lru_cache`` here would pin the first answer (including the hardcoded
+    fallback served while OntServe is down) for the life of the process and
+    bypass the cache's expiry and background refresh.
     """
 
     def __init__(self):
@@ -33,13 +39,12 @@ class OntServeClient:
 
         logger.info("OntServe client initialized for semantic change ontology")
 
-    @lru_cache(maxsize=1)
     def get_event_types(self) -> List[Dict[str, Any]]:
         """
         Fetch semantic event types from SCO ontology.
 
         Returns synchronous result by running async code.
-        Cached for application lifetime.
+        Served from the shared ontology lookup cache (see MCPClient.call_mcp).
 
         Returns:
             List of event types with:
@@ -72,34 +77,15 @@ class OntServeClient:
         Returns:
             List of event type dictionaries
         """
-        # SPARQL query to get all semantic event types
-        sparql = f"""
-        PREFIX sco: <{self.namespace}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
-
-        SELECT ?eventType ?label ?comment
-               (GROUP_CONCAT(DISTINCT ?example; separator="|||") as ?examples)
-        WHERE {{
-            ?eventType rdfs:subClassOf* sco:SemanticChangeEvent .
-            ?eventType rdfs:label ?label .
-            OPTIONAL {{ ?eventType rdfs:comment ?comment }}
-            OPTIONAL {{ ?eventType skos:example ?example }}
-            FILTER(?eventType != sco:SemanticChangeEvent)
-        }}
-        GROUP BY ?eventType ?label ?comment
-        ORDER BY ?label
-        """
-
         try:
             result = await self.mcp_client.call_mcp("sparql_query", {
                 "ontology": self.ontology_name,
-                "query": sparql
+                "query": self._event_types_query()
             })
 
             # Transform SPARQL results to UI format
             event_types = []
-            bindings = result.get("results", {}).get("bindings", [])
+            bindings = (result or {}).get("results", {}).get("bindings", [])
 
             for binding in bindings:
                 uri = binding["eventType"]["value"]
@@ -127,6 +113,26 @@ class OntServeClient:
             # Return hardcoded fallback
             return self._get_fallback_event_types()
 
+    def _event_types_query(self) -> str:
+        """SPARQL query for all semantic event types."""
+        return f"""
+        PREFIX sco: <{self.namespace}>
+        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+        PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
+
+        SELECT ?eventType ?label ?comment
+               (GROUP_CONCAT(DISTINCT ?example; separator="|||") as ?examples)
+        WHERE {{
+            ?eventType rdfs:subClassOf* sco:SemanticChangeEvent .
+            ?eventType rdfs:label ?label .
+            OPTIONAL {{ ?eventType rdfs:comment ?comment }}
+            OPTIONAL {{ ?eventType skos:example ?example }}
+            FILTER(?eventType != sco:SemanticChangeEvent)
+        }}
+        GROUP BY ?eventType ?label ?comment
+        ORDER BY ?label
+        """
+
     def _get_fallback_event_types(self) -> List[Dict[str, Any]]:
         """
         Fallback event types if ontology query fails.
@@ -232,23 +238,13 @@ class OntServeClient:
         Returns:
             True if valid
         """
-        # SPARQL query to check if URI exists as a class
-        sparql = f"""
-        PREFIX sco: <{self.namespace}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-        ASK {{
-            <{uri}> rdfs:subClassOf* sco:SemanticChangeEvent .
-        }}
-        """
-
         try:
             result = await self.mcp_client.call_mcp("sparql_query", {
                 "ontology": self.ontology_name,
-                "query": sparql
+                "query": self._validate_uri_query(uri)
             })
 
-            return result.get("boolean", False)
+            return (result or {}).get("boolean", False)
 
         except MCPClientError as e:
             logger.error(f"URI validation failed: {e}")
@@ -258,6 +254,17 @@ class OntServeClient:
             }
             return uri in fallback_uris
 
+    def _validate_uri_query(self, uri: str) -> str:
+        """SPARQL ASK query checking that a URI is a semantic event type."""
+        return f"""
+        PREFIX sco: <{self.namespace}>
+        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+        ASK {{
+            <{uri}> rdfs:subClassOf* sco:SemanticChangeEvent .
+        }}
+        """
+
     def get_properties(self) -> List[Dict[str, Any]]:
         """
         Get all SCO properties (object and datatype).
@@ -282,32 +289,14 @@ class OntServeClient:
         Returns:
             List of properties with metadata
         """
-        sparql = f"""
-        PREFIX sco: <{self.namespace}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        PREFIX owl: <http://www.w3.org/2002/07/owl#>
-
-        SELECT ?property ?label ?type ?comment ?domain ?range
-        WHERE {{
-            VALUES ?type {{ owl:ObjectProperty owl:DatatypeProperty }}
-            ?property a ?type .
-            ?property rdfs:label ?label .
-            OPTIONAL {{ ?property rdfs:comment ?comment }}
-            OPTIONAL {{ ?property rdfs:domain ?domain }}
-            OPTIONAL {{ ?property rdfs:range ?range }}
-            FILTER(STRSTARTS(STR(?property), "{self.namespace}"))
-        }}
-        ORDER BY ?type ?label
-        """
-
         try:
             result = await self.mcp_client.call_mcp("sparql_query", {
                 "ontology": self.ontology_name,
-                "query": sparql
+                "query": self._properties_query()
             })
 
             properties = []
-            bindings = result.get("results", {}).get("bindings", [])
+            bindings = (result or {}).get("results", {}).get("bindings", [])
 
             for binding in bindings:
                 uri = binding["property"]["value"]
@@ -331,6 +320,68 @@ class OntServeClient:
             logger.error(f"Failed to fetch properties: {e}")
             return []
 
+    def _properties_query(self) -> str:
+        """SPARQL query for SCO object and datatype properties."""
+        return f"""
+        PREFIX sco: <{self.namespace}>
+        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+        PREFIX owl: <http://www.w3.org/2002/07/owl#>
+
+        SELECT ?property ?label ?type ?comment ?domain ?range
+        WHERE {{
+            VALUES ?type {{ owl:ObjectProperty owl:DatatypeProperty }}
+            ?property a ?type .
+            ?property rdfs:label ?label .
+            OPTIONAL {{ ?property rdfs:comment ?comment }}
+            OPTIONAL {{ ?property rdfs:domain ?domain }}
+            OPTIONAL {{ ?property rdfs:range ?range }}
+            FILTER(STRSTARTS(STR(?property), "{self.namespace}"))
+        }}
+        ORDER BY ?type ?label
+        """
+
+    def prefill_from_local_ontology(self, ontology_path: Optional[Path] = None) -> int:
+        """
+        Seed the lookup cache with this client's queries answered locally.
+
+        Runs the event type, period type, property and event URI validation
+        queries against ``ontologies/<ontology_name>.ttl`` with rdflib and
+        stores the results under the same keys OntServe answers use. Entries
+        are stored already stale, so they are served immediately and replaced
+        by OntServe's answer as soon as a background refresh succeeds.
+
+        Args:
+            ontology_path: Turtle file to query (default: the bundled copy)
+
+        Returns:
+            Number of query results cached
+        """
+        from shared_services.ontology.graph_cache import get_ontology_graph_cache
+
+        if ontology_path is None:
+            ontology_path = Path(__file__).resolve().parents[2] / 'ontologies' / f"{self.ontology_name}.ttl"
+        graph = get_ontology_graph_cache().load_file(ontology_path, format='turtle').graph
+
+        def answer(query: str) -> Dict[str, Any]:
+            return json.loads(graph.query(query).serialize(format='json'))
+
+        queries = [self._event_types_query(), self._period_types_query(), self._properties_query()]
+        event_types = answer(queries[0])
+        queries += [
+            self._validate_uri_query(uri)
+            for uri in {binding["eventType"]["value"] for binding in event_types["results"]["bindings"]}
+        ]
+
+        primed = 0
+        for query in queries:
+            result = event_types if query is queries[0] else answer(query)
+            if "results" in result and not result["results"].get("bindings"):
+                # Nothing local to offer; leave the lookup to OntServe or the fallbacks
+                continue
+            self.mcp_client.prime("sparql_query", {"ontology": self.ontology_name, "query": query}, result, ttl=0)
+            primed += 1
+        return primed
+
     def _get_color_for_type(self, event_name: str) -> str:
         """
         Map event type to UI color.
@@ -373,13 +424,12 @@ class OntServeClient:
         }
         return icons.get(event_name, "fas fa-circle")
 
-    @lru_cache(maxsize=1)
     def get_period_types(self) -> List[Dict[str, Any]]:
         """
         Fetch temporal period types from SCO ontology.
 
         Returns synchronous result by running async code.
-        Cached for application lifetime.
+        Served from the shared ontology lookup cache (see MCPClient.call_mcp).
 
         Returns:
             List of period types with:
@@ -411,30 +461,15 @@ class OntServeClient:
         Returns:
             List of period type dictionaries
         """
-        # SPARQL query to get all temporal period types
-        sparql = f"""
-        PREFIX sco: <{self.namespace}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-        SELECT ?periodType ?label ?comment
-        WHERE {{
-            ?periodType rdfs:subClassOf* sco:TemporalPeriod .
-            ?periodType rdfs:label ?label .
-            OPTIONAL {{ ?periodType rdfs:comment ?comment }}
-            FILTER(?periodType != sco:TemporalPeriod)
-        }}
-        ORDER BY ?label
-        """
-
         try:
             result = await self.mcp_client.call_mcp("sparql_query", {
                 "ontology": self.ontology_name,
-                "query": sparql
+                "query": self._period_types_query()
             })
 
             # Transform SPARQL results to UI format
             period_types = []
-            bindings = result.get("results", {}).get("bindings", [])
+            bindings = (result or {}).get("results", {}).get("bindings", [])
 
             for binding in bindings:
                 uri = binding["periodType"]["value"]
@@ -457,6 +492,22 @@ class OntServeClient:
             # Return hardcoded fallback
             return self._get_fallback_period_types()
 
+    def _period_types_query(self) -> str:
+        """SPARQL query for all temporal period types."""
+        return f"""
+        PREFIX sco: <{self.namespace}>
+        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+        SELECT ?periodType ?label ?comment
+        WHERE {{
+            ?periodType rdfs:subClassOf* sco:TemporalPeriod .
+            ?periodType rdfs:label ?label .
+            OPTIONAL {{ ?periodType rdfs:comment ?comment }}
+            FILTER(?periodType != sco:TemporalPeriod)
+        }}
+        ORDER BY ?label
+        """
+
     def _get_fallback_period_types(self) -> List[Dict[str, Any]]:
         """
         Fallback period types if ontology query fails.
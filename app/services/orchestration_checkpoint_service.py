@@ -0,0 +1,120 @@
+"""Per-tool execution checkpoints for resumable orchestration runs."""
+
+import hashlib
+import json
+import logging
+
+from app import db
+from app.models.document import Document
+from app.models.orchestration_checkpoint import OrchestrationToolCheckpoint
+
+
+logger = logging.getLogger(__name__)
+
+
+class OrchestrationCheckpointService:
+    """Record, look up and summarize (document, tool) checkpoints for a run."""
+
+    @staticmethod
+    def idempotency_key(document_id, version_number, content, tool_name, parameters=None):
+        """
+        Derive the key identifying one unit of work.
+
+        The key changes whenever the document version or text, the tool, or
+        its parameters change, so stale checkpoints are never reused.
+        """
+        payload = json.dumps({
+            'document_id': int(document_id),
+            'version': version_number,
+            'content_sha256': hashlib.sha256((content or '').encode('utf-8')).hexdigest(),
+            'tool': tool_name,
+            'parameters': parameters or {},
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def document_versions(document_ids):
+        """Map document id (as given) to its current version number in one query."""
+        ids = {int(doc_id): doc_id for doc_id in document_ids}
+        if not ids:
+            return {}
+        rows = db.session.query(Document.id, Document.version_number).filter(
+            Document.id.in_(list(ids))
+        ).all()
+        return {ids[row.id]: row.version_number for row in rows}
+
+    @staticmethod
+    def load(run_id):
+        """All checkpoints for a run keyed by idempotency key."""
+        checkpoints = OrchestrationToolCheckpoint.query.filter_by(run_id=run_id).all()
+        return {checkpoint.idempotency_key: checkpoint for checkpoint in checkpoints}
+
+    @staticmethod
+    def begin(run_id, document_id, tool_name, key, existing=None):
+        """Create (or reopen) the checkpoint for an execution about to start."""
+        checkpoint = existing
+        if checkpoint is None:
+            checkpoint = OrchestrationToolCheckpoint(
+                run_id=run_id,
+                document_id=int(document_id),
+                tool_name=tool_name,
+                idempotency_key=key,
+                attempts=0,
+            )
+            db.session.add(checkpoint)
+        elif checkpoint.status == 'running':
+            logger.info(
+                f"[Run {run_id}] Re-running interrupted {tool_name} on doc {document_id}"
+            )
+        checkpoint.status = 'running'
+        checkpoint.attempts = (checkpoint.attempts or 0) + 1
+        checkpoint.error_message = None
+        db.session.commit()
+        return checkpoint
+
+    @staticmethod
+    def complete(checkpoint, result):
+        """Persist a successful result summary."""
+        try:
+            checkpoint.mark_completed(result)
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Error saving checkpoint {checkpoint.id}: {e}")
+            db.session.rollback()
+
+    @staticmethod
+    def fail(checkpoint, error):
+        """Persist a failed execution so it is retried on resume."""
+        try:
+            checkpoint.mark_failed(error)
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Error saving checkpoint {checkpoint.id}: {e}")
+            db.session.rollback()
+
+    @staticmethod
+    def summarize(run_id, planned=None):
+        """
+        Progress of a run's execution stage built from its checkpoints.
+
+        Args:
+            run_id: Orchestration run ID
+            planned: Total (document, tool) pairs in the strategy, if known
+
+        Returns:
+            Counts per status plus completed results grouped by document
+        """
+        checkpoints = OrchestrationToolCheckpoint.query.filter_by(run_id=run_id).order_by(
+            OrchestrationToolCheckpoint.id
+        ).all()
+        counts = {'completed': 0, 'failed': 0, 'running': 0}
+        partial_results = {}
+        for checkpoint in checkpoints:
+            counts[checkpoint.status] = counts.get(checkpoint.status, 0) + 1
+            if checkpoint.status == 'completed':
+                partial_results.setdefault(str(checkpoint.document_id), {})[checkpoint.tool_name] = checkpoint.result
+        return {
+            'planned': planned,
+            **counts,
+            'partial_results': partial_results,
+        }
@@ -0,0 +1,369 @@
+"""
+Push-based progress events for orchestration runs and processing jobs.
+
+Orchestration nodes publish progress to a channel instead of committing
+every status change to ``experiment_orchestration_runs``; the browser
+subscribes over server-sent events instead of polling the run status.
+Committed ``ProcessingJob`` changes are published on the same channel,
+keyed by job and by document, whichever code path made them.
+
+- ``RedisProgressChannel`` fans events out across processes (Celery workers
+  publish, web workers stream) with Redis pub/sub
+- ``InMemoryProgressChannel`` serves single-process setups and tests; under
+  the ``auto`` backend it is only a fallback, with a warning, because events
+  published by Celery workers never reach a web process's stream
+- ``OrchestrationProgressReporter`` publishes every update immediately but
+  writes ``current_operation`` to the database at most once per flush interval
+- ``OrchestrationProgressStream`` turns a subscription into an SSE stream,
+  re-reading the run (or job) status on status changes and periodically as
+  a safety net
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app import db
+from app.models.experiment_orchestration_run import ExperimentOrchestrationRun
+from app.models.processing_job import ProcessingJob
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ('completed', 'failed', 'reviewing')
+JOB_TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+def _config(key: str, default: Any) -> Any:
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return os.environ.get(key, default)
+
+
+class _QueueSubscription:
+    """Subscription backed by a local queue."""
+
+    def __init__(self, channel, run_id):
+        self._channel = channel
+        self._run_id = run_id
+        self._queue = queue.Queue()
+
+    def put(self, event):
+        self._queue.put(event)
+
+    def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self._channel._unsubscribe(self._run_id, self)
+
+
+class InMemoryProgressChannel:
+    """Process-local progress channel."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, list] = {}
+
+    def publish(self, run_id, event: Dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(run_id), []))
+        for subscription in subscribers:
+            subscription.put(event)
+
+    def subscribe(self, run_id) -> _QueueSubscription:
+        subscription = _QueueSubscription(self, str(run_id))
+        with self._lock:
+            self._subscribers.setdefault(str(run_id), []).append(subscription)
+        return subscription
+
+    def _unsubscribe(self, run_id, subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(run_id, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._subscribers.pop(run_id, None)
+
+
+class _RedisSubscription:
+    """Subscription backed by a Redis pub/sub connection."""
+
+    def __init__(self, pubsub):
+        self._pubsub = pubsub
+
+    def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        message = self._pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if not message:
+            return None
+        try:
+            return json.loads(message['data'])
+        except (TypeError, ValueError):
+            return None
+
+    def close(self):
+        try:
+            self._pubsub.close()
+        except Exception:
+            pass
+
+
+class RedisProgressChannel:
+    """Progress channel shared by all processes through Redis pub/sub."""
+
+    PREFIX = 'ontextract:orchestration:progress:'
+
+    def __init__(self, client):
+        self.client = client
+
+    def publish(self, run_id, event: Dict[str, Any]) -> None:
+        try:
+            self.client.publish(self.PREFIX + str(run_id), json.dumps(event, default=str))
+        except Exception as e:
+            # Progress is best effort; the coalesced DB state still advances
+            logger.warning(f"Failed to publish progress for run {run_id}: {e}")
+
+    def subscribe(self, run_id) -> _RedisSubscription:
+        pubsub = self.client.pubsub()
+        pubsub.subscribe(self.PREFIX + str(run_id))
+        return _RedisSubscription(pubsub)
+
+
+def _build_channel():
+    backend = str(_config('ORCHESTRATION_PROGRESS_BACKEND', 'auto')).lower()
+    if backend in ('redis', 'auto'):
+        try:
+            import redis
+
+            client = redis.from_url(_config('REDIS_URL', 'redis://localhost:6379/0'))
+            client.ping()
+            return RedisProgressChannel(client)
+        except Exception as e:
+            if backend == 'redis':
+                raise
+            if _config('TESTING', False):
+                logger.info(f"Redis unavailable for orchestration progress ({e}); using in-process channel")
+            else:
+                logger.warning(
+                    f"Redis unavailable for orchestration progress ({e}); using an in-process channel. "
+                    f"Progress published by Celery workers will not reach progress streams. Set "
+                    f"ORCHESTRATION_PROGRESS_BACKEND=memory for a single-process deployment or "
+                    f"ORCHESTRATION_PROGRESS_BACKEND=redis to fail at startup instead."
+                )
+    return InMemoryProgressChannel()
+
+
+class OrchestrationProgressReporter:
+    """Publish progress immediately; persist the latest operation lazily."""
+
+    def __init__(self, channel, flush_seconds: float = 2.0, clock=time.monotonic):
+        self.channel = channel
+        self.flush_seconds = flush_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._pending: Dict[str, str] = {}
+        self._last_flush: Dict[str, float] = {}
+
+    def report(self, run_id, operation: str, **fields) -> None:
+        """Publish an operation update; write it to the DB if the interval elapsed."""
+        key = str(run_id)
+        self.channel.publish(key, {
+            'type': 'operation',
+            'run_id': key,
+            'current_operation': operation,
+            'timestamp': datetime.utcnow().isoformat(),
+            **fields,
+        })
+        with self._lock:
+            self._pending[key] = operation
+            due = self.clock() - self._last_flush.get(key, float('-inf')) >= self.flush_seconds
+        if due:
+            self.flush(run_id)
+
+    def flush(self, run_id) -> None:
+        """Write the latest pending operation for a run (single UPDATE)."""
+        key = str(run_id)
+        with self._lock:
+            operation = self._pending.pop(key, None)
+            self._last_flush[key] = self.clock()
+        if operation is None:
+            return
+        try:
+            ExperimentOrchestrationRun.query.filter_by(id=run_id).update(
+                {'current_operation': operation}, synchronize_session=False
+            )
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"Error updating current_operation: {e}")
+            # Don't fail execution if progress update fails
+            db.session.rollback()
+
+    def status_changed(self, run: ExperimentOrchestrationRun) -> None:
+        """Flush pending progress and announce a stage/status transition."""
+        key = str(run.id)
+        self.flush(run.id)
+        with self._lock:
+            self._last_flush.pop(key, None)
+        self.channel.publish(key, {
+            'type': 'status',
+            'run_id': key,
+            'status': run.status,
+            'current_stage': run.current_stage,
+            'timestamp': datetime.utcnow().isoformat(),
+        })
+
+
+class OrchestrationProgressStream:
+    """Stream a run's (or processing job's) progress as server-sent events."""
+
+    def __init__(self, channel, status_reader, heartbeat_seconds=15.0,
+                 resync_seconds=30.0, max_seconds=900.0, clock=time.monotonic,
+                 terminal_statuses=TERMINAL_STATUSES):
+        """
+        Args:
+            channel: Progress channel to subscribe to
+            status_reader: Callable returning the full run status payload
+            heartbeat_seconds: Idle interval between keep-alive comments
+            resync_seconds: Re-read the run status this often as a safety net
+            max_seconds: Close the stream after this long (EventSource reconnects)
+            terminal_statuses: Snapshot statuses that end the stream
+        """
+        self.channel = channel
+        self.status_reader = status_reader
+        self.heartbeat_seconds = heartbeat_seconds
+        self.resync_seconds = resync_seconds
+        self.max_seconds = max_seconds
+        self.clock = clock
+        self.terminal_statuses = terminal_statuses
+
+    def stream(self, run_id, channel_key=None) -> Iterator[str]:
+        """
+        Args:
+            run_id: ID passed to the status reader
+            channel_key: Channel key to subscribe to (default: ``run_id``)
+        """
+        # Subscribe before the first snapshot so no event falls in between
+        subscription = self.channel.subscribe(channel_key or run_id)
+        try:
+            snapshot = self._snapshot(run_id)
+            yield self._event(snapshot)
+            if snapshot.get('status') in self.terminal_statuses:
+                return
+
+            started = last_sync = self.clock()
+            while self.clock() - started < self.max_seconds:
+                event = subscription.get(timeout=self.heartbeat_seconds)
+                yield self._event(event) if event is not None else ': heartbeat\n\n'
+
+                # Stage changes need the full payload (e.g. strategy for review)
+                stage_changed = event is not None and event.get('type') == 'status'
+                if not stage_changed and self.clock() - last_sync < self.resync_seconds:
+                    continue
+
+                snapshot = self._snapshot(run_id)
+                last_sync = self.clock()
+                yield self._event(snapshot)
+                if snapshot.get('status') in self.terminal_statuses:
+                    return
+        finally:
+            subscription.close()
+
+    def _snapshot(self, run_id) -> Dict[str, Any]:
+        try:
+            return {'type': 'status', **self.status_reader(run_id)}
+        finally:
+            # Release the connection and drop cached rows so the next read is fresh
+            db.session.close()
+
+    @staticmethod
+    def _event(payload):
+        return f'data: {json.dumps(payload, default=str)}\n\n'
+
+
+def processing_job_channel_key(job_id) -> str:
+    return f'processing-job:{job_id}'
+
+
+def processing_document_channel_key(document_id) -> str:
+    return f'processing-document:{document_id}'
+
+
+_JOB_EVENTS_KEY = 'processing_job_events'
+
+
+def _queue_job_event(mapper, connection, job: ProcessingJob) -> None:
+    session = object_session(job)
+    if session is None:
+        return
+    document_ids = {job.document_id, job.get_parameters().get('original_document_id')}
+    session.info.setdefault(_JOB_EVENTS_KEY, {})[job.id] = ({
+        'type': 'status',
+        'job_id': job.id,
+        'job_type': job.job_type,
+        'document_id': job.document_id,
+        'status': job.status,
+        'progress_percent': job.progress_percent,
+        'current_step': job.current_step,
+        'timestamp': datetime.utcnow().isoformat(),
+    }, [document_id for document_id in document_ids if document_id is not None])
+
+
+def _publish_job_events(session) -> None:
+    """Publish ProcessingJob changes once they are committed (and visible)."""
+    events = session.info.pop(_JOB_EVENTS_KEY, None)
+    if not events:
+        return
+    try:
+        channel = get_progress_channel()
+        for payload, document_ids in events.values():
+            channel.publish(processing_job_channel_key(payload['job_id']), payload)
+            for document_id in document_ids:
+                channel.publish(processing_document_channel_key(document_id), payload)
+    except Exception as e:
+        # The commit already happened; streams still resync from the database
+        logger.warning(f"Failed to publish processing job progress: {e}")
+
+
+def _discard_job_events(session, previous_transaction=None) -> None:
+    session.info.pop(_JOB_EVENTS_KEY, None)
+
+
+event.listen(ProcessingJob, 'after_insert', _queue_job_event)
+event.listen(ProcessingJob, 'after_update', _queue_job_event)
+event.listen(Session, 'after_commit', _publish_job_events)
+event.listen(Session, 'after_soft_rollback', _discard_job_events)
+
+
+# Global instances (singleton pattern)
+_progress_channel = None
+_progress_reporter: Optional[OrchestrationProgressReporter] = None
+
+
+def get_progress_channel():
+    """Get the process-wide progress channel."""
+    global _progress_channel
+    if _progress_channel is None:
+        _progress_channel = _build_channel()
+    return _progress_channel
+
+
+def get_progress_reporter() -> OrchestrationProgressReporter:
+    """Get the process-wide progress reporter."""
+    global _progress_reporter
+    if _progress_reporter is None:
+        _progress_reporter = OrchestrationProgressReporter(
+            get_progress_channel(),
+            flush_seconds=float(_config('ORCHESTRATION_PROGRESS_FLUSH_SECONDS', 2.0)),
+        )
+    return _progress_reporter
@@ -11,6 +11,7 @@ from app.models.experiment_processing import ExperimentDocumentProcessing
 from app.models.processing_job import ProcessingJob
 from app.models.text_segment import TextSegment
 from app.services.base_service import NotFoundError
+from app.services.orchestration_checkpoint_service import OrchestrationCheckpointService
 
 
 class OrchestrationStatusService:
@@ -104,6 +105,14 @@ class OrchestrationStatusService:
             'started_at': run.started_at.isoformat() if run.started_at else None,
         }
 
+    @classmethod
+    def execution_percentage(cls, done, planned):
+        """Overall progress while executing, between the review and synthesis marks."""
+        if not planned:
+            return cls.STAGE_PROGRESS['executing']
+        start, end = cls.STAGE_PROGRESS['reviewing'], cls.STAGE_PROGRESS['synthesizing']
+        return start + int((end - start) * min(done, planned) / planned)
+
     @classmethod
     def get_run_status(cls, run_id):
         run = db.session.get(ExperimentOrchestrationRun, run_id)
@@ -124,6 +133,16 @@ class OrchestrationStatusService:
                 'synthesize_experiment': run.cross_document_insights is not None,
             },
         }
+        if run.status in ('executing', 'synthesizing', 'failed'):
+            # Partial results from per-tool checkpoints stay visible mid-run and after a crash
+            strategy = run.modified_strategy or run.recommended_strategy or {}
+            planned = sum(len(tools) for tools in strategy.values()) if isinstance(strategy, dict) else None
+            execution = OrchestrationCheckpointService.summarize(run.id, planned)
+            response['execution_progress'] = execution
+            if run.status == 'executing' and planned:
+                response['progress_percentage'] = cls.execution_percentage(
+                    execution['completed'] + execution['failed'], planned
+                )
         if run.status == 'reviewing':
             response.update({
                 'awaiting_user_approval': True,
@@ -10,6 +10,8 @@ import os
 from datetime import datetime
 import anthropic
 
+from shared_services.llm.gateway import get_llm_gateway
+
 
 class PeriodExcerptService:
     """Service for extracting period-relevant excerpts from OED definitions"""
@@ -55,15 +57,21 @@ class PeriodExcerptService:
         
         if self.use_llm:
             try:
-                # Get LLM analysis using Anthropic client
-                message = self.client.messages.create(
-                    model=os.environ.get("CLAUDE_DEFAULT_MODEL", "claude-sonnet-4-5-20250929"),
-                    max_tokens=800,
-                    messages=[{"role": "user", "content": prompt}]
+                # Get LLM analysis using Anthropic client (via the response cache)
+                model = os.environ.get("CLAUDE_DEFAULT_MODEL", "claude-sonnet-4-5-20250929")
+                messages = [{"role": "user", "content": prompt}]
+                response_text = get_llm_gateway().complete(
+                    provider='anthropic',
+                    model=model,
+                    messages=messages,
+                    call=lambda: self.client.messages.create(
+                        model=model, max_tokens=800, messages=messages
+                    ).content[0].text,
+                    max_tokens=800
                 )
                 
                 # Parse the response
-                result = self._parse_llm_response(message.content[0].text, definition_text, target_years)
+                result = self._parse_llm_response(response_text, definition_text, target_years)
                 
                 return {
                     "success": True,
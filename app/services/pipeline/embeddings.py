@@ -39,10 +39,24 @@ class PipelineEmbeddingMixin:
             except AttributeError:
                 pass
 
-        # STEP 1: Always create document-level embedding
+        existing_segments = ProcessingArtifact.query.filter(
+            ProcessingArtifact.document_id == exp_doc.document_id,
+            ProcessingArtifact.artifact_type == 'text_segment'
+        ).order_by(ProcessingArtifact.artifact_index).all()
+        segment_texts = [
+            (idx, segment_artifact, segment_artifact.get_content().get('text', '')[:2000])
+            for idx, segment_artifact in enumerate(existing_segments)
+        ]
+        segment_texts = [entry for entry in segment_texts if entry[2]]
+
+        # Embed the document and its segments in one batch; texts embedded by an
+        # earlier run (or another experiment) come from the embedding memo
         text_to_embed = content[:2000]  # First 2000 chars represents the document
-        doc_embedding_result = embedding_service.generate_embeddings(text_to_embed, processing_method, year=doc_year)
+        doc_embedding_result, *segment_results = embedding_service.generate_embeddings_batch(
+            [text_to_embed] + [text for _, _, text in segment_texts], processing_method, year=doc_year
+        )
 
+        # STEP 1: Always create document-level embedding
         doc_embedding_artifact = ProcessingArtifact(
             processing_id=processing_op.id,
             document_id=exp_doc.document_id,
@@ -87,24 +101,10 @@ class PipelineEmbeddingMixin:
         document_embedding_id = str(doc_embedding_artifact.id)
 
         # STEP 2: Create segment-level embeddings if segments exist
-        existing_segments = ProcessingArtifact.query.filter(
-            ProcessingArtifact.document_id == exp_doc.document_id,
-            ProcessingArtifact.artifact_type == 'text_segment'
-        ).order_by(ProcessingArtifact.artifact_index).all()
-
         segment_embeddings_created = 0
 
-        if existing_segments:
-            for idx, segment_artifact in enumerate(existing_segments):
-                segment_data = segment_artifact.get_content()
-                text_to_embed = segment_data.get('text', '')[:2000]
-
-                if not text_to_embed:
-                    continue
-
-                # Generate embedding for this segment
-                embedding_result = embedding_service.generate_embeddings(text_to_embed, processing_method, year=doc_year)
-
+        if segment_texts:
+            for (idx, segment_artifact, text_to_embed), embedding_result in zip(segment_texts, segment_results):
                 # Create segment embedding artifact
                 embedding_artifact = ProcessingArtifact(
                     processing_id=processing_op.id,
@@ -90,68 +90,71 @@ class PipelineEntityMixin:
         index_entry.status = 'completed'
 
     def _extract_entities_spacy(self, content: str) -> List[Dict[str, Any]]:
-        """Extract entities using spaCy"""
-        import spacy
-        from collections import defaultdict
-
-        nlp = spacy.load('en_core_web_sm')
-        doc = nlp(content)
+        """Extract entities using spaCy, window by window for long documents"""
+        from app.services.windowed_nlp import get_windowed_nlp_runner, phrase_key, phrase_keys
 
         extracted_entities = []
         seen_entities = set()
+        # Every word sequence of every entity text, so noun phrases already
+        # covered by an entity are dropped with one set lookup
+        entity_phrases = set()
+        concepts = []
 
-        # Extract named entities
-        for ent in doc.ents:
-            entity_text = ent.text.strip()
-            entity_key = (entity_text.lower(), ent.label_)
-
-            if len(entity_text) < 2 or entity_key in seen_entities:
-                continue
-
-            seen_entities.add(entity_key)
-
-            sent_text = ent.sent.text.strip()
-            ent_start_in_sent = ent.start_char - ent.sent.start_char
-            ent_end_in_sent = ent.end_char - ent.sent.start_char
-
-            context_start = max(0, ent_start_in_sent - 50)
-            context_end = min(len(sent_text), ent_end_in_sent + 50)
-            context = sent_text[context_start:context_end].strip()
+        for offset, doc in get_windowed_nlp_runner().docs(content):
+            # Extract named entities
+            for ent in doc.ents:
+                entity_text = ent.text.strip()
+                entity_key = (entity_text.lower(), ent.label_)
 
-            extracted_entities.append({
-                'entity': entity_text,
-                'type': ent.label_,
-                'confidence': 0.85,
-                'context': context,
-                'start_char': ent.start_char,
-                'end_char': ent.end_char
-            })
-
-        # Extract noun phrases as concepts
-        for np in doc.noun_chunks:
-            np_text = np.text.strip()
-            np_key = np_text.lower()
+                if len(entity_text) < 2 or entity_key in seen_entities:
+                    continue
 
-            if (len(np_text) < 3 or len(np_text) > 100 or
-                any(np_key in seen_ent[0] for seen_ent in seen_entities)):
-                continue
+                seen_entities.add(entity_key)
+                entity_phrases.update(phrase_keys(entity_text))
 
-            if (any(token.pos_ in ['PROPN', 'NOUN'] for token in np) and
-                not all(token.is_stop for token in np)):
+                sent_text = ent.sent.text.strip()
+                ent_start_in_sent = ent.start_char - ent.sent.start_char
+                ent_end_in_sent = ent.end_char - ent.sent.start_char
 
-                context_start = max(0, np.start_char - 50)
-                context_end = min(len(content), np.end_char + 50)
-                context = content[context_start:context_end].strip()
+                context_start = max(0, ent_start_in_sent - 50)
+                context_end = min(len(sent_text), ent_end_in_sent + 50)
+                context = sent_text[context_start:context_end].strip()
 
                 extracted_entities.append({
-                    'entity': np_text,
-                    'type': 'CONCEPT',
-                    'confidence': 0.65,
+                    'entity': entity_text,
+                    'type': ent.label_,
+                    'confidence': 0.85,
                     'context': context,
-                    'start_char': np.start_char,
-                    'end_char': np.end_char
+                    'start_char': offset + ent.start_char,
+                    'end_char': offset + ent.end_char
                 })
 
+            # Collect noun phrases as concepts; filtered once all entities are known
+            for np in doc.noun_chunks:
+                np_text = np.text.strip()
+                if len(np_text) < 3 or len(np_text) > 100:
+                    continue
+
+                if (any(token.pos_ in ['PROPN', 'NOUN'] for token in np) and
+                    not all(token.is_stop for token in np)):
+                    start_char = offset + np.start_char
+                    end_char = offset + np.end_char
+                    context_start = max(0, start_char - 50)
+                    context_end = min(len(content), end_char + 50)
+
+                    concepts.append({
+                        'entity': np_text,
+                        'type': 'CONCEPT',
+                        'confidence': 0.65,
+                        'context': content[context_start:context_end].strip(),
+                        'start_char': start_char,
+                        'end_char': end_char
+                    })
+
+        extracted_entities.extend(
+            concept for concept in concepts
+            if phrase_key(concept['entity']) not in entity_phrases
+        )
         return extracted_entities
 
     def _extract_entities_nltk(self, content: str) -> List[Dict[str, Any]]:
@@ -164,91 +164,114 @@ class PipelineExecutionMixin:
             if existing_processing and existing_processing.status == 'completed':
                 raise ValidationError(f'{processing_type} with {processing_method} method already completed')
 
-            # Create new processing operation
-            processing_op = ExperimentDocumentProcessing(
-                experiment_document_id=experiment_document_id,
-                processing_type=processing_type,
-                processing_method=processing_method,
-                status='pending'
+            return self.run_processing_operation(
+                exp_doc, processing_type, processing_method, user_id
             )
 
-            # Set configuration
-            config = {
-                'method': processing_method,
-                'created_by': user_id,
-                'experiment_id': exp_doc.experiment_id,
-                'document_id': exp_doc.document_id
-            }
-            processing_op.set_configuration(config)
+        except (NotFoundError, PermissionError, ValidationError):
+            raise
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error starting processing: {e}", exc_info=True)
+            raise ServiceError(f"Failed to start processing: {str(e)}")
 
-            db.session.add(processing_op)
-            db.session.flush()  # Assigns ID to processing_op
+    def run_processing_operation(
+        self,
+        exp_doc,
+        processing_type: str,
+        processing_method: str,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """
+        Create and run one processing operation for an experiment document
 
-            # Create index entry
-            index_entry = DocumentProcessingIndex(
-                document_id=exp_doc.document_id,
-                experiment_id=exp_doc.experiment_id,
-                processing_id=processing_op.id,
-                processing_type=processing_type,
-                processing_method=processing_method,
-                status='pending'
-            )
+        Used by ``start_processing`` after validation and by the processing
+        plan scheduler for each plan node. The operation and its
+        DocumentProcessingIndex entry are committed as running before the
+        stage executes, so progress views see work in flight.
 
-            db.session.add(index_entry)
-            db.session.commit()
+        Returns:
+            Dictionary containing processing ID and status (and ``error``
+            when the stage failed)
+        """
+        processing_op = ExperimentDocumentProcessing(
+            experiment_document_id=exp_doc.id,
+            processing_type=processing_type,
+            processing_method=processing_method,
+            status='pending'
+        )
+
+        # Set configuration
+        config = {
+            'method': processing_method,
+            'created_by': user_id,
+            'experiment_id': exp_doc.experiment_id,
+            'document_id': exp_doc.document_id
+        }
+        processing_op.set_configuration(config)
+
+        db.session.add(processing_op)
+        db.session.flush()  # Assigns ID to processing_op
+
+        # Create index entry
+        index_entry = DocumentProcessingIndex(
+            document_id=exp_doc.document_id,
+            experiment_id=exp_doc.experiment_id,
+            processing_id=processing_op.id,
+            processing_type=processing_type,
+            processing_method=processing_method,
+            status='pending'
+        )
+
+        db.session.add(index_entry)
+        db.session.commit()
+
+        # Start processing
+        processing_op.mark_started()
+        index_entry.status = 'running'
+        db.session.commit()
+
+        # Execute processing based on type
+        try:
+            if processing_type == 'embeddings':
+                self._process_embeddings(processing_op, index_entry, exp_doc, processing_method)
+            elif processing_type == 'segmentation':
+                self._process_segmentation(processing_op, index_entry, exp_doc, processing_method)
+            elif processing_type == 'entities':
+                self._process_entities(processing_op, index_entry, exp_doc, processing_method)
+            elif processing_type == 'temporal':
+                self._process_temporal(processing_op, index_entry, exp_doc, processing_method)
+            elif processing_type == 'definitions':
+                self._process_definitions(processing_op, index_entry, exp_doc, processing_method)
+            elif processing_type == 'enhanced_processing':
+                self._process_enhanced(processing_op, index_entry, exp_doc, processing_method)
+            else:
+                raise ValidationError(f'Unsupported processing type: {processing_type}')
 
-            # Start processing
-            processing_op.mark_started()
-            index_entry.status = 'running'
+            # Create provenance record for completed processing
+            if processing_op.status == 'completed':
+                self._create_provenance_record(processing_op, exp_doc, user_id)
 
-            # Execute processing based on type
-            try:
-                if processing_type == 'embeddings':
-                    self._process_embeddings(processing_op, index_entry, exp_doc, processing_method)
-                elif processing_type == 'segmentation':
-                    self._process_segmentation(processing_op, index_entry, exp_doc, processing_method)
-                elif processing_type == 'entities':
-                    self._process_entities(processing_op, index_entry, exp_doc, processing_method)
-                elif processing_type == 'temporal':
-                    self._process_temporal(processing_op, index_entry, exp_doc, processing_method)
-                elif processing_type == 'definitions':
-                    self._process_definitions(processing_op, index_entry, exp_doc, processing_method)
-                elif processing_type == 'enhanced_processing':
-                    self._process_enhanced(processing_op, index_entry, exp_doc, processing_method)
-                else:
-                    raise ValidationError(f'Unsupported processing type: {processing_type}')
-
-                # Create provenance record for completed processing
-                if processing_op.status == 'completed':
-                    self._create_provenance_record(processing_op, exp_doc, user_id)
-
-                db.session.commit()
-
-                logger.info(f"Processing {processing_type} completed for exp_doc {experiment_document_id} with method {processing_method}")
-
-                return {
-                    'processing_id': str(processing_op.id),
-                    'status': processing_op.status
-                }
+            db.session.commit()
 
-            except Exception as proc_error:
-                # Mark processing as failed
-                error_message = f"Processing failed: {str(proc_error)}"
-                processing_op.mark_failed(error_message)
-                index_entry.status = 'failed'
-                db.session.commit()
+            logger.info(f"Processing {processing_type} completed for exp_doc {exp_doc.id} with method {processing_method}")
 
-                logger.error(f"Processing failed: {proc_error}", exc_info=True)
+            return {
+                'processing_id': str(processing_op.id),
+                'status': processing_op.status
+            }
 
-                return {
-                    'processing_id': str(processing_op.id),
-                    'status': 'failed',
-                    'error': error_message
-                }
+        except Exception as proc_error:
+            # Mark processing as failed
+            error_message = f"Processing failed: {str(proc_error)}"
+            processing_op.mark_failed(error_message)
+            index_entry.status = 'failed'
+            db.session.commit()
 
-        except (NotFoundError, PermissionError, ValidationError):
-            raise
-        except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error starting processing: {e}", exc_info=True)
-            raise ServiceError(f"Failed to start processing: {str(e)}")
+            logger.error(f"Processing failed: {proc_error}", exc_info=True)
+
+            return {
+                'processing_id': str(processing_op.id),
+                'status': 'failed',
+                'error': error_message
+            }
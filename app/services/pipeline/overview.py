@@ -11,6 +11,7 @@ from app.services.base_service import (
     ServiceError,
     ValidationError,
 )
+from app.services.experiment_corpus_service import ExperimentCorpusService
 from app.services.pipeline_access_service import PipelineAccessService
 
 from .constants import LLM_TOOL_TO_OPERATION_MAP
@@ -50,27 +51,8 @@ class PipelineOverviewMixin:
             if orchestration_run and orchestration_run.processing_results:
                 orchestration_results = orchestration_run.processing_results
 
-            # Get experiment documents
-            exp_docs = ExperimentDocument.query.filter_by(experiment_id=experiment_id).all()
-
-            # Group documents by root to show only latest version
-            # Key: root_document_id, Value: list of (exp_doc, document) tuples
-            doc_families = {}
-            for exp_doc in exp_docs:
-                doc = exp_doc.document
-                # Get root document ID (either the document itself or its source)
-                root_id = doc.source_document_id if doc.source_document_id else doc.id
-
-                if root_id not in doc_families:
-                    doc_families[root_id] = []
-                doc_families[root_id].append((exp_doc, doc))
-
-            # For each family, select only the latest version
-            latest_exp_docs = []
-            for root_id, family_members in doc_families.items():
-                # Sort by version_number (desc) and pick the first one
-                family_members.sort(key=lambda x: x[1].version_number or 0, reverse=True)
-                latest_exp_docs.append(family_members[0])  # (exp_doc, doc) tuple
+            # Latest associated version of each document family
+            latest_exp_docs = ExperimentCorpusService.latest_associations(experiment_id)
 
             # Build processed documents list
             processed_docs = []
@@ -60,14 +60,13 @@ class PipelineSegmentationMixin:
 
         else:  # semantic
             # spaCy semantic chunking
-            import spacy
-            nlp = spacy.load('en_core_web_sm')
-            doc = nlp(content)
+            # Chunks carry across window boundaries on book-length documents
+            from app.services.windowed_nlp import get_windowed_nlp_runner
 
             current_chunk = []
             chunks = []
 
-            for sent in doc.sents:
+            for _, _, sent in get_windowed_nlp_runner().sentences(content):
                 current_chunk.append(sent.text.strip())
                 if len(current_chunk) >= 3 or (sent.ents and len(current_chunk) >= 2):
                     chunks.append(' '.join(current_chunk))
@@ -0,0 +1,367 @@
+"""
+Scheduled per-document processing for whole experiments.
+
+A ``ProcessingPlan`` expands an experiment's documents x requested stages into
+one node per (document, stage). A node waits for the nodes of stages it
+depends on for the same document (``STAGE_DEPENDENCIES``: segment embeddings
+need the segmentation's segments), and nodes whose operation already
+completed are skipped.
+
+``ProcessingPlanScheduler.dispatch`` queues every ready node, up to a
+per-stage concurrency limit counted across all plans, and hands it to
+``submit`` (a Celery task by default). Each node runs through
+``PipelineService.run_processing_operation``, which keeps
+``DocumentProcessingIndex`` current, and dispatches again when it finishes,
+so independent nodes fan out over the workers as capacity frees up.
+
+With ``PROCESSING_PLAN_BACKGROUND`` disabled the plan runs inline, node by
+node, in the same dependency order.
+"""
+
+import uuid
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from sqlalchemy import text
+
+from app import db
+from app.models.experiment_document import ExperimentDocument
+from app.models.experiment_processing import ExperimentDocumentProcessing
+from app.models.processing_plan import (
+    ACTIVE_NODE_STATUSES,
+    TERMINAL_NODE_STATUSES,
+    ProcessingPlan,
+    ProcessingPlanNode,
+)
+from app.services.base_service import BaseService, NotFoundError, ValidationError
+from app.services.pipeline.constants import SUPPORTED_PROCESSING_METHODS
+from app.services.pipeline_access_service import PipelineAccessService
+
+# Stages that must finish for the same document before a stage may start
+STAGE_DEPENDENCIES: Dict[str, Sequence[str]] = {
+    'embeddings': ('segmentation',),
+}
+
+# Per-stage concurrency across all plans; LLM/embedding-bound stages are
+# kept lower than local CPU stages
+DEFAULT_STAGE_CONCURRENCY: Dict[str, int] = {
+    'segmentation': 8,
+    'embeddings': 4,
+    'entities': 4,
+    'temporal': 4,
+    'definitions': 4,
+    'enhanced_processing': 2,
+}
+
+# Serializes dispatchers so per-stage limits hold across workers
+_DISPATCH_LOCK_KEY = 0x0E7D15A7
+
+Runner = Callable[[ExperimentDocument, str, str, Optional[int]], Dict[str, Any]]
+
+
+def _default_runner(exp_doc, processing_type, processing_method, user_id):
+    from app.services.pipeline_service import get_pipeline_service
+
+    return get_pipeline_service().run_processing_operation(
+        exp_doc, processing_type, processing_method, user_id
+    )
+
+
+def _celery_submit(node_id: str) -> Optional[str]:
+    from app.tasks.processing import run_processing_plan_node_task
+
+    return run_processing_plan_node_task.delay(node_id).id
+
+
+class ProcessingPlanScheduler:
+    """Dispatch and run the nodes of ``ProcessingPlan``s in dependency order."""
+
+    def __init__(
+        self,
+        runner: Optional[Runner] = None,
+        submit: Optional[Callable[[str], Optional[str]]] = None,
+        limits: Optional[Mapping[str, int]] = None,
+        default_limit: int = 4,
+        logger=None,
+    ):
+        self.runner = runner or _default_runner
+        self.submit = submit or _celery_submit
+        self.limits = dict(DEFAULT_STAGE_CONCURRENCY, **(limits or {}))
+        self.default_limit = default_limit
+        self.logger = logger
+
+    def limit_for(self, processing_type: str) -> int:
+        return self.limits.get(processing_type, self.default_limit)
+
+    def dispatch(self, plan_ids: Iterable = ()) -> List[str]:
+        """
+        Queue and submit every ready node within its stage's free capacity.
+
+        Waiting nodes with a failed or blocked dependency are blocked, and
+        plans with no unfinished nodes (among those with waiting nodes and
+        ``plan_ids``) are closed. Returns the submitted node ids.
+        """
+        if db.session.get_bind().dialect.name == 'postgresql':
+            db.session.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': _DISPATCH_LOCK_KEY})
+
+        waiting = ProcessingPlanNode.query.join(ProcessingPlan).filter(
+            ProcessingPlan.status == 'running',
+            ProcessingPlanNode.status == 'waiting',
+        ).order_by(ProcessingPlan.created_at, ProcessingPlanNode.position).all()
+
+        dependency_ids = {dep for node in waiting for dep in (node.depends_on or [])}
+        dependency_status = dict(
+            (str(node_id), status) for node_id, status in db.session.query(
+                ProcessingPlanNode.id, ProcessingPlanNode.status
+            ).filter(ProcessingPlanNode.id.in_(dependency_ids)).all()
+        ) if dependency_ids else {}
+
+        active = Counter(dict(
+            db.session.query(ProcessingPlanNode.processing_type, db.func.count(ProcessingPlanNode.id)).filter(
+                ProcessingPlanNode.status.in_(ACTIVE_NODE_STATUSES)
+            ).group_by(ProcessingPlanNode.processing_type).all()
+        ))
+
+        now = datetime.utcnow()
+        queued = []
+        touched_plans = {node.plan_id for node in waiting} | set(plan_ids)
+        for node in waiting:
+            states = [dependency_status.get(dep, 'completed') for dep in node.depends_on or []]
+            if any(state in ('failed', 'blocked') for state in states):
+                node.status = 'blocked'
+                node.error_message = 'A dependency failed'
+                node.completed_at = node.updated_at = now
+                continue
+            if not all(state in ('completed', 'skipped') for state in states):
+                continue
+            if active[node.processing_type] >= self.limit_for(node.processing_type):
+                continue
+            active[node.processing_type] += 1
+            node.status = 'queued'
+            node.updated_at = now
+            queued.append(node)
+
+        self._close_finished_plans(touched_plans)
+        db.session.commit()
+
+        submitted = []
+        for index, node in enumerate(queued):
+            node_id = str(node.id)
+            try:
+                task_id = self.submit(node_id)
+            except Exception:
+                # Broker unavailable: hand the unsubmitted nodes back to the queue
+                ProcessingPlanNode.query.filter(
+                    ProcessingPlanNode.id.in_([n.id for n in queued[index:]]),
+                    ProcessingPlanNode.status == 'queued',
+                ).update({'status': 'waiting'}, synchronize_session=False)
+                db.session.commit()
+                raise
+            if task_id:
+                ProcessingPlanNode.query.filter_by(id=node.id).update({'celery_task_id': task_id})
+            submitted.append(node_id)
+        db.session.commit()
+        return submitted
+
+    def run_node(self, node_id) -> Optional[ProcessingPlanNode]:
+        """
+        Run one node's processing operation, record its outcome and dispatch
+        whatever it unblocked. Finished nodes are left alone (redelivery).
+        """
+        node = db.session.get(ProcessingPlanNode, node_id)
+        if node is None or node.status in TERMINAL_NODE_STATUSES:
+            return node
+
+        node.status = 'running'
+        node.attempts = (node.attempts or 0) + 1
+        node.started_at = node.updated_at = datetime.utcnow()
+        node.error_message = None
+        db.session.commit()
+
+        try:
+            exp_doc = db.session.get(ExperimentDocument, node.experiment_document_id)
+            if exp_doc is None:
+                raise NotFoundError(f'Experiment document {node.experiment_document_id} not found')
+            result = self.runner(exp_doc, node.processing_type, node.processing_method, node.plan.requested_by)
+            status = result.get('status')
+            if result.get('processing_id'):
+                node.processing_id = uuid.UUID(str(result['processing_id']))
+            if status == 'completed':
+                node.status = 'completed'
+            else:
+                node.status = 'failed'
+                node.error_message = result.get('error') or f'Processing ended with status {status}'
+        except Exception as exc:
+            db.session.rollback()
+            node = db.session.get(ProcessingPlanNode, node_id)
+            node.status = 'failed'
+            node.error_message = str(exc)
+            if self.logger:
+                self.logger.error(f"Processing plan node {node_id} failed: {exc}", exc_info=True)
+
+        node.completed_at = node.updated_at = datetime.utcnow()
+        db.session.commit()
+
+        self.dispatch([node.plan_id])
+        return node
+
+    def run_inline(self, plan: ProcessingPlan) -> ProcessingPlan:
+        """Run a plan to completion in this process, in dispatch order."""
+        pending = deque()
+        submit, self.submit = self.submit, lambda node_id: pending.append(node_id)
+        try:
+            self.dispatch([plan.id])
+            while pending:
+                self.run_node(pending.popleft())
+        finally:
+            self.submit = submit
+        db.session.refresh(plan)
+        return plan
+
+    @staticmethod
+    def _close_finished_plans(plan_ids: Iterable) -> None:
+        for plan_id in plan_ids:
+            plan = db.session.get(ProcessingPlan, plan_id)
+            counts = plan.node_counts()
+            if any(status not in TERMINAL_NODE_STATUSES for status in counts):
+                continue
+            failed = counts.get('failed', 0) or counts.get('blocked', 0)
+            plan.status = 'failed' if failed else 'completed'
+            plan.completed_at = plan.updated_at = datetime.utcnow()
+
+
+class ProcessingPlanService(BaseService):
+    """Create processing plans for experiments and report their progress."""
+
+    def build_plan(
+        self,
+        experiment_id: int,
+        stages: Sequence[Mapping[str, str]],
+        user_id: int,
+        document_ids: Optional[Sequence[int]] = None,
+    ) -> ProcessingPlan:
+        """
+        Expand ``stages`` over the experiment's documents into plan nodes.
+
+        Args:
+            experiment_id: Experiment whose documents are processed
+            stages: Ordered ``{'processing_type', 'processing_method'}`` dicts
+            user_id: Requesting user (must be able to edit the experiment)
+            document_ids: Restrict the plan to these documents
+
+        Raises:
+            NotFoundError, PermissionError: Experiment access
+            ValidationError: Unsupported stage or no matching documents
+        """
+        PipelineAccessService.experiment(experiment_id, user_id)
+
+        stages = [
+            {'processing_type': stage['processing_type'], 'processing_method': stage['processing_method']}
+            for stage in stages
+        ]
+        if not stages:
+            raise ValidationError('At least one stage is required')
+        for stage in stages:
+            if stage['processing_method'] not in SUPPORTED_PROCESSING_METHODS.get(stage['processing_type'], ()):
+                raise ValidationError(
+                    f"Unsupported method {stage['processing_method']} for {stage['processing_type']}"
+                )
+
+        query = ExperimentDocument.query.filter_by(experiment_id=experiment_id)
+        if document_ids:
+            query = query.filter(ExperimentDocument.document_id.in_(document_ids))
+        exp_docs = query.order_by(ExperimentDocument.id).all()
+        if not exp_docs:
+            raise ValidationError('No experiment documents to process')
+
+        completed = {
+            (row.experiment_document_id, row.processing_type, row.processing_method): row.id
+            for row in ExperimentDocumentProcessing.query.filter(
+                ExperimentDocumentProcessing.experiment_document_id.in_([d.id for d in exp_docs]),
+                ExperimentDocumentProcessing.status == 'completed',
+            ).all()
+        }
+
+        plan = ProcessingPlan(experiment_id=experiment_id, requested_by=user_id, stages=stages)
+        db.session.add(plan)
+        db.session.flush()
+
+        now = datetime.utcnow()
+        position = 0
+        for exp_doc in exp_docs:
+            by_type: Dict[str, List[ProcessingPlanNode]] = {}
+            for stage in stages:
+                key = (exp_doc.id, stage['processing_type'], stage['processing_method'])
+                node = ProcessingPlanNode(
+                    plan_id=plan.id,
+                    experiment_document_id=exp_doc.id,
+                    document_id=exp_doc.document_id,
+                    position=position,
+                    processing_type=stage['processing_type'],
+                    processing_method=stage['processing_method'],
+                    status='skipped' if key in completed else 'waiting',
+                    processing_id=completed.get(key),
+                    depends_on=[],
+                    created_at=now,
+                    updated_at=now,
+                )
+                db.session.add(node)
+                by_type.setdefault(stage['processing_type'], []).append(node)
+                position += 1
+            db.session.flush()
+            for processing_type, nodes in by_type.items():
+                prerequisites = [
+                    str(prerequisite.id)
+                    for dependency in STAGE_DEPENDENCIES.get(processing_type, ())
+                    for prerequisite in by_type.get(dependency, ())
+                ]
+                for node in nodes:
+                    node.depends_on = prerequisites
+
+        db.session.commit()
+        self.logger.info(
+            f"User {user_id} planned {position} processing nodes for experiment {experiment_id} (plan {plan.id})"
+        )
+        return plan
+
+    def start_plan(
+        self,
+        experiment_id: int,
+        stages: Sequence[Mapping[str, str]],
+        user_id: int,
+        document_ids: Optional[Sequence[int]] = None,
+        background: bool = True,
+        limits: Optional[Mapping[str, int]] = None,
+        default_limit: int = 4,
+    ) -> Dict[str, Any]:
+        """
+        Build a plan and start it: with ``background`` its ready nodes are
+        submitted to Celery and the plan is returned at once; otherwise it
+        runs inline to completion.
+        """
+        plan = self.build_plan(experiment_id, stages, user_id, document_ids)
+        scheduler = ProcessingPlanScheduler(limits=limits, default_limit=default_limit, logger=self.logger)
+        if background:
+            scheduler.dispatch([plan.id])
+        else:
+            plan = scheduler.run_inline(plan)
+        return plan.to_dict()
+
+    def get_plan(self, plan_id, user_id: int) -> Dict[str, Any]:
+        plan = db.session.get(ProcessingPlan, plan_id)
+        if plan is None:
+            raise NotFoundError(f'Processing plan {plan_id} not found')
+        PipelineAccessService.experiment(plan.experiment_id, user_id)
+        return plan.to_dict(include_nodes=True)
+
+
+_processing_plan_service = None
+
+
+def get_processing_plan_service() -> ProcessingPlanService:
+    """Return the process-wide processing plan service instance."""
+    global _processing_plan_service
+    if _processing_plan_service is None:
+        _processing_plan_service = ProcessingPlanService()
+    return _processing_plan_service
@@ -1,10 +1,11 @@
 """Shared queries and adapters for processing result views."""
 
-from .jobs import ProcessingJobView, append_experiment_jobs
+from .jobs import ProcessingJobView, append_experiment_jobs, experiment_job_history
 from .queries import get_document_family_ids
 
 __all__ = [
     "ProcessingJobView",
     "append_experiment_jobs",
+    "experiment_job_history",
     "get_document_family_ids",
 ]
\ No newline at end of file
@@ -1,10 +1,21 @@
 """Adapters and queries that normalize processing jobs for result templates."""
 
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
+from app import db
 from app.models.experiment_document import ExperimentDocument
 from app.models.experiment_processing import ExperimentDocumentProcessing
 
+# Columns ProcessingJobView reads; all served by the history index
+JOB_HISTORY_COLUMNS = (
+    ExperimentDocumentProcessing.id,
+    ExperimentDocumentProcessing.status,
+    ExperimentDocumentProcessing.created_at,
+    ExperimentDocumentProcessing.completed_at,
+    ExperimentDocumentProcessing.processing_type,
+    ExperimentDocumentProcessing.processing_method,
+)
+
 
 class ProcessingJobView:
     """Present experiment processing records through the legacy job interface."""
@@ -24,25 +35,55 @@ class ProcessingJobView:
         }
 
 
+def experiment_job_history(
+    document_ids: Iterable[int],
+    processing_type: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List:
+    """
+    Experiment processing records of one type for a set of documents, in
+    one joined query, newest first (undated records first, as in the job
+    lists). The ID tie-breaker keeps pages stable between requests.
+    """
+    document_ids = list(document_ids)
+    if not document_ids:
+        return []
+    query = (
+        db.session.query(*JOB_HISTORY_COLUMNS)
+        .join(
+            ExperimentDocument,
+            ExperimentDocument.id == ExperimentDocumentProcessing.experiment_document_id,
+        )
+        .filter(
+            ExperimentDocument.document_id.in_(document_ids),
+            ExperimentDocumentProcessing.processing_type == processing_type,
+        )
+        .order_by(
+            ExperimentDocumentProcessing.created_at.desc().nullsfirst(),
+            ExperimentDocumentProcessing.id.desc(),
+        )
+    )
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+
 def append_experiment_jobs(
     jobs: List,
     document_ids: Iterable[int],
     processing_type: str,
 ) -> List:
     """Append experiment processing records and sort all jobs newest first."""
-    for document_id in document_ids:
-        experiment_documents = ExperimentDocument.query.filter_by(
-            document_id=document_id
-        ).all()
-        for experiment_document in experiment_documents:
-            processing_records = ExperimentDocumentProcessing.query.filter_by(
-                experiment_document_id=experiment_document.id,
-                processing_type=processing_type,
-            ).all()
-            jobs.extend(ProcessingJobView(record) for record in processing_records)
+    jobs.extend(
+        ProcessingJobView(record)
+        for record in experiment_job_history(document_ids, processing_type)
+    )
 
     jobs.sort(
         key=lambda job: (job.created_at is None, job.created_at),
         reverse=True,
     )
-    return jobs
\ No newline at end of file
+    return jobs
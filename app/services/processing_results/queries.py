@@ -1,5 +1,6 @@
 """Document-family queries shared by processing result views."""
 
+from app import db
 from app.models.document import Document
 from app.services.inheritance_versioning_service import InheritanceVersioningService
 
@@ -7,8 +8,12 @@ from app.services.inheritance_versioning_service import InheritanceVersioningSer
 def get_document_family_ids(document) -> list[int]:
     """Return IDs for every derived version plus the base document itself."""
     base_document_id = InheritanceVersioningService._get_base_document_id(document)
-    versions = Document.query.filter_by(source_document_id=base_document_id).all()
-    document_ids = [version.id for version in versions]
+    document_ids = [
+        document_id
+        for (document_id,) in db.session.query(Document.id).filter(
+            Document.source_document_id == base_document_id
+        )
+    ]
 
     if base_document_id not in document_ids:
         document_ids.append(base_document_id)
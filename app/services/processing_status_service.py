@@ -225,8 +225,8 @@ class ProcessingStatusService:
             }
         return response
 
-    @classmethod
-    def get_document_processing_jobs(cls, document_uuid):
+    @staticmethod
+    def get_document_by_uuid(document_uuid):
         try:
             normalized_uuid = UUID(str(document_uuid))
         except (TypeError, ValueError, AttributeError):
@@ -235,6 +235,11 @@ class ProcessingStatusService:
         document = Document.query.filter_by(uuid=normalized_uuid).first()
         if not document:
             raise NotFoundError(f'Document {document_uuid} not found')
+        return document
+
+    @classmethod
+    def get_document_processing_jobs(cls, document_uuid):
+        document = cls.get_document_by_uuid(document_uuid)
 
         jobs = ProcessingJob.query.filter_by(document_id=document.id).all()
         for job in ProcessingJob.query.filter(
@@ -1,16 +1,26 @@
-"""Semantic event configuration and provenance workflow."""
+"""
+Semantic event storage and provenance workflow.
+
+Events are rows in ``semantic_events`` (see ``app.models.semantic_event``).
+Experiments whose events are still in the legacy ``configuration`` JSON
+(not yet migrated) are read from there and imported on their first edit.
+"""
 
 import json
 import logging
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy import func
+from sqlalchemy.orm.exc import StaleDataError
+
 from app import db
 from app.models.document import Document
 from app.models.experiment import Experiment
 from app.models.experiment_document import ExperimentDocument
+from app.models.semantic_event import SemanticEvent, SemanticEventDocument
 from app.models.user import User
-from app.services.base_service import NotFoundError, PermissionError, ValidationError
+from app.services.base_service import ConflictError, NotFoundError, PermissionError, ValidationError
 from app.services.provenance_service import ProvenanceService
 from app.services.temporal_ontology_service import TemporalOntologyService
 
@@ -38,90 +48,198 @@ class SemanticEventService:
     def save(self, experiment_id, data, actor):
         experiment = self._owned_temporal_experiment(experiment_id, actor.id)
         normalized = self._validate_event_data(data)
-        config = self._configuration(experiment)
-        events = config.get('semantic_events', [])
-        if not isinstance(events, list):
-            events = []
+        self._import_legacy_events(experiment)
 
         supplied_id = normalized.get('id')
-        existing_index = next(
-            (
-                index for index, event in enumerate(events)
-                if event.get('id') == supplied_id
-            ),
-            None,
-        ) if supplied_id else None
-        if supplied_id and existing_index is None:
+        existing = self._event(experiment.id, supplied_id) if supplied_id else None
+        if supplied_id and existing is None:
             raise NotFoundError(f'Semantic event {supplied_id} not found')
-        existing = events[existing_index] if existing_index is not None else None
-        event_id = supplied_id or str(self.id_factory())
+        if (existing is not None and normalized['version'] is not None
+                and normalized['version'] != existing.version):
+            raise ConflictError(
+                f'Semantic event {supplied_id} was changed by someone else; reload and try again'
+            )
         related_documents = self._related_documents(
             experiment,
             normalized['related_document_ids'],
         )
         ontology = self._ontology_metadata(normalized['event_type'])
-        now = self.clock().isoformat()
-        event = {
-            'id': event_id,
-            'event_type': normalized['event_type'],
-            'from_period': normalized['from_period'],
-            'to_period': normalized['to_period'],
-            'description': normalized['description'],
-            'related_documents': related_documents,
-            'type_label': (
-                ontology['label']
-                if ontology else normalized['event_type'].replace('_', ' ').title()
-            ),
-            'type_uri': ontology['uri'] if ontology else None,
-            'definition': ontology['definition'] if ontology else None,
-            'citation': ontology['citation'] if ontology else None,
-            'example': ontology['example'] if ontology else None,
-            'created_by': (existing.get('created_by') or actor.id) if existing else actor.id,
-            'created_at': (existing.get('created_at') or now) if existing else now,
-            'modified_by': actor.id if existing else None,
-            'modified_at': now if existing else None,
-        }
-        if existing_index is None:
-            events.append(event)
-        else:
-            events[existing_index] = event
-        self._commit_events(experiment, config, events)
+        experiment_id = experiment.id
+        now = self.clock()
+
+        event = existing or SemanticEvent(
+            experiment_id=experiment.id,
+            event_id=str(self.id_factory()),
+            created_by=actor.id,
+            created_at=now,
+        )
+        if existing is not None:
+            event.created_by = event.created_by or actor.id
+            event.modified_by = actor.id
+            event.modified_at = now
+        event.event_type = normalized['event_type']
+        event.from_period = normalized['from_period']
+        event.to_period = normalized['to_period']
+        event.description = normalized['description']
+        event.type_label = (
+            ontology['label']
+            if ontology else normalized['event_type'].replace('_', ' ').title()
+        )
+        event.type_uri = ontology['uri'] if ontology else None
+        event.definition = ontology['definition'] if ontology else None
+        event.citation = ontology['citation'] if ontology else None
+        event.example = ontology['example'] if ontology else None
+        self._link_documents(event, [document['id'] for document in related_documents])
+        if existing is None:
+            db.session.add(event)
+        event_data = self._commit(supplied_id, event)
+
         self._track_best_effort(
-            event['event_type'],
+            event_data['event_type'],
             experiment,
             actor,
-            event,
+            event_data,
             related_documents,
             is_update=existing is not None,
         )
-        return {'success': True, 'semantic_events': events}
+        return {'success': True, 'semantic_events': self.list_events(experiment_id)}
 
     def remove(self, experiment_id, event_id, actor):
         experiment = self._owned_temporal_experiment(experiment_id, actor.id)
         if not event_id:
             raise ValidationError('Missing event_id')
         event_id = str(event_id).strip()
-        config = self._configuration(experiment)
-        events = config.get('semantic_events', [])
-        if not isinstance(events, list):
-            events = []
-        existing = next(
-            (event for event in events if event.get('id') == event_id),
-            None,
-        )
+        self._import_legacy_events(experiment)
+        existing = self._event(experiment.id, event_id)
         if not existing:
             raise NotFoundError(f'Semantic event {event_id} not found')
-        remaining = [event for event in events if event.get('id') != event_id]
-        self._commit_events(experiment, config, remaining)
+        experiment_id = experiment.id
+        event_data = existing.to_dict()
+        db.session.delete(existing)
+        self._commit(event_id)
         self._track_best_effort(
-            existing.get('event_type', 'unknown'),
+            event_data.get('event_type', 'unknown'),
             experiment,
             actor,
-            existing,
+            event_data,
             None,
             is_deletion=True,
         )
-        return {'success': True, 'semantic_events': remaining}
+        return {'success': True, 'semantic_events': self.list_events(experiment_id)}
+
+    @staticmethod
+    def list_events(experiment_id, start=None, end=None, event_type=None):
+        """
+        Events of an experiment in timeline order, optionally only those
+        overlapping the years ``start``..``end`` and of one type.
+        """
+        query = SemanticEvent.query.filter_by(experiment_id=experiment_id)
+        if event_type:
+            query = query.filter(SemanticEvent.event_type == event_type)
+        if end is not None:
+            query = query.filter(SemanticEvent.from_period <= end)
+        if start is not None:
+            # Open-ended events (no to_period) cover their start year
+            query = query.filter(
+                func.coalesce(SemanticEvent.to_period, SemanticEvent.from_period) >= start
+            )
+        query = query.order_by(
+            SemanticEvent.from_period.asc().nullsfirst(),
+            SemanticEvent.id,
+        )
+        return [event.to_dict() for event in query.all()]
+
+    @classmethod
+    def events_for(cls, experiment, config=None, start=None, end=None, event_type=None):
+        """
+        Timeline events of an experiment (optionally overlapping
+        ``start``..``end`` and of one type), from the legacy JSON until it
+        is imported.
+        """
+        config = cls._configuration(experiment) if config is None else config
+        if 'semantic_events' not in config:
+            return cls.list_events(experiment.id, start=start, end=end, event_type=event_type)
+        events = config['semantic_events']
+        events = events if isinstance(events, list) else []
+        if start is None and end is None and not event_type:
+            return events
+        # legacy_event_rows skips non-dict events and repeated ids; drop them
+        # here too so each row lines up with its event
+        candidates, seen = [], set()
+        for event in events:
+            event_id = str(event.get('id') or '').strip()[:64] if isinstance(event, dict) else None
+            if event_id is None or (event_id and event_id in seen):
+                continue
+            seen.add(event_id)
+            candidates.append(event)
+        rows = legacy_event_rows(experiment.id, candidates)
+        return [
+            event for event, row in zip(candidates, rows)
+            if (not event_type or row.event_type == event_type)
+            and (start is None and end is None or row.from_period is not None)
+            and (end is None or row.from_period <= end)
+            and (start is None or (row.to_period or row.from_period) >= start)
+        ]
+
+    @staticmethod
+    def _event(experiment_id, event_id):
+        return SemanticEvent.query.filter_by(
+            experiment_id=experiment_id,
+            event_id=event_id,
+        ).first()
+
+    @staticmethod
+    def _link_documents(event, document_ids):
+        links = {link.document_id: link for link in event.related_documents}
+        for link in list(event.related_documents):
+            if link.document_id not in document_ids:
+                event.related_documents.remove(link)
+        for position, document_id in enumerate(document_ids):
+            link = links.get(document_id)
+            if link is None:
+                event.related_documents.append(SemanticEventDocument(
+                    document_id=document_id,
+                    position=position,
+                ))
+            else:
+                link.position = position
+
+    @staticmethod
+    def _commit(event_id, event=None):
+        """Commit, returning ``event`` as flushed (before commit expires it)."""
+        try:
+            db.session.flush()
+            event_data = event.to_dict() if event is not None else None
+            db.session.commit()
+        except StaleDataError as exc:
+            db.session.rollback()
+            raise ConflictError(
+                f'Semantic event {event_id} was changed by someone else; reload and try again'
+            ) from exc
+        except Exception:
+            db.session.rollback()
+            raise
+        return event_data
+
+    def _import_legacy_events(self, experiment):
+        """Move events still stored in the configuration JSON into rows."""
+        if 'semantic_events' not in self._configuration(experiment):
+            return
+        # Lock so two first edits do not both import the same events
+        experiment = (
+            Experiment.query.filter_by(id=experiment.id)
+            .with_for_update()
+            .populate_existing()
+            .first()
+        )
+        config = self._configuration(experiment)
+        events = config.pop('semantic_events', None)
+        if events is None:
+            return
+        for event in legacy_event_rows(experiment.id, events, self.id_factory):
+            db.session.add(event)
+        experiment.configuration = json.dumps(config)
+        db.session.flush()
 
     @staticmethod
     def _validate_event_data(data):
@@ -165,8 +283,17 @@ class SemanticEventService:
             event_id = str(event_id).strip()
             if not event_id:
                 event_id = None
+        version = data.get('version')
+        if version not in (None, ''):
+            try:
+                version = int(version)
+            except (TypeError, ValueError) as exc:
+                raise ValidationError('version must be an integer') from exc
+        else:
+            version = None
         return {
             'id': event_id,
+            'version': version,
             'event_type': event_type.strip(),
             'from_period': from_period,
             'to_period': to_period,
@@ -241,16 +368,6 @@ class SemanticEventService:
         except (json.JSONDecodeError, TypeError):
             return {}
 
-    @staticmethod
-    def _commit_events(experiment, config, events):
-        config['semantic_events'] = events
-        experiment.configuration = json.dumps(config)
-        try:
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-            raise
-
     def _track_best_effort(
         self,
         event_type,
@@ -277,11 +394,7 @@ class SemanticEventService:
 
     @staticmethod
     def _owned_temporal_experiment(experiment_id, actor_id):
-        experiment = (
-            Experiment.query.filter_by(id=experiment_id)
-            .with_for_update()
-            .first()
-        )
+        experiment = db.session.get(Experiment, experiment_id)
         if not experiment:
             raise NotFoundError('Experiment not found')
         actor = db.session.get(User, actor_id)
@@ -292,3 +405,79 @@ class SemanticEventService:
                 'Semantic events are only available for temporal evolution experiments'
             )
         return experiment
+
+
+def _legacy_year(value):
+    try:
+        year = int(value)
+    except (TypeError, ValueError):
+        return None
+    return year if 1 <= year <= 9999 else None
+
+
+def _legacy_timestamp(value):
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _existing_ids(model, ids):
+    ids = {value for value in ids if isinstance(value, int) and not isinstance(value, bool)}
+    if not ids:
+        return set()
+    return {value for (value,) in db.session.query(model.id).filter(model.id.in_(ids))}
+
+
+def legacy_event_rows(experiment_id, events, id_factory=uuid4):
+    """
+    ``SemanticEvent`` rows for events from the configuration JSON. Older
+    shapes (``type``/``year``) are accepted; events without a readable year
+    are kept with an empty period rather than dropped.
+    """
+    events = [event for event in events if isinstance(event, dict)] if isinstance(events, list) else []
+    # Links and authors may point at documents or users deleted since
+    document_ids = {
+        document.get('id') if isinstance(document, dict) else document
+        for event in events
+        for document in event.get('related_documents') or []
+    }
+    user_ids = {event.get(field) for event in events for field in ('created_by', 'modified_by')}
+    known_documents = _existing_ids(Document, document_ids)
+    known_users = _existing_ids(User, user_ids)
+
+    rows, seen = [], set()
+    for event in events:
+        event_id = str(event.get('id') or '').strip()[:64] or str(id_factory())
+        if event_id in seen:
+            continue
+        seen.add(event_id)
+        event_type = str(event.get('event_type') or event.get('type') or 'unknown')
+        row = SemanticEvent(
+            experiment_id=experiment_id,
+            event_id=event_id,
+            event_type=event_type[:100],
+            from_period=_legacy_year(event.get('from_period', event.get('year'))),
+            to_period=_legacy_year(event.get('to_period')),
+            description=str(event.get('description') or ''),
+            type_label=event.get('type_label'),
+            type_uri=event.get('type_uri'),
+            definition=event.get('definition'),
+            citation=event.get('citation'),
+            example=event.get('example'),
+            created_by=event.get('created_by') if event.get('created_by') in known_users else None,
+            created_at=_legacy_timestamp(event.get('created_at')) or datetime.utcnow(),
+            modified_by=event.get('modified_by') if event.get('modified_by') in known_users else None,
+            modified_at=_legacy_timestamp(event.get('modified_at')),
+        )
+        linked = []
+        for document in event.get('related_documents') or []:
+            document_id = document.get('id') if isinstance(document, dict) else document
+            if document_id in known_documents and document_id not in linked:
+                linked.append(document_id)
+        row.related_documents = [
+            SemanticEventDocument(document_id=document_id, position=position)
+            for position, document_id in enumerate(linked)
+        ]
+        rows.append(row)
+    return rows
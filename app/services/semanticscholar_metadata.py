@@ -7,7 +7,8 @@ Provides comprehensive metadata for arXiv papers, published papers, and preprint
 
 from typing import Optional, Dict, Any
 import logging
-from semanticscholar import SemanticScholar
+
+from shared_services.http_client import get_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +26,43 @@ class SemanticScholarMetadataExtractor:
     - Abstracts and full metadata
     """
 
-    def __init__(self):
-        """Initialize Semantic Scholar client with timeout."""
-        # Set a reasonable timeout (5 seconds)
-        # Reduced from 10s to fail faster when API is slow
-        self.sch = SemanticScholar(timeout=5)
+    BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    FIELDS = (
+        "paperId,title,abstract,url,year,authors,venue,externalIds,"
+        "publicationTypes,citationCount,openAccessPdf"
+    )
+
+    def __init__(self, timeout: float = 5):
+        """
+        Initialize Semantic Scholar client.
+
+        Queries the Graph API through the shared HTTP pool instead of the
+        semanticscholar package, which opens a new client per request.
+
+        Args:
+            timeout: Request timeout in seconds (short so uploads fail fast)
+        """
+        self.timeout = timeout
+        self.session = get_http_pool().session()
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """GET a Graph API resource; returns None when the paper is unknown."""
+        query = {'fields': self.FIELDS}
+        query.update(params or {})
+        response = self.session.get(f"{self.BASE_URL}{path}", params=query, timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a single paper by S2 identifier (e.g. ``DOI:...`` or ``ARXIV:...``)."""
+        return self._get(f"/paper/{paper_id}")
+
+    def search_paper(self, query: str, limit: int = 5) -> list:
+        """Search papers by free-text query."""
+        data = self._get("/paper/search", {'query': query, 'limit': limit})
+        return (data or {}).get('data') or []
 
     def extract_from_arxiv_id(self, arxiv_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -48,7 +81,7 @@ class SemanticScholarMetadataExtractor:
             logger.info(f"Semantic Scholar: Querying for arXiv:{base_arxiv_id}")
 
             # Query Semantic Scholar
-            paper = self.sch.get_paper(f'ARXIV:{base_arxiv_id}')
+            paper = self.get_paper(f'ARXIV:{base_arxiv_id}')
 
             if not paper:
                 logger.warning(f"Semantic Scholar returned no results for arXiv:{arxiv_id}")
@@ -85,7 +118,7 @@ class SemanticScholarMetadataExtractor:
             clean_doi = doi.replace('https://doi.org/', '').replace('http://dx.doi.org/', '')
 
             # Query Semantic Scholar
-            paper = self.sch.get_paper(f'DOI:{clean_doi}')
+            paper = self.get_paper(f'DOI:{clean_doi}')
 
             if not paper:
                 logger.warning(f"Semantic Scholar returned no results for DOI:{doi}")
@@ -124,7 +157,7 @@ class SemanticScholarMetadataExtractor:
                 logger.info(f"Semantic Scholar: Searching with title and first author: {authors[0]}")
 
             # Search Semantic Scholar
-            results = self.sch.search_paper(query, limit=limit)
+            results = self.search_paper(query, limit=limit)
 
             if not results or len(results) == 0:
                 logger.warning(f"Semantic Scholar: No results for title search: {title}")
@@ -155,58 +188,60 @@ class SemanticScholarMetadataExtractor:
 
     def _parse_paper(self, paper) -> Dict[str, Any]:
         """
-        Parse Semantic Scholar paper object into standard metadata format.
+        Parse Semantic Scholar paper record into standard metadata format.
 
         Args:
-            paper: SemanticScholar paper object
+            paper: Graph API paper dict (or a semanticscholar Paper object)
 
         Returns:
             Dictionary with standardized metadata fields
         """
+        if not isinstance(paper, dict):
+            paper = getattr(paper, 'raw_data', None) or {}
+
         metadata = {}
 
         # Basic fields
-        metadata['title'] = paper.title if hasattr(paper, 'title') else None
-        metadata['abstract'] = paper.abstract if hasattr(paper, 'abstract') else None
-        metadata['url'] = paper.url if hasattr(paper, 'url') else None
+        metadata['title'] = paper.get('title')
+        metadata['abstract'] = paper.get('abstract')
+        metadata['url'] = paper.get('url')
 
         # Publication year
-        if hasattr(paper, 'year') and paper.year:
-            metadata['publication_year'] = paper.year
+        if paper.get('year'):
+            metadata['publication_year'] = paper['year']
 
         # Authors
-        if hasattr(paper, 'authors') and paper.authors:
-            author_names = [author.name for author in paper.authors if hasattr(author, 'name')]
-            if author_names:
-                metadata['authors'] = author_names
+        author_names = [a.get('name') for a in paper.get('authors') or [] if a.get('name')]
+        if author_names:
+            metadata['authors'] = author_names
 
         # Journal/venue
-        if hasattr(paper, 'venue') and paper.venue:
-            metadata['journal'] = paper.venue
+        if paper.get('venue'):
+            metadata['journal'] = paper['venue']
 
         # DOI
-        if hasattr(paper, 'externalIds') and paper.externalIds:
-            if 'DOI' in paper.externalIds:
-                metadata['doi'] = paper.externalIds['DOI']
-            if 'ArXiv' in paper.externalIds:
-                metadata['arxiv_id'] = paper.externalIds['ArXiv']
+        external_ids = paper.get('externalIds') or {}
+        if 'DOI' in external_ids:
+            metadata['doi'] = external_ids['DOI']
+        if 'ArXiv' in external_ids:
+            metadata['arxiv_id'] = external_ids['ArXiv']
 
         # Publication type (mapped from Semantic Scholar fields)
-        if hasattr(paper, 'publicationTypes') and paper.publicationTypes:
-            metadata['type'] = ', '.join(paper.publicationTypes)
+        if paper.get('publicationTypes'):
+            metadata['type'] = ', '.join(paper['publicationTypes'])
 
         # Citation count (useful for provenance)
-        if hasattr(paper, 'citationCount') and paper.citationCount:
-            metadata['citation_count'] = paper.citationCount
+        if paper.get('citationCount'):
+            metadata['citation_count'] = paper['citationCount']
 
         # PDF URL if available
-        if hasattr(paper, 'openAccessPdf') and paper.openAccessPdf:
-            if hasattr(paper.openAccessPdf, 'url'):
-                metadata['pdf_url'] = paper.openAccessPdf.url
+        open_access = paper.get('openAccessPdf') or {}
+        if open_access.get('url'):
+            metadata['pdf_url'] = open_access['url']
 
         # Semantic Scholar paper ID
-        if hasattr(paper, 'paperId'):
-            metadata['s2_paper_id'] = paper.paperId
+        if 'paperId' in paper:
+            metadata['s2_paper_id'] = paper['paperId']
 
         return metadata
 
@@ -0,0 +1,291 @@
+"""
+Parse-once spaCy annotation store shared by the extraction tools.
+
+Entity, definition, temporal and causal extraction and semantic chunking
+all need a spaCy parse of the same document text. Running ``nlp(text)`` in
+each tool meant an orchestration strategy selecting four tools parsed every
+book four times (and reloaded the model each time). The store parses a text
+once per pipeline and hands the same ``Doc`` to every caller:
+
+- models are loaded once per process
+- parsed docs are kept in a small in-memory LRU and serialized to disk as
+  ``DocBin`` bytes, keyed by content hash + model name/version + spaCy
+  version, so changed content never hits a stale entry
+- callers may ask for a subset of the pipeline; when a later caller needs
+  more components, only the missing ones are run, on a copy of the cached
+  ``Doc`` that then replaces it in the cache
+
+Returned docs are shared and must be treated as read-only.
+
+Configuration:
+
+    SPACY_ANNOTATION_CACHE_DIR        directory for serialized docs
+                                      (default: <project>/annotation_cache)
+    SPACY_ANNOTATION_CACHE_MAX_DISK   serialized docs kept on disk (default 256)
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = 'en_core_web_sm'
+
+# Under the project rather than the working directory, so web and Celery
+# processes started from different directories share one cache
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'annotation_cache',
+)
+
+# Components the tools that only need syntax (sentences, POS, dependencies) can skip
+SYNTAX_ONLY_EXCLUDE = ('ner',)
+
+
+def _load_model(name: str):
+    import spacy
+    return spacy.load(name)
+
+
+class SpacyAnnotationStore:
+    """Memory + disk cache of spaCy parses keyed by content and pipeline."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memory_docs: int = 8,
+                 max_disk_docs: Optional[int] = None,
+                 loader: Callable[[str], object] = _load_model):
+        """
+        Args:
+            cache_dir: Directory for serialized docs; an empty string (or an
+                empty ``SPACY_ANNOTATION_CACHE_DIR``) disables the disk tier
+            max_memory_docs: Parsed docs kept in memory
+            max_disk_docs: Serialized docs kept on disk
+            loader: Model loader (``spacy.load`` by default)
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get('SPACY_ANNOTATION_CACHE_DIR', DEFAULT_CACHE_DIR)
+        self.cache_dir = cache_dir or None
+        self.max_memory_docs = max_memory_docs
+        self.max_disk_docs = max_disk_docs if max_disk_docs is not None else int(
+            os.environ.get('SPACY_ANNOTATION_CACHE_MAX_DISK', 256)
+        )
+        self._loader = loader
+        self._models: Dict[str, object] = {}
+        self._memory: 'OrderedDict[str, Tuple[FrozenSet[str], object]]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'parses': 0, 'partial_parses': 0}
+
+    def get_nlp(self, model: str = DEFAULT_MODEL):
+        """
+        Load a spaCy pipeline once per process.
+
+        Raises:
+            OSError: If the model is not installed (same as ``spacy.load``)
+        """
+        with self._lock:
+            nlp = self._models.get(model)
+            if nlp is None:
+                nlp = self._loader(model)
+                self._models[model] = nlp
+            return nlp
+
+    def parse(self, text: str, model: str = DEFAULT_MODEL, exclude: Iterable[str] = ()):
+        """
+        Return a parsed Doc for ``text``, reusing earlier parses.
+
+        Args:
+            text: Text to parse
+            model: spaCy pipeline name
+            exclude: Pipeline components the caller does not need
+
+        Returns:
+            spaCy Doc annotated by at least the requested components
+
+        Raises:
+            OSError: If the model is not installed
+        """
+        nlp = self.get_nlp(model)
+        required = frozenset(name for name in nlp.pipe_names if name not in set(exclude))
+        key = self._key(text, model, nlp)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is None:
+            entry = self._read_disk_entry(key, nlp)
+            if entry is not None:
+                self._count('disk_hits')
+        elif required <= entry[0]:
+            self._count('memory_hits')
+
+        if entry is not None and required <= entry[0]:
+            self._remember(key, entry)
+            return entry[1]
+
+        if entry is not None:
+            doc, applied = self._complete(nlp, text, entry, required)
+        else:
+            doc = nlp(text, disable=[name for name in nlp.pipe_names if name not in required])
+            applied = required
+            self._count('parses')
+
+        entry = (frozenset(applied), doc)
+        self._remember(key, entry)
+        self._write_disk_entry(key, entry)
+        return doc
+
+    def invalidate(self, text: Optional[str] = None) -> None:
+        """Drop cached parses of one text (all models) or everything."""
+        prefix = hashlib.sha256(text.encode('utf-8')).hexdigest() if text is not None else ''
+        with self._lock:
+            for key in [k for k in self._memory if k.startswith(prefix)]:
+                del self._memory[key]
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(prefix) and name.endswith('.spacy'):
+                    self._remove(os.path.join(self.cache_dir, name))
+
+    def stats(self) -> Dict[str, object]:
+        """Hit/parse counters and number of docs held in memory."""
+        with self._lock:
+            return dict(self._stats, in_memory=len(self._memory), cache_dir=self.cache_dir)
+
+    def _complete(self, nlp, text, entry, required):
+        """
+        Run only the components a cached Doc is missing.
+
+        The components run on a copy: the cached Doc may already be held by
+        other callers (or threads), who must not see pipes they did not ask for.
+        """
+        applied, doc = entry
+        missing = set(required) - set(applied)
+        # Listener components (e.g. a shared tok2vec) need their source re-run,
+        # since serialized docs do not keep tensors
+        for name, proc in nlp.pipeline:
+            listeners = getattr(proc, 'listening_components', None) or []
+            if missing.intersection(listeners):
+                missing.add(name)
+        try:
+            doc = doc.copy()
+            for name, proc in nlp.pipeline:
+                if name in missing:
+                    doc = proc(doc)
+            self._count('partial_parses')
+            return doc, set(applied) | set(required)
+        except Exception as e:
+            logger.warning(f"Partial pipeline reuse failed ({e}); parsing from scratch")
+            self._count('parses')
+            union = set(applied) | set(required)
+            return nlp(text, disable=[n for n in nlp.pipe_names if n not in union]), union
+
+    @staticmethod
+    def _key(text: str, model: str, nlp) -> str:
+        import spacy
+
+        content_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        version = (getattr(nlp, 'meta', None) or {}).get('version', '0')
+        pipeline = hashlib.sha256(
+            f"{model}|{version}|{spacy.__version__}|{','.join(nlp.pipe_names)}".encode('utf-8')
+        ).hexdigest()[:16]
+        return f"{content_hash}-{pipeline}"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _remember(self, key, entry) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_docs:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.spacy")
+
+    def _read_disk_entry(self, key: str, nlp):
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            import srsly
+            from spacy.tokens import DocBin
+
+            with open(path, 'rb') as f:
+                payload = srsly.msgpack_loads(f.read())
+            doc = next(DocBin().from_bytes(payload['docbin']).get_docs(nlp.vocab))
+            return frozenset(payload['components']), doc
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable annotation cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+    def _write_disk_entry(self, key: str, entry) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            import srsly
+            from spacy.tokens import DocBin
+
+            applied, doc = entry
+            doc_bin = DocBin(store_user_data=False)
+            doc_bin.add(doc)
+            payload = srsly.msgpack_dumps({
+                'components': sorted(applied),
+                'docbin': doc_bin.to_bytes(),
+            })
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+            self._prune_disk()
+        except Exception as e:
+            # The disk tier is an optimization; keep serving from memory
+            logger.warning(f"Could not write annotation cache entry for {key}: {e}")
+
+    def _prune_disk(self) -> None:
+        entries: List[Tuple[float, str]] = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.spacy'):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        if len(entries) <= self.max_disk_docs:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_disk_docs]:
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# Global store instance (singleton pattern)
+_global_annotation_store: Optional[SpacyAnnotationStore] = None
+
+
+def get_annotation_store() -> SpacyAnnotationStore:
+    """
+    Get the process-wide spaCy annotation store.
+
+    Returns:
+        Singleton SpacyAnnotationStore instance
+    """
+    global _global_annotation_store
+    if _global_annotation_store is None:
+        _global_annotation_store = SpacyAnnotationStore()
+    return _global_annotation_store
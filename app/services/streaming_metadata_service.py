@@ -47,6 +47,9 @@ class StreamingMetadataService:
         def report(message):
             messages.put({'type': 'progress', 'message': message})
 
+        def report_source(outcome):
+            messages.put({'type': 'source', **outcome})
+
         def worker():
             try:
                 with app.app_context():
@@ -54,6 +57,7 @@ class StreamingMetadataService:
                         result = self.upload_service.extract_metadata_from_pdf_streaming(
                             temp_path,
                             progress_callback=report,
+                            source_callback=report_source,
                         )
                     else:
                         result = {
@@ -90,7 +94,7 @@ class StreamingMetadataService:
                 except queue.Empty:
                     yield self._event({'type': 'heartbeat'})
                     continue
-                if message['type'] == 'progress':
+                if message['type'] in ('progress', 'source'):
                     yield self._event(message)
                     continue
                 if message['type'] == 'complete':
@@ -22,6 +22,7 @@ from app.services.base_service import (
     ServiceError,
     ValidationError,
 )
+from app.services.semantic_event_service import SemanticEventService
 
 logger = logging.getLogger(__name__)
 
@@ -168,7 +169,7 @@ class TemporalService(BaseService):
                 'orchestration_decisions': orchestration_decisions,
                 'period_documents': period_documents_hydrated,
                 'period_metadata': config.get('period_metadata', {}),
-                'semantic_events': config.get('semantic_events', []),
+                'semantic_events': SemanticEventService.events_for(experiment, config),
                 'periods': config.get('periods', []),  # Full period objects for timeline view
                 'named_periods': config.get('named_periods', [])  # Named period ranges (e.g., "AI Revolution")
             }
@@ -628,11 +629,10 @@ class TemporalService(BaseService):
 
             # Import temporal analysis service
             from shared_services.temporal import TemporalAnalysisService
-            from shared_services.ontology.ontology_importer import OntologyImporter
+            from shared_services.ontology.ontology_importer import get_ontology_importer
 
             # Initialize services
-            ontology_importer = OntologyImporter()
-            temporal_service = TemporalAnalysisService(ontology_importer)
+            temporal_service = TemporalAnalysisService(get_ontology_importer())
 
             # Get all documents from the experiment
             all_documents = list(experiment.documents) + list(experiment.references)
@@ -6,13 +6,13 @@ from statistics import mean
 from app import db
 from app.models.document import Document
 from app.models.experiment import Experiment
-from app.models.experiment_document import ExperimentDocument
 from app.models.temporal_experiment import (
     DocumentTemporalMetadata,
     SemanticShiftAnalysis,
 )
 from app.models.term import Term
 from app.services.base_service import NotFoundError, ValidationError
+from app.services.experiment_corpus_service import ExperimentCorpusService
 
 
 class TemporalVisualizationService:
@@ -178,26 +178,7 @@ class TemporalVisualizationService:
 
     @classmethod
     def _experiment_content(cls, experiment):
-        canonical_ids = {
-            association.document_id
-            for association in ExperimentDocument.query.filter_by(
-                experiment_id=experiment.id
-            ).all()
-        }
-        compatibility_documents = list(experiment.documents)
-        reference_documents = list(experiment.references)
-        reference_ids = {reference.id for reference in reference_documents}
-        document_ids = canonical_ids | {
-            document.id for document in compatibility_documents
-        }
-        document_ids -= reference_ids
-        documents = (
-            Document.query.filter(Document.id.in_(document_ids)).all()
-            if document_ids else []
-        )
-        documents.sort(key=lambda document: document.id)
-        reference_documents.sort(key=lambda document: document.id)
-        return documents, reference_documents
+        return ExperimentCorpusService.documents_and_references(experiment.id)
 
     @classmethod
     def _document_summary(cls, document, experiment_id):
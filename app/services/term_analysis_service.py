@@ -18,7 +18,8 @@ from shared_services.preprocessing.temporal_extractor import TemporalWordUsageEx
 from shared_services.preprocessing.historical_processor import HistoricalDocumentProcessor
 from shared_services.preprocessing.provenance_tracker import ProvenanceTracker
 
-from app.models import Term, TermVersion, ContextAnchor, SemanticDriftActivity, AnalysisAgent
+from app.models import Term, TermVersion, SemanticDriftActivity, AnalysisAgent
+from app.services.anchor_embedding_index import get_anchor_embedding_index
 from app import db
 
 logger = logging.getLogger(__name__)
@@ -281,30 +282,16 @@ class TermAnalysisService:
             return []
         
         try:
-            # Get existing context anchors from database for similarity comparison
-            existing_anchors = ContextAnchor.query.limit(100).all()
-            if not existing_anchors:
-                return []
-            
             # Generate embedding for the term's meaning
             term_embedding = self.embedding_service.get_embedding(
                 f"{term.term_text}. {version.meaning_description}"
             )
             
-            # Compare with existing anchors
-            similarities = []
-            for anchor in existing_anchors:
-                try:
-                    anchor_embedding = self.embedding_service.get_embedding(anchor.anchor_term)
-                    similarity = self.embedding_service.similarity(term_embedding, anchor_embedding)
-                    similarities.append((anchor.anchor_term, similarity))
-                except Exception as e:
-                    logger.debug(f"Failed to compare with anchor {anchor.anchor_term}: {e}")
-                    continue
-            
-            # Sort by similarity and return top matches
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            return [anchor for anchor, sim in similarities[:15] if sim > 0.3]  # Threshold for relevance
+            # Rank every stored anchor against it in one pass over the cached matrix
+            matches = get_anchor_embedding_index().top_k(
+                self.embedding_service, term_embedding, 15, min_similarity=0.3  # Threshold for relevance
+            )
+            return [anchor for anchor, frequency, similarity in matches]
             
         except Exception as e:
             logger.error(f"Failed to discover context anchors: {e}")
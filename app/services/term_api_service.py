@@ -5,8 +5,10 @@ from uuid import UUID
 
 from app import db
 from app.models.context_anchor import ContextAnchor
+from app.models.fuzzy_search import FUZZY_MATCH_MODES, bounded_limit
 from app.models.term import FuzzinessAdjustment, Term, TermVersion
 from app.models.user import User
+from app.services.anchor_embedding_index import get_anchor_embedding_index
 from app.services.base_service import (
     NotFoundError,
     PermissionError,
@@ -23,10 +25,12 @@ class TermApiService:
     """Serve term utility APIs with bounded queries and validated identities."""
 
     @classmethod
-    def search_context_anchors(cls, query='', limit=20):
+    def search_context_anchors(cls, query='', limit=20, mode='fuzzy'):
+        mode = cls._mode(mode)
         anchors = ContextAnchor.search_anchors(
             cls._clean(query),
-            cls._limit(limit, 20),
+            bounded_limit(limit, mode, 20),
+            mode,
         )
         return [
             {
@@ -38,9 +42,10 @@ class TermApiService:
         ]
 
     @classmethod
-    def search_terms(cls, query='', limit=10):
-        terms = Term.search_terms(cls._clean(query)).limit(
-            cls._limit(limit, 10)
+    def search_terms(cls, query='', limit=10, mode='fuzzy'):
+        mode = cls._mode(mode)
+        terms = Term.search_terms(cls._clean(query), mode=mode).limit(
+            bounded_limit(limit, mode, 10)
         ).all()
         return [term.to_dict() for term in terms]
 
@@ -71,32 +76,20 @@ class TermApiService:
             combined_text += f'. {meaning_description}'
         try:
             term_embedding = embedding_service.get_embedding(combined_text)
-            anchors = ContextAnchor.query.order_by(
-                ContextAnchor.frequency.desc()
-            ).limit(100).all()
-            similarities = []
-            for anchor in anchors:
-                try:
-                    anchor_embedding = embedding_service.get_embedding(
-                        anchor.anchor_term
-                    )
-                    similarity = embedding_service.similarity(
-                        term_embedding,
-                        anchor_embedding,
-                    )
-                    similarities.append({
-                        'term': anchor.anchor_term,
-                        'frequency': anchor.frequency,
-                        'similarity': round(float(similarity), 3),
-                        'source': 'embedding_similarity',
-                    })
-                except Exception:
-                    continue
-            similarities.sort(
-                key=lambda item: item['similarity'],
-                reverse=True,
+            matches = get_anchor_embedding_index().top_k(
+                embedding_service,
+                term_embedding,
+                limit,
             )
-            return similarities[:limit]
+            return [
+                {
+                    'term': anchor_term,
+                    'frequency': frequency,
+                    'similarity': round(similarity, 3),
+                    'source': 'embedding_similarity',
+                }
+                for anchor_term, frequency, similarity in matches
+            ]
         except Exception as exc:
             raise ServiceError('Context anchor discovery failed') from exc
 
@@ -202,6 +195,13 @@ class TermApiService:
             value = default
         return max(1, min(value, 100))
 
+    @staticmethod
+    def _mode(value):
+        value = value or 'fuzzy'
+        if value not in FUZZY_MATCH_MODES:
+            raise ValidationError(f'Unknown search mode: {value}')
+        return value
+
     @staticmethod
     def _uuid(value, label):
         try:
@@ -11,7 +11,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from app import db
-from app.models import Experiment
+from app.models import Document, Experiment
 from app.models.user import User
 from app.services.base_service import (
     BaseService,
@@ -20,6 +20,7 @@ from app.services.base_service import (
     ServiceError,
     ValidationError,
 )
+from app.services.document_search_service import get_document_search_service
 
 logger = logging.getLogger(__name__)
 
@@ -329,7 +330,15 @@ class TermService(BaseService):
         """
         domain_definitions = []
 
-        for ref in experiment.references:
+        # The full-text index narrows the references to those mentioning the
+        # term, best match first; only they are loaded and scanned (stop-word
+        # terms and unindexed long content fall back to substring matching)
+        reference_ids = get_document_search_service().matching_ids(
+            term, experiment_id=experiment.id, role='reference'
+        )
+        references = {ref.id: ref for ref in Document.query.filter(Document.id.in_(reference_ids))} if reference_ids else {}
+
+        for ref in (references[ref_id] for ref_id in reference_ids if ref_id in references):
             # Check if reference matches domain (simple heuristic)
             ref_content = ref.content or ''
             if term.lower() in ref_content.lower():
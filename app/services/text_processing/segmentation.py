@@ -8,19 +8,26 @@ import re
 import logging
 from typing import List, Dict, Any
 import nltk
-import spacy
 
 from app import db
 from app.models.text_segment import TextSegment
+from app.services.windowed_nlp import get_windowed_nlp_runner
 from app.text_utils import clean_jstor_boilerplate
 
 logger = logging.getLogger(__name__)
 
-# Load spacy model
-try:
-    nlp = spacy.load('en_core_web_sm')
-except OSError:
-    nlp = None
+
+def _sentences(text: str):
+    """
+    spaCy sentences of ``text`` as ``(start_char, end_char, span)``, parsed
+    in sentence-aligned windows when long, or None if the model is unavailable.
+    """
+    runner = get_windowed_nlp_runner()
+    try:
+        runner.store.get_nlp()
+    except (ImportError, OSError):
+        return None
+    return runner.sentences(text)
 
 
 class TextSegmentation:
@@ -113,19 +120,21 @@ class TextSegmentation:
         """Create sentence-level segments for a document using spaCy"""
         try:
             content = clean_jstor_boilerplate(document.content)
-            if not content or not nlp:
+            if not content:
                 return
 
-            doc = nlp(content)
+            sentences = _sentences(content)
+            if sentences is None:
+                return
 
-            for i, sent in enumerate(doc.sents):
+            for i, (start_char, end_char, sent) in enumerate(sentences):
                 segment = TextSegment(
                     document_id=document.id,
                     content=sent.text,
                     segment_type='sentence',
                     segment_number=i + 1,
-                    start_position=sent.start_char,
-                    end_position=sent.end_char,
+                    start_position=start_char,
+                    end_position=end_char,
                     level=1,
                     language=document.detected_language
                 )
@@ -160,12 +169,12 @@ class TextSegmentation:
                 nltk.download('punkt_tab', quiet=True)
 
             # Try spaCy for entity-aware chunking
-            if nlp:
-                doc = nlp(text)
+            sentences = _sentences(text)
+            if sentences is not None:
                 current_chunk = []
                 chunks = []
 
-                for sent in doc.sents:
+                for _, _, sent in sentences:
                     current_chunk.append(sent.text.strip())
                     if len(current_chunk) >= 3 or (sent.ents and len(current_chunk) >= 2):
                         chunks.append(' '.join(current_chunk))
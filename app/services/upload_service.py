@@ -6,19 +6,24 @@ experiment-specific uploads. Handles file processing, metadata extraction,
 and document creation.
 """
 
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Callable
 from dataclasses import dataclass, field
+import logging
 import os
 import tempfile
 from pathlib import Path
+from flask import current_app, has_app_context
 from werkzeug.utils import secure_filename
 from werkzeug.datastructures import FileStorage
 
 from app.utils.file_handler import FileHandler
 from app.services.crossref_metadata import CrossRefMetadataExtractor
+from app.services.metadata_fanout import MetadataFanout, SourceLookup, SourceOutcome
 from app.services.semanticscholar_metadata import SemanticScholarMetadataExtractor
 from app.utils.pdf_analyzer import pdf_analyzer
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class UploadResult:
@@ -49,6 +54,7 @@ class UploadService:
     - File handling and validation
     - Temporary file management
     - CrossRef metadata extraction
+    - Concurrent metadata-source fan-out for PDFs
     - Bibliographic metadata normalization
     """
 
@@ -59,6 +65,8 @@ class UploadService:
         self.file_handler = FileHandler()
         self.crossref = CrossRefMetadataExtractor()
         self.semanticscholar = SemanticScholarMetadataExtractor()
+        self._zotero = None
+        self._zotero_checked = False
 
     def validate_file(self, file: FileStorage) -> Tuple[bool, Optional[str]]:
         """
@@ -242,7 +250,7 @@ class UploadService:
                 error=f"Error searching CrossRef: {str(e)}"
             )
 
-    def extract_metadata_from_pdf(self, pdf_path: str) -> MetadataExtractionResult:
+    def extract_metadata_from_pdf(self, pdf_path: str, fanout: Optional[bool] = None) -> MetadataExtractionResult:
         """
         Extract metadata from PDF file automatically (Zotero-style).
 
@@ -252,8 +260,12 @@ class UploadService:
         3. Extract title from PDF and query CrossRef (with authors for better matching)
         4. Use embedded PDF metadata as fallback
 
+        In fan-out mode (METADATA_FANOUT, on by default) steps 1-3 plus CrossRef
+        DOI and optional Zotero lookups run concurrently instead.
+
         Args:
             pdf_path: Path to PDF file
+            fanout: Force fan-out on/off (defaults to METADATA_FANOUT config)
 
         Returns:
             MetadataExtractionResult with extracted metadata and progress messages
@@ -267,6 +279,14 @@ class UploadService:
             if pdf_info.get('progress'):
                 progress.extend(pdf_info['progress'])
 
+            if self._fanout_enabled(fanout):
+                result = self._extract_with_fanout(pdf_info, progress.append)
+                if result:
+                    result.progress = progress
+                    return result
+                progress.append("Using extracted PDF metadata as fallback")
+                return self._pdf_fallback_result(pdf_info, progress)
+
             # Try arXiv ID first (most reliable for arXiv papers)
             if pdf_info.get('arxiv_id'):
                 progress.append("Checking Semantic Scholar with arXiv ID...")
@@ -331,27 +351,7 @@ class UploadService:
 
             # Fallback: return what we found from PDF (even if lookups failed)
             progress.append("Using extracted PDF metadata as fallback")
-            fallback_metadata = pdf_info.get('metadata', {})
-
-            # Include extracted metadata even if API lookups failed
-            if pdf_info.get('title') and 'title' not in fallback_metadata:
-                fallback_metadata['title'] = pdf_info['title']
-            if pdf_info.get('doi') and 'doi' not in fallback_metadata:
-                fallback_metadata['doi'] = pdf_info['doi']
-            if pdf_info.get('arxiv_id'):
-                fallback_metadata['arxiv_id'] = pdf_info['arxiv_id']
-            if pdf_info.get('authors') and 'authors' not in fallback_metadata:
-                fallback_metadata['authors'] = pdf_info['authors']
-            if pdf_info.get('abstract') and 'abstract' not in fallback_metadata:
-                fallback_metadata['abstract'] = pdf_info['abstract']
-
-            return MetadataExtractionResult(
-                success=False,
-                metadata=fallback_metadata,
-                source='pdf_analysis',
-                error="Could not find metadata using Semantic Scholar or CrossRef",
-                progress=progress
-            )
+            return self._pdf_fallback_result(pdf_info, progress)
 
         except Exception as e:
             progress.append(f"Error: {str(e)}")
@@ -366,7 +366,9 @@ class UploadService:
     def extract_metadata_from_pdf_streaming(
         self,
         pdf_path: str,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        source_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        fanout: Optional[bool] = None
     ) -> MetadataExtractionResult:
         """
         Extract metadata from PDF with real-time progress streaming.
@@ -378,6 +380,9 @@ class UploadService:
         Args:
             pdf_path: Path to PDF file
             progress_callback: Function called with each progress message
+            source_callback: Function called with each metadata source's
+                result (fan-out mode) as soon as it arrives
+            fanout: Force fan-out on/off (defaults to METADATA_FANOUT config)
 
         Returns:
             MetadataExtractionResult with extracted metadata
@@ -398,6 +403,14 @@ class UploadService:
                 progress_callback=lambda msg: report_progress(msg)
             )
 
+            if self._fanout_enabled(fanout):
+                result = self._extract_with_fanout(pdf_info, report_progress, source_callback)
+                if result:
+                    result.progress = progress
+                    return result
+                report_progress("Using extracted PDF metadata")
+                return self._pdf_fallback_result(pdf_info, progress)
+
             # Try arXiv ID first (most reliable for arXiv papers)
             if pdf_info.get('arxiv_id'):
                 report_progress("Querying Semantic Scholar with arXiv ID (this may take a moment)...")
@@ -462,27 +475,7 @@ class UploadService:
 
             # Fallback: return what we found from PDF
             report_progress("Using extracted PDF metadata")
-            fallback_metadata = pdf_info.get('metadata', {})
-
-            # Include extracted metadata even if API lookups failed
-            if pdf_info.get('title') and 'title' not in fallback_metadata:
-                fallback_metadata['title'] = pdf_info['title']
-            if pdf_info.get('doi') and 'doi' not in fallback_metadata:
-                fallback_metadata['doi'] = pdf_info['doi']
-            if pdf_info.get('arxiv_id'):
-                fallback_metadata['arxiv_id'] = pdf_info['arxiv_id']
-            if pdf_info.get('authors') and 'authors' not in fallback_metadata:
-                fallback_metadata['authors'] = pdf_info['authors']
-            if pdf_info.get('abstract') and 'abstract' not in fallback_metadata:
-                fallback_metadata['abstract'] = pdf_info['abstract']
-
-            return MetadataExtractionResult(
-                success=False,
-                metadata=fallback_metadata,
-                source='pdf_analysis',
-                error="Could not find metadata using Semantic Scholar or CrossRef",
-                progress=progress
-            )
+            return self._pdf_fallback_result(pdf_info, progress)
 
         except Exception as e:
             report_progress(f"Error: {str(e)}")
@@ -494,6 +487,182 @@ class UploadService:
                 progress=progress
             )
 
+    def _fanout_enabled(self, fanout: Optional[bool]) -> bool:
+        """Resolve fan-out mode from the explicit flag or METADATA_FANOUT config."""
+        if fanout is not None:
+            return fanout
+        return bool(self._config('METADATA_FANOUT', True))
+
+    @staticmethod
+    def _config(key: str, default: Any) -> Any:
+        if has_app_context():
+            return current_app.config.get(key, default)
+        return default
+
+    def _zotero_service(self):
+        """Zotero client when PREFILL_USE_ZOTERO is enabled and configured."""
+        if not self._config('PREFILL_USE_ZOTERO', False):
+            return None
+        if not self._zotero_checked:
+            self._zotero_checked = True
+            try:
+                from shared_services.zotero.zotero_service import ZoteroService
+                self._zotero = ZoteroService()
+            except Exception as e:
+                logger.info(f"Zotero lookups disabled for uploads: {e}")
+                self._zotero = None
+        return self._zotero
+
+    def _metadata_lookups(self, pdf_info: Dict[str, Any]) -> List[SourceLookup]:
+        """
+        Build the independent source lookups for a PDF analysis result.
+
+        Precedence follows the sequential cascade: Semantic Scholar by arXiv
+        ID, then by DOI, CrossRef by DOI, CrossRef title search, Zotero.
+        """
+        lookups = []
+        arxiv_id = pdf_info.get('arxiv_id')
+        doi = pdf_info.get('doi')
+        title = pdf_info.get('title')
+        authors = pdf_info.get('authors')
+
+        if arxiv_id:
+            lookups.append(SourceLookup(
+                'semanticscholar_arxiv', 'semanticscholar', 'Semantic Scholar (arXiv ID)', 0,
+                lambda: self.semanticscholar.extract_from_arxiv_id(arxiv_id),
+            ))
+
+        if doi:
+            def semanticscholar_doi():
+                result = self.semanticscholar.extract_from_doi(doi)
+                if result:
+                    result['extracted_doi'] = doi
+                return result
+
+            def crossref_doi():
+                result = self.crossref.extract_from_doi(doi)
+                if result:
+                    result['extraction_method'] = 'doi'
+                return result
+
+            lookups.append(SourceLookup(
+                'semanticscholar_doi', 'semanticscholar', 'Semantic Scholar (DOI)', 1, semanticscholar_doi,
+            ))
+            lookups.append(SourceLookup(
+                'crossref_doi', 'crossref', 'CrossRef (DOI)', 2, crossref_doi,
+            ))
+
+        if title:
+            def crossref_title():
+                result = self.crossref.extract_from_metadata(title, authors=authors)
+                if result:
+                    result['extracted_title'] = title
+                    if authors:
+                        result['extracted_authors'] = authors
+                    result['extraction_method'] = 'title_from_pdf_with_authors' if authors else 'title_from_pdf'
+                return result
+
+            lookups.append(SourceLookup(
+                'crossref_title', 'crossref', 'CrossRef (title search)', 3, crossref_title,
+            ))
+
+        zotero = self._zotero_service() if (doi or title) else None
+        if zotero:
+            def zotero_lookup():
+                from shared_services.zotero.metadata_mapper import ZoteroMetadataMapper
+
+                item = zotero.search_by_doi(doi) if doi else None
+                if not item and title:
+                    matches = zotero.search_by_title(title, limit=3)
+                    item = matches[0] if matches else None
+                if not item:
+                    return None
+                result = ZoteroMetadataMapper.map_to_source_metadata(item)
+                date = str(result.get('publication_date') or '')
+                if date[:4].isdigit():
+                    result['publication_year'] = int(date[:4])
+                result['extraction_method'] = 'zotero'
+                return result
+
+            lookups.append(SourceLookup('zotero', 'zotero', 'Zotero library', 4, zotero_lookup))
+
+        return lookups
+
+    def _extract_with_fanout(
+        self,
+        pdf_info: Dict[str, Any],
+        report_progress: Callable[[str], None],
+        source_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Optional[MetadataExtractionResult]:
+        """
+        Query metadata sources concurrently and merge the accepted matches.
+
+        Returns:
+            Successful MetadataExtractionResult, or None when no source matched
+        """
+        lookups = self._metadata_lookups(pdf_info)
+        if not lookups:
+            return None
+
+        report_progress(f"Querying {len(lookups)} metadata sources in parallel...")
+
+        def on_outcome(outcome: SourceOutcome):
+            label = outcome.lookup.label
+            if outcome.confident:
+                report_progress(f"Found paper in {label}!")
+            elif outcome.found:
+                report_progress(f"Found possible match in {label} (low confidence)")
+            elif outcome.error:
+                report_progress(f"{label} lookup failed")
+            else:
+                report_progress(f"Not found in {label}")
+            if source_callback:
+                source_callback(outcome.to_event())
+
+        fanout = MetadataFanout(
+            budget_seconds=float(self._config('METADATA_FANOUT_BUDGET', 8.0)),
+        )
+        result = fanout.run(lookups, on_outcome)
+
+        if result.abandoned and result.primary is None:
+            report_progress(
+                "Stopped waiting for: " + ', '.join(lookup.label for lookup in result.abandoned)
+            )
+        if result.primary is None:
+            return None
+
+        # Primary match wins; other confident sources only fill missing fields
+        merged = self.merge_metadata(*(outcome.metadata for outcome in result.accepted))
+        return MetadataExtractionResult(
+            success=True,
+            metadata=self._normalize_metadata(merged),
+            source=result.primary.lookup.source,
+        )
+
+    def _pdf_fallback_result(self, pdf_info: Dict[str, Any], progress: List[str]) -> MetadataExtractionResult:
+        """Build the unsuccessful result carrying whatever the PDF analysis found."""
+        fallback_metadata = pdf_info.get('metadata', {})
+
+        # Include extracted metadata even if API lookups failed
+        if pdf_info.get('title') and 'title' not in fallback_metadata:
+            fallback_metadata['title'] = pdf_info['title']
+        if pdf_info.get('doi') and 'doi' not in fallback_metadata:
+            fallback_metadata['doi'] = pdf_info['doi']
+        if pdf_info.get('arxiv_id'):
+            fallback_metadata['arxiv_id'] = pdf_info['arxiv_id']
+        if pdf_info.get('authors') and 'authors' not in fallback_metadata:
+            fallback_metadata['authors'] = pdf_info['authors']
+        if pdf_info.get('abstract') and 'abstract' not in fallback_metadata:
+            fallback_metadata['abstract'] = pdf_info['abstract']
+
+        return MetadataExtractionResult(
+            success=False,
+            metadata=fallback_metadata,
+            source='pdf_analysis',
+            error="Could not find metadata using Semantic Scholar or CrossRef",
+            progress=progress
+        )
+
     def extract_text_content(self, file_path: str, filename: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Extract text content from file.
@@ -0,0 +1,139 @@
+"""
+Windowed spaCy processing for book-length texts.
+
+``nlp(text)`` on a whole book fails past ``nlp.max_length`` (1,000,000
+characters by default) and holds every token of the book in one ``Doc``.
+``WindowedNLPRunner.docs`` splits long texts into windows of at most
+``SPACY_WINDOW_CHARS`` characters, each ending at a sentence boundary
+(or, failing that, a paragraph break or whitespace), and streams them
+through ``nlp.pipe``, so only one batch of window docs is alive at a time.
+Callers receive ``(offset, doc)`` pairs and add ``offset`` to character
+offsets to get positions in the full text.
+
+Texts that fit in one window still go through the annotation store, so
+short documents keep sharing one cached parse between tools.
+
+``phrase_keys`` supports hash-based dedup of noun phrases against entity
+texts (set lookups instead of substring scans over every entity).
+
+Configuration:
+
+    SPACY_WINDOW_CHARS        maximum window size (default 100000)
+    SPACY_WINDOW_BATCH_SIZE   windows per nlp.pipe batch (default 4)
+"""
+
+import os
+import re
+from typing import Iterable, Iterator, Optional, Set, Tuple
+
+from app.services.spacy_annotation_store import DEFAULT_MODEL, SpacyAnnotationStore, get_annotation_store
+
+DEFAULT_WINDOW_CHARS = 100000
+DEFAULT_WINDOW_BATCH_SIZE = 4
+
+# Sentence end (with closing quotes/brackets) followed by whitespace, or a paragraph break
+_SENTENCE_BOUNDARY = re.compile(r'[.!?]["\')\]]*\s+|\n\s*\n')
+_WORD = re.compile(r'\w+')
+
+
+def _window_end(text: str, start: int, limit: int) -> int:
+    """Best cut in ``text[start:limit]``, searching its second half for a boundary."""
+    floor = start + (limit - start) // 2
+    last = None
+    for last in _SENTENCE_BOUNDARY.finditer(text, floor, limit):
+        pass
+    if last is not None:
+        return last.end()
+    space = max(text.rfind(' ', floor, limit), text.rfind('\n', floor, limit))
+    return space + 1 if space != -1 else limit
+
+
+def iter_text_windows(text: str, max_chars: int = DEFAULT_WINDOW_CHARS) -> Iterator[Tuple[int, int]]:
+    """
+    Yield ``(start, end)`` bounds covering ``text`` in order, each at most
+    ``max_chars`` long and cut at a sentence boundary where one exists.
+    """
+    if max_chars < 2:
+        raise ValueError('max_chars must be at least 2')
+    start, length = 0, len(text)
+    while start < length:
+        if length - start <= max_chars:
+            yield start, length
+            return
+        end = _window_end(text, start, start + max_chars)
+        yield start, end
+        start = end
+
+
+def phrase_keys(text: str) -> Set[str]:
+    """Lowercased contiguous word sequences of ``text`` (all of its sub-phrases)."""
+    words = _WORD.findall(text.lower())
+    return {
+        ' '.join(words[i:j])
+        for i in range(len(words))
+        for j in range(i + 1, len(words) + 1)
+    }
+
+
+def phrase_key(text: str) -> str:
+    """Normalized key of ``text`` comparable with ``phrase_keys`` entries."""
+    return ' '.join(_WORD.findall(text.lower()))
+
+
+class WindowedNLPRunner:
+    """Run a spaCy pipeline over long texts in sentence-aligned windows."""
+
+    def __init__(self, store: Optional[SpacyAnnotationStore] = None,
+                 window_chars: Optional[int] = None, batch_size: Optional[int] = None):
+        """
+        Args:
+            store: Annotation store providing models and short-text parses
+            window_chars: Maximum window size (``SPACY_WINDOW_CHARS``)
+            batch_size: Windows per ``nlp.pipe`` batch (``SPACY_WINDOW_BATCH_SIZE``)
+        """
+        self._store = store
+        self.window_chars = window_chars or int(os.environ.get('SPACY_WINDOW_CHARS', DEFAULT_WINDOW_CHARS))
+        self.batch_size = batch_size or int(os.environ.get('SPACY_WINDOW_BATCH_SIZE', DEFAULT_WINDOW_BATCH_SIZE))
+
+    @property
+    def store(self) -> SpacyAnnotationStore:
+        return self._store or get_annotation_store()
+
+    def docs(self, text: str, model: str = DEFAULT_MODEL, exclude: Iterable[str] = ()):
+        """
+        Yield ``(offset, doc)`` for each window of ``text``, in order.
+
+        Docs must be treated as read-only (short texts return the store's
+        shared parse) and should not be kept once processed.
+
+        Raises:
+            OSError: If the model is not installed
+        """
+        exclude = tuple(exclude)
+        nlp = self.store.get_nlp(model)
+        window_chars = min(self.window_chars, getattr(nlp, 'max_length', self.window_chars))
+        if len(text) <= window_chars:
+            yield 0, self.store.parse(text, model=model, exclude=exclude)
+            return
+
+        windows = ((text[start:end], start) for start, end in iter_text_windows(text, window_chars))
+        disable = [name for name in nlp.pipe_names if name in exclude]
+        for doc, offset in nlp.pipe(windows, as_tuples=True, batch_size=self.batch_size, disable=disable):
+            yield offset, doc
+
+    def sentences(self, text: str, model: str = DEFAULT_MODEL, exclude: Iterable[str] = ()):
+        """Yield ``(start_char, end_char, sentence span)`` over the whole text."""
+        for offset, doc in self.docs(text, model=model, exclude=exclude):
+            for sent in doc.sents:
+                yield offset + sent.start_char, offset + sent.end_char, sent
+
+
+_windowed_nlp_runner: Optional[WindowedNLPRunner] = None
+
+
+def get_windowed_nlp_runner() -> WindowedNLPRunner:
+    """Get the process-wide windowed NLP runner."""
+    global _windowed_nlp_runner
+    if _windowed_nlp_runner is None:
+        _windowed_nlp_runner = WindowedNLPRunner()
+    return _windowed_nlp_runner
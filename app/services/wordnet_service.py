@@ -3,11 +3,15 @@ WordNet service for semantic analysis and term definitions.
 Provides access to WordNet lexical database via NLTK.
 """
 
+import copy
 import nltk
 from nltk.corpus import wordnet as wn
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
+from app.services.lexical_similarity import LexicalSimilarityEngine, get_lexical_similarity_engine
+
 logger = logging.getLogger(__name__)
 
 # Ensure WordNet data is available
@@ -19,11 +23,28 @@ except LookupError:
     except Exception as e:
         logger.warning(f"Could not download WordNet data: {e}")
 
+_POS_NAMES = {
+    'n': 'noun',
+    'v': 'verb',
+    'a': 'adjective',
+    'r': 'adverb',
+    's': 'adjective satellite'
+}
+
+
 class WordNetService:
     """Service for accessing WordNet lexical database."""
     
-    def __init__(self):
+    def __init__(self, engine: Optional[LexicalSimilarityEngine] = None):
         self.available = self._check_availability()
+        self._engine = engine
+
+    @property
+    def engine(self) -> LexicalSimilarityEngine:
+        """Shared batched similarity engine (built on first use)."""
+        if self._engine is None:
+            self._engine = get_lexical_similarity_engine()
+        return self._engine
     
     def _check_availability(self) -> bool:
         """Check if WordNet is available."""
@@ -56,72 +77,20 @@ class WordNetService:
             return {"success": False, "error": "No word provided"}
         
         try:
-            # Get all synsets for the word
-            synsets = wn.synsets(word)
-            
-            if not synsets:
+            # Synset expansions are cached per word
+            results, pos_counts = _expand_word(word)
+
+            if not results:
                 return {
                     "success": True,
                     "word": word,
                     "synsets": [],
                     "message": f"No synsets found for '{word}'"
                 }
-            
-            results = []
-            pos_counts = {}
-            
-            for synset in synsets:
-                # Get basic synset information
-                synset_info = {
-                    "name": synset.name(),
-                    "pos": synset.pos(),
-                    "pos_name": self._get_pos_name(synset.pos()),
-                    "definition": synset.definition(),
-                    "examples": synset.examples(),
-                    "lemmas": [lemma.name().replace('_', ' ') for lemma in synset.lemmas()],
-                }
-                
-                # Get synonyms (other lemmas in the same synset)
-                synonyms = []
-                for lemma in synset.lemmas():
-                    lemma_name = lemma.name().replace('_', ' ')
-                    if lemma_name.lower() != word:
-                        synonyms.append(lemma_name)
-                synset_info["synonyms"] = synonyms
-                
-                # Get antonyms
-                antonyms = []
-                for lemma in synset.lemmas():
-                    for antonym in lemma.antonyms():
-                        antonyms.append(antonym.name().replace('_', ' '))
-                synset_info["antonyms"] = antonyms
-                
-                # Get hypernyms (more general terms)
-                hypernyms = []
-                for hypernym in synset.hypernyms():
-                    hypernyms.append({
-                        "name": hypernym.name(),
-                        "definition": hypernym.definition(),
-                        "lemmas": [lemma.name().replace('_', ' ') for lemma in hypernym.lemmas()]
-                    })
-                synset_info["hypernyms"] = hypernyms[:3]  # Limit to 3
-                
-                # Get hyponyms (more specific terms)  
-                hyponyms = []
-                for hyponym in synset.hyponyms():
-                    hyponyms.append({
-                        "name": hyponym.name(),
-                        "definition": hyponym.definition(),
-                        "lemmas": [lemma.name().replace('_', ' ') for lemma in hyponym.lemmas()]
-                    })
-                synset_info["hyponyms"] = hyponyms[:3]  # Limit to 3
-                
-                results.append(synset_info)
-                
-                # Count parts of speech
-                pos = synset.pos()
-                pos_counts[pos] = pos_counts.get(pos, 0) + 1
-            
+
+            results = copy.deepcopy(results)
+            pos_counts = dict(pos_counts)
+
             return {
                 "success": True,
                 "word": word,
@@ -140,14 +109,7 @@ class WordNetService:
     
     def _get_pos_name(self, pos_code: str) -> str:
         """Convert POS code to readable name."""
-        pos_names = {
-            'n': 'noun',
-            'v': 'verb', 
-            'a': 'adjective',
-            'r': 'adverb',
-            's': 'adjective satellite'
-        }
-        return pos_names.get(pos_code, pos_code)
+        return _POS_NAMES.get(pos_code, pos_code)
     
     def get_word_similarity(self, word1: str, word2: str) -> Dict[str, Any]:
         """
@@ -167,50 +129,142 @@ class WordNetService:
             }
         
         try:
-            synsets1 = wn.synsets(word1.strip().lower())
-            synsets2 = wn.synsets(word2.strip().lower())
-            
-            if not synsets1 or not synsets2:
+            engine = self.engine
+            word1_found = bool(engine.synset_ids(word1))
+            word2_found = bool(engine.synset_ids(word2))
+
+            if not word1_found or not word2_found:
                 return {
                     "success": True,
                     "similarity": 0.0,
                     "message": f"One or both words not found in WordNet"
                 }
-            
-            # Find maximum similarity between any pair of synsets
-            max_similarity = 0.0
-            best_synsets = None
-            
-            for s1 in synsets1:
-                for s2 in synsets2:
-                    try:
-                        sim = s1.path_similarity(s2)
-                        if sim and sim > max_similarity:
-                            max_similarity = sim
-                            best_synsets = (s1, s2)
-                    except:
-                        continue
-            
+
+            # Maximum path similarity over all synset pairs, computed as a batch
+            scores, best_pairs = engine.similarity_matrix([word1], [word2])
+
             result = {
                 "success": True,
                 "word1": word1,
                 "word2": word2,
-                "similarity": max_similarity,
+                "similarity": float(scores[0, 0]),
             }
-            
-            if best_synsets:
+
+            if best_pairs[0][0]:
+                synset1, synset2 = (engine.reader.synset(name) for name in best_pairs[0][0])
                 result["best_match"] = {
-                    "synset1": best_synsets[0].name(),
-                    "synset2": best_synsets[1].name(),
-                    "definition1": best_synsets[0].definition(),
-                    "definition2": best_synsets[1].definition()
+                    "synset1": synset1.name(),
+                    "synset2": synset2.name(),
+                    "definition1": synset1.definition(),
+                    "definition2": synset2.definition()
                 }
-            
+
             return result
-            
+
         except Exception as e:
             logger.error(f"Error calculating similarity for '{word1}' and '{word2}': {e}")
             return {
                 "success": False,
                 "error": f"Error calculating similarity: {str(e)}"
-            }
\ No newline at end of file
+            }
+
+    def score_terms_against_anchors(self, terms: List[str], anchors: List[str],
+                                    top_k: Optional[int] = None, min_score: float = 0.0) -> Dict[str, Any]:
+        """
+        Score a list of terms against context anchors in one batch.
+
+        Args:
+            terms: Terms to score
+            anchors: Context anchor terms
+            top_k: Keep only each term's best anchors
+            min_score: Drop anchors scoring below this
+
+        Returns:
+            Dictionary with per-term anchor similarities, best first
+        """
+        if not self.available:
+            return {
+                "success": False,
+                "error": "WordNet is not available"
+            }
+
+        terms = [t.strip() for t in terms if t and t.strip()]
+        anchors = [a.strip() for a in anchors if a and a.strip()]
+        if not terms or not anchors:
+            return {"success": False, "error": "At least one term and one anchor are required"}
+
+        try:
+            result = self.engine.score_terms(terms, anchors, top_k=top_k, min_score=min_score)
+            result.update(success=True, metric="path_similarity")
+            return result
+        except Exception as e:
+            logger.error(f"Error scoring {len(terms)} terms against {len(anchors)} anchors: {e}")
+            return {
+                "success": False,
+                "error": f"Error calculating similarity: {str(e)}"
+            }
+
+
+@lru_cache(maxsize=1024)
+def _expand_word(word: str) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Synsets of a word with synonyms, antonyms, hypernyms and hyponyms.
+
+    Cached per word; callers must copy before modifying the result.
+    """
+    results = []
+    pos_counts = {}
+
+    for synset in wn.synsets(word):
+        # Get basic synset information
+        synset_info = {
+            "name": synset.name(),
+            "pos": synset.pos(),
+            "pos_name": _POS_NAMES.get(synset.pos(), synset.pos()),
+            "definition": synset.definition(),
+            "examples": synset.examples(),
+            "lemmas": [lemma.name().replace('_', ' ') for lemma in synset.lemmas()],
+        }
+
+        # Get synonyms (other lemmas in the same synset)
+        synonyms = []
+        for lemma in synset.lemmas():
+            lemma_name = lemma.name().replace('_', ' ')
+            if lemma_name.lower() != word:
+                synonyms.append(lemma_name)
+        synset_info["synonyms"] = synonyms
+
+        # Get antonyms
+        antonyms = []
+        for lemma in synset.lemmas():
+            for antonym in lemma.antonyms():
+                antonyms.append(antonym.name().replace('_', ' '))
+        synset_info["antonyms"] = antonyms
+
+        # Get hypernyms (more general terms)
+        hypernyms = []
+        for hypernym in synset.hypernyms():
+            hypernyms.append({
+                "name": hypernym.name(),
+                "definition": hypernym.definition(),
+                "lemmas": [lemma.name().replace('_', ' ') for lemma in hypernym.lemmas()]
+            })
+        synset_info["hypernyms"] = hypernyms[:3]  # Limit to 3
+
+        # Get hyponyms (more specific terms)  
+        hyponyms = []
+        for hyponym in synset.hyponyms():
+            hyponyms.append({
+                "name": hyponym.name(),
+                "definition": hyponym.definition(),
+                "lemmas": [lemma.name().replace('_', ' ') for lemma in hyponym.lemmas()]
+            })
+        synset_info["hyponyms"] = hyponyms[:3]  # Limit to 3
+
+        results.append(synset_info)
+
+        # Count parts of speech
+        pos = synset.pos()
+        pos_counts[pos] = pos_counts.get(pos, 0) + 1
+
+    return results, pos_counts
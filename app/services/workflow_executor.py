@@ -19,6 +19,7 @@ from app.models.experiment_orchestration_run import ExperimentOrchestrationRun
 from app.orchestration.experiment_graph import get_experiment_graph
 from app.orchestration.experiment_state import ExperimentOrchestrationState, create_initial_experiment_state
 from app.services.extraction_tools import get_tool_registry
+from app.services.orchestration_progress_service import get_progress_reporter
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +70,7 @@ class WorkflowExecutor:
             run.status = 'analyzing'
             run.current_stage = 'analyzing'
             db.session.commit()
+            self._announce(run)
 
             # Build initial state
             logger.info(f"Building state for orchestration run {run_id}")
@@ -89,6 +91,7 @@ class WorkflowExecutor:
             run.strategy_approved = result.get('strategy_approved', False)
 
             db.session.commit()
+            self._announce(run)
 
             logger.info(
                 f"Recommendation phase completed for run {run_id}. "
@@ -120,6 +123,7 @@ class WorkflowExecutor:
                     logger.info(f"Experiment {run.experiment_id} marked as error")
 
                 db.session.commit()
+                self._announce(run)
 
             raise RuntimeError(f"Recommendation phase failed: {str(e)}") from e
 
@@ -166,6 +170,7 @@ class WorkflowExecutor:
             run.status = 'executing'
             run.current_stage = 'executing'
             db.session.commit()
+            self._announce(run)
 
             # Build state for processing
             logger.info(f"Building state for processing phase of run {run_id}")
@@ -198,6 +203,7 @@ class WorkflowExecutor:
                 logger.info(f"Experiment {run.experiment_id} marked as completed")
 
             db.session.commit()
+            self._announce(run)
 
             logger.info(f"Processing phase completed for run {run_id}")
 
@@ -225,9 +231,18 @@ class WorkflowExecutor:
                     logger.info(f"Experiment {run.experiment_id} marked as error")
 
                 db.session.commit()
+                self._announce(run)
 
             raise RuntimeError(f"Processing phase failed: {str(e)}") from e
 
+    @staticmethod
+    def _announce(run: ExperimentOrchestrationRun) -> None:
+        """Push a status transition to progress subscribers (SSE)."""
+        try:
+            get_progress_reporter().status_changed(run)
+        except Exception as e:
+            logger.warning(f"Failed to publish status for run {run.id}: {e}")
+
     def _build_graph_state(
         self,
         experiment_id: int,
@@ -75,11 +75,17 @@ class LLMOrchestrationClient {
     }
 
     /**
-     * Start polling for orchestration status
+     * Start listening for orchestration status
+     *
+     * Uses the server-sent event stream when the browser supports it and
+     * falls back to polling if the stream cannot be established.
      */
     startPolling() {
-        if (this.pollInterval) {
-            clearInterval(this.pollInterval);
+        this.stopPolling();
+
+        if (window.EventSource) {
+            this.openStatusStream();
+            return;
         }
 
         this.pollInterval = setInterval(() => {
@@ -90,6 +96,44 @@ class LLMOrchestrationClient {
         this.checkStatus();
     }
 
+    /**
+     * Subscribe to pushed progress events for the current run
+     */
+    openStatusStream() {
+        const source = new EventSource(`/experiments/orchestration/stream/${this.currentRunId}`);
+        let received = false;
+        this.eventSource = source;
+
+        source.onmessage = (event) => {
+            received = true;
+            const data = JSON.parse(event.data);
+
+            if (data.type === 'status') {
+                this.handleStatus(data);
+            } else if (data.type === 'operation') {
+                this.updateProgress(
+                    this.lastStage || 'executing',
+                    data.progress_percentage !== undefined ? data.progress_percentage : this.lastPercentage,
+                    this.getStageMessage(this.lastStage),
+                    data.current_operation
+                );
+            }
+        };
+
+        source.onerror = () => {
+            // EventSource reconnects on its own after a stream ends; only fall
+            // back to polling if the stream never worked
+            if (!received) {
+                source.close();
+                this.eventSource = null;
+                this.pollInterval = setInterval(() => {
+                    this.checkStatus();
+                }, this.pollIntervalMs);
+                this.checkStatus();
+            }
+        };
+    }
+
     /**
      * Stop polling
      */
@@ -98,6 +142,10 @@ class LLMOrchestrationClient {
             clearInterval(this.pollInterval);
             this.pollInterval = null;
         }
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
     }
 
     /**
@@ -112,40 +160,7 @@ class LLMOrchestrationClient {
                 throw new Error(data.error);
             }
 
-            // Update progress UI
-            this.updateProgress(
-                data.current_stage,
-                data.progress_percentage,
-                this.getStageMessage(data.current_stage),
-                data.current_operation  // Detailed operation status
-            );
-
-            // Handle different statuses
-            if (data.status === 'reviewing') {
-                this.stopPolling();
-                this.showStrategyReview(data);
-            } else if (data.status === 'completed') {
-                this.stopPolling();
-                this.showCompletionMessage(data);
-            } else if (data.status === 'failed') {
-                this.stopPolling();
-
-                // Determine error type from message
-                let errorType = 'general';
-                const errorMsg = data.error_message || '';
-
-                if (errorMsg.includes('timeout') || errorMsg.includes('exceeded timeout')) {
-                    errorType = 'timeout';
-                } else if (errorMsg.includes('429') || errorMsg.includes('rate limit')) {
-                    errorType = 'rate_limit';
-                } else if (errorMsg.includes('500') || errorMsg.includes('503') || errorMsg.includes('server error')) {
-                    errorType = 'server_error';
-                } else if (errorMsg.includes('LLM') || errorMsg.includes('failed after')) {
-                    errorType = 'llm_error';
-                }
-
-                this.showError(errorMsg, errorType);
-            }
+            this.handleStatus(data);
 
         } catch (error) {
             console.error('Error checking status:', error);
@@ -154,6 +169,49 @@ class LLMOrchestrationClient {
         }
     }
 
+    /**
+     * Apply a run status payload (from polling or the event stream)
+     */
+    handleStatus(data) {
+        this.lastStage = data.current_stage;
+        this.lastPercentage = data.progress_percentage;
+
+        // Update progress UI
+        this.updateProgress(
+            data.current_stage,
+            data.progress_percentage,
+            this.getStageMessage(data.current_stage),
+            data.current_operation  // Detailed operation status
+        );
+
+        // Handle different statuses
+        if (data.status === 'reviewing') {
+            this.stopPolling();
+            this.showStrategyReview(data);
+        } else if (data.status === 'completed') {
+            this.stopPolling();
+            this.showCompletionMessage(data);
+        } else if (data.status === 'failed') {
+            this.stopPolling();
+
+            // Determine error type from message
+            let errorType = 'general';
+            const errorMsg = data.error_message || '';
+
+            if (errorMsg.includes('timeout') || errorMsg.includes('exceeded timeout')) {
+                errorType = 'timeout';
+            } else if (errorMsg.includes('429') || errorMsg.includes('rate limit')) {
+                errorType = 'rate_limit';
+            } else if (errorMsg.includes('500') || errorMsg.includes('503') || errorMsg.includes('server error')) {
+                errorType = 'server_error';
+            } else if (errorMsg.includes('LLM') || errorMsg.includes('failed after')) {
+                errorType = 'llm_error';
+            }
+
+            this.showError(errorMsg, errorType);
+        }
+    }
+
     /**
      * Approve strategy and continue to execution
      */
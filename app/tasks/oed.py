@@ -0,0 +1,47 @@
+"""
+Celery Tasks for OED PDF Parsing
+
+Runs an OEDParseJob in a worker so large OED entry PDFs are not parsed
+inside the upload request. Page layouts are committed as they are
+extracted, so a redelivered task resumes at the next page.
+"""
+from celery_config import get_celery
+from app import db
+from app.models.oed_parse_job import OEDParseJob
+from app.services.oed_parse_job_service import get_oed_parse_job_service
+import logging
+
+logger = logging.getLogger(__name__)
+
+celery = get_celery()
+
+
+@celery.task(
+    bind=True,
+    name='app.tasks.oed.run_oed_parse_job',
+    acks_late=True,
+    reject_on_worker_lost=True
+)
+def run_oed_parse_job_task(self, job_id: str):
+    """
+    Run (or resume) an OED PDF parse job.
+
+    Args:
+        job_id: UUID of the OEDParseJob
+
+    Returns:
+        dict: Final job state (without the parsed entry)
+    """
+    logger.info(f"[Celery Task {self.request.id}] Starting OED parse job {job_id}")
+
+    job = db.session.get(OEDParseJob, job_id)
+    if not job:
+        raise ValueError(f"OED parse job {job_id} not found")
+
+    job.celery_task_id = self.request.id
+    db.session.commit()
+
+    job = get_oed_parse_job_service().run(job)
+
+    logger.info(f"[Celery Task {self.request.id}] OED parse job {job_id} finished: {job.status}")
+    return {'success': job.status == 'completed', 'job': job.to_dict(include_result=False)}
@@ -106,7 +106,14 @@ def run_orchestration_task(self, run_id: str, review_choices: bool):
         raise
 
 
-@celery.task(bind=True, name='app.tasks.orchestration.run_execution_phase')
+# acks_late + reject_on_worker_lost: if the worker dies mid-run the task is
+# redelivered, and per-tool checkpoints let the retry skip completed work
+@celery.task(
+    bind=True,
+    name='app.tasks.orchestration.run_execution_phase',
+    acks_late=True,
+    reject_on_worker_lost=True
+)
 def run_execution_phase_task(
     self,
     run_id: str,
@@ -118,7 +125,8 @@ def run_execution_phase_task(
     Execute processing phase (Stages 4-5) after user approval.
 
     This task runs in a Celery worker process after the user has reviewed
-    and approved the recommended strategy.
+    and approved the recommended strategy. Safe to redeliver: tool executions
+    already checkpointed for this run are skipped.
 
     Args:
         run_id: UUID of the orchestration run
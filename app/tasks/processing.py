@@ -0,0 +1,48 @@
+"""
+Celery Tasks for Experiment Processing Plans
+
+Each task runs one (document, stage) node of a ProcessingPlan and then
+dispatches the nodes it unblocked, so a plan fans out across workers within
+the per-stage concurrency limits.
+"""
+from flask import current_app
+from celery_config import get_celery
+from app.services.processing_plan_service import ProcessingPlanScheduler
+import logging
+
+logger = logging.getLogger(__name__)
+
+celery = get_celery()
+
+
+# acks_late + reject_on_worker_lost: a node whose worker died is redelivered
+# and rerun; nodes that already finished are ignored on redelivery
+@celery.task(
+    bind=True,
+    name='app.tasks.processing.run_processing_plan_node',
+    acks_late=True,
+    reject_on_worker_lost=True
+)
+def run_processing_plan_node_task(self, node_id: str):
+    """
+    Run one processing plan node.
+
+    Args:
+        node_id: UUID of the ProcessingPlanNode
+
+    Returns:
+        dict: Final node state
+    """
+    logger.info(f"[Celery Task {self.request.id}] Running processing plan node {node_id}")
+
+    scheduler = ProcessingPlanScheduler(
+        limits=current_app.config.get('PROCESSING_STAGE_CONCURRENCY'),
+        default_limit=current_app.config.get('PROCESSING_STAGE_CONCURRENCY_DEFAULT', 4),
+        logger=logger,
+    )
+    node = scheduler.run_node(node_id)
+    if node is None:
+        raise ValueError(f"Processing plan node {node_id} not found")
+
+    logger.info(f"[Celery Task {self.request.id}] Processing plan node {node_id}: {node.status}")
+    return {'success': node.status in ('completed', 'skipped'), 'node': node.to_dict()}
@@ -0,0 +1,52 @@
+"""
+Celery Tasks for Document Purges
+
+Runs a DocumentPurgeJob in a worker so the admin request returns at once.
+Progress is committed to the job row after every batch.
+"""
+from celery_config import get_celery
+from app import db
+from app.models.document_purge_job import DocumentPurgeJob
+from app.services.document_purge_service import DocumentPurgeEngine
+import logging
+
+logger = logging.getLogger(__name__)
+
+celery = get_celery()
+
+
+# acks_late + reject_on_worker_lost: if the worker dies mid-purge the task is
+# redelivered and the engine resumes from the job's committed cursor
+@celery.task(
+    bind=True,
+    name='app.tasks.purge.run_document_purge',
+    acks_late=True,
+    reject_on_worker_lost=True
+)
+def run_document_purge_task(self, job_id: str):
+    """
+    Run (or resume) a document purge job.
+
+    Args:
+        job_id: UUID of the DocumentPurgeJob
+
+    Returns:
+        dict: Final job state
+    """
+    logger.info(f"[Celery Task {self.request.id}] Starting document purge job {job_id}")
+
+    job = db.session.get(DocumentPurgeJob, job_id)
+    if not job:
+        raise ValueError(f"Purge job {job_id} not found")
+
+    job.celery_task_id = self.request.id
+    db.session.commit()
+
+    try:
+        job = DocumentPurgeEngine(logger=logger).run(job)
+    except Exception as e:
+        logger.error(f"[Celery Task {self.request.id}] Purge job {job_id} failed: {e}", exc_info=True)
+        raise
+
+    logger.info(f"[Celery Task {self.request.id}] Purge job {job_id} completed: {job.counts}")
+    return {'success': True, 'job': job.to_dict()}
@@ -0,0 +1,78 @@
+"""
+Per-request metrics and trace spans for the Flask app.
+
+Every request records its latency and the number/time of database statements
+it issued, labelled by URL rule (not raw path, to keep label cardinality
+bounded). When tracing is enabled the request runs in a server span whose
+context is injected into any Celery task it enqueues.
+"""
+
+import time
+
+from flask import g, request
+
+from shared_services.metrics import (
+    ActiveSpan,
+    CeleryQueueDepthCollector,
+    begin_query_stats,
+    configure_tracing,
+    end_query_stats,
+    install_sqlalchemy_metrics,
+    record_http_request,
+    register_collector,
+)
+
+SKIPPED_ENDPOINTS = {'metrics.metrics', 'static'}
+
+
+def _endpoint_label() -> str:
+    return request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+
+def _before_request():
+    if request.endpoint in SKIPPED_ENDPOINTS:
+        return
+    g._metrics_started = time.perf_counter()
+    g._metrics_queries = begin_query_stats()
+    g._metrics_span = ActiveSpan(
+        f"{request.method} {_endpoint_label()}", dict(request.headers),
+        **{'http.method': request.method, 'http.route': _endpoint_label()}
+    )
+
+
+def _after_request(response):
+    if hasattr(g, '_metrics_started'):
+        g._metrics_status = response.status_code
+    return response
+
+
+def _teardown_request(error=None):
+    started = g.pop('_metrics_started', None)
+    if started is None:
+        return
+    endpoint = _endpoint_label()
+    status = g.pop('_metrics_status', 500 if error is not None else 200)
+    record_http_request(endpoint, request.method, status, time.perf_counter() - started)
+    end_query_stats(g.pop('_metrics_queries'), 'request', endpoint)
+    span = g.pop('_metrics_span')
+    span.set_attribute('http.status_code', status)
+    span.end(error)
+
+
+def init_request_metrics(app) -> None:
+    """Instrument ``app`` unless ``METRICS_ENABLED`` is off."""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+    install_sqlalchemy_metrics()
+
+    queues = [q.strip() for q in app.config.get('METRICS_CELERY_QUEUES', 'celery').split(',') if q.strip()]
+    if queues and app.config.get('REDIS_URL'):
+        register_collector('celery_queue_depth', CeleryQueueDepthCollector(app.config['REDIS_URL'], queues))
+
+    if app.config.get('TRACING_ENABLED'):
+        configure_tracing(app.config.get('TRACING_SERVICE_NAME', 'ontextract'),
+                          exporter=app.config.get('TRACING_EXPORTER', 'console'))
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
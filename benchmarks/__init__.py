@@ -0,0 +1 @@
+"""Performance benchmarks over deterministic synthetic corpora (``python -m benchmarks``)."""
@@ -0,0 +1,131 @@
+"""
+Command line entry point.
+
+    python -m benchmarks run [--size small|medium|large] [--database URL]
+                             [--filter AREA] [--rounds N] [--compare REF]
+    python -m benchmarks compare BASELINE CURRENT [--size SIZE] [--database sqlite|postgresql]
+    python -m benchmarks list
+
+``--compare`` and ``compare`` accept a results file or a git ref; a ref
+resolves to the newest stored run of that commit at the same size and on
+the same database.
+"""
+
+import argparse
+import shutil
+import sys
+
+from benchmarks.corpus import SIZES
+from benchmarks.harness import (
+    RESULTS_DIR,
+    compare_results,
+    find_results,
+    format_comparison,
+    load_results,
+)
+
+
+def _compare(baseline_ref, current, current_path, args):
+    baseline_path = find_results(baseline_ref, current['size'], current['database'], args.output,
+                                 exclude=current_path)
+    if baseline_path is None:
+        print(f"No stored {current['database']} {current['size']} results for {baseline_ref!r}",
+              file=sys.stderr)
+        return 2
+    rows = compare_results(load_results(baseline_path), current, threshold=args.threshold)
+    print(f"\nCompared with {baseline_path}")
+    print(format_comparison(rows))
+    regressions = [row['name'] for row in rows if row['verdict'] == 'regression']
+    if regressions and args.fail_on_regression:
+        print(f"\nRegressions: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def run(args) -> int:
+    from benchmarks.environment import configure_environment, make_workdir
+
+    workdir = make_workdir()
+    database_url = configure_environment(args.database, workdir)
+    try:
+        # App modules read the environment at import time, so import after configuring it
+        from benchmarks import suites  # noqa: F401  (registers benchmarks)
+        from benchmarks.environment import benchmark_app
+        from benchmarks.harness import BenchmarkContext, registered_benchmarks, run_benchmarks, save_results
+
+        names = [name for name in registered_benchmarks() if not args.filter or args.filter in name]
+        if not names:
+            print(f"No benchmarks match {args.filter!r}", file=sys.stderr)
+            return 2
+        spec = SIZES[args.size]
+        dialect = database_url.split(':', 1)[0]
+        print(f"Running {len(names)} benchmarks at size {args.size!r} on {dialect}")
+        with benchmark_app(database_url) as (app, session):
+            context = BenchmarkContext(spec=spec, size=args.size, app=app, session=session,
+                                       workdir=workdir, database=dialect)
+            results = run_benchmarks(context, names, rounds=args.rounds, warmup=args.warmup)
+        path = save_results(results, args.size, dialect, spec, directory=args.output)
+        print(f"\nSaved {path}")
+        if args.compare:
+            return _compare(args.compare, load_results(path), path, args)
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare(args) -> int:
+    current_path = find_results(args.current, args.size, args.database, args.output)
+    if current_path is None:
+        print(f"No stored {args.database} {args.size} results for {args.current!r}", file=sys.stderr)
+        return 2
+    return _compare(args.baseline, load_results(current_path), current_path, args)
+
+
+def list_benchmarks(args) -> int:
+    from benchmarks import suites  # noqa: F401
+    from benchmarks.harness import registered_benchmarks
+
+    for name in registered_benchmarks():
+        print(name)
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=RESULTS_DIR, help='Results directory (default: .benchmarks/)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def comparison_options(command):
+        command.add_argument('--threshold', type=float, default=0.10,
+                             help='Relative median change treated as significant (default: 0.10)')
+        command.add_argument('--fail-on-regression', action='store_true',
+                             help='Exit with status 1 when any benchmark regressed')
+
+    run_parser = commands.add_parser('run', help='Run benchmarks and store the results')
+    run_parser.add_argument('--size', choices=sorted(SIZES), default='small')
+    run_parser.add_argument('--database', help='SQLAlchemy URL (default: temporary SQLite file)')
+    run_parser.add_argument('--filter', help='Only run benchmarks whose name contains this')
+    run_parser.add_argument('--rounds', type=int, default=5)
+    run_parser.add_argument('--warmup', type=int, default=1)
+    run_parser.add_argument('--compare', metavar='REF', help='Results file or git ref to compare against')
+    comparison_options(run_parser)
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser('compare', help='Compare two stored runs')
+    compare_parser.add_argument('baseline', help='Results file or git ref')
+    compare_parser.add_argument('current', help='Results file or git ref')
+    compare_parser.add_argument('--size', choices=sorted(SIZES), default='small')
+    compare_parser.add_argument('--database', default='sqlite', help='Database dialect of the runs')
+    comparison_options(compare_parser)
+    compare_parser.set_defaults(handler=compare)
+
+    list_parser = commands.add_parser('list', help='List registered benchmarks')
+    list_parser.set_defaults(handler=list_benchmarks)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
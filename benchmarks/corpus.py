@@ -0,0 +1,434 @@
+"""
+Deterministic synthetic corpora for benchmarks.
+
+Everything here is a pure function of a ``CorpusSpec`` (including its seed),
+so two runs, on any machine and any commit, benchmark identical inputs:
+
+- ``generate_corpus`` builds multi-period historical documents in which a
+  target term drifts between period-specific senses, with dated sentences,
+  definitions, named entities and causal/temporal markers for the
+  extraction tools to find
+- ``write_pdf`` writes a small text PDF (title, DOI, arXiv id, embedded
+  metadata) without any PDF-writing dependency
+- ``seed_documents`` and ``seed_provenance_graph`` load a corpus into the
+  database as an experiment with segments, and as a PROV-O graph of
+  activities, derivation chains and relationships
+"""
+
+import hashlib
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Period -> senses of the target term, so analyses see real drift
+PERIOD_SENSES = {
+    1800: ('commercial', ['factor', 'merchant', 'commission', 'estate', 'principal', 'ledger']),
+    1850: ('legal', ['attorney', 'deputy', 'proxy', 'covenant', 'mandate', 'trustee']),
+    1900: ('chemical', ['reagent', 'catalyst', 'solution', 'compound', 'reaction', 'tincture']),
+    1950: ('intelligence', ['espionage', 'operative', 'handler', 'cipher', 'bureau', 'informant']),
+    2000: ('computational', ['software', 'autonomous', 'learning', 'network', 'protocol', 'model']),
+    2020: ('artificial', ['language', 'reasoning', 'planner', 'tool', 'benchmark', 'alignment']),
+}
+
+FILLER = (
+    'the of and to in that was for on with as by this from which his their were had been it not are '
+    'an be or at have but all would there one more other its so these some into upon such only also '
+    'report society committee council government history letter account journal volume article '
+    'treatise practice principle question nature manner subject condition system method inquiry'
+).split()
+
+PEOPLE = ['John Smith', 'Mary Hale', 'Thomas Reid', 'Ada Byron', 'Charles Babbage', 'Jane Marcet',
+          'Herbert Simon', 'Alan Turing', 'Grace Hopper', 'Norbert Wiener']
+PLACES = ['London', 'Edinburgh', 'Boston', 'Paris', 'Philadelphia', 'Manchester', 'Geneva']
+ORGANIZATIONS = ['the Royal Society', 'the East India Company', 'the British Museum',
+                 'the War Office', 'Bell Laboratories', 'the Rand Corporation']
+
+SENTENCES = (
+    'In {year} {person} of {place} wrote that the {term} acted as a {sense} for {org}.',
+    'The {term} is defined as a {sense} {word} employed in matters of {word2}.',
+    '{Term} refers to a person or thing that acts as a {sense} on behalf of another.',
+    'Before {year} the {term} was rarely described as a {sense}; after {year2} it became common.',
+    'Because the {sense} failed, the {term} was dismissed, which led to a dispute with {org}.',
+    'During the {decade} the {word} of the {term} changed as a result of new {word2}.',
+    'The {term} (a {sense} of {org}) reported to {person} between {year} and {year2}.',
+    'Since {year} scholars at {org} have treated the {term} as a {sense}.',
+)
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Size and shape of a synthetic corpus."""
+
+    periods: Tuple[int, ...] = (1850, 1900, 1950, 2000)
+    documents_per_period: int = 5
+    words_per_document: int = 600
+    segments_per_document: int = 4
+    pdfs: int = 5
+    pdf_pages: int = 3
+    provenance_activities_per_document: int = 5
+    provenance_derivation_depth: int = 5
+    book_characters: int = 5_000_000  # Single book-length text for the windowed spaCy case
+    term: str = 'agent'
+    seed: int = 20261020
+
+
+SIZES = {
+    'small': CorpusSpec(),
+    'medium': CorpusSpec(
+        periods=(1800, 1850, 1900, 1950, 2000, 2020),
+        documents_per_period=20,
+        words_per_document=1500,
+        segments_per_document=8,
+        pdfs=20,
+        pdf_pages=10,
+        provenance_activities_per_document=10,
+        provenance_derivation_depth=10,
+    ),
+    'large': CorpusSpec(
+        periods=(1800, 1850, 1900, 1950, 2000, 2020),
+        documents_per_period=60,
+        words_per_document=4000,
+        segments_per_document=16,
+        pdfs=50,
+        pdf_pages=30,
+        provenance_activities_per_document=20,
+        provenance_derivation_depth=20,
+    ),
+}
+
+
+@dataclass
+class SyntheticDocument:
+    """Duck-types the Document attributes the analysis services read."""
+
+    title: str
+    content: str
+    year: int
+    period: int
+    sense: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def get_display_name(self) -> str:
+        return self.title
+
+
+def _sense(period: int) -> Tuple[str, List[str]]:
+    nearest = min(PERIOD_SENSES, key=lambda start: abs(start - period))
+    return PERIOD_SENSES[nearest]
+
+
+def _sentence(rng: random.Random, term: str, year: int, senses: List[str]) -> str:
+    year2 = year + rng.randint(1, 30)
+    return rng.choice(SENTENCES).format(
+        term=term, Term=term.capitalize(), year=year, year2=year2,
+        decade=f"{year // 10 * 10}s", sense=rng.choice(senses),
+        person=rng.choice(PEOPLE), place=rng.choice(PLACES), org=rng.choice(ORGANIZATIONS),
+        word=rng.choice(FILLER[40:]), word2=rng.choice(FILLER[40:]),
+    )
+
+
+def _filler(rng: random.Random, words: int) -> str:
+    text = ' '.join(rng.choice(FILLER) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def generate_corpus(spec: CorpusSpec) -> List[SyntheticDocument]:
+    """Build ``documents_per_period`` documents for each period, deterministically."""
+    rng = random.Random(spec.seed)
+    documents = []
+    for period in spec.periods:
+        sense_name, senses = _sense(period)
+        for index in range(spec.documents_per_period):
+            year = period + rng.randint(0, 2)
+            paragraphs, words = [f"Published in {year}."], 3
+            while words < spec.words_per_document:
+                sentences = [_sentence(rng, spec.term, year, senses) for _ in range(rng.randint(2, 4))]
+                sentences.append(_filler(rng, rng.randint(12, 30)))
+                paragraph = ' '.join(sentences)
+                paragraphs.append(paragraph)
+                words += len(paragraph.split())
+            documents.append(SyntheticDocument(
+                title=f"On the {spec.term} as {sense_name} ({year}) #{index + 1}",
+                content='\n\n'.join(paragraphs),
+                year=year,
+                period=period,
+                sense=sense_name,
+                metadata={'year': year, 'period': period},
+            ))
+    return documents
+
+
+def generate_book(spec: CorpusSpec) -> str:
+    """A single book of about ``book_characters`` characters, in chapters."""
+    rng = random.Random(spec.seed + 1)
+    sense_name, senses = _sense(spec.periods[0])
+    year = spec.periods[0]
+    chapters, length = [], 0
+    while length < spec.book_characters:
+        paragraphs = [f"Chapter {len(chapters) + 1}. The {spec.term} as {sense_name}."]
+        for _ in range(rng.randint(20, 40)):
+            sentences = [_sentence(rng, spec.term, year, senses) for _ in range(rng.randint(2, 5))]
+            sentences.append(_filler(rng, rng.randint(12, 30)))
+            paragraphs.append(' '.join(sentences))
+        chapter = '\n\n'.join(paragraphs)
+        chapters.append(chapter)
+        length += len(chapter) + 2
+    return '\n\n'.join(chapters)[:spec.book_characters]
+
+
+def segment_text(text: str, segments: int) -> List[str]:
+    """Split text on paragraph boundaries into at most ``segments`` pieces."""
+    paragraphs = [p for p in text.split('\n\n') if p.strip()]
+    size = max(1, -(-len(paragraphs) // max(1, segments)))
+    return ['\n\n'.join(paragraphs[i:i + size]) for i in range(0, len(paragraphs), size)]
+
+
+# --- PDFs -------------------------------------------------------------------
+
+def _pdf_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _wrap(text: str, width: int = 90) -> List[str]:
+    lines, current = [], ''
+    for word in text.split():
+        if current and len(current) + len(word) + 1 > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}".strip()
+    if current:
+        lines.append(current)
+    return lines
+
+
+def write_pdf(path: str, document: SyntheticDocument, pages: int, doi: Optional[str] = None,
+              arxiv_id: Optional[str] = None) -> str:
+    """
+    Write ``document`` as a plain-text PDF of ``pages`` pages.
+
+    The first page carries the title, authors, DOI and arXiv id like a
+    paper's front matter; the Info dictionary carries Title and Author.
+    """
+    lines_per_page = 48
+    body = _wrap(document.content.replace('\n\n', ' '))
+    front = [document.title, 'Mary Hale and Thomas Reid']
+    if doi:
+        front.append(f"doi:{doi}")
+    if arxiv_id:
+        front.append(f"arXiv:{arxiv_id}")
+    front.extend(['', 'Abstract'])
+    lines = front + body
+    while len(lines) < pages * lines_per_page:
+        lines.extend(body)
+
+    objects: List[bytes] = []
+    page_ids = []
+    font_id, pages_id = 3, 2
+    objects.append(b'<< /Type /Catalog /Pages 2 0 R >>')
+    objects.append(b'')  # Pages, filled in once page ids are known
+    objects.append(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    for page in range(pages):
+        page_lines = lines[page * lines_per_page:(page + 1) * lines_per_page]
+        size = 16 if page == 0 else 10
+        stream = [f"BT /F1 {size} Tf 14 TL 50 780 Td".encode()]
+        for i, line in enumerate(page_lines):
+            if page == 0 and i == 1:
+                stream.append(b'/F1 10 Tf')
+            stream.append(f"({_pdf_escape(line)}) Tj T*".encode('latin-1', 'replace'))
+        stream.append(b'ET')
+        content = b'\n'.join(stream)
+        objects.append(b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream')
+        content_id = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        )
+        page_ids.append(len(objects))
+    kids = ' '.join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+    objects.append(
+        f"<< /Title ({_pdf_escape(document.title)}) /Author (Mary Hale) /Producer (ontextract-benchmarks) >>".encode()
+    )
+    info_id = len(objects)
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body_bytes in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n' % number + body_bytes + b'\nendobj\n'
+    xref = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        output += b'%010d 00000 n \n' % offset
+    output += (
+        b'trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+        % (len(objects) + 1, info_id, xref)
+    )
+    with open(path, 'wb') as handle:
+        handle.write(bytes(output))
+    return path
+
+
+def write_pdfs(directory: str, spec: CorpusSpec, corpus: Sequence[SyntheticDocument]) -> List[str]:
+    paths = []
+    for index in range(spec.pdfs):
+        document = corpus[index % len(corpus)]
+        digest = hashlib.sha256(f"{spec.seed}:{index}".encode()).hexdigest()
+        paths.append(write_pdf(
+            f"{directory}/paper-{index:04d}.pdf", document, spec.pdf_pages,
+            doi=f"10.{5000 + index % 4000}/bench.{digest[:8]}",
+            arxiv_id=f"{2000 + index % 900:04d}.{int(digest[8:13], 16) % 100000:05d}",
+        ))
+    return paths
+
+
+# --- Database seeding ---------------------------------------------------------
+
+def seed_documents(session, spec: CorpusSpec, corpus: Sequence[SyntheticDocument], user_id: int):
+    """
+    Load a corpus as one experiment with associated documents and segments.
+
+    Returns:
+        (experiment, [(ExperimentDocument, ExperimentDocumentProcessing, DocumentProcessingIndex)])
+    """
+    from app.models import Document, Experiment, ExperimentDocument
+    from app.models.experiment_processing import (
+        DocumentProcessingIndex,
+        ExperimentDocumentProcessing,
+        ProcessingArtifact,
+    )
+
+    experiment = Experiment(
+        name=f"Benchmark corpus {spec.seed}",
+        experiment_type='temporal_evolution',
+        user_id=user_id,
+        status='draft',
+    )
+    session.add(experiment)
+    session.flush()
+
+    work = []
+    for document_spec in corpus:
+        document = Document(
+            title=document_spec.title,
+            content=document_spec.content,
+            document_type='document',
+            content_type='text',
+            status='completed',
+            user_id=user_id,
+            word_count=len(document_spec.content.split()),
+            publication_date=datetime(document_spec.year, 1, 1).date(),
+            source_metadata=dict(document_spec.metadata),
+        )
+        session.add(document)
+        session.flush()
+        association = ExperimentDocument(experiment_id=experiment.id, document_id=document.id)
+        session.add(association)
+        session.flush()
+        operation = ExperimentDocumentProcessing(
+            experiment_document_id=association.id,
+            processing_type='embeddings',
+            processing_method='local',
+            status='pending',
+        )
+        session.add(operation)
+        session.flush()
+        index_entry = DocumentProcessingIndex(
+            document_id=document.id,
+            experiment_id=experiment.id,
+            processing_id=operation.id,
+            processing_type='embeddings',
+            processing_method='local',
+            status='pending',
+        )
+        session.add(index_entry)
+        for position, text in enumerate(segment_text(document_spec.content, spec.segments_per_document)):
+            segment = ProcessingArtifact(
+                processing_id=operation.id,
+                document_id=document.id,
+                artifact_type='text_segment',
+                artifact_index=position,
+            )
+            segment.set_content({'text': text})
+            session.add(segment)
+        work.append((association, operation, index_entry))
+    session.flush()
+    return experiment, work
+
+
+def seed_provenance_graph(session, spec: CorpusSpec, experiment_id: int, document_ids: Sequence[int]):
+    """
+    Load a PROV-O graph: per document, an upload activity and entity followed
+    by ``provenance_activities_per_document`` processing activities whose
+    entities form derivation chains ``provenance_derivation_depth`` deep.
+
+    Returns:
+        The entity id at the end of the longest derivation chain
+    """
+    from app.models.prov_o_models import ProvActivity, ProvAgent, ProvEntity, ProvRelationship
+
+    rng = random.Random(spec.seed)
+
+    def next_uuid():
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    agent = ProvAgent(agent_id=next_uuid(), agent_type='SoftwareAgent', foaf_name='benchmark-agent')
+    session.add(agent)
+    clock = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    deepest, deepest_length = None, 0
+    activity_types = ['text_extraction', 'document_segmentation', 'embedding_generation',
+                      'entity_extraction', 'temporal_extraction', 'definition_extraction']
+
+    for document_id in document_ids:
+        parent = None
+        chain_length = 0
+        for step in range(spec.provenance_activities_per_document + 1):
+            clock += timedelta(seconds=rng.randint(1, 90))
+            activity = ProvActivity(
+                activity_id=next_uuid(),
+                activity_type='document_upload' if step == 0 else rng.choice(activity_types),
+                startedattime=clock,
+                endedattime=clock + timedelta(seconds=5),
+                wasassociatedwith=agent.agent_id,
+                # Ids as strings: SQLite compares JSON ints and ``astext`` strings by type
+                activity_parameters={'experiment_id': str(experiment_id), 'document_id': str(document_id)},
+                activity_status='completed',
+                activity_metadata={},
+            )
+            # Restart the derivation chain every ``depth`` steps
+            if chain_length >= spec.provenance_derivation_depth:
+                parent, chain_length = None, 0
+            entity = ProvEntity(
+                entity_id=next_uuid(),
+                entity_type='document' if step == 0 else 'processing_result',
+                generatedattime=clock + timedelta(seconds=5),
+                wasgeneratedby=activity.activity_id,
+                wasattributedto=agent.agent_id,
+                wasderivedfrom=parent.entity_id if parent else None,
+                entity_value={'document_id': document_id, 'step': step},
+                entity_metadata={},
+            )
+            session.add(activity)
+            session.add(entity)
+            session.add(ProvRelationship(
+                relationship_id=next_uuid(),
+                relationship_type='wasGeneratedBy',
+                subject_type='entity', subject_id=entity.entity_id,
+                object_type='activity', object_id=activity.activity_id,
+            ))
+            if parent is not None:
+                session.add(ProvRelationship(
+                    relationship_id=next_uuid(),
+                    relationship_type='wasDerivedFrom',
+                    subject_type='entity', subject_id=entity.entity_id,
+                    object_type='entity', object_id=parent.entity_id,
+                ))
+            parent = entity
+            chain_length += 1
+            if chain_length > deepest_length:
+                deepest, deepest_length = entity.entity_id, chain_length
+        session.flush()
+    return deepest
@@ -0,0 +1,137 @@
+"""
+Isolated, offline application environment for benchmarks.
+
+``configure_environment`` must run before anything under ``app`` is imported:
+it points the testing config at the benchmark database, puts the LLM
+gateway in replay mode against an empty fixture directory (so an
+unexpected LLM call fails instead of reaching a provider), drops provider
+keys and disables the on-disk spaCy annotation cache so repeated rounds
+measure parsing rather than disk reads.
+
+Embeddings come from ``StubEmbeddingService``: deterministic vectors with
+the shape and metadata of the real service, so the pipeline code around
+the model is what gets timed.
+"""
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+STUB_DIMENSIONS = 384
+PROVIDER_KEYS = ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'GOOGLE_API_KEY', 'GEMINI_API_KEY')
+
+
+def configure_environment(database_url: Optional[str], workdir: str) -> str:
+    """
+    Set process environment for an offline run and return the database URL.
+
+    Without ``database_url`` a fresh SQLite file under ``workdir`` is used.
+    """
+    if not database_url:
+        database_url = f"sqlite:///{os.path.join(workdir, 'benchmark.db')}"
+    os.environ['FLASK_ENV'] = 'testing'
+    os.environ['TESTING'] = 'True'
+    os.environ['TEST_DATABASE_URL'] = database_url
+    os.environ['LLM_CACHE_MODE'] = 'replay'
+    os.environ['LLM_CACHE_DIR'] = os.path.join(workdir, 'llm_cache')
+    os.environ['SPACY_ANNOTATION_CACHE_DIR'] = ''
+    os.environ['EMBEDDING_MEMO_PATH'] = ''
+    for key in PROVIDER_KEYS:
+        os.environ.pop(key, None)
+    return database_url
+
+
+def _register_sqlite_types():
+    """Render the PostgreSQL-only column types as JSON (or TEXT) on SQLite."""
+    from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+    from sqlalchemy.ext.compiler import compiles
+
+    @compiles(JSONB, 'sqlite')
+    def _jsonb(element, compiler, **kw):
+        return 'JSON'
+
+    @compiles(ARRAY, 'sqlite')
+    def _array(element, compiler, **kw):
+        return 'JSON'
+
+    @compiles(TSVECTOR, 'sqlite')
+    def _tsvector(element, compiler, **kw):
+        return 'TEXT'
+
+
+class StubEmbeddingService:
+    """Stand-in for ``ExperimentEmbeddingService`` with hash-seeded vectors."""
+
+    def __init__(self, dimensions: int = STUB_DIMENSIONS):
+        self.dimensions = dimensions
+
+    def is_method_available(self, method: str) -> bool:
+        return method in ('local', 'period_aware', 'openai')
+
+    def get_available_methods(self) -> List[str]:
+        return ['local', 'period_aware', 'openai']
+
+    def _vector(self, text: str) -> List[float]:
+        import numpy as np
+
+        seed = int.from_bytes(hashlib.sha256(text.encode('utf-8')).digest()[:8], 'little')
+        vector = np.random.default_rng(seed).standard_normal(self.dimensions)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def generate_embeddings(self, text: str, method: str = 'local', year: int = None) -> Dict[str, Any]:
+        result = {
+            'vector': self._vector(text),
+            'model': f'benchmark-stub-{self.dimensions}',
+            'dimensions': self.dimensions,
+            'tokens_used': len(text.split()),
+        }
+        if method == 'period_aware':
+            result.update(period_category='benchmark', document_year=year, selection_reason='stub',
+                          selection_confidence=1.0, fallback_used=False)
+        return result
+
+    def generate_embeddings_batch(self, texts: List[str], method: str = 'local',
+                                  year: int = None) -> List[Dict[str, Any]]:
+        return [self.generate_embeddings(text, method, year) for text in texts]
+
+
+@contextmanager
+def benchmark_app(database_url: str):
+    """
+    Yield ``(app, session)`` with the schema created and every write inside
+    one outer transaction that is rolled back afterwards, as in the tests.
+    """
+    from sqlalchemy.orm import scoped_session, sessionmaker
+
+    from app import create_app, db
+
+    if database_url.startswith('sqlite'):
+        _register_sqlite_types()
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        session = scoped_session(sessionmaker(bind=connection))
+        original_session = db.session
+        db.session = session
+        stub = mock.patch(
+            'app.services.experiment_embedding_service.ExperimentEmbeddingService', StubEmbeddingService
+        )
+        stub.start()
+        try:
+            yield app, session
+        finally:
+            stub.stop()
+            db.session = original_session
+            session.remove()
+            transaction.rollback()
+            connection.close()
+
+
+def make_workdir() -> str:
+    return tempfile.mkdtemp(prefix='ontextract-bench-')
@@ -0,0 +1,211 @@
+"""
+Timing, result storage and comparison for the benchmark suite.
+
+Benchmarks register with ``@benchmark(name)``. The decorated function
+receives a ``BenchmarkContext`` and does its (untimed) setup, then returns
+a ``Measurement`` describing what to time. ``run_benchmarks`` times each
+one for a number of rounds and ``save_results`` writes one JSON file per
+run, filed by database and size and named by timestamp and git commit, so
+``compare_results`` can diff any two commits on the same inputs.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.benchmarks')
+RESULTS_FORMAT_VERSION = 1
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark whose requirements (model, database) are missing."""
+
+
+@dataclass
+class Measurement:
+    """
+    What a benchmark times.
+
+    ``run`` is called once per round; when ``setup`` is given it is called
+    (untimed) before every round and its return value is passed to ``run``.
+    ``extra`` is stored with the timings (e.g. items processed per round).
+    """
+
+    run: Callable[..., Any]
+    setup: Optional[Callable[[], Any]] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BenchmarkContext:
+    spec: Any
+    size: str
+    app: Any
+    session: Any
+    workdir: str
+    database: str
+    cache: Dict[str, Any] = field(default_factory=dict)  # Shared seeded fixtures
+
+
+_REGISTRY: Dict[str, Callable[[BenchmarkContext], Measurement]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark function under ``name``."""
+    def decorator(func):
+        _REGISTRY[name] = func
+        return func
+    return decorator
+
+
+def registered_benchmarks() -> Dict[str, Callable[[BenchmarkContext], Measurement]]:
+    return dict(_REGISTRY)
+
+
+def measure(measurement: Measurement, rounds: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """Time ``measurement`` and summarize per-round wall-clock seconds."""
+    timings = []
+    for iteration in range(warmup + rounds):
+        args = (measurement.setup(),) if measurement.setup else ()
+        start = time.perf_counter()
+        measurement.run(*args)
+        elapsed = time.perf_counter() - start
+        if iteration >= warmup:
+            timings.append(elapsed)
+    return {
+        'status': 'ok',
+        'rounds': len(timings),
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+        'stddev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'max': max(timings),
+        'extra': measurement.extra,
+    }
+
+
+def run_benchmarks(context: BenchmarkContext, names: List[str], rounds: int = 5, warmup: int = 1,
+                   log: Callable[[str], None] = print) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name in names:
+        try:
+            measurement = _REGISTRY[name](context)
+            results[name] = measure(measurement, rounds=rounds, warmup=warmup)
+            log(f"{name:45s} median {results[name]['median'] * 1000:10.2f} ms  "
+                f"(min {results[name]['min'] * 1000:.2f} ms, {results[name]['rounds']} rounds)")
+        except BenchmarkSkipped as exc:
+            results[name] = {'status': 'skipped', 'reason': str(exc)}
+            log(f"{name:45s} skipped: {exc}")
+    return results
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ['git', *args], cwd=os.path.dirname(RESULTS_DIR), stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_info() -> Dict[str, Any]:
+    return {
+        'commit': _git('rev-parse', 'HEAD'),
+        'branch': _git('rev-parse', '--abbrev-ref', 'HEAD'),
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def save_results(results: Dict[str, Dict[str, Any]], size: str, database: str, spec: Any,
+                 directory: str = RESULTS_DIR) -> str:
+    """Write a run to ``<directory>/<database>/<size>/<timestamp>-<commit>.json`` and return the path."""
+    info = environment_info()
+    created = datetime.now(timezone.utc)
+    payload = {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'created_at': created.isoformat(),
+        'size': size,
+        'database': database,
+        'spec': spec.__dict__ if hasattr(spec, '__dict__') else spec,
+        'environment': info,
+        'benchmarks': results,
+    }
+    folder = os.path.join(directory, database, size)
+    os.makedirs(folder, exist_ok=True)
+    commit = (info['commit'] or 'nocommit')[:12] + ('-dirty' if info['dirty'] else '')
+    path = os.path.join(folder, f"{created.strftime('%Y%m%dT%H%M%S')}-{commit}.json")
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(payload, handle, indent=2, default=str)
+    return path
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def find_results(ref: str, size: str, database: str, directory: str = RESULTS_DIR,
+                 exclude: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve ``ref`` to a results file: a path, or the newest run of ``size``
+    on ``database`` whose commit starts with ``ref`` (a git ref is resolved
+    to its commit). ``exclude`` skips a file, e.g. the run just saved.
+    """
+    if os.path.isfile(ref):
+        return ref
+    commit = _git('rev-parse', '--verify', '--quiet', f"{ref}^{{commit}}") or ref
+    folder = os.path.join(directory, database, size)
+    if not os.path.isdir(folder):
+        return None
+    matches = sorted(
+        name for name in os.listdir(folder)
+        if name.endswith('.json') and name.split('-', 1)[1].startswith(commit[:12])
+        and os.path.join(folder, name) != exclude
+    )
+    return os.path.join(folder, matches[-1]) if matches else None
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10,
+                    statistic: str = 'median') -> List[Dict[str, Any]]:
+    """
+    Compare two runs benchmark by benchmark.
+
+    A benchmark regressed when ``current / baseline - 1`` exceeds ``threshold``
+    on ``statistic`` and improved when it is below ``-threshold``.
+    """
+    rows = []
+    names = sorted(set(baseline['benchmarks']) | set(current['benchmarks']))
+    for name in names:
+        before = baseline['benchmarks'].get(name, {})
+        after = current['benchmarks'].get(name, {})
+        row = {'name': name, 'baseline': before.get(statistic), 'current': after.get(statistic)}
+        if before.get('status') != 'ok' or after.get('status') != 'ok':
+            row.update(change=None, verdict='missing')
+        else:
+            change = after[statistic] / before[statistic] - 1 if before[statistic] else 0.0
+            verdict = 'regression' if change > threshold else 'improvement' if change < -threshold else 'unchanged'
+            row.update(change=change, verdict=verdict)
+        rows.append(row)
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'benchmark':45s} {'baseline ms':>12s} {'current ms':>12s} {'change':>9s}  verdict"]
+    for row in rows:
+        baseline = f"{row['baseline'] * 1000:.2f}" if row['baseline'] is not None else '-'
+        current = f"{row['current'] * 1000:.2f}" if row['current'] is not None else '-'
+        change = f"{row['change'] * 100:+.1f}%" if row['change'] is not None else '-'
+        lines.append(f"{row['name']:45s} {baseline:>12s} {current:>12s} {change:>9s}  {row['verdict']}")
+    return '\n'.join(lines)
@@ -0,0 +1,242 @@
+"""
+Benchmarks for the hot paths of document processing and analysis.
+
+Each benchmark seeds what it needs (once per run, shared via
+``context.cache``) and returns the ``Measurement`` to time. Names are
+``<area>.<operation>`` so ``--filter`` can select an area.
+"""
+
+import os
+import time
+
+from benchmarks.corpus import generate_book, generate_corpus, seed_documents, seed_provenance_graph, write_pdfs
+from benchmarks.harness import BenchmarkContext, BenchmarkSkipped, Measurement, benchmark
+
+
+def _corpus(context: BenchmarkContext):
+    if 'corpus' not in context.cache:
+        context.cache['corpus'] = generate_corpus(context.spec)
+    return context.cache['corpus']
+
+
+def _user(context: BenchmarkContext):
+    if 'user' not in context.cache:
+        from app.models.user import User
+
+        user = User(username='benchmark', email='benchmark@example.com', password='benchmark',
+                    is_active=True, account_status='active')
+        context.session.add(user)
+        context.session.flush()
+        context.cache['user'] = user
+    return context.cache['user']
+
+
+def _seeded_experiment(context: BenchmarkContext):
+    if 'experiment' not in context.cache:
+        context.cache['experiment'] = seed_documents(
+            context.session, context.spec, _corpus(context), _user(context).id
+        )
+    return context.cache['experiment']
+
+
+def _text_sample(context: BenchmarkContext) -> str:
+    # One document per period keeps the spaCy cases proportional to corpus shape
+    corpus = _corpus(context)
+    step = context.spec.documents_per_period
+    return '\n\n'.join(document.content for document in corpus[::step])
+
+
+@benchmark('pipeline.embeddings')
+def pipeline_embeddings(context: BenchmarkContext) -> Measurement:
+    from app.models.experiment_processing import ProcessingArtifact
+    from app.services.pipeline.embeddings import PipelineEmbeddingMixin
+
+    _, work = _seeded_experiment(context)
+    pipeline = PipelineEmbeddingMixin()
+    operation_ids = [operation.id for _, operation, _ in work]
+
+    def setup():
+        ProcessingArtifact.query.filter(
+            ProcessingArtifact.processing_id.in_(operation_ids),
+            ProcessingArtifact.artifact_type == 'embedding_vector',
+        ).delete(synchronize_session=False)
+        context.session.flush()
+
+    def run(_):
+        for association, operation, index_entry in work:
+            pipeline._process_embeddings(operation, index_entry, association, 'local')
+        context.session.flush()
+
+    return Measurement(run=run, setup=setup, extra={'documents': len(work)})
+
+
+@benchmark('temporal.extract_temporal_data')
+def temporal_extract(context: BenchmarkContext) -> Measurement:
+    from shared_services.temporal import TemporalAnalysisService
+
+    corpus = _corpus(context)
+    service = TemporalAnalysisService()
+    periods = list(context.spec.periods)
+    return Measurement(
+        run=lambda: service.extract_temporal_data(corpus, context.spec.term, periods),
+        extra={'documents': len(corpus), 'periods': len(periods)},
+    )
+
+
+@benchmark('temporal.analyze_semantic_drift')
+def temporal_drift(context: BenchmarkContext) -> Measurement:
+    from shared_services.temporal import TemporalAnalysisService
+
+    corpus = _corpus(context)
+    service = TemporalAnalysisService()
+    periods = list(context.spec.periods)
+    return Measurement(
+        run=lambda: service.analyze_semantic_drift(corpus, context.spec.term, periods),
+        extra={'documents': len(corpus), 'periods': len(periods)},
+    )
+
+
+@benchmark('terms.extract_from_content')
+def term_extraction(context: BenchmarkContext) -> Measurement:
+    from app.services.enhanced_document_processor import EnhancedDocumentProcessor
+
+    corpus = _corpus(context)
+    processor = EnhancedDocumentProcessor()
+
+    def run():
+        for document in corpus:
+            processor._extract_terms_from_content(document.content)
+
+    return Measurement(run=run, extra={'documents': len(corpus)})
+
+
+def _spacy_benchmark(context: BenchmarkContext, tool: str) -> Measurement:
+    from app.services import spacy_annotation_store
+    from app.services.processing_tools import DocumentProcessor
+
+    store = spacy_annotation_store.get_annotation_store()
+    try:
+        store.get_nlp()
+    except OSError as exc:
+        raise BenchmarkSkipped(f"spaCy model unavailable ({exc.__class__.__name__})")
+
+    processor = DocumentProcessor()
+    text = _text_sample(context)
+    method = getattr(processor, tool)
+
+    def run(_):
+        result = method(text)
+        if result.status != 'success':
+            raise RuntimeError(f"{tool} failed: {result.metadata}")
+
+    # Clear parsed docs so every round pays for parsing, as a cold request would
+    return Measurement(run=run, setup=store.invalidate, extra={'characters': len(text)})
+
+
+@benchmark('spacy.extract_entities')
+def spacy_entities(context: BenchmarkContext) -> Measurement:
+    return _spacy_benchmark(context, 'extract_entities_spacy')
+
+
+@benchmark('spacy.extract_definitions')
+def spacy_definitions(context: BenchmarkContext) -> Measurement:
+    return _spacy_benchmark(context, 'extract_definitions')
+
+
+@benchmark('spacy.extract_temporal')
+def spacy_temporal(context: BenchmarkContext) -> Measurement:
+    return _spacy_benchmark(context, 'extract_temporal')
+
+
+@benchmark('spacy.extract_causal')
+def spacy_causal(context: BenchmarkContext) -> Measurement:
+    return _spacy_benchmark(context, 'extract_causal')
+
+
+@benchmark('spacy.windowed_book')
+def spacy_windowed_book(context: BenchmarkContext) -> Measurement:
+    import resource
+    import sys
+
+    from app.services import spacy_annotation_store
+    from app.services.processing_tools import DocumentProcessor
+
+    store = spacy_annotation_store.get_annotation_store()
+    try:
+        store.get_nlp()
+    except OSError as exc:
+        raise BenchmarkSkipped(f"spaCy model unavailable ({exc.__class__.__name__})")
+
+    processor = DocumentProcessor()
+    text = generate_book(context.spec)
+    extra = {'characters': len(text)}
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    rss_unit = 1 if sys.platform == 'darwin' else 1024
+
+    def run():
+        start = time.perf_counter()
+        result = processor.extract_entities_spacy(text)
+        if result.status != 'success':
+            raise RuntimeError(f"extract_entities_spacy failed: {result.metadata}")
+        extra['entities'] = len(result.data)
+        extra['chars_per_second'] = round(len(text) / (time.perf_counter() - start))
+        # Process-wide peak, so it also covers earlier benchmarks in the same run
+        extra['peak_rss_mb'] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * rss_unit / 2 ** 20, 1)
+
+    return Measurement(run=run, extra=extra)
+
+
+@benchmark('pdf.analyze')
+def pdf_analyze(context: BenchmarkContext) -> Measurement:
+    from app.utils.pdf_analyzer import PDFAnalyzer
+
+    directory = os.path.join(context.workdir, 'pdfs')
+    os.makedirs(directory, exist_ok=True)
+    paths = write_pdfs(directory, context.spec, _corpus(context))
+    analyzer = PDFAnalyzer()
+
+    def run():
+        for path in paths:
+            analyzer.analyze(path)
+
+    return Measurement(run=run, extra={'pdfs': len(paths), 'pages': context.spec.pdf_pages})
+
+
+def _provenance(context: BenchmarkContext):
+    if 'provenance' not in context.cache:
+        experiment, work = _seeded_experiment(context)
+        deepest = seed_provenance_graph(
+            context.session, context.spec, experiment.id,
+            [association.document_id for association, _, _ in work],
+        )
+        context.cache['provenance'] = (experiment.id, deepest)
+    return context.cache['provenance']
+
+
+@benchmark('provenance.timeline')
+def provenance_timeline(context: BenchmarkContext) -> Measurement:
+    from app.services.provenance_service import ProvenanceService
+
+    experiment_id, _ = _provenance(context)
+    return Measurement(
+        run=lambda: ProvenanceService.get_timeline(experiment_id=experiment_id, include_invalidated=True),
+    )
+
+
+@benchmark('provenance.graph')
+def provenance_graph(context: BenchmarkContext) -> Measurement:
+    from app.services.provenance_service import ProvenanceService
+
+    experiment_id, _ = _provenance(context)
+    return Measurement(run=lambda: ProvenanceService.get_graph_data(experiment_id=experiment_id))
+
+
+@benchmark('provenance.lineage')
+def provenance_lineage(context: BenchmarkContext) -> Measurement:
+    from app.services.provenance_service import ProvenanceService
+
+    _, deepest = _provenance(context)
+    return Measurement(
+        run=lambda: ProvenanceService.get_entity_lineage(deepest),
+        extra={'depth': context.spec.provenance_derivation_depth},
+    )
@@ -49,7 +49,7 @@ def get_celery():
             app.import_name,
             broker=redis_url,
             backend=redis_url,
-            include=['app.tasks.orchestration']
+            include=['app.tasks.orchestration', 'app.tasks.purge', 'app.tasks.processing', 'app.tasks.oed']
         )
 
         # Configure Celery
@@ -76,6 +76,10 @@ def get_celery():
                     return self.run(*args, **kwargs)
 
         celery.Task = ContextTask
+
+        # Task timing, per-task DB statements, trace context from the publisher
+        from shared_services.metrics import install_celery_metrics
+        install_celery_metrics()
         _celery_instance = celery
 
         logger.info("Celery configured successfully")
@@ -0,0 +1,47 @@
+"""Add orchestration tool checkpoints table
+
+Revision ID: 20261018_tool_checkpoints
+Revises: 20251207_cleaned
+Create Date: 2026-10-18
+
+Records each (document, tool) execution of an orchestration run under an
+idempotency key so retried or resumed runs skip completed work instead of
+re-executing the whole strategy.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261018_tool_checkpoints'
+down_revision = '20251207_cleaned'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('orchestration_tool_checkpoints',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('run_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('tool_name', sa.String(length=100), nullable=False),
+        sa.Column('idempotency_key', sa.String(length=64), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),  # running, completed, failed
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['experiment_orchestration_runs.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('run_id', 'idempotency_key', name='uq_orchestration_checkpoint_key')
+    )
+    op.create_index('ix_orchestration_tool_checkpoints_run_id', 'orchestration_tool_checkpoints', ['run_id'])
+    op.create_index('ix_orchestration_tool_checkpoints_document_id', 'orchestration_tool_checkpoints', ['document_id'])
+
+
+def downgrade():
+    op.drop_index('ix_orchestration_tool_checkpoints_document_id', table_name='orchestration_tool_checkpoints')
+    op.drop_index('ix_orchestration_tool_checkpoints_run_id', table_name='orchestration_tool_checkpoints')
+    op.drop_table('orchestration_tool_checkpoints')
@@ -0,0 +1,50 @@
+"""Add document purge jobs table
+
+Revision ID: 20261019_purge_jobs
+Revises: 20261018_tool_checkpoints
+Create Date: 2026-10-19
+
+Tracks the chunked background purge of all documents: the current step,
+keyset cursor, per-step counts and file paths still to unlink, so large
+purges run outside the request and resume after interruption.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261019_purge_jobs'
+down_revision = '20261018_tool_checkpoints'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('document_purge_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('requested_by', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),  # pending, running, completed, failed
+        sa.Column('step', sa.String(length=100), nullable=True),
+        sa.Column('step_index', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('cursor', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('counts', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='{}'),
+        sa.Column('pending_files', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='[]'),
+        sa.Column('files_deleted', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('files_failed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('batch_size', sa.Integer(), nullable=False, server_default='1000'),
+        sa.Column('total_documents', sa.Integer(), nullable=True),
+        sa.Column('celery_task_id', sa.String(length=255), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['requested_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_document_purge_jobs_status', 'document_purge_jobs', ['status'])
+
+
+def downgrade():
+    op.drop_index('ix_document_purge_jobs_status', table_name='document_purge_jobs')
+    op.drop_table('document_purge_jobs')
@@ -0,0 +1,197 @@
+"""Add trigger-maintained experiment corpus membership table
+
+Revision ID: 20261020_corpus_members
+Revises: 20261019_purge_jobs
+Create Date: 2026-10-20
+
+Materializes each experiment's corpus (documents, version family roots,
+roles and latest associated versions) in experiment_corpus_members. Triggers
+on the association tables and document version columns keep it current in
+the same transaction; existing experiments are backfilled here.
+
+The trigger DDL is inlined so this revision stays fixed when
+app.models.experiment_corpus changes.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261020_corpus_members'
+down_revision = '20261019_purge_jobs'
+branch_labels = None
+depends_on = None
+
+REFRESH_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION refresh_experiment_corpus(exp_ids integer[]) RETURNS void AS $$
+BEGIN
+    IF exp_ids IS NULL OR cardinality(exp_ids) = 0 THEN
+        RETURN;
+    END IF;
+
+    DELETE FROM experiment_corpus_members
+    WHERE experiment_id = ANY(exp_ids)
+      AND (experiment_id, document_id) NOT IN (
+          SELECT experiment_id, document_id FROM experiment_documents_v2 WHERE experiment_id = ANY(exp_ids)
+          UNION SELECT experiment_id, document_id FROM experiment_documents WHERE experiment_id = ANY(exp_ids)
+          UNION SELECT r.experiment_id, r.reference_id
+          FROM experiment_references r JOIN documents rd ON rd.id = r.reference_id
+          WHERE r.experiment_id = ANY(exp_ids) AND rd.document_type = 'reference'
+      );
+
+    INSERT INTO experiment_corpus_members
+        (experiment_id, document_id, root_document_id, role, experiment_document_id, legacy, is_latest)
+    SELECT
+        links.experiment_id,
+        links.document_id,
+        COALESCE(d.source_document_id, d.id),
+        CASE WHEN bool_or(links.reference) THEN 'reference' ELSE 'document' END,
+        max(links.experiment_document_id),
+        bool_or(links.legacy),
+        max(links.experiment_document_id) IS NOT NULL AND row_number() OVER (
+            PARTITION BY links.experiment_id, COALESCE(d.source_document_id, d.id),
+                         max(links.experiment_document_id) IS NOT NULL
+            ORDER BY COALESCE(d.version_number, 0) DESC, d.id DESC
+        ) = 1
+    FROM (
+        SELECT experiment_id, document_id, id AS experiment_document_id, false AS legacy, false AS reference
+        FROM experiment_documents_v2 WHERE experiment_id = ANY(exp_ids)
+        UNION ALL
+        SELECT experiment_id, document_id, NULL, true, false
+        FROM experiment_documents WHERE experiment_id = ANY(exp_ids)
+        UNION ALL
+        SELECT r.experiment_id, r.reference_id, NULL, false, true
+        FROM experiment_references r JOIN documents rd ON rd.id = r.reference_id
+        WHERE r.experiment_id = ANY(exp_ids) AND rd.document_type = 'reference'
+    ) AS links
+    JOIN documents d ON d.id = links.document_id
+    GROUP BY links.experiment_id, links.document_id, d.id
+    ON CONFLICT (experiment_id, document_id) DO UPDATE SET
+        root_document_id = EXCLUDED.root_document_id,
+        role = EXCLUDED.role,
+        experiment_document_id = EXCLUDED.experiment_document_id,
+        legacy = EXCLUDED.legacy,
+        is_latest = EXCLUDED.is_latest;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+LINKS_INSERTED_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION experiment_corpus_links_inserted() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_experiment_corpus(ARRAY(SELECT DISTINCT experiment_id FROM new_links));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+LINKS_DELETED_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION experiment_corpus_links_deleted() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_experiment_corpus(ARRAY(SELECT DISTINCT experiment_id FROM old_links));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+LINK_UPDATED_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION experiment_corpus_link_updated() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_experiment_corpus(ARRAY[OLD.experiment_id, NEW.experiment_id]);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+DOCUMENT_CHANGED_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION experiment_corpus_document_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM refresh_experiment_corpus(ARRAY(
+        SELECT experiment_id FROM experiment_corpus_members
+        WHERE document_id = NEW.id OR root_document_id IN (OLD.id, OLD.source_document_id, NEW.source_document_id)
+        UNION
+        SELECT experiment_id FROM experiment_references WHERE reference_id = NEW.id
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# (table, key column) of each association table feeding the corpus
+LINK_TABLES = (
+    ('experiment_documents_v2', 'document_id'),
+    ('experiment_documents', 'document_id'),
+    ('experiment_references', 'reference_id'),
+)
+
+
+def _trigger_statements():
+    statements = [REFRESH_FUNCTION_SQL, LINKS_INSERTED_FUNCTION_SQL, LINKS_DELETED_FUNCTION_SQL, LINK_UPDATED_FUNCTION_SQL, DOCUMENT_CHANGED_FUNCTION_SQL]
+    for table, key in LINK_TABLES:
+        statements += [
+            f"CREATE OR REPLACE TRIGGER {table}_corpus_insert AFTER INSERT ON {table} "
+            f"REFERENCING NEW TABLE AS new_links FOR EACH STATEMENT "
+            f"EXECUTE FUNCTION experiment_corpus_links_inserted()",
+            f"CREATE OR REPLACE TRIGGER {table}_corpus_delete AFTER DELETE ON {table} "
+            f"REFERENCING OLD TABLE AS old_links FOR EACH STATEMENT "
+            f"EXECUTE FUNCTION experiment_corpus_links_deleted()",
+            f"CREATE OR REPLACE TRIGGER {table}_corpus_update AFTER UPDATE OF experiment_id, {key} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION experiment_corpus_link_updated()",
+        ]
+    statements.append(
+        "CREATE OR REPLACE TRIGGER documents_corpus_update "
+        "AFTER UPDATE OF source_document_id, version_number, document_type ON documents FOR EACH ROW "
+        "WHEN (OLD.source_document_id IS DISTINCT FROM NEW.source_document_id "
+        "OR OLD.version_number IS DISTINCT FROM NEW.version_number "
+        "OR OLD.document_type IS DISTINCT FROM NEW.document_type) "
+        "EXECUTE FUNCTION experiment_corpus_document_changed()"
+    )
+    return statements
+
+
+def _drop_trigger_statements():
+    statements = [
+        f"DROP TRIGGER IF EXISTS {table}_corpus_{action} ON {table}"
+        for table, _ in LINK_TABLES for action in ('insert', 'delete', 'update')
+    ]
+    statements.append("DROP TRIGGER IF EXISTS documents_corpus_update ON documents")
+    statements += [
+        "DROP FUNCTION IF EXISTS experiment_corpus_document_changed()",
+        "DROP FUNCTION IF EXISTS experiment_corpus_link_updated()",
+        "DROP FUNCTION IF EXISTS experiment_corpus_links_deleted()",
+        "DROP FUNCTION IF EXISTS experiment_corpus_links_inserted()",
+        "DROP FUNCTION IF EXISTS refresh_experiment_corpus(integer[])",
+    ]
+    return statements
+
+
+def upgrade():
+    op.create_table('experiment_corpus_members',
+        sa.Column('experiment_id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('root_document_id', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(length=20), nullable=False),  # document, reference
+        sa.Column('experiment_document_id', sa.Integer(), nullable=True),
+        sa.Column('legacy', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.Column('is_latest', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.ForeignKeyConstraint(['experiment_id'], ['experiments.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('experiment_id', 'document_id')
+    )
+    op.create_index('ix_experiment_corpus_members_experiment_role', 'experiment_corpus_members',
+                    ['experiment_id', 'role'])
+    op.create_index('ix_experiment_corpus_members_experiment_root', 'experiment_corpus_members',
+                    ['experiment_id', 'root_document_id'])
+    op.create_index('ix_experiment_corpus_members_document', 'experiment_corpus_members', ['document_id'])
+
+    for statement in _trigger_statements():
+        op.execute(statement)
+    op.execute('SELECT refresh_experiment_corpus(ARRAY(SELECT id FROM experiments))')
+
+
+def downgrade():
+    for statement in _drop_trigger_statements():
+        op.execute(statement)
+    op.drop_index('ix_experiment_corpus_members_document', table_name='experiment_corpus_members')
+    op.drop_index('ix_experiment_corpus_members_experiment_root', table_name='experiment_corpus_members')
+    op.drop_index('ix_experiment_corpus_members_experiment_role', table_name='experiment_corpus_members')
+    op.drop_table('experiment_corpus_members')
@@ -0,0 +1,75 @@
+"""Add processing plan tables
+
+Revision ID: 20261021_processing_plans
+Revises: 20261020_corpus_members
+Create Date: 2026-10-21
+
+A processing plan expands an experiment's documents x stages into nodes with
+their dependencies, so per-document processing runs as a scheduled graph of
+Celery tasks (with per-stage concurrency limits) instead of one browser
+request per operation.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261021_processing_plans'
+down_revision = '20261020_corpus_members'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('processing_plans',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('experiment_id', sa.Integer(), nullable=False),
+        sa.Column('requested_by', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),  # running, completed, failed
+        sa.Column('stages', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='[]'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['experiment_id'], ['experiments.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['requested_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_processing_plans_experiment_id', 'processing_plans', ['experiment_id'])
+    op.create_index('ix_processing_plans_status', 'processing_plans', ['status'])
+
+    op.create_table('processing_plan_nodes',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('plan_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('experiment_document_id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('processing_type', sa.String(length=50), nullable=False),
+        sa.Column('processing_method', sa.String(length=50), nullable=False),
+        # waiting, queued, running, completed, failed, skipped, blocked
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('depends_on', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='[]'),
+        sa.Column('processing_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('celery_task_id', sa.String(length=255), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['plan_id'], ['processing_plans.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['experiment_document_id'], ['experiment_documents_v2.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['processing_id'], ['experiment_document_processing.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_processing_plan_nodes_plan_id', 'processing_plan_nodes', ['plan_id'])
+    op.create_index('idx_processing_plan_nodes_status_type', 'processing_plan_nodes',
+                    ['status', 'processing_type'])
+
+
+def downgrade():
+    op.drop_index('idx_processing_plan_nodes_status_type', table_name='processing_plan_nodes')
+    op.drop_index('ix_processing_plan_nodes_plan_id', table_name='processing_plan_nodes')
+    op.drop_table('processing_plan_nodes')
+    op.drop_index('ix_processing_plans_status', table_name='processing_plans')
+    op.drop_index('ix_processing_plans_experiment_id', table_name='processing_plans')
+    op.drop_table('processing_plans')
@@ -0,0 +1,160 @@
+"""Add trigger-maintained full-text search vector to documents
+
+Revision ID: 20261022_document_search
+Revises: 20261021_processing_plans
+Create Date: 2026-10-22
+
+Adds documents.search_vector (weighted title + content lexemes) with a GIN
+index, the ontextract_historical text search configuration and the trigger
+keeping the vector current. Existing documents are backfilled before the
+index is built.
+
+The function and trigger DDL is inlined so this revision stays fixed when
+app.models.document_search changes.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261022_document_search'
+down_revision = '20261021_processing_plans'
+branch_labels = None
+depends_on = None
+
+CREATE_CONFIG_SQL = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'ontextract_historical') THEN
+        CREATE TEXT SEARCH CONFIGURATION ontextract_historical (COPY = pg_catalog.english);
+    END IF;
+END;
+$$;
+"""
+
+NORMALIZE_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION ontextract_normalize_historical(body text) RETURNS text AS $$
+DECLARE
+    result text := body;
+BEGIN
+    IF result IS NULL THEN
+        RETURN NULL;
+    END IF;
+    result := translate(result, 'ſ', 's');
+    result := replace(result, 'æ', 'ae');
+    result := replace(result, 'Æ', 'Ae');
+    result := replace(result, 'œ', 'oe');
+    result := replace(result, 'Œ', 'Oe');
+    result := replace(result, 'ﬀ', 'ff');
+    result := replace(result, 'ﬁ', 'fi');
+    result := replace(result, 'ﬂ', 'fl');
+    result := replace(result, 'ﬃ', 'ffi');
+    result := replace(result, 'ﬄ', 'ffl');
+    result := replace(result, 'ﬅ', 'st');
+    result := replace(result, 'ﬆ', 'st');
+    result := regexp_replace(result, '\m(academ|ant|arithmet|authent|cathol|characterist|com|crit|domest|emet|ep|eth|fantast|frol|hero|log|lyr|mag|mathemat|mechan|metaphys|mus|panegyr|phys|poet|polit|publ|rhetor|romant|rust|satir|top|traff|trag)ick(s?)\M', '\1ic\2', 'gi');
+    result := regexp_replace(result, '\mantient\M', 'ancient', 'gi');
+    result := regexp_replace(result, '\mantients\M', 'ancients', 'gi');
+    result := regexp_replace(result, '\mchymical\M', 'chemical', 'gi');
+    result := regexp_replace(result, '\mchymist\M', 'chemist', 'gi');
+    result := regexp_replace(result, '\mchymistry\M', 'chemistry', 'gi');
+    result := regexp_replace(result, '\mcompleat\M', 'complete', 'gi');
+    result := regexp_replace(result, '\mconnexion\M', 'connection', 'gi');
+    result := regexp_replace(result, '\mcroud\M', 'crowd', 'gi');
+    result := regexp_replace(result, '\moeconomy\M', 'economy', 'gi');
+    result := regexp_replace(result, '\mphrenzy\M', 'frenzy', 'gi');
+    result := regexp_replace(result, '\mshew\M', 'show', 'gi');
+    result := regexp_replace(result, '\mshewed\M', 'showed', 'gi');
+    result := regexp_replace(result, '\mshewn\M', 'shown', 'gi');
+    result := regexp_replace(result, '\mshews\M', 'shows', 'gi');
+    RETURN result;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE;
+"""
+
+CREATE_CONFIG_FUNCTION_SQL = """
+DO $do$
+BEGIN
+    IF to_regprocedure('ontextract_search_config()') IS NULL THEN
+        CREATE FUNCTION ontextract_search_config() RETURNS regconfig AS $f$
+            SELECT 'ontextract_historical'::regconfig
+        $f$ LANGUAGE sql STABLE;
+    END IF;
+END;
+$do$;
+"""
+
+SEARCH_TEXT_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION ontextract_search_text(cfg regconfig, body text) RETURNS text AS $$
+    SELECT CASE WHEN cfg = 'ontextract_historical'::regconfig
+                THEN ontextract_normalize_historical(body) ELSE body END
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+SEARCH_VECTOR_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION ontextract_search_vector(cfg regconfig, title text, body text) RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector(cfg, ontextract_search_text(cfg, coalesce(title, ''))), 'A')
+        || setweight(to_tsvector(cfg, ontextract_search_text(cfg, left(coalesce(body, ''), 1000000))), 'B')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+SEARCH_QUERY_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION ontextract_search_query(cfg regconfig, query text) RETURNS tsquery AS $$
+    SELECT websearch_to_tsquery(cfg, ontextract_search_text(cfg, query))
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+"""
+
+REFRESH_TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION documents_search_vector_refresh() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := ontextract_search_vector(ontextract_search_config(), NEW.title, NEW.content);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+CREATE_TRIGGER_SQL = (
+    "CREATE OR REPLACE TRIGGER documents_search_vector "
+    "BEFORE INSERT OR UPDATE OF title, content ON documents "
+    "FOR EACH ROW EXECUTE FUNCTION documents_search_vector_refresh()"
+)
+
+DROP_STATEMENTS = (
+    "DROP TRIGGER IF EXISTS documents_search_vector ON documents",
+    "DROP FUNCTION IF EXISTS documents_search_vector_refresh()",
+    "DROP FUNCTION IF EXISTS ontextract_search_query(regconfig, text)",
+    "DROP FUNCTION IF EXISTS ontextract_search_vector(regconfig, text, text)",
+    "DROP FUNCTION IF EXISTS ontextract_search_text(regconfig, text)",
+    "DROP FUNCTION IF EXISTS ontextract_search_config()",
+    "DROP FUNCTION IF EXISTS ontextract_normalize_historical(text)",
+    "DROP TEXT SEARCH CONFIGURATION IF EXISTS ontextract_historical",
+)
+
+
+def upgrade():
+    op.add_column('documents', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    for statement in (
+        CREATE_CONFIG_SQL,
+        NORMALIZE_FUNCTION_SQL,
+        CREATE_CONFIG_FUNCTION_SQL,
+        SEARCH_TEXT_FUNCTION_SQL,
+        SEARCH_VECTOR_FUNCTION_SQL,
+        SEARCH_QUERY_FUNCTION_SQL,
+        REFRESH_TRIGGER_FUNCTION_SQL,
+        CREATE_TRIGGER_SQL,
+    ):
+        op.execute(statement)
+    op.execute(
+        'UPDATE documents SET search_vector = '
+        'ontextract_search_vector(ontextract_search_config(), title, content)'
+    )
+    op.create_index('ix_documents_search_vector', 'documents', ['search_vector'],
+                    postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_documents_search_vector', table_name='documents')
+    for statement in DROP_STATEMENTS:
+        op.execute(statement)
+    op.drop_column('documents', 'search_vector')
@@ -0,0 +1,54 @@
+"""Add pg_trgm indexes for fuzzy term, anchor and document title search
+
+Revision ID: 20261023_trigram_search
+Revises: 20261022_document_search
+Create Date: 2026-10-23
+
+Installs the pg_trgm extension and GIN trigram indexes over the historically
+normalized term text, context anchor text, document titles and authors used
+by ``app.models.fuzzy_search.fuzzy_match``. Servers without pg_trgm are
+skipped, as ``db.create_all()`` does; fuzzy_match then falls back to
+substring matching.
+
+The DDL is inlined so this revision stays fixed when app.models.fuzzy_search
+changes.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261023_trigram_search'
+down_revision = '20261022_document_search'
+branch_labels = None
+depends_on = None
+
+# (index name, table, column)
+TRIGRAM_INDEXES = (
+    ('ix_terms_term_text_trgm', 'terms', 'term_text'),
+    ('ix_context_anchors_anchor_term_trgm', 'context_anchors', 'anchor_term'),
+    ('ix_documents_title_trgm', 'documents', 'title'),
+    ('ix_documents_authors_trgm', 'documents', 'authors'),
+)
+
+
+def upgrade():
+    statements = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+        f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+        f"USING gin (ontextract_normalize_historical({column}) gin_trgm_ops)"
+        for name, table, column in TRIGRAM_INDEXES
+    ]
+    op.execute("""
+DO $do$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        {statements}
+    ELSE
+        RAISE NOTICE 'pg_trgm is not available; skipping trigram indexes';
+    END IF;
+END;
+$do$;
+""".format(statements='\n        '.join(f"EXECUTE '{statement}';" for statement in statements)))
+
+
+def downgrade():
+    for name, _, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,66 @@
+"""Add OED PDF parse jobs and the page layout cache
+
+Revision ID: 20261024_oed_parse_jobs
+Revises: 20261023_trigram_search
+Create Date: 2026-10-24
+
+OED entry PDFs are parsed by background jobs instead of inside the upload
+request. oed_pdf_page_layouts caches each page's extracted layout by the
+PDF's SHA-256, so interrupted jobs resume and re-parses skip extraction.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261024_oed_parse_jobs'
+down_revision = '20261023_trigram_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('oed_parse_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('requested_by', sa.Integer(), nullable=True),
+        sa.Column('file_hash', sa.String(length=64), nullable=False),
+        sa.Column('file_path', sa.String(length=500), nullable=True),
+        sa.Column('original_filename', sa.String(length=255), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),  # pending, running, completed, failed
+        sa.Column('stage', sa.String(length=50), nullable=True),
+        sa.Column('pages_total', sa.Integer(), nullable=True),
+        sa.Column('pages_done', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('force_reparse', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('layout_cached', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('result_reused_from', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('celery_task_id', sa.String(length=255), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['requested_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_oed_parse_jobs_file_hash', 'oed_parse_jobs', ['file_hash'])
+    op.create_index('ix_oed_parse_jobs_status', 'oed_parse_jobs', ['status'])
+
+    op.create_table('oed_pdf_page_layouts',
+        sa.Column('file_hash', sa.String(length=64), nullable=False),
+        sa.Column('page_number', sa.Integer(), nullable=False),
+        sa.Column('page_count', sa.Integer(), nullable=False),
+        sa.Column('width', sa.Float(), nullable=True),
+        sa.Column('height', sa.Float(), nullable=True),
+        sa.Column('lines', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='[]'),
+        sa.Column('text', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('file_hash', 'page_number')
+    )
+
+
+def downgrade():
+    op.drop_table('oed_pdf_page_layouts')
+    op.drop_index('ix_oed_parse_jobs_status', table_name='oed_parse_jobs')
+    op.drop_index('ix_oed_parse_jobs_file_hash', table_name='oed_parse_jobs')
+    op.drop_table('oed_parse_jobs')
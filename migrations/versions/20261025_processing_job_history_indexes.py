@@ -0,0 +1,37 @@
+"""Add covering indexes for the processing job history
+
+Revision ID: 20261025_job_history_indexes
+Revises: 20261024_oed_parse_jobs
+Create Date: 2026-10-25
+
+Result pages read every experiment processing record of one type for a
+document family in one joined query. These indexes let PostgreSQL answer
+it from the indexes alone: document IDs to experiment associations, then
+associations to processing rows by type and status.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261025_job_history_indexes'
+down_revision = '20261024_oed_parse_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_experiment_documents_v2_document_id_id',
+        'experiment_documents_v2',
+        ['document_id', 'id'],
+    )
+    op.create_index(
+        'ix_experiment_document_processing_history',
+        'experiment_document_processing',
+        ['experiment_document_id', 'processing_type', 'status'],
+        postgresql_include=['id', 'created_at', 'completed_at', 'processing_method'],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_experiment_document_processing_history', table_name='experiment_document_processing')
+    op.drop_index('ix_experiment_documents_v2_document_id_id', table_name='experiment_documents_v2')
@@ -0,0 +1,217 @@
+"""Move semantic events out of experiment configuration JSON
+
+Revision ID: 20261026_semantic_events
+Revises: 20261025_job_history_indexes
+Create Date: 2026-10-26
+
+Semantic events become rows in semantic_events, indexed by experiment,
+period and type. Each row carries a version counter for optimistic
+concurrency, and its evidence documents go in semantic_event_documents.
+Events found in experiments.configuration are copied into the tables and
+removed from the JSON. The downgrade writes them back.
+"""
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261026_semantic_events'
+down_revision = '20261025_job_history_indexes'
+branch_labels = None
+depends_on = None
+
+
+def _year(value):
+    try:
+        year = int(value)
+    except (TypeError, ValueError):
+        return None
+    return year if 1 <= year <= 9999 else None
+
+
+def _timestamp(value):
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _links(event):
+    return [
+        document.get('id') if isinstance(document, dict) else document
+        for document in event.get('related_documents') or []
+    ]
+
+
+def _existing(bind, table, ids):
+    ids = sorted({value for value in ids if isinstance(value, int) and not isinstance(value, bool)})
+    if not ids:
+        return set()
+    rows = bind.execute(
+        sa.text(f"SELECT id FROM {table} WHERE id IN :ids").bindparams(sa.bindparam('ids', expanding=True)),
+        {'ids': ids},
+    )
+    return {row[0] for row in rows}
+
+
+def upgrade():
+    op.create_table('semantic_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('experiment_id', sa.Integer(), nullable=False),
+        sa.Column('event_id', sa.String(length=64), nullable=False),
+        sa.Column('event_type', sa.String(length=100), nullable=False),
+        sa.Column('from_period', sa.Integer(), nullable=True),
+        sa.Column('to_period', sa.Integer(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('type_label', sa.String(length=255), nullable=True),
+        sa.Column('type_uri', sa.String(length=500), nullable=True),
+        sa.Column('definition', sa.Text(), nullable=True),
+        sa.Column('citation', sa.Text(), nullable=True),
+        sa.Column('example', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('modified_by', sa.Integer(), nullable=True),
+        sa.Column('modified_at', sa.DateTime(), nullable=True),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+        sa.ForeignKeyConstraint(['experiment_id'], ['experiments.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['modified_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('experiment_id', 'event_id', name='uq_semantic_events_experiment_event'),
+    )
+    op.create_index('ix_semantic_events_experiment_period', 'semantic_events',
+                    ['experiment_id', 'from_period', 'to_period'])
+    op.create_index('ix_semantic_events_experiment_type', 'semantic_events', ['experiment_id', 'event_type'])
+
+    op.create_table('semantic_event_documents',
+        sa.Column('semantic_event_id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['semantic_event_id'], ['semantic_events.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('semantic_event_id', 'document_id'),
+    )
+    op.create_index('ix_semantic_event_documents_document', 'semantic_event_documents', ['document_id'])
+
+    bind = op.get_bind()
+    experiments = bind.execute(
+        sa.text("SELECT id, configuration FROM experiments WHERE configuration LIKE :pattern"),
+        {'pattern': '%semantic_events%'},
+    ).fetchall()
+    for experiment_id, configuration in experiments:
+        try:
+            config = json.loads(configuration)
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(config, dict) or 'semantic_events' not in config:
+            continue
+        events = config.pop('semantic_events')
+        events = [event for event in events if isinstance(event, dict)] if isinstance(events, list) else []
+
+        known_documents = _existing(bind, 'documents', [i for event in events for i in _links(event)])
+        known_users = _existing(bind, 'users', [event.get(f) for event in events for f in ('created_by', 'modified_by')])
+
+        seen = set()
+        for event in events:
+            event_id = str(event.get('id') or '').strip()[:64] or str(uuid4())
+            if event_id in seen:
+                continue
+            seen.add(event_id)
+            row_id = bind.execute(sa.text(
+                "INSERT INTO semantic_events (experiment_id, event_id, event_type, from_period, to_period, "
+                "description, type_label, type_uri, definition, citation, example, created_by, created_at, "
+                "modified_by, modified_at, version) VALUES (:experiment_id, :event_id, :event_type, "
+                ":from_period, :to_period, :description, :type_label, :type_uri, :definition, :citation, "
+                ":example, :created_by, :created_at, :modified_by, :modified_at, 1) RETURNING id"
+            ), {
+                'experiment_id': experiment_id,
+                'event_id': event_id,
+                'event_type': str(event.get('event_type') or event.get('type') or 'unknown')[:100],
+                'from_period': _year(event.get('from_period', event.get('year'))),
+                'to_period': _year(event.get('to_period')),
+                'description': str(event.get('description') or ''),
+                'type_label': event.get('type_label'),
+                'type_uri': event.get('type_uri'),
+                'definition': event.get('definition'),
+                'citation': event.get('citation'),
+                'example': event.get('example'),
+                'created_by': event.get('created_by') if event.get('created_by') in known_users else None,
+                'created_at': _timestamp(event.get('created_at')) or datetime.utcnow(),
+                'modified_by': event.get('modified_by') if event.get('modified_by') in known_users else None,
+                'modified_at': _timestamp(event.get('modified_at')),
+            }).scalar()
+            linked = []
+            for document_id in _links(event):
+                if document_id in known_documents and document_id not in linked:
+                    linked.append(document_id)
+            for position, document_id in enumerate(linked):
+                bind.execute(sa.text(
+                    "INSERT INTO semantic_event_documents (semantic_event_id, document_id, position) "
+                    "VALUES (:event, :document, :position)"
+                ), {'event': row_id, 'document': document_id, 'position': position})
+
+        bind.execute(
+            sa.text("UPDATE experiments SET configuration = :configuration WHERE id = :id"),
+            {'configuration': json.dumps(config), 'id': experiment_id},
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    events = bind.execute(sa.text(
+        "SELECT e.id, e.experiment_id, e.event_id, e.event_type, e.from_period, e.to_period, e.description, "
+        "e.type_label, e.type_uri, e.definition, e.citation, e.example, e.created_by, e.created_at, "
+        "e.modified_by, e.modified_at FROM semantic_events e ORDER BY e.experiment_id, e.from_period, e.id"
+    )).mappings().fetchall()
+    links = {}
+    for row in bind.execute(sa.text(
+        "SELECT l.semantic_event_id, d.id, d.uuid, d.title FROM semantic_event_documents l "
+        "JOIN documents d ON d.id = l.document_id ORDER BY l.semantic_event_id, l.position"
+    )):
+        links.setdefault(row[0], []).append({
+            'id': row[1], 'uuid': str(row[2]) if row[2] else None, 'title': row[3] or 'Untitled Document',
+        })
+
+    by_experiment = {}
+    for event in events:
+        by_experiment.setdefault(event['experiment_id'], []).append({
+            'id': event['event_id'],
+            'event_type': event['event_type'],
+            'from_period': event['from_period'],
+            'to_period': event['to_period'],
+            'description': event['description'],
+            'related_documents': links.get(event['id'], []),
+            'type_label': event['type_label'],
+            'type_uri': event['type_uri'],
+            'definition': event['definition'],
+            'citation': event['citation'],
+            'example': event['example'],
+            'created_by': event['created_by'],
+            'created_at': event['created_at'].isoformat() if event['created_at'] else None,
+            'modified_by': event['modified_by'],
+            'modified_at': event['modified_at'].isoformat() if event['modified_at'] else None,
+        })
+    for experiment_id, experiment_events in by_experiment.items():
+        configuration = bind.execute(
+            sa.text("SELECT configuration FROM experiments WHERE id = :id"), {'id': experiment_id}
+        ).scalar()
+        try:
+            config = json.loads(configuration) if configuration else {}
+        except (TypeError, ValueError):
+            config = {}
+        if not isinstance(config, dict):
+            config = {}
+        config['semantic_events'] = experiment_events
+        bind.execute(
+            sa.text("UPDATE experiments SET configuration = :configuration WHERE id = :id"),
+            {'configuration': json.dumps(config), 'id': experiment_id},
+        )
+
+    op.drop_index('ix_semantic_event_documents_document', table_name='semantic_event_documents')
+    op.drop_table('semantic_event_documents')
+    op.drop_index('ix_semantic_events_experiment_type', table_name='semantic_events')
+    op.drop_index('ix_semantic_events_experiment_period', table_name='semantic_events')
+    op.drop_table('semantic_events')
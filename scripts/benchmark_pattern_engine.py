@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Benchmark the compiled pattern engine against the previous per-call regex loops.
+
+Builds a synthetic, date-dense historical corpus (default 5 MB) and times the
+regex stages of ``extract_temporal`` and ``extract_definitions`` both ways.
+The old temporal overlap check is quadratic, so it is only run on a prefix
+(``--legacy-bytes``); the engine is timed on that prefix and on the full corpus.
+
+Usage:
+    python scripts/benchmark_pattern_engine.py [--megabytes 5] [--legacy-bytes 250000]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.document_processing_tools.definitions import DEFINITION_PATTERNS  # noqa: E402
+from app.services.document_processing_tools.patterns import CompiledPatternSet, IntervalSet  # noqa: E402
+from app.services.document_processing_tools.relationships import TEMPORAL_PATTERNS  # noqa: E402
+
+SENTENCES = [
+    "In {year} the committee revised the charter, and by the {decade} the term had shifted.",
+    "During the {ordinal} century scholars wrote of the Industrial Revolution and its aftermath.",
+    "Between {year} and {year2} the word was used in a legal sense; since {year2} it has broadened.",
+    "Ontology is defined as the study of what there is in {year}.",
+    "Agency refers to the capacity of an actor to act, as argued in the late {decade}.",
+    "The WHO (World Health Organization) published guidance in {year}.",
+    "Recently the Victorian era usage was traced to a pamphlet from {year}.",
+    "Reform means a change in structure, noted before {year} and after {year2}.",
+    "The archive holds letters dated {year}, {year2} and the early {decade}.",
+]
+ORDINALS = ['17th', '18th', '19th', '20th', 'eighteenth', 'nineteenth', 'twentieth']
+
+
+def build_corpus(size_bytes, seed=13):
+    rng = random.Random(seed)
+    parts, length = [], 0
+    while length < size_bytes:
+        year = rng.randint(1600, 2029)
+        sentence = rng.choice(SENTENCES).format(
+            year=year, year2=min(year + rng.randint(1, 40), 2029),
+            decade=f"{year // 10 * 10}s", ordinal=rng.choice(ORDINALS),
+        )
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return ' '.join(parts)
+
+
+def legacy_temporal(text):
+    seen_positions = set()
+    found = 0
+    for spec in TEMPORAL_PATTERNS:
+        for match in re.finditer(spec.pattern, text, re.IGNORECASE):
+            start_pos, end_pos = match.start(), match.end()
+            if any(start <= start_pos < end or start < end_pos <= end
+                   for start, end in seen_positions):
+                continue
+            seen_positions.add((start_pos, end_pos))
+            found += 1
+    return found
+
+
+def engine_temporal(pattern_set, text):
+    seen_positions = IntervalSet()
+    found = 0
+    for spec, match in pattern_set.scan(text):
+        if seen_positions.add(match.start(), match.end()):
+            found += 1
+    return found
+
+
+def legacy_definitions(sentences):
+    found = 0
+    for sent in sentences:
+        for spec in DEFINITION_PATTERNS:
+            flags = 0 if spec.data[0] == 'acronym' else re.IGNORECASE
+            found += sum(1 for _ in re.finditer(spec.pattern, sent, flags))
+    return found
+
+
+def engine_definitions(pattern_set, sentences):
+    return sum(len(pattern_set.scan(sent)) for sent in sentences)
+
+
+def timed(label, fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<34} {elapsed:9.3f}s  ({result} matches)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--megabytes', type=float, default=5.0)
+    parser.add_argument('--legacy-bytes', type=int, default=250_000)
+    args = parser.parse_args()
+
+    corpus = build_corpus(int(args.megabytes * 1_000_000))
+    prefix = corpus[:args.legacy_bytes]
+    print(f"Corpus: {len(corpus) / 1e6:.1f} MB, legacy prefix: {len(prefix) / 1e3:.0f} KB")
+
+    temporal = CompiledPatternSet('temporal', TEMPORAL_PATTERNS)
+    print("extract_temporal regex stage")
+    legacy = timed('legacy (prefix)', legacy_temporal, prefix)
+    engine = timed('engine (prefix)', engine_temporal, temporal, prefix)
+    print(f"  speedup on prefix: {legacy / engine:.1f}x")
+    timed('engine (full corpus)', engine_temporal, temporal, corpus)
+
+    sentences = re.split(r'(?<=[.!?])\s+', corpus)
+    definitions = CompiledPatternSet('definitions', DEFINITION_PATTERNS)
+    print(f"extract_definitions pattern stage ({len(sentences)} sentences)")
+    legacy = timed('legacy (full corpus)', legacy_definitions, sentences)
+    engine = timed('engine (full corpus)', engine_definitions, definitions, sentences)
+    print(f"  speedup: {legacy / engine:.1f}x")
+
+    print("Per-pattern statistics (engine, temporal):")
+    for name, entry in temporal.stats().items():
+        print(f"  {name:<18} matches={entry['matches']:<8} seconds={entry['seconds']:.3f}")
+
+
+if __name__ == '__main__':
+    main()
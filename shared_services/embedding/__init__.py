@@ -3,5 +3,6 @@ Embedding services for text processing and similarity search.
 """
 
 from .embedding_service import EmbeddingService
+from .memo_store import EmbeddingMemoStore, MemoKey, get_embedding_memo_store
 
-__all__ = ["EmbeddingService"]
+__all__ = ["EmbeddingMemoStore", "EmbeddingService", "MemoKey", "get_embedding_memo_store"]
@@ -10,17 +10,31 @@ This service provides multi-provider embedding generation with support for:
 """
 
 import os
+import time
 import numpy as np
 from typing import List, Dict, Any, Union, Optional, Tuple
-import requests
 import json
 import io
 import logging
 from abc import ABC, abstractmethod
 
+from shared_services.http_client import get_http_pool
+from shared_services.metrics import record_embedding, record_embedding_error
+
+from .memo_store import (
+    MemoKey,
+    get_embedding_memo_store,
+    model_revision,
+    sentence_transformer_key,
+    text_hash,
+)
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Providers whose vectors depend only on the text (Claude falls back to random ones)
+MEMOIZED_PROVIDERS = ('local', 'openai')
+
 class BaseEmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
     
@@ -110,7 +124,7 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
             "model": self.model
         }
         
-        response = requests.post(
+        response = get_http_pool().session().post(
             f"{self.api_base}/embeddings", 
             headers=headers, 
             json=data
@@ -160,7 +174,7 @@ class ClaudeEmbeddingProvider(BaseEmbeddingProvider):
         
         # Try embeddings endpoint (may not exist yet)
         try:
-            response = requests.post(
+            response = get_http_pool().session().post(
                 f"{self.api_base}/embeddings",
                 headers=headers, 
                 json=data
@@ -204,7 +218,8 @@ class EmbeddingService:
     def __init__(self, 
                  model_name: str = None, 
                  provider_priority: List[str] = None,
-                 embedding_dimension: int = None):
+                 embedding_dimension: int = None,
+                 memo_store=None):
         """
         Initialize the embedding service.
         
@@ -212,11 +227,13 @@ class EmbeddingService:
             model_name: Local model name (defaults to env var or 'all-MiniLM-L6-v2')
             provider_priority: List of providers in priority order ['local', 'openai', 'claude']
             embedding_dimension: Override dimension if needed
+            memo_store: Embedding memo (defaults to the process-wide one)
         """
         self.model_name = model_name or os.environ.get("LOCAL_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
         self.provider_priority = provider_priority or self._get_default_priority()
         self.providers = {}
         self.embedding_dimension = embedding_dimension
+        self.memo_store = memo_store
         
         # Initialize providers
         self._setup_providers()
@@ -254,6 +271,9 @@ class EmbeddingService:
         """
         Get embedding for text using the first available provider.
         
+        Vectors from the first available provider are memoized (see
+        ``memo_store``), so a text is only encoded once per model.
+        
         Args:
             text: Text to embed
             
@@ -262,7 +282,58 @@ class EmbeddingService:
         """
         if not text or not text.strip():
             return [0.0] * self.embedding_dimension
+        return self._embed_memoized([text])[0]
+    
+    def _embed_memoized(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, looking the whole batch up in the memo first."""
+        _, embedded = self._embed_with_providers(texts)
+        return [embedding for embedding, _ in embedded]
+    
+    def _embed_with_providers(self, texts: List[str]) -> Tuple[Optional[str], List[Tuple[List[float], Optional[str]]]]:
+        """
+        Embed texts through the memo, recording which provider produced each vector.
         
+        Returns:
+            The keyed (first available) provider name, and one
+            ``(vector, provider_name)`` pair per text; memo hits count as the
+            keyed provider, random fallback vectors as ``None``
+        """
+        provider_name, key = self._memo_key()
+        if key is None:
+            return provider_name, [self._encode(text) for text in texts]
+        
+        store = self.memo_store or get_embedding_memo_store()
+        hashes = [text_hash(text) for text in texts]
+        found = store.get_many(hashes, key)
+        encoded = {}
+        embedded = []
+        for text, digest in zip(texts, hashes):
+            embedding = found.get(digest) or encoded.get(digest)
+            used = provider_name
+            if embedding is None:
+                embedding, used = self._encode(text)
+                # Only vectors of the keyed model may be stored under its key
+                if used == provider_name:
+                    encoded[digest] = embedding
+            embedded.append((embedding, used))
+        store.put_many(encoded, key)
+        return provider_name, embedded
+    
+    def _memo_key(self) -> Tuple[Optional[str], Optional[MemoKey]]:
+        """Memo key of the provider ``get_embedding`` would use first."""
+        for provider_name in self.provider_priority:
+            provider = self.providers.get(provider_name)
+            if provider is None or not provider.is_available():
+                continue
+            if provider_name == "local":
+                return provider_name, sentence_transformer_key(provider.model_name, provider.model)
+            if provider_name == "openai":
+                return provider_name, MemoKey(f"openai:{provider.model}", model_revision("api"), "api")
+            return provider_name, None
+        return None, None
+    
+    def _encode(self, text: str) -> Tuple[List[float], Optional[str]]:
+        """Encode with the first provider that succeeds; returns the vector and provider name."""
         # Try each provider in priority order
         for provider_name in self.provider_priority:
             if provider_name not in self.providers:
@@ -272,17 +343,22 @@ class EmbeddingService:
             if not provider.is_available():
                 continue
             
+            started = time.perf_counter()
             try:
                 embedding = provider.get_embedding(text.strip())
                 logger.debug(f"Generated embedding using {provider_name} (dim: {len(embedding)})")
-                return embedding
+                model = getattr(provider, 'model_name', None) or getattr(provider, 'model', None) or provider_name
+                record_embedding(provider_name, str(model), time.perf_counter() - started,
+                                 characters=len(text))
+                return embedding, provider_name
             except Exception as e:
                 logger.warning(f"Provider {provider_name} failed: {e}")
+                record_embedding_error(provider_name)
                 continue
         
         # All providers failed, return random fallback
         logger.error("All embedding providers failed, using random fallback")
-        return self._get_random_embedding()
+        return self._get_random_embedding(), None
     
     def _get_random_embedding(self) -> List[float]:
         """Generate a random normalized embedding for fallback."""
@@ -294,28 +370,54 @@ class EmbeddingService:
         """
         Generate embeddings for multiple texts.
         
+        The batch is looked up in the embedding memo at once; only texts
+        not seen before are encoded.
+        
         Args:
             texts: List of texts to embed
             
         Returns:
             List of embedding vectors
         """
-        embeddings = []
-        
         logger.info(f"Generating embeddings for {len(texts)} texts...")
         
-        for i, text in enumerate(texts):
-            try:
-                embedding = self.get_embedding(text)
-                embeddings.append(embedding)
-                
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Processed {i + 1}/{len(texts)} embeddings")
-                    
-            except Exception as e:
-                logger.error(f"Error generating embedding for text {i}: {e}")
-                embeddings.append([0.0] * self.embedding_dimension)
+        blank = [0.0] * self.embedding_dimension
+        embeddings = [None if text and text.strip() else blank for text in texts]
+        pending = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        try:
+            for i, embedding in zip(pending, self._embed_memoized([texts[i] for i in pending])):
+                embeddings[i] = embedding
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+        
+        return [embedding if embedding is not None else blank for embedding in embeddings]
+    
+    def embed_primary(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embeddings from the first available provider only.
         
+        Unlike ``embed_documents``, a text that provider fails to encode gets
+        ``None`` rather than a later provider's or a random vector, so the
+        results can safely be cached under ``get_model_name()``.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            One vector per text; ``None`` for blank texts and failures
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        pending = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not pending:
+            return embeddings
+        try:
+            provider_name, embedded = self._embed_with_providers([texts[i] for i in pending])
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            return embeddings
+        for i, (embedding, used) in zip(pending, embedded):
+            if used is not None and used == provider_name:
+                embeddings[i] = embedding
         return embeddings
     
     def similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
@@ -15,6 +15,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from abc import ABC, abstractmethod
 
+from shared_services.http_client import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 class BaseFileProcessor(ABC):
@@ -152,7 +154,7 @@ class URLProcessor(BaseFileProcessor):
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(url, headers=headers)
+            response = get_http_pool().session().get(url, headers=headers)
             response.raise_for_status()
             
             # Parse with BeautifulSoup
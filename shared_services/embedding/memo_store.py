@@ -0,0 +1,298 @@
+"""
+Persistent memo of text embeddings, keyed by content and model.
+
+The same text is embedded over and over: document versions with identical
+content, segments repeated across experiments, re-runs of an experiment,
+and the snippets a domain comparison compares pairwise. The memo stores
+each vector once per
+
+    (normalized-text hash, model name, model revision, truncation policy)
+
+in a local SQLite file, so re-running an experiment only encodes texts the
+encoder has not seen:
+
+- callers look up a whole batch before encoding and encode only the misses
+  (identical texts within a batch are encoded once)
+- hits and misses are counted per model (``ontextract_embedding_memo_lookups_total``)
+- the first time a process uses a model at a new revision, rows of older
+  revisions of that model are evicted
+- the file is bounded; the oldest rows go first
+
+Vectors are stored as float64, so a hit returns exactly what the encoder
+returned. Storage errors never fail an embedding: they count as misses.
+
+Configuration:
+
+    EMBEDDING_MEMO_PATH       SQLite file
+                              (default <project>/embedding_cache/embedding_memo.sqlite3);
+                              an empty value disables the memo
+    EMBEDDING_MEMO_MAX_ROWS   rows kept across all models (default 500000)
+    EMBEDDING_MODEL_REVISION  appended to every model revision; change it after
+                              replacing model weights in place
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+from contextlib import closing
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared_services.metrics import record_embedding_memo
+
+# One memo per checkout, whichever directory a process was started from
+DEFAULT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'embedding_cache', 'embedding_memo.sqlite3',
+)
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_CHUNK = 500
+
+
+class MemoKey(NamedTuple):
+    """Everything besides the text that determines an embedding."""
+
+    model: str
+    revision: str = ''
+    truncation: str = ''
+
+
+def normalize_text(text: str) -> str:
+    """Text as the memo compares it: NFC, whitespace runs collapsed, stripped."""
+    return ' '.join(unicodedata.normalize('NFC', text or '').split())
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def model_revision(*parts) -> str:
+    """Revision string from library/model versions plus ``EMBEDDING_MODEL_REVISION``."""
+    parts = [str(part) for part in parts if part]
+    override = os.environ.get('EMBEDDING_MODEL_REVISION')
+    if override:
+        parts.append(override)
+    return '+'.join(parts)
+
+
+def sentence_transformer_key(model_name: str, model=None) -> MemoKey:
+    """Memo key of a sentence-transformers model, the same for every service that loads it."""
+    library = getattr(sys.modules.get('sentence_transformers'), '__version__', None)
+    return MemoKey(
+        f"local:{model_name.replace('sentence-transformers/', '', 1)}",
+        model_revision(f'sentence-transformers-{library}' if library else None),
+        f"max_seq_length={getattr(model, 'max_seq_length', None)}",
+    )
+
+
+class EmbeddingMemoStore:
+    """SQLite-backed embedding memo shared by every process on the host."""
+
+    def __init__(self, path: Optional[str] = None, max_rows: Optional[int] = None):
+        """
+        Args:
+            path: SQLite file; an empty string (or an empty
+                ``EMBEDDING_MEMO_PATH``) disables the memo
+            max_rows: Rows kept across all models
+        """
+        if path is None:
+            path = os.environ.get('EMBEDDING_MEMO_PATH', DEFAULT_PATH)
+        self.path = path or None
+        self.max_rows = max_rows if max_rows is not None else int(
+            os.environ.get('EMBEDDING_MEMO_MAX_ROWS', 500000)
+        )
+        self._lock = threading.Lock()
+        self._ready = False
+        self._revisions_checked = set()
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evicted': 0, 'errors': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def embed(self, texts: Sequence[str], key: MemoKey,
+              encode: Callable[[List[str]], Sequence[Sequence[float]]]) -> List[List[float]]:
+        """
+        Embeddings of ``texts``, encoding only those not in the memo.
+
+        Args:
+            texts: Texts to embed, in order
+            key: Model, revision and truncation policy of ``encode``
+            encode: Encoder for a list of texts; called once, with the misses
+
+        Returns:
+            One vector per text, in input order
+        """
+        hashes = [text_hash(text) for text in texts]
+        found = self.get_many(hashes, key)
+        missing: Dict[str, str] = {}
+        for text, digest in zip(texts, hashes):
+            if digest not in found and digest not in missing:
+                missing[digest] = text
+        if missing:
+            vectors = encode(list(missing.values()))
+            encoded = dict(zip(missing, (list(map(float, vector)) for vector in vectors)))
+            self.put_many(encoded, key)
+            found.update(encoded)
+        return [found[digest] for digest in hashes]
+
+    def get_many(self, hashes: Sequence[str], key: MemoKey) -> Dict[str, List[float]]:
+        """Stored vectors for the given text hashes (see ``text_hash``)."""
+        unique = list(dict.fromkeys(hashes))
+        found: Dict[str, List[float]] = {}
+        if not self.enabled:
+            return found
+        if unique and self._prepare(key):
+            try:
+                with closing(self._connect()) as conn:
+                    for start in range(0, len(unique), _LOOKUP_CHUNK):
+                        chunk = unique[start:start + _LOOKUP_CHUNK]
+                        rows = conn.execute(
+                            'SELECT text_hash, vector FROM embedding_memo '
+                            'WHERE model = ? AND revision = ? AND truncation = ? '
+                            f'AND text_hash IN ({", ".join("?" * len(chunk))})',
+                            (key.model, key.revision, key.truncation, *chunk),
+                        )
+                        for digest, blob in rows:
+                            found[digest] = np.frombuffer(blob, dtype='<f8').tolist()
+            except sqlite3.Error as e:
+                self._failed('lookup', e)
+        hits = sum(1 for digest in hashes if digest in found)
+        self._count(key.model, hits, len(hashes) - hits)
+        return found
+
+    def put_many(self, vectors: Dict[str, Sequence[float]], key: MemoKey) -> None:
+        """Store vectors keyed by text hash."""
+        rows = [
+            (key.model, key.revision, key.truncation, digest, len(vector),
+             np.asarray(vector, dtype='<f8').tobytes(), time.time())
+            for digest, vector in vectors.items()
+            # Zero vectors are what encoders return on failure; never memoize them
+            if len(vector) and np.all(np.isfinite(vector)) and np.any(vector)
+        ]
+        if not rows or not self._prepare(key):
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO embedding_memo '
+                    '(model, revision, truncation, text_hash, dimensions, vector, created_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    rows,
+                )
+                excess = conn.execute('SELECT COUNT(*) FROM embedding_memo').fetchone()[0] - self.max_rows
+                if excess > 0:
+                    conn.execute(
+                        'DELETE FROM embedding_memo WHERE rowid IN '
+                        '(SELECT rowid FROM embedding_memo ORDER BY created_at LIMIT ?)',
+                        (excess,),
+                    )
+                    self._bump('evicted', excess)
+            self._bump('writes', len(rows))
+        except sqlite3.Error as e:
+            self._failed('write', e)
+
+    def evict_model(self, model: str, keep_revision: Optional[str] = None) -> int:
+        """Delete a model's rows, except those of ``keep_revision``; returns rows removed."""
+        if not self._prepare():
+            return 0
+        query = 'DELETE FROM embedding_memo WHERE model = ?'
+        params: Tuple = (model,)
+        if keep_revision is not None:
+            query += ' AND revision != ?'
+            params = (model, keep_revision)
+        try:
+            with closing(self._connect()) as conn, conn:
+                removed = conn.execute(query, params).rowcount
+        except sqlite3.Error as e:
+            self._failed('eviction', e)
+            return 0
+        if removed:
+            logger.info(f"Evicted {removed} memoized embeddings of {model} (keeping revision {keep_revision!r})")
+            self._bump('evicted', removed)
+        return removed
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def _prepare(self, key: Optional[MemoKey] = None) -> bool:
+        """Create the schema once and evict stale revisions the first time a key is seen."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            ready = self._ready
+        if not ready:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with closing(self._connect()) as conn, conn:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    conn.execute(
+                        'CREATE TABLE IF NOT EXISTS embedding_memo ('
+                        'model TEXT NOT NULL, revision TEXT NOT NULL, truncation TEXT NOT NULL, '
+                        'text_hash TEXT NOT NULL, dimensions INTEGER NOT NULL, vector BLOB NOT NULL, '
+                        'created_at REAL NOT NULL, '
+                        'PRIMARY KEY (model, revision, truncation, text_hash))'
+                    )
+                    conn.execute(
+                        'CREATE INDEX IF NOT EXISTS ix_embedding_memo_created ON embedding_memo (created_at)'
+                    )
+            except (OSError, sqlite3.Error) as e:
+                self._failed('setup', e)
+                return False
+            with self._lock:
+                self._ready = True
+        if key is not None:
+            with self._lock:
+                first_use = (key.model, key.revision) not in self._revisions_checked
+                self._revisions_checked.add((key.model, key.revision))
+            if first_use:
+                self.evict_model(key.model, keep_revision=key.revision)
+        return True
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _count(self, model: str, hits: int, misses: int) -> None:
+        with self._lock:
+            self._stats['hits'] += hits
+            self._stats['misses'] += misses
+        record_embedding_memo(model, hits, misses)
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def _failed(self, operation: str, error: Exception) -> None:
+        self._bump('errors')
+        logger.warning(f"Embedding memo {operation} failed ({self.path}): {error}")
+
+
+_global_memo_store: Optional[EmbeddingMemoStore] = None
+
+
+def get_embedding_memo_store() -> EmbeddingMemoStore:
+    """
+    Get the process-wide embedding memo.
+
+    Returns:
+        The shared EmbeddingMemoStore instance
+    """
+    global _global_memo_store
+    if _global_memo_store is None:
+        _global_memo_store = EmbeddingMemoStore()
+    return _global_memo_store
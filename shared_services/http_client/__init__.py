@@ -0,0 +1,7 @@
+"""
+Pooled HTTP clients with retry policy and per-host metrics.
+"""
+
+from .pool import HttpClientPool, HttpPoolSettings, get_http_pool
+
+__all__ = ["HttpClientPool", "HttpPoolSettings", "get_http_pool"]
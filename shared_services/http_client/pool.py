@@ -0,0 +1,275 @@
+"""
+Shared HTTP connection pool for external metadata and API clients.
+
+Every outbound integration (CrossRef, Semantic Scholar, Merriam-Webster,
+OED, embedding providers, URL ingestion) goes through one process-wide
+pool so TLS sessions and keep-alive connections are reused between calls
+instead of being negotiated on every lookup.
+
+The pool provides:
+- A ``requests.Session`` with per-host connection limits and urllib3 retry/backoff
+- An ``httpx.Client`` with matching limits for clients built on httpx
+- Default timeouts applied when callers do not pass their own
+- Per-host latency, status and error metrics for diagnostics (also exported
+  to Prometheus as ``ontextract_external_request_*``)
+
+Configuration comes from environment variables so the same pool works in
+the Flask app, Celery workers and standalone scripts:
+
+    HTTP_POOL_CONNECTIONS     number of per-host pools kept (default 20)
+    HTTP_POOL_MAXSIZE         connections kept alive per host (default 10)
+    HTTP_TIMEOUT              default timeout in seconds (default 15)
+    HTTP_RETRY_TOTAL          retry attempts for idempotent requests (default 2)
+    HTTP_RETRY_BACKOFF        exponential backoff factor in seconds (default 0.5)
+"""
+
+import os
+import threading
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from shared_services.metrics import record_external_request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'OntExtract/1.0 (research)'
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class HttpPoolSettings:
+    """Connection, timeout and retry settings for the shared pool."""
+
+    pool_connections: int = 20
+    pool_maxsize: int = 10
+    timeout: float = 15.0
+    retry_total: int = 2
+    retry_backoff: float = 0.5
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+
+    @classmethod
+    def from_env(cls) -> 'HttpPoolSettings':
+        return cls(
+            pool_connections=_env_int('HTTP_POOL_CONNECTIONS', cls.pool_connections),
+            pool_maxsize=_env_int('HTTP_POOL_MAXSIZE', cls.pool_maxsize),
+            timeout=_env_float('HTTP_TIMEOUT', cls.timeout),
+            retry_total=_env_int('HTTP_RETRY_TOTAL', cls.retry_total),
+            retry_backoff=_env_float('HTTP_RETRY_BACKOFF', cls.retry_backoff),
+        )
+
+
+@dataclass
+class HostMetrics:
+    """Latency and outcome counters for a single upstream host."""
+
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'avg_ms': round(self.total_ms / self.requests, 2) if self.requests else 0.0,
+            'max_ms': round(self.max_ms, 2),
+            'statuses': dict(self.statuses),
+            'last_error': self.last_error,
+        }
+
+
+class HttpMetricsRecorder:
+    """Thread-safe per-host metrics shared by both client flavours."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, HostMetrics] = {}
+
+    def record(self, url: str, elapsed_ms: float, status: Optional[int] = None,
+               error: Optional[BaseException] = None) -> None:
+        host = urlsplit(str(url)).netloc or 'unknown'
+        record_external_request(host, elapsed_ms / 1000, status=status, error=error)
+        with self._lock:
+            metrics = self._hosts.setdefault(host, HostMetrics())
+            metrics.requests += 1
+            metrics.total_ms += elapsed_ms
+            metrics.max_ms = max(metrics.max_ms, elapsed_ms)
+            if status is not None:
+                metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            if error is not None or (status is not None and status >= 400):
+                metrics.errors += 1
+                metrics.last_error = repr(error) if error is not None else f'HTTP {status}'
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {host: metrics.to_dict() for host, metrics in self._hosts.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+
+class PooledSession(requests.Session):
+    """requests.Session that applies a default timeout and records metrics."""
+
+    def __init__(self, settings: HttpPoolSettings, metrics: HttpMetricsRecorder):
+        super().__init__()
+        self.default_timeout = settings.timeout
+        self._metrics = metrics
+        self.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+
+        retry = Retry(
+            total=settings.retry_total,
+            connect=settings.retry_total,
+            read=settings.retry_total,
+            status=settings.retry_total,
+            backoff_factor=settings.retry_backoff,
+            status_forcelist=settings.retry_statuses,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.pool_connections,
+            pool_maxsize=settings.pool_maxsize,
+            max_retries=retry,
+        )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault('timeout', self.default_timeout)
+        started = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException as exc:
+            self._metrics.record(url, (time.perf_counter() - started) * 1000, error=exc)
+            raise
+        self._metrics.record(url, (time.perf_counter() - started) * 1000, status=response.status_code)
+        return response
+
+
+class HttpClientPool:
+    """
+    Process-wide factory for pooled HTTP clients.
+
+    Clients are created lazily and reused; callers should never close them.
+    Use :func:`get_http_pool` rather than instantiating this directly so all
+    integrations share the same connections.
+    """
+
+    def __init__(self, settings: Optional[HttpPoolSettings] = None):
+        self.settings = settings or HttpPoolSettings.from_env()
+        self.metrics = HttpMetricsRecorder()
+        self._lock = threading.Lock()
+        self._session: Optional[PooledSession] = None
+        self._httpx_client = None
+
+    def session(self) -> requests.Session:
+        """Return the shared requests session."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = PooledSession(self.settings, self.metrics)
+        return self._session
+
+    def httpx_client(self):
+        """Return the shared httpx client (imported lazily)."""
+        if self._httpx_client is None:
+            with self._lock:
+                if self._httpx_client is None:
+                    self._httpx_client = self._build_httpx_client()
+        return self._httpx_client
+
+    def _build_httpx_client(self):
+        import httpx
+
+        metrics = self.metrics
+
+        def _on_request(request):
+            request.extensions['ontextract_started'] = time.perf_counter()
+
+        def _on_response(response):
+            started = response.request.extensions.get('ontextract_started')
+            if started is not None:
+                metrics.record(response.request.url, (time.perf_counter() - started) * 1000,
+                               status=response.status_code)
+
+        limits = httpx.Limits(
+            max_connections=self.settings.pool_connections * self.settings.pool_maxsize,
+            max_keepalive_connections=self.settings.pool_maxsize,
+        )
+        # httpx only retries connection establishment, which is the safe subset
+        transport = httpx.HTTPTransport(retries=self.settings.retry_total, limits=limits)
+        return httpx.Client(
+            timeout=self.settings.timeout,
+            transport=transport,
+            headers={'User-Agent': DEFAULT_USER_AGENT},
+            event_hooks={'request': [_on_request], 'response': [_on_response]},
+        )
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host request counts, error counts and latency (ms)."""
+        return self.metrics.snapshot()
+
+    def close(self) -> None:
+        """Close pooled connections (used on shutdown and after fork)."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._httpx_client is not None:
+                self._httpx_client.close()
+                self._httpx_client = None
+
+
+# Global pool instance (singleton pattern)
+_global_http_pool: Optional[HttpClientPool] = None
+_global_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpClientPool:
+    """
+    Get the process-wide HTTP client pool.
+
+    Returns:
+        Singleton HttpClientPool instance
+    """
+    global _global_http_pool
+    if _global_http_pool is None:
+        with _global_http_pool_lock:
+            if _global_http_pool is None:
+                _global_http_pool = HttpClientPool()
+    return _global_http_pool
+
+
+def _reset_after_fork() -> None:
+    """Drop inherited sockets in forked children (Celery prefork, gunicorn)."""
+    global _global_http_pool, _global_http_pool_lock
+    _global_http_pool = None
+    _global_http_pool_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -3,5 +3,6 @@ LLM services and providers for text generation and processing.
 """
 
 from .base_service import BaseLLMService
+from .gateway import LLMGateway, LLMReplayMissError, LLMResponseStore, get_llm_gateway
 
-__all__ = ["BaseLLMService"]
+__all__ = ["BaseLLMService", "LLMGateway", "LLMReplayMissError", "LLMResponseStore", "get_llm_gateway"]
@@ -21,6 +21,8 @@ from abc import ABC, abstractmethod
 import requests
 import json
 
+from .gateway import get_llm_gateway
+
 logger = logging.getLogger(__name__)
 
 class BaseLLMProvider(ABC):
@@ -244,9 +246,7 @@ class BaseLLMService:
             if not provider_obj.is_available():
                 raise RuntimeError(f"Provider {provider} not available")
             
-            return provider_obj.generate_text(
-                prompt, max_tokens, temperature, **kwargs
-            )
+            return self._generate(provider_obj, prompt, max_tokens, temperature, **kwargs)
         
         # Try each provider in priority order
         for provider_name in self.provider_priority:
@@ -258,9 +258,7 @@ class BaseLLMService:
                 continue
             
             try:
-                result = provider_obj.generate_text(
-                    prompt, max_tokens, temperature, **kwargs
-                )
+                result = self._generate(provider_obj, prompt, max_tokens, temperature, **kwargs)
                 logger.debug(f"Generated text using {provider_name}")
                 return result
             except Exception as e:
@@ -270,6 +268,19 @@ class BaseLLMService:
         # All providers failed
         raise RuntimeError("All LLM providers failed or unavailable")
     
+    def _generate(self, provider_obj: BaseLLMProvider, prompt: str,
+                  max_tokens: int, temperature: float, **kwargs) -> str:
+        """Call a provider through the LLM gateway (response cache / replay)."""
+        return get_llm_gateway().complete(
+            provider=provider_obj.provider_name,
+            model=getattr(provider_obj, 'model', None),
+            messages=[{"role": "user", "content": prompt}],
+            call=lambda: provider_obj.generate_text(prompt, max_tokens, temperature, **kwargs),
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+    
     def get_provider_status(self) -> Dict[str, bool]:
         """
         Get status of all configured providers.
@@ -0,0 +1,224 @@
+"""
+Provider-agnostic LLM gateway with a content-addressed response cache.
+
+Call sites keep their own client code and hand the gateway a description of
+the request plus a callable that performs it live::
+
+    text = get_llm_gateway().complete(
+        provider='anthropic', model=model, messages=[{'role': 'user', 'content': prompt}],
+        max_tokens=800, temperature=0.2,
+        call=lambda: client.messages.create(...).content[0].text,
+    )
+
+Responses are stored as JSON files named by the SHA-256 of the normalized
+(provider, model, system, messages, params) request, so identical prompts
+share one entry across runs, processes and machines.
+
+Modes (``LLM_CACHE_MODE``):
+
+    off      call the provider every time (default)
+    auto     serve cached responses, call and record on a miss
+    record   always call the provider and (re)record the response
+    replay   serve cached responses only; a miss raises LLMReplayMissError
+
+``LLM_CACHE_DIR`` sets the fixture directory (default ./llm_cache). The same
+directory can be served over HTTP by ``replay_server`` for clients that
+cannot be wrapped.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from shared_services.metrics import observe_llm, span
+
+logger = logging.getLogger(__name__)
+
+MODES = ('off', 'auto', 'record', 'replay')
+
+# Request parameters that change the response; anything else is not keyed
+KEY_PARAMS = ('max_tokens', 'temperature', 'top_p', 'top_k', 'stop', 'stop_sequences')
+
+_PROVIDER_ALIASES = {'claude': 'anthropic', 'gpt': 'openai'}
+
+
+class LLMReplayMissError(RuntimeError):
+    """Raised in replay mode when no recorded response matches a request."""
+
+
+def normalize_provider(provider: str) -> str:
+    provider = (provider or '').lower()
+    return _PROVIDER_ALIASES.get(provider, provider)
+
+
+def _text(content: Any) -> str:
+    # Anthropic/OpenAI content may be a string or a list of typed blocks
+    if isinstance(content, list):
+        return ''.join(
+            block.get('text', '') if isinstance(block, dict) else str(block) for block in content
+        )
+    return '' if content is None else str(content)
+
+
+def normalize_request(provider: str, model: str, messages: List[Dict[str, Any]],
+                      system: Any = None, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Canonical form of a request, shared by the gateway and the replay server."""
+    return {
+        'provider': normalize_provider(provider),
+        'model': model,
+        'system': _text(system) or None,
+        'messages': [
+            {'role': message.get('role'), 'content': _text(message.get('content'))}
+            for message in messages
+        ],
+        'params': {
+            key: value for key, value in sorted((params or {}).items())
+            if key in KEY_PARAMS and value is not None
+        },
+    }
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    payload = json.dumps(request, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseStore:
+    """Directory of recorded responses, one JSON file per request key."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, request: Dict[str, Any], text: str) -> None:
+        path = self._path(key)
+        entry = {
+            'key': key,
+            'request': request,
+            'response': {'text': text},
+            'recorded_at': datetime.utcnow().isoformat(),
+        }
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not record LLM response {key}: {e}")
+
+
+class LLMGateway:
+    """Route LLM calls through the response cache according to the mode."""
+
+    def __init__(self, store: Optional[LLMResponseStore] = None, mode: str = 'off'):
+        if mode not in MODES:
+            raise ValueError(f"Unknown LLM cache mode '{mode}' (expected one of {', '.join(MODES)})")
+        self.store = store
+        self.mode = mode if store is not None else 'off'
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'recorded': 0, 'live_calls': 0}
+
+    def complete(self, provider: str, model: str, messages: List[Dict[str, Any]],
+                 call: Callable[[], str], system: Any = None, **params) -> str:
+        """
+        Return the response text for a request, calling the provider if needed.
+
+        Args:
+            provider: 'anthropic' / 'openai' (aliases 'claude' / 'gpt' accepted)
+            model: Model identifier sent to the provider
+            messages: Chat messages (role/content)
+            call: Zero-argument callable performing the live request, returning text
+            system: System prompt, if sent separately from the messages
+            **params: Sampling parameters (max_tokens, temperature, ...)
+
+        Raises:
+            LLMReplayMissError: In replay mode when nothing was recorded
+        """
+        with span('llm.complete', provider=provider, model=model), \
+                observe_llm(normalize_provider(provider), model) as source:
+            request, key, cached = self._lookup(provider, model, messages, system, params)
+            if cached is not None:
+                source['value'] = 'cache'
+                return cached
+            return self._record(request, key, call())
+
+    async def acomplete(self, provider: str, model: str, messages: List[Dict[str, Any]],
+                        call: Callable[[], Awaitable[str]], system: Any = None, **params) -> str:
+        """Async variant of ``complete`` for coroutine-based clients."""
+        with span('llm.complete', provider=provider, model=model), \
+                observe_llm(normalize_provider(provider), model) as source:
+            request, key, cached = self._lookup(provider, model, messages, system, params)
+            if cached is not None:
+                source['value'] = 'cache'
+                return cached
+            return self._record(request, key, await call())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, mode=self.mode)
+
+    def _lookup(self, provider, model, messages, system, params):
+        if self.mode == 'off':
+            self._count('live_calls')
+            return None, None, None
+        request = normalize_request(provider, model, messages, system, params)
+        key = request_key(request)
+        if self.mode in ('auto', 'replay'):
+            entry = self.store.get(key)
+            if entry is not None:
+                self._count('hits')
+                return request, key, entry['response']['text']
+            self._count('misses')
+            if self.mode == 'replay':
+                raise LLMReplayMissError(
+                    f"No recorded {request['provider']} response for model {model} (key {key[:12]})"
+                )
+        self._count('live_calls')
+        return request, key, None
+
+    def _record(self, request, key, text):
+        if key is not None and isinstance(text, str):
+            self.store.put(key, request, text)
+            self._count('recorded')
+        return text
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+# Global gateway instance (singleton pattern)
+_global_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """
+    Get the process-wide LLM gateway configured from the environment.
+
+    Returns:
+        Singleton LLMGateway instance
+    """
+    global _global_gateway
+    if _global_gateway is None:
+        mode = os.environ.get('LLM_CACHE_MODE', 'off').strip().lower() or 'off'
+        directory = os.environ.get('LLM_CACHE_DIR') or os.path.join(os.getcwd(), 'llm_cache')
+        _global_gateway = LLMGateway(LLMResponseStore(directory), mode)
+    return _global_gateway
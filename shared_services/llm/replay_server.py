@@ -0,0 +1,150 @@
+"""
+Local stand-in LLM server answering from recorded gateway fixtures.
+
+Speaks enough of the Anthropic Messages API (``POST /v1/messages``) and the
+OpenAI Chat Completions API (``POST /v1/chat/completions``) for the SDKs and
+the legacy HTTP providers. Requests are keyed exactly like ``LLMGateway``,
+so responses recorded with ``LLM_CACHE_MODE=record`` or ``auto`` are served
+back byte for byte; unknown requests get a 404 error in the provider's format.
+
+Point clients at it with e.g.::
+
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765          # anthropic SDK / LangChain
+    ANTHROPIC_API_BASE=http://127.0.0.1:8765/v1       # BaseLLMService providers
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1          # openai SDK
+    OPENAI_API_BASE=http://127.0.0.1:8765/v1
+
+Run with::
+
+    python -m shared_services.llm.replay_server --fixtures llm_cache --port 8765
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+
+from .gateway import KEY_PARAMS, LLMResponseStore, normalize_request, request_key
+
+logger = logging.getLogger(__name__)
+
+
+def anthropic_request(body: Dict[str, Any]) -> Dict[str, Any]:
+    params = {key: body.get(key) for key in KEY_PARAMS if key in body}
+    return normalize_request('anthropic', body.get('model'), body.get('messages') or [],
+                             body.get('system'), params)
+
+
+def openai_request(body: Dict[str, Any]) -> Dict[str, Any]:
+    params = {key: body.get(key) for key in KEY_PARAMS if key in body}
+    if 'max_completion_tokens' in body and 'max_tokens' not in params:
+        params['max_tokens'] = body['max_completion_tokens']
+    return normalize_request('openai', body.get('model'), body.get('messages') or [], None, params)
+
+
+def anthropic_response(key: str, model: str, text: str) -> Dict[str, Any]:
+    return {
+        'id': f"msg_replay_{key[:24]}",
+        'type': 'message',
+        'role': 'assistant',
+        'model': model,
+        'content': [{'type': 'text', 'text': text}],
+        'stop_reason': 'end_turn',
+        'stop_sequence': None,
+        'usage': {'input_tokens': 0, 'output_tokens': 0},
+    }
+
+
+def openai_response(key: str, model: str, text: str) -> Dict[str, Any]:
+    return {
+        'id': f"chatcmpl-replay-{key[:24]}",
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': model,
+        'choices': [{
+            'index': 0,
+            'message': {'role': 'assistant', 'content': text},
+            'finish_reason': 'stop',
+        }],
+        'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+    }
+
+
+ROUTES = {
+    '/v1/messages': (anthropic_request, anthropic_response),
+    '/v1/chat/completions': (openai_request, openai_response),
+}
+
+
+def replay(store: LLMResponseStore, path: str, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Answer one API request from the store; returns (status, payload)."""
+    route = ROUTES.get(path.split('?', 1)[0].rstrip('/'))
+    if route is None:
+        return 404, {'error': {'type': 'not_found_error', 'message': f"Unsupported endpoint {path}"}}
+    build_request, build_response = route
+    request = build_request(body)
+    key = request_key(request)
+    entry = store.get(key)
+    if entry is None:
+        message = f"No recorded response for {request['provider']} model {request['model']} (key {key[:12]})"
+        if build_response is anthropic_response:
+            return 404, {'type': 'error', 'error': {'type': 'not_found_error', 'message': message}}
+        return 404, {'error': {'type': 'not_found_error', 'message': message, 'code': 'replay_miss'}}
+    return 200, build_response(key, request['model'], entry['response']['text'])
+
+
+def make_server(fixtures_dir: str, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+    """Create (but do not start) a replay server over a fixture directory."""
+    store = LLMResponseStore(fixtures_dir)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                body = json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                self._send(400, {'error': {'type': 'invalid_request_error', 'message': 'Invalid JSON body'}})
+                return
+            if body.get('stream'):
+                self._send(400, {'error': {'type': 'invalid_request_error',
+                                           'message': 'Streaming is not supported by the replay server'}})
+                return
+            self._send(*replay(store, self.path, body))
+
+        def _send(self, status: int, payload: Dict[str, Any]):
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            logger.debug("replay-server: " + format, *args)
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded LLM responses over HTTP")
+    parser.add_argument('--fixtures', default=os.environ.get('LLM_CACHE_DIR', 'llm_cache'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = make_server(args.fixtures, args.host, args.port)
+    logger.info(f"Replaying LLM responses from {args.fixtures} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
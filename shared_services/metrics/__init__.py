@@ -0,0 +1,49 @@
+"""
+Prometheus metrics and optional OpenTelemetry tracing.
+"""
+
+from .collectors import (
+    CeleryQueueDepthCollector,
+    begin_query_stats,
+    end_query_stats,
+    install_sqlalchemy_metrics,
+    observe_llm,
+    observe_oed,
+    record_embedding,
+    record_embedding_error,
+    record_embedding_memo,
+    record_external_request,
+    record_http_request,
+    record_tool,
+    register_collector,
+    registered_collectors,
+    render_latest,
+    timed_stage,
+)
+from .celery_signals import install_celery_metrics
+from .tracing import ActiveSpan, configure_tracing, inject_context, propagation_fields, span
+
+__all__ = [
+    "ActiveSpan",
+    "CeleryQueueDepthCollector",
+    "begin_query_stats",
+    "configure_tracing",
+    "end_query_stats",
+    "inject_context",
+    "install_celery_metrics",
+    "install_sqlalchemy_metrics",
+    "observe_llm",
+    "observe_oed",
+    "propagation_fields",
+    "record_embedding",
+    "record_embedding_error",
+    "record_embedding_memo",
+    "record_external_request",
+    "record_http_request",
+    "record_tool",
+    "register_collector",
+    "registered_collectors",
+    "render_latest",
+    "span",
+    "timed_stage",
+]
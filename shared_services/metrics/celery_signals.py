@@ -0,0 +1,105 @@
+"""
+Celery signal handlers: task timing, per-task database statements and trace
+context carried from the publishing web request to the task.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from .collectors import (
+    CELERY_TASK_DURATION,
+    begin_query_stats,
+    end_query_stats,
+    exposition_registry,
+    install_sqlalchemy_metrics,
+    multiprocess_enabled,
+)
+from .tracing import ActiveSpan, inject_context, propagation_fields
+
+logger = logging.getLogger(__name__)
+
+_installed = False
+_install_lock = threading.Lock()
+_running: Dict[str, Dict[str, Any]] = {}
+
+
+def _request_carrier(request) -> Dict[str, Any]:
+    # Custom message headers surface as request attributes (or under .headers)
+    nested = getattr(request, 'headers', None) or {}
+    return {
+        field: getattr(request, field, None) or nested.get(field)
+        for field in propagation_fields()
+    }
+
+
+def _before_publish(sender=None, headers=None, **kwargs):
+    if headers is not None:
+        inject_context(headers)
+
+
+def _prerun(task_id=None, task=None, **kwargs):
+    _running[task_id] = {
+        'started': time.perf_counter(),
+        'queries': begin_query_stats(),
+        'span': ActiveSpan(f'celery.task {task.name}', _request_carrier(task.request), kind='CONSUMER',
+                           task_id=task_id, task=task.name),
+    }
+
+
+def _postrun(task_id=None, task=None, state=None, **kwargs):
+    running = _running.pop(task_id, None)
+    if running is None:
+        return
+    CELERY_TASK_DURATION.labels(task.name, state or 'UNKNOWN').observe(time.perf_counter() - running['started'])
+    end_query_stats(running['queries'], 'task', task.name)
+    running['span'].set_attribute('celery.state', state)
+    running['span'].end()
+
+
+def _failure(task_id=None, exception=None, **kwargs):
+    running = _running.get(task_id)
+    if running is not None and exception is not None:
+        running['span'].set_attribute('error.type', type(exception).__name__)
+
+
+def _start_exporter(sender=None, **kwargs):
+    port = os.environ.get('CELERY_METRICS_PORT')
+    if not port:
+        return
+    from prometheus_client import start_http_server
+
+    start_http_server(int(port), registry=exposition_registry())
+    logger.info(f"Celery metrics exposed on :{port}/metrics")
+
+
+def _child_exit(pid=None, **kwargs):
+    if multiprocess_enabled():
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def install_celery_metrics() -> None:
+    """
+    Connect the handlers (idempotent).
+
+    Workers serve ``/metrics`` on ``CELERY_METRICS_PORT`` when it is set; with
+    the prefork pool also set ``PROMETHEUS_MULTIPROC_DIR`` so the main
+    process reports its children's samples.
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        from celery import signals
+
+        install_sqlalchemy_metrics()
+        signals.before_task_publish.connect(_before_publish, weak=False)
+        signals.task_prerun.connect(_prerun, weak=False)
+        signals.task_postrun.connect(_postrun, weak=False)
+        signals.task_failure.connect(_failure, weak=False)
+        signals.worker_ready.connect(_start_exporter, weak=False)
+        signals.worker_process_shutdown.connect(_child_exit, weak=False)
+        _installed = True
@@ -0,0 +1,384 @@
+"""
+Prometheus metrics for processing tools, embeddings, external calls, the
+database and Celery.
+
+Metrics live in the default ``prometheus_client`` registry and are exposed
+by the web app at ``/metrics`` and, for Celery workers, on
+``CELERY_METRICS_PORT``. Nothing is pushed anywhere; a local Prometheus (or
+``curl``) scrapes them.
+
+Processes forked by a prefork server (Celery ``--pool=prefork``, gunicorn
+workers) each hold their own counters. Set ``PROMETHEUS_MULTIPROC_DIR`` to an
+empty, writable directory before the process starts to aggregate them; the
+exposition then reads every process' samples from that directory.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000)
+
+TOOL_DURATION = Histogram(
+    'ontextract_tool_duration_seconds', 'Processing tool execution time',
+    ['tool', 'status'], buckets=LATENCY_BUCKETS,
+)
+TOOL_ERRORS = Counter(
+    'ontextract_tool_errors_total', 'Processing tool executions that did not succeed', ['tool'],
+)
+STAGE_DURATION = Histogram(
+    'ontextract_orchestration_stage_duration_seconds', 'Orchestration stage (graph node) time',
+    ['stage', 'outcome'], buckets=LATENCY_BUCKETS,
+)
+EMBEDDING_DURATION = Histogram(
+    'ontextract_embedding_duration_seconds', 'Embedding generation time per call',
+    ['method', 'model'], buckets=LATENCY_BUCKETS,
+)
+EMBEDDING_TEXTS = Counter(
+    'ontextract_embedding_texts_total', 'Texts embedded', ['method', 'model'],
+)
+EMBEDDING_CHARACTERS = Counter(
+    'ontextract_embedding_characters_total', 'Characters embedded', ['method', 'model'],
+)
+EMBEDDING_ERRORS = Counter(
+    'ontextract_embedding_errors_total', 'Failed embedding calls', ['method'],
+)
+EMBEDDING_MEMO_LOOKUPS = Counter(
+    'ontextract_embedding_memo_lookups_total', 'Texts looked up in the embedding memo',
+    ['model', 'outcome'],
+)
+EXTERNAL_DURATION = Histogram(
+    'ontextract_external_request_duration_seconds', 'Outbound HTTP request time',
+    ['host', 'status'], buckets=LATENCY_BUCKETS,
+)
+EXTERNAL_ERRORS = Counter(
+    'ontextract_external_request_errors_total', 'Outbound HTTP requests that failed or returned >= 400',
+    ['host', 'error'],
+)
+LLM_DURATION = Histogram(
+    'ontextract_llm_request_duration_seconds', 'LLM completion time through the gateway',
+    ['provider', 'model', 'source'], buckets=LATENCY_BUCKETS,
+)
+LLM_ERRORS = Counter(
+    'ontextract_llm_errors_total', 'LLM completions that raised', ['provider', 'model', 'error'],
+)
+OED_DURATION = Histogram(
+    'ontextract_oed_operation_duration_seconds', 'OED lookups and entry parsing',
+    ['operation', 'outcome'], buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUEST_DURATION = Histogram(
+    'ontextract_http_request_duration_seconds', 'Web request time',
+    ['endpoint', 'method', 'status'], buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram(
+    'ontextract_db_query_duration_seconds', 'Database statement time', ['operation'],
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERIES_PER_UNIT = Histogram(
+    'ontextract_db_queries_per_unit', 'Database statements per web request or Celery task',
+    ['kind', 'name'], buckets=QUERY_COUNT_BUCKETS,
+)
+DB_TIME_PER_UNIT = Histogram(
+    'ontextract_db_seconds_per_unit', 'Database time per web request or Celery task',
+    ['kind', 'name'], buckets=LATENCY_BUCKETS,
+)
+CELERY_TASK_DURATION = Histogram(
+    'ontextract_celery_task_duration_seconds', 'Celery task run time', ['task', 'state'],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def _status_label(status) -> str:
+    return str(status) if status is not None else 'none'
+
+
+# --- Recording helpers ----------------------------------------------------------
+
+def record_tool(tool: str, seconds: float, status: str) -> None:
+    TOOL_DURATION.labels(tool, status).observe(seconds)
+    if status != 'success':
+        TOOL_ERRORS.labels(tool).inc()
+
+
+def record_http_request(endpoint: str, method: str, status: int, seconds: float) -> None:
+    HTTP_REQUEST_DURATION.labels(endpoint, method, str(status)).observe(seconds)
+
+
+def record_embedding(method: str, model: str, seconds: float, texts: int = 1, characters: int = 0) -> None:
+    EMBEDDING_DURATION.labels(method, model).observe(seconds)
+    EMBEDDING_TEXTS.labels(method, model).inc(texts)
+    if characters:
+        EMBEDDING_CHARACTERS.labels(method, model).inc(characters)
+
+
+def record_embedding_error(method: str) -> None:
+    EMBEDDING_ERRORS.labels(method).inc()
+
+
+def record_embedding_memo(model: str, hits: int, misses: int) -> None:
+    if hits:
+        EMBEDDING_MEMO_LOOKUPS.labels(model, 'hit').inc(hits)
+    if misses:
+        EMBEDDING_MEMO_LOOKUPS.labels(model, 'miss').inc(misses)
+
+
+def record_external_request(host: str, seconds: float, status: Optional[int] = None,
+                            error: Optional[BaseException] = None) -> None:
+    label = 'error' if error is not None else _status_label(status)
+    EXTERNAL_DURATION.labels(host, label).observe(seconds)
+    if error is not None:
+        EXTERNAL_ERRORS.labels(host, type(error).__name__).inc()
+    elif status is not None and status >= 400:
+        EXTERNAL_ERRORS.labels(host, f'http_{status}').inc()
+
+
+@contextmanager
+def observe_llm(provider: str, model: str):
+    """Time an LLM completion; the body sets ``source['value']`` to 'cache' on a hit."""
+    source = {'value': 'live'}
+    started = time.perf_counter()
+    try:
+        yield source
+    except Exception as exc:
+        LLM_ERRORS.labels(provider, model or 'unknown', type(exc).__name__).inc()
+        raise
+    finally:
+        LLM_DURATION.labels(provider, model or 'unknown', source['value']).observe(time.perf_counter() - started)
+
+
+@contextmanager
+def observe_oed(operation: str):
+    """Time an OED operation; the body may set ``outcome['value']``."""
+    outcome = {'value': 'success'}
+    started = time.perf_counter()
+    try:
+        yield outcome
+    except Exception:
+        outcome['value'] = 'exception'
+        raise
+    finally:
+        OED_DURATION.labels(operation, outcome['value']).observe(time.perf_counter() - started)
+
+
+def timed_stage(stage: str):
+    """Decorator timing an orchestration node (sync or async) inside a span."""
+    def decorator(func):
+        import asyncio
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                outcome = 'exception'
+                try:
+                    with span(f'orchestration.{stage}'):
+                        result = await func(*args, **kwargs)
+                    outcome = 'success'
+                    return result
+                finally:
+                    STAGE_DURATION.labels(stage, outcome).observe(time.perf_counter() - started)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = 'exception'
+            try:
+                with span(f'orchestration.{stage}'):
+                    result = func(*args, **kwargs)
+                outcome = 'success'
+                return result
+            finally:
+                STAGE_DURATION.labels(stage, outcome).observe(time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+# --- Database statements ----------------------------------------------------------
+
+class QueryStats:
+    """Statement count and time accumulated for one request or task."""
+
+    __slots__ = ('count', 'seconds')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+_current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar('ontextract_query_stats', default=None)
+_sqlalchemy_installed = False
+_install_lock = threading.Lock()
+
+
+def begin_query_stats():
+    """Start counting statements for the current unit of work; returns a reset token."""
+    return _current_query_stats.set(QueryStats())
+
+
+def end_query_stats(token, kind: str, name: str) -> Optional[QueryStats]:
+    """Stop counting, record the totals under ``kind``/``name`` and return them."""
+    stats = _current_query_stats.get()
+    _current_query_stats.reset(token)
+    if stats is not None:
+        DB_QUERIES_PER_UNIT.labels(kind, name).observe(stats.count)
+        DB_TIME_PER_UNIT.labels(kind, name).observe(stats.seconds)
+    return stats
+
+
+def _statement_operation(statement: str) -> str:
+    word = statement.lstrip().split(None, 1)[0].upper() if statement and statement.strip() else ''
+    return word if word in ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH') else 'OTHER'
+
+
+def install_sqlalchemy_metrics() -> None:
+    """Time every statement on every engine (idempotent)."""
+    global _sqlalchemy_installed
+    with _install_lock:
+        if _sqlalchemy_installed:
+            return
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        @event.listens_for(Engine, 'before_cursor_execute')
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault('ontextract_query_started', []).append(time.perf_counter())
+
+        @event.listens_for(Engine, 'after_cursor_execute')
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info.get('ontextract_query_started')
+            if not started:
+                return
+            elapsed = time.perf_counter() - started.pop()
+            DB_QUERY_DURATION.labels(_statement_operation(statement)).observe(elapsed)
+            stats = _current_query_stats.get()
+            if stats is not None:
+                stats.count += 1
+                stats.seconds += elapsed
+
+        @event.listens_for(Engine, 'handle_error')
+        def _error(exception_context):
+            conn = exception_context.connection
+            if conn is not None and conn.info.get('ontextract_query_started'):
+                conn.info['ontextract_query_started'].pop()
+
+        _sqlalchemy_installed = True
+
+
+# --- Celery queue depth -----------------------------------------------------------
+
+class CeleryQueueDepthCollector:
+    """
+    Report pending messages per Celery queue at scrape time.
+
+    Reads list lengths straight from the Redis broker with a short timeout;
+    when the broker is unreachable the gauge is omitted and
+    ``ontextract_celery_broker_up`` is 0.
+    """
+
+    def __init__(self, broker_url: str, queues: Sequence[str] = ('celery',), timeout: float = 0.5):
+        self.broker_url = broker_url
+        self.queues = tuple(queues)
+        self.timeout = timeout
+        self._client = None
+
+    def _redis(self):
+        if self._client is None:
+            import redis
+            self._client = redis.from_url(
+                self.broker_url, socket_timeout=self.timeout, socket_connect_timeout=self.timeout
+            )
+        return self._client
+
+    def describe(self):
+        return []
+
+    def collect(self):
+        up = GaugeMetricFamily('ontextract_celery_broker_up', 'Whether the Celery broker answered the scrape')
+        depth = GaugeMetricFamily('ontextract_celery_queue_depth', 'Messages waiting in a Celery queue',
+                                  labels=['queue'])
+        try:
+            client = self._redis()
+            with client.pipeline() as pipe:
+                for queue in self.queues:
+                    pipe.llen(queue)
+                lengths = pipe.execute()
+        except Exception as exc:
+            logger.debug(f"Celery queue depth unavailable: {exc}")
+            up.add_metric([], 0)
+            yield up
+            return
+        up.add_metric([], 1)
+        for queue, length in zip(self.queues, lengths):
+            depth.add_metric([queue], length)
+        yield up
+        yield depth
+
+
+# --- Exposition -------------------------------------------------------------------
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+
+def exposition_registry(extra_collectors: Iterable = ()) -> CollectorRegistry:
+    """
+    The registry to scrape: the process registry, or in multiprocess mode a
+    fresh one aggregating every process' samples.
+    """
+    if not multiprocess_enabled():
+        return REGISTRY
+    from prometheus_client import multiprocess
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    for collector in extra_collectors:
+        registry.register(collector)
+    return registry
+
+
+def render_latest(extra_collectors: Iterable = ()) -> Tuple[bytes, str]:
+    """Prometheus text exposition: (body, content type)."""
+    return generate_latest(exposition_registry(extra_collectors)), CONTENT_TYPE_LATEST
+
+
+_registered_collectors: Dict[str, object] = {}
+
+
+def register_collector(name: str, collector) -> object:
+    """
+    Register a scrape-time collector once per process under ``name``.
+
+    In multiprocess mode collectors are attached to each exposition
+    registry instead, so they are only kept here.
+    """
+    with _install_lock:
+        if name not in _registered_collectors:
+            if not multiprocess_enabled():
+                REGISTRY.register(collector)
+            _registered_collectors[name] = collector
+        return _registered_collectors[name]
+
+
+def registered_collectors():
+    return list(_registered_collectors.values())
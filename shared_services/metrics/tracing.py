@@ -0,0 +1,125 @@
+"""
+Optional OpenTelemetry spans linking web requests to the Celery tasks they
+enqueue.
+
+Only the OpenTelemetry API is used here; without it every helper is a
+no-op. With the API alone spans are not recorded but trace context still
+propagates. ``configure_tracing`` installs the SDK tracer provider when
+``opentelemetry-sdk`` is available, exporting to the log (``console``) by
+default so no collector is needed, or to OTLP when
+``opentelemetry-exporter-otlp`` is installed and ``exporter='otlp'``.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, MutableMapping, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover - depends on the environment
+    otel_context = propagate = trace = None
+
+TRACER_NAME = 'ontextract'
+
+_configured = False
+
+
+def tracing_available() -> bool:
+    return trace is not None
+
+
+def configure_tracing(service_name: str, exporter: str = 'console') -> bool:
+    """
+    Install an SDK tracer provider once per process; returns False when the
+    SDK is missing.
+
+    Args:
+        service_name: ``service.name`` resource attribute (e.g. 'ontextract-web')
+        exporter: 'console' (log spans), 'otlp' or 'none' (record, export nothing)
+    """
+    global _configured
+    if _configured:
+        return True
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    except ImportError:
+        logger.warning("opentelemetry-sdk not installed - tracing spans will not be recorded")
+        return False
+
+    provider = TracerProvider(resource=Resource.create({'service.name': service_name}))
+    if exporter == 'console':
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    elif exporter == 'otlp':
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning("opentelemetry-exporter-otlp not installed - spans will not be exported")
+        else:
+            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+    _configured = True
+    return True
+
+
+def _attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: value if isinstance(value, (str, bool, int, float)) else str(value)
+        for key, value in attributes.items() if value is not None
+    }
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Run the body in a child span of the current context (no-op without OpenTelemetry)."""
+    if trace is None:
+        yield None
+        return
+    with trace.get_tracer(TRACER_NAME).start_as_current_span(name, attributes=_attributes(attributes)) as current:
+        yield current
+
+
+def inject_context(carrier: MutableMapping[str, str]) -> MutableMapping[str, str]:
+    """Write the current trace context (``traceparent``...) into ``carrier``."""
+    if propagate is not None:
+        propagate.inject(carrier)
+    return carrier
+
+
+def propagation_fields():
+    return propagate.get_global_textmap().fields if propagate is not None else set()
+
+
+class ActiveSpan:
+    """A span started from an incoming carrier and ended explicitly (request/task hooks)."""
+
+    def __init__(self, name: str, carrier: Optional[Dict[str, Any]] = None, kind: str = 'SERVER',
+                 **attributes):
+        self._span = None
+        self._tokens = []
+        if trace is None:
+            return
+        parent = propagate.extract({k: v for k, v in (carrier or {}).items() if isinstance(v, str)})
+        self._span = trace.get_tracer(TRACER_NAME).start_span(
+            name, context=parent, kind=getattr(trace.SpanKind, kind), attributes=_attributes(attributes)
+        )
+        self._tokens.append(otel_context.attach(trace.set_span_in_context(self._span, parent)))
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self._span is not None and value is not None:
+            self._span.set_attributes(_attributes({key: value}))
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if self._span is None:
+            return
+        if error is not None:
+            self._span.record_exception(error)
+            self._span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+        self._span.end()
+        while self._tokens:
+            otel_context.detach(self._tokens.pop())
+        self._span = None
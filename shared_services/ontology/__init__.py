@@ -3,5 +3,6 @@ Ontology services for RDF/TTL processing and entity extraction.
 """
 
 from .entity_service import OntologyEntityService
+from .graph_cache import OntologyGraphCache, ParsedOntology, get_ontology_graph_cache
 
-__all__ = ["OntologyEntityService"]
+__all__ = ["OntologyEntityService", "OntologyGraphCache", "ParsedOntology", "get_ontology_graph_cache"]
@@ -14,6 +14,8 @@ import logging
 from typing import Dict, List, Any, Optional, Set, Tuple
 from abc import ABC, abstractmethod
 
+from .graph_cache import get_ontology_graph_cache
+
 logger = logging.getLogger(__name__)
 
 class BaseOntologyStore(ABC):
@@ -175,10 +177,9 @@ class OntologyEntityService:
         Returns:
             Dictionary containing entities organized by type
         """
-        # Parse the ontology content into a graph
-        g = Graph()
+        # Parse the ontology content into a graph (shared, read-only)
         try:
-            g.parse(data=content, format="turtle")
+            g = get_ontology_graph_cache().load_content(content, format="turtle", source=ontology_id).graph
             logger.info(f"Successfully parsed ontology {ontology_id} with {len(g)} triples")
         except Exception as e:
             logger.error(f"Error parsing ontology {ontology_id}: {e}")
@@ -501,8 +502,7 @@ class OntologyEntityService:
             content = self.ontology_store.get_ontology_content(ontology_id)
             
             # Try parsing
-            g = Graph()
-            g.parse(data=content, format="turtle")
+            g = get_ontology_graph_cache().load_content(content, format="turtle", source=ontology_id).graph
             
             # Basic validation
             triple_count = len(g)
@@ -0,0 +1,268 @@
+"""
+Process-wide cache of parsed rdflib ontology graphs.
+
+Parsing Turtle is by far the most expensive part of working with the
+ontologies (bfo.ttl alone is ~540 KB), and several services used to parse the
+same files on every request. This cache parses each distinct ontology once
+and keeps it:
+
+- in memory, shared by every service in the process
+- on disk as a pickled graph, keyed by the SHA-256 of the source bytes, so new
+  processes (Celery workers, app restarts) skip parsing entirely
+
+Each cached entry also carries precomputed class/label/subclass indexes so
+common lookups do not need SPARQL.
+
+Cached graphs are shared between callers and must be treated as read-only;
+copy a graph (``copy_graph``) before adding or removing triples.
+
+Unpickling runs code, so the disk tier lives under the project directory
+rather than the working directory, and entries are only loaded from a
+directory and files owned by the current user (or root) that other users
+cannot write.
+
+Configuration:
+
+    ONTOLOGY_GRAPH_CACHE_DIR   directory for pickled graphs
+                               (default: <project>/ontology_cache/parsed)
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+
+import rdflib
+from rdflib import Graph, OWL, RDF, RDFS
+
+logger = logging.getLogger(__name__)
+
+# Bump when ParsedOntology's pickled layout changes
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'ontology_cache', 'parsed',
+)
+
+
+def copy_graph(graph: Graph) -> Graph:
+    """Mutable copy of a (shared, read-only) cached graph."""
+    copy = Graph()
+    for prefix, namespace in graph.namespaces():
+        copy.bind(prefix, namespace, override=True)
+    copy += graph
+    return copy
+
+
+def _is_trusted(path: str) -> bool:
+    """Owned by this user (or root) and not writable by other users."""
+    if not hasattr(os, 'getuid'):
+        return True
+    info = os.stat(path)
+    return info.st_uid in (os.getuid(), 0) and not info.st_mode & 0o022
+
+
+@dataclass
+class ParsedOntology:
+    """A parsed graph plus lookup indexes built once at parse time."""
+
+    graph: Graph
+    content_hash: str
+    source: Optional[str] = None
+    classes: FrozenSet[str] = frozenset()
+    labels: Dict[str, List[str]] = field(default_factory=dict)
+    subclasses: Dict[str, List[str]] = field(default_factory=dict)
+    superclasses: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, graph: Graph, content_hash: str, source: Optional[str] = None) -> 'ParsedOntology':
+        labels: Dict[str, List[str]] = {}
+        for subject, label in graph.subject_objects(RDFS.label):
+            labels.setdefault(str(subject), []).append(str(label))
+
+        subclasses: Dict[str, List[str]] = {}
+        superclasses: Dict[str, List[str]] = {}
+        for child, parent in graph.subject_objects(RDFS.subClassOf):
+            subclasses.setdefault(str(parent), []).append(str(child))
+            superclasses.setdefault(str(child), []).append(str(parent))
+
+        return cls(
+            graph=graph,
+            content_hash=content_hash,
+            source=source,
+            classes=frozenset(str(s) for s in graph.subjects(RDF.type, OWL.Class)),
+            labels=labels,
+            subclasses=subclasses,
+            superclasses=superclasses,
+        )
+
+    def label(self, uri: str) -> Optional[str]:
+        """First rdfs:label of a resource, if any."""
+        values = self.labels.get(str(uri))
+        return values[0] if values else None
+
+    def direct_subclasses(self, uri: str, classes_only: bool = True) -> List[str]:
+        """Direct rdfs:subClassOf children of ``uri``."""
+        children = self.subclasses.get(str(uri), [])
+        if classes_only:
+            children = [child for child in children if child in self.classes]
+        return list(children)
+
+    def values(self, uri: str, predicate: Union[str, rdflib.URIRef]) -> List[str]:
+        """String values of ``predicate`` on ``uri``."""
+        return [str(o) for o in self.graph.objects(rdflib.URIRef(str(uri)), rdflib.URIRef(str(predicate)))]
+
+
+class OntologyGraphCache:
+    """
+    Memory + disk cache of parsed ontologies keyed by content hash.
+
+    Use :func:`get_ontology_graph_cache` rather than instantiating this
+    directly so all services share the same parsed graphs.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or os.environ.get('ONTOLOGY_GRAPH_CACHE_DIR') or DEFAULT_CACHE_DIR
+        self._memory: Dict[str, ParsedOntology] = {}
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'parses': 0}
+
+    def load_file(self, path: Union[str, os.PathLike], format: str = 'turtle') -> ParsedOntology:
+        """
+        Parse an ontology file, reusing any cached parse of identical bytes.
+
+        Args:
+            path: Path to the ontology file
+            format: rdflib parser format
+
+        Returns:
+            ParsedOntology for the file's current content
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        return self._load(data, format, source=str(path))
+
+    def load_content(self, content: Union[str, bytes], format: str = 'turtle',
+                     source: Optional[str] = None) -> ParsedOntology:
+        """
+        Parse ontology content held in memory (e.g. from a database store).
+
+        Args:
+            content: Serialized RDF
+            format: rdflib parser format
+            source: Optional description for logging
+
+        Returns:
+            ParsedOntology for the content
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        return self._load(data, format, source=source)
+
+    def invalidate(self, content_hash: Optional[str] = None) -> None:
+        """Drop one cached entry (by content hash) or everything."""
+        with self._lock:
+            if content_hash is None:
+                keys = list(self._memory)
+            else:
+                keys = [key for key in self._memory if key.startswith(content_hash)]
+            for key in keys:
+                self._memory.pop(key, None)
+                self._remove_disk_entry(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/parse counters and number of graphs held in memory."""
+        with self._lock:
+            return dict(self._stats, in_memory=len(self._memory), cache_dir=self.cache_dir)
+
+    def _load(self, data: bytes, format: str, source: Optional[str]) -> ParsedOntology:
+        content_hash = hashlib.sha256(data).hexdigest()
+        key = f"{content_hash}-{format}"
+
+        parsed = self._memory.get(key)
+        if parsed is not None:
+            with self._lock:
+                self._stats['memory_hits'] += 1
+            return parsed
+
+        # Parsing under the lock keeps concurrent first requests from parsing twice
+        with self._lock:
+            parsed = self._memory.get(key)
+            if parsed is not None:
+                self._stats['memory_hits'] += 1
+                return parsed
+
+            parsed = self._read_disk_entry(key)
+            if parsed is not None:
+                self._stats['disk_hits'] += 1
+            else:
+                graph = Graph()
+                graph.parse(data=data, format=format)
+                parsed = ParsedOntology.build(graph, content_hash, source)
+                self._stats['parses'] += 1
+                logger.info(f"Parsed ontology {source or content_hash[:12]}: {len(graph)} triples")
+                self._write_disk_entry(key, parsed)
+
+            self._memory[key] = parsed
+            return parsed
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(
+            self.cache_dir,
+            f"{key}-v{CACHE_FORMAT_VERSION}-rdflib{rdflib.__version__}.pickle",
+        )
+
+    def _read_disk_entry(self, key: str) -> Optional[ParsedOntology]:
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            if not (_is_trusted(self.cache_dir) and _is_trusted(path)):
+                logger.warning(f"Not loading ontology cache entry {path}: writable by other users")
+                return None
+            with open(path, 'rb') as f:
+                parsed = pickle.load(f)
+            if isinstance(parsed, ParsedOntology):
+                return parsed
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable ontology cache entry {path}: {e}")
+        self._remove_disk_entry(key)
+        return None
+
+    def _write_disk_entry(self, key: str, parsed: ParsedOntology) -> None:
+        try:
+            os.makedirs(self.cache_dir, mode=0o755, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._disk_path(key))
+        except Exception as e:
+            # The disk tier is an optimization; keep serving from memory
+            logger.warning(f"Could not write ontology cache entry for {key}: {e}")
+
+    def _remove_disk_entry(self, key: str) -> None:
+        try:
+            os.remove(self._disk_path(key))
+        except OSError:
+            pass
+
+
+# Global cache instance (singleton pattern)
+_global_graph_cache: Optional[OntologyGraphCache] = None
+
+
+def get_ontology_graph_cache() -> OntologyGraphCache:
+    """
+    Get the process-wide parsed ontology cache.
+
+    Returns:
+        Singleton OntologyGraphCache instance
+    """
+    global _global_graph_cache
+    if _global_graph_cache is None:
+        _global_graph_cache = OntologyGraphCache()
+    return _global_graph_cache
@@ -24,6 +24,8 @@ import rdflib
 from rdflib import Graph, Namespace, RDF, RDFS, OWL
 from rdflib.namespace import PROV, FOAF, DCTERMS, XSD
 
+from .graph_cache import get_ontology_graph_cache
+
 logger = logging.getLogger(__name__)
 
 # Try to import OntServe client
@@ -676,7 +678,12 @@ class OntologyImporter:
         return 'turtle'
     
     def _load_from_cache(self, ontology_id: str) -> Optional[Dict[str, Any]]:
-        """Load an ontology from cache."""
+        """
+        Load an ontology from cache.
+
+        The returned graph is shared through the parsed-graph cache and must
+        be treated as read-only (see ``graph_cache.copy_graph``).
+        """
         cache_file = os.path.join(self.cache_dir, f"{ontology_id}.ttl")
         metadata_file = os.path.join(self.cache_dir, f"{ontology_id}.json")
         
@@ -688,15 +695,17 @@ class OntologyImporter:
             with open(metadata_file, 'r') as f:
                 metadata = json.load(f)
             
-            # Load graph
-            g = Graph()
-            g.parse(cache_file, format='turtle')
+            # Load graph (parsed once per file content, shared across importers)
+            with open(cache_file, 'rb') as f:
+                data = f.read()
+            g = get_ontology_graph_cache().load_content(data, format='turtle', source=cache_file).graph
+            content = data.decode('utf-8')
             
             # Store in memory
             self.imported_ontologies[ontology_id] = {
                 'graph': g,
                 'metadata': metadata,
-                'content': g.serialize(format='turtle')
+                'content': content
             }
             
             return self.imported_ontologies[ontology_id]
@@ -716,6 +725,26 @@ class OntologyImporter:
         pass
 
 
+# Global importer instance (singleton pattern)
+_global_ontology_importer: Optional[OntologyImporter] = None
+
+
+def get_ontology_importer() -> OntologyImporter:
+    """
+    Get the process-wide ontology importer.
+
+    Sharing one importer keeps its loaded ontologies in memory between
+    requests instead of re-reading the cache directory each time.
+
+    Returns:
+        Singleton OntologyImporter instance
+    """
+    global _global_ontology_importer
+    if _global_ontology_importer is None:
+        _global_ontology_importer = OntologyImporter()
+    return _global_ontology_importer
+
+
 # Integration comment for proethica:
 """
 This ontology importer can be integrated into the proethica system by:
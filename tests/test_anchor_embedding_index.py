@@ -0,0 +1,127 @@
+"""Regression coverage for the cached context-anchor embedding matrix."""
+
+import numpy as np
+
+from app.services.anchor_embedding_index import AnchorEmbeddingIndex
+
+
+class Encoder:
+    """Deterministic two-dimensional embeddings: anchor ``n`` sits at angle ``n``."""
+
+    def __init__(self, model='test:angles'):
+        self.model = model
+        self.calls = []
+
+    def get_model_name(self):
+        return self.model
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [self.get_embedding(text) for text in texts]
+
+    @staticmethod
+    def get_embedding(text):
+        angle = np.radians(float(text.split()[-1]))
+        return [3 * np.cos(angle), 3 * np.sin(angle)]
+
+
+def _index(anchors):
+    return AnchorEmbeddingIndex(anchor_loader=lambda: list(anchors))
+
+
+def test_every_anchor_is_ranked_and_encoded_once_per_model():
+    anchors = [(f'anchor {n}', 1) for n in range(150)]
+    index = _index(anchors)
+    encoder = Encoder()
+
+    matches = index.top_k(encoder, encoder.get_embedding('query 120'), 3)
+    again = index.top_k(encoder, encoder.get_embedding('query 0'), 2, min_similarity=0.9)
+
+    assert [term for term, _, _ in matches] == ['anchor 120', 'anchor 119', 'anchor 121']
+    assert np.isclose(matches[0][2], 1.0)
+    assert [term for term, _, _ in again] == ['anchor 0', 'anchor 1']
+    assert len(encoder.calls) == 1 and len(encoder.calls[0]) == 150
+
+    other = Encoder('test:other-model')
+    index.top_k(other, other.get_embedding('query 1'), 1)
+    assert index.stats() == {'models': 2, 'anchors': 300, 'encoded': 300}
+
+
+def test_matrix_follows_added_and_removed_anchors():
+    anchors = [('anchor 10', 1), ('anchor 20', 5)]
+    index = _index(anchors)
+    encoder = Encoder()
+    index.top_k(encoder, encoder.get_embedding('query 15'), 5)
+
+    anchors.append(('anchor 14', 2))
+    anchors.remove(('anchor 20', 5))
+    matches = index.top_k(encoder, encoder.get_embedding('query 15'), 5)
+
+    assert [term for term, _, _ in matches] == ['anchor 14', 'anchor 10']
+    assert encoder.calls[-1] == ['anchor 14']
+    assert index.stats()['anchors'] == 2
+
+
+def test_ties_prefer_frequent_anchors_and_failures_are_retried():
+    anchors = [('rare 30', 1), ('common 30', 9), ('broken 0', 4)]
+    index = _index(anchors)
+    failing = {'broken 0'}
+
+    class Flaky(Encoder):
+        embed_documents = None
+
+        def get_embedding(self, text):
+            if text in failing:
+                raise RuntimeError('encoder unavailable')
+            return Encoder.get_embedding(text)
+
+    encoder = Flaky()
+    first = index.top_k(encoder, encoder.get_embedding('query 30'), 3)
+    failing.clear()
+    second = index.top_k(encoder, encoder.get_embedding('query 30'), 3)
+
+    assert [(term, frequency) for term, frequency, _ in first] == [('common 30', 9), ('rare 30', 1)]
+    assert [term for term, _, _ in second] == ['common 30', 'rare 30', 'broken 0']
+    assert index.stats()['encoded'] == 3
+
+
+def test_vectors_from_fallback_providers_are_not_cached(tmp_path):
+    from shared_services.embedding.embedding_service import EmbeddingService
+    from shared_services.embedding.memo_store import EmbeddingMemoStore
+
+    failing = {'anchor 45'}
+
+    class Provider:
+        model = None
+        model_name = 'angles'
+
+        def __init__(self, fail=()):
+            self.fail = fail
+            self.calls = []
+
+        def is_available(self):
+            return True
+
+        def get_embedding(self, text):
+            self.calls.append(text)
+            if text in self.fail:
+                raise RuntimeError('provider down')
+            return Encoder.get_embedding(text)
+
+    primary, backup = Provider(fail=failing), Provider()
+    backup.model = 'backup'
+    service = EmbeddingService.__new__(EmbeddingService)
+    service.provider_priority = ['local', 'openai']
+    service.providers = {'local': primary, 'openai': backup}
+    service.embedding_dimension = 2
+    service.memo_store = EmbeddingMemoStore(path='')
+    index = _index([('anchor 10', 1), ('anchor 45', 1)])
+
+    first = index.top_k(service, Encoder.get_embedding('query 45'), 2)
+    failing.clear()
+    second = index.top_k(service, Encoder.get_embedding('query 45'), 2)
+
+    assert backup.calls == ['anchor 45']
+    assert [term for term, _, _ in first] == ['anchor 10']
+    assert [term for term, _, _ in second] == ['anchor 45', 'anchor 10']
+    assert primary.calls == ['anchor 10', 'anchor 45', 'anchor 45']
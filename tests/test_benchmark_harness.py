@@ -0,0 +1,54 @@
+"""Tests for the benchmark corpus generator and result comparison."""
+
+from benchmarks.corpus import CorpusSpec, generate_corpus, segment_text, write_pdf
+from benchmarks.harness import Measurement, compare_results, measure
+
+SPEC = CorpusSpec(periods=(1850, 1950), documents_per_period=2, words_per_document=200)
+
+
+def test_corpus_is_deterministic_and_drifts():
+    first, second = generate_corpus(SPEC), generate_corpus(SPEC)
+
+    assert [d.content for d in first] == [d.content for d in second]
+    assert [d.sense for d in first] == ['legal', 'legal', 'intelligence', 'intelligence']
+    assert all(abs(d.year - d.period) <= 2 and 'agent' in d.content for d in first)
+    assert generate_corpus(CorpusSpec(periods=(1850,), documents_per_period=1, seed=1))[0].content != \
+        first[0].content
+    assert '\n\n'.join(segment_text(first[0].content, 3)) == first[0].content
+
+
+def test_generated_pdf_is_readable(tmp_path):
+    from app.utils.pdf_analyzer import PDFAnalyzer
+
+    document = generate_corpus(SPEC)[0]
+    path = write_pdf(str(tmp_path / 'paper.pdf'), document, pages=2,
+                     doi='10.5555/bench.1234', arxiv_id='2101.01234')
+
+    result = PDFAnalyzer().analyze(path)
+
+    assert result['doi'] == '10.5555/bench.1234'
+    assert result['arxiv_id'] == '2101.01234'
+    assert result['title'] == document.title
+
+
+def test_measure_and_compare():
+    calls = []
+    stats = measure(Measurement(run=calls.append, setup=lambda: 'fresh'), rounds=3, warmup=1)
+    assert calls == ['fresh'] * 4
+    assert stats['rounds'] == 3 and stats['min'] <= stats['median'] <= stats['max']
+
+    def run(medians):
+        return {'benchmarks': {
+            name: {'status': 'ok', 'median': value} if value else {'status': 'skipped'}
+            for name, value in medians.items()
+        }}
+
+    rows = compare_results(
+        run({'a': 1.0, 'b': 1.0, 'c': 1.0, 'd': None}),
+        run({'a': 1.05, 'b': 1.5, 'c': 0.5, 'd': 1.0}),
+        threshold=0.10,
+    )
+
+    assert {row['name']: row['verdict'] for row in rows} == {
+        'a': 'unchanged', 'b': 'regression', 'c': 'improvement', 'd': 'missing',
+    }
@@ -0,0 +1,145 @@
+"""Regression coverage for the chunked, resumable document purge."""
+
+from unittest.mock import MagicMock, patch
+
+from app.models import Document
+from app.models.document_purge_job import DocumentPurgeJob
+from app.models.processing_job import ProcessingJob
+from app.services.document_purge_service import (
+    DOCUMENT_PURGE_STEPS,
+    DocumentPurgeEngine,
+    DocumentPurgeService,
+)
+
+
+def _documents_with_files(db_session, test_user, tmp_path, count=5):
+    documents = []
+    for i in range(count):
+        path = tmp_path / f'doc{i}.txt'
+        path.write_text('content')
+        doc = Document(
+            title=f'Purge Document {i}',
+            content='content',
+            document_type='document',
+            content_type='text/plain',
+            status='completed',
+            user_id=test_user.id,
+            file_path=str(path),
+        )
+        db_session.add(doc)
+        documents.append(doc)
+    db_session.flush()
+    # A version chain must be detached before its documents can go
+    documents[1].source_document_id = documents[0].id
+    documents[1].parent_document_id = documents[0].id
+    db_session.commit()
+    return documents
+
+
+def _job(db_session, **kwargs):
+    kwargs.setdefault('batch_size', 2)
+    kwargs.setdefault('counts', {})
+    kwargs.setdefault('pending_files', [])
+    job = DocumentPurgeJob(**kwargs)
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+def test_purge_deletes_in_batches_and_unlinks_files(db_session, test_user, tmp_path):
+    documents = _documents_with_files(db_session, test_user, tmp_path)
+    db_session.add(ProcessingJob(job_type='embeddings', document_id=documents[2].id, user_id=test_user.id))
+    db_session.commit()
+
+    job = DocumentPurgeEngine().run(_job(db_session))
+
+    assert job.status == 'completed'
+    assert job.step_index == len(DOCUMENT_PURGE_STEPS)
+    assert job.counts['documents'] == 5
+    assert job.counts['detach_document_versions'] == 1
+    assert job.counts['processing_jobs'] == 1
+    assert job.files_deleted == 5
+    assert job.pending_files == []
+    assert Document.query.count() == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_resume_drains_pending_files_and_continues_from_cursor(db_session, test_user, tmp_path):
+    documents = _documents_with_files(db_session, test_user, tmp_path)
+    documents[1].source_document_id = documents[1].parent_document_id = None
+    db_session.commit()
+    ids = sorted(doc.id for doc in documents)
+    by_id = {doc.id: doc for doc in documents}
+    step_index = [step.name for step in DOCUMENT_PURGE_STEPS].index('documents')
+    # Interrupted after committing the first batch but before unlinking its files
+    first_file = by_id[ids[0]].file_path
+    db_session.delete(by_id[ids[0]])
+    db_session.commit()
+    job = _job(
+        db_session,
+        status='running',
+        step='documents',
+        step_index=step_index,
+        cursor=[ids[0]],
+        counts={'documents': 1},
+        pending_files=[first_file, str(tmp_path / 'already-gone.txt')],
+    )
+
+    job = DocumentPurgeEngine().run(job)
+
+    assert job.status == 'completed'
+    assert job.counts['documents'] == 5
+    assert job.files_deleted == 6
+    assert Document.query.count() == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_background_purge_returns_job_for_polling(app, admin_client, db_session, test_user, tmp_path):
+    _documents_with_files(db_session, test_user, tmp_path, count=2)
+    app.config['DOCUMENT_PURGE_BACKGROUND'] = True
+    try:
+        with patch('app.tasks.purge.run_document_purge_task.delay') as delay:
+            delay.return_value = MagicMock(id='task-1')
+            response = admin_client.post('/input/documents/delete-all')
+    finally:
+        app.config['DOCUMENT_PURGE_BACKGROUND'] = False
+
+    assert response.status_code == 202
+    data = response.get_json()
+    job_id = data['job']['id']
+    delay.assert_called_once_with(job_id)
+    assert Document.query.count() == 2
+
+    # Dispatching again resumes the same unfinished job
+    assert DocumentPurgeService.start_purge(None, app.logger, background=False)['job']['id'] == job_id
+
+    status = admin_client.get(data['status_url']).get_json()
+    assert status['job']['status'] == 'completed'
+    assert status['job']['counts']['documents'] == 2
+
+
+def test_self_referencing_jobs_and_segments_purge_one_row_per_batch(db_session, test_user, tmp_path):
+    from app.models.text_segment import TextSegment
+
+    document = _documents_with_files(db_session, test_user, tmp_path, count=2)[0]
+    parent_job = ProcessingJob(job_type='segmentation', document_id=document.id, user_id=test_user.id)
+    parent_segment = TextSegment(content='Parent', document_id=document.id)
+    db_session.add_all([parent_job, parent_segment])
+    db_session.flush()
+    db_session.add_all([
+        ProcessingJob(
+            job_type='embeddings', document_id=document.id, user_id=test_user.id,
+            parent_job_id=parent_job.id,
+        ),
+        TextSegment(content='Child', document_id=document.id, parent_segment_id=parent_segment.id),
+    ])
+    db_session.commit()
+
+    job = DocumentPurgeEngine().run(_job(db_session, batch_size=1))
+
+    assert job.status == 'completed'
+    assert job.counts['detach_processing_jobs'] == 1
+    assert job.counts['processing_jobs'] == 2
+    assert job.counts['detach_text_segments'] == 1
+    assert job.counts['text_segments'] == 2
+    assert Document.query.count() == 0
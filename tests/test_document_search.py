@@ -0,0 +1,101 @@
+"""Tests for the trigger-maintained full-text index and ranked search."""
+
+from sqlalchemy import text
+
+from app.models import Document, Experiment
+from app.services.document_search_service import DocumentSearchService
+
+
+def _document(db_session, user, title, content, document_type='document'):
+    document = Document(title=title, content=content, content_type='text', document_type=document_type,
+                        status='completed', user_id=user.id)
+    db_session.add(document)
+    db_session.commit()
+    return document
+
+
+def test_search_ranks_hits_with_snippets_and_offsets(db_session, test_user):
+    passing = _document(db_session, test_user, 'Notes', 'Some remarks on gravitation among other things.')
+    focused = _document(db_session, test_user, 'Gravitation', 'Gravitation explains tides. The law of gravitation.')
+    _document(db_session, test_user, 'Unrelated', 'Nothing to see here.')
+
+    hits = DocumentSearchService().search('gravitation')
+
+    assert [hit.document_id for hit in hits] == [focused.id, passing.id]
+    content = focused.content
+    assert hits[0].offsets and all(content[start:end].lower() == 'gravitation' for start, end in hits[0].offsets)
+    assert any('law of gravitation' in snippet for snippet in hits[0].snippets)
+
+
+def test_historical_spellings_match_modern_queries(db_session, test_user):
+    old = _document(db_session, test_user, 'Treatise', 'Of the ſcience of Musick, as the Antients shewed it.')
+    modern = _document(db_session, test_user, 'Essay', 'On music as the ancients showed it.')
+
+    service = DocumentSearchService()
+    assert set(service.matching_ids('music ancients')) == {old.id, modern.id}
+    hit = service.search('music', document_ids=[old.id])[0]
+    assert [old.content[start:end] for start, end in hit.offsets] == ['Musick']
+    assert set(service.matching_ids('musick')) == {old.id, modern.id}
+    assert service.matching_ids('science', document_ids=[old.id]) == [old.id]
+
+
+def test_search_vector_follows_content_updates(db_session, test_user):
+    document = _document(db_session, test_user, 'Draft', 'The first version mentions phlogiston.')
+    service = DocumentSearchService()
+    assert service.matching_ids('phlogiston', document_ids=[document.id]) == [document.id]
+
+    document.content = 'The revised version mentions oxygen instead.'
+    db_session.commit()
+
+    assert service.matching_ids('phlogiston', document_ids=[document.id]) == []
+    assert service.matching_ids('oxygen', document_ids=[document.id]) == [document.id]
+    config = db_session.execute(text('SELECT ontextract_search_config()::text')).scalar()
+    assert config == 'ontextract_historical'
+
+
+def test_search_restricts_to_experiment_references(db_session, test_user):
+    experiment = Experiment(name='Search Experiment', experiment_type='domain_comparison', user_id=test_user.id)
+    reference = _document(db_session, test_user, 'Dictionary', 'Agent: one who acts.', document_type='reference')
+    _document(db_session, test_user, 'Elsewhere', 'An agent elsewhere.', document_type='reference')
+    experiment.references.append(reference)
+    db_session.add(experiment)
+    db_session.commit()
+
+    hits = DocumentSearchService().search('agent', experiment_id=experiment.id, role='reference')
+
+    assert [hit.document_id for hit in hits] == [reference.id]
+
+
+def test_only_listed_ick_words_are_folded(db_session, test_user):
+    folded = db_session.execute(text(
+        "SELECT ontextract_normalize_historical('Musick, Publicks and Logick; homesick sidekick gimmick Warwick')"
+    )).scalar()
+
+    assert folded == 'Music, Publics and Logic; homesick sidekick gimmick Warwick'
+
+
+def test_stop_word_terms_fall_back_to_substring_matching(db_session, test_user):
+    from app.services.term_service import TermService
+
+    experiment = Experiment(name='Stop Words', experiment_type='domain_comparison', user_id=test_user.id)
+    reference = _document(db_session, test_user, 'Ontology', 'Notes\nBeing: that which is.\nMore notes',
+                          document_type='reference')
+    _document(db_session, test_user, 'Other', 'Nothing relevant.', document_type='reference')
+    experiment.references.append(reference)
+    db_session.add(experiment)
+    db_session.commit()
+
+    assert db_session.execute(text("SELECT ontextract_search_query(ontextract_search_config(), 'being')::text")).scalar() == ''
+    assert DocumentSearchService().matching_ids('being', experiment_id=experiment.id) == [reference.id]
+    definitions = TermService()._search_references_for_term(experiment, 'being', 'philosophy')
+    assert [d['source'] for d in definitions] == [reference.get_display_name()]
+    assert 'Being: that which is.' in definitions[0]['text']
+
+
+def test_content_past_the_indexed_prefix_is_still_matched(db_session, test_user):
+    from app.models.document_search import SEARCH_MAX_CHARS
+
+    indexed = _document(db_session, test_user, 'Short', 'Phlogiston theory.')
+    long = _document(db_session, test_user, 'Long', 'filler ' * (SEARCH_MAX_CHARS // 7 + 1) + 'phlogiston')
+
+    assert DocumentSearchService().matching_ids('phlogiston') == [indexed.id, long.id]
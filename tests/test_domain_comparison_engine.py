@@ -0,0 +1,180 @@
+"""Regression coverage for the vectorized domain-comparison engine."""
+
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services.experiment_domain_comparison import (
+    DomainComparisonCache,
+    DomainComparisonService,
+)
+
+
+class Encoder:
+    """Two-dimensional embeddings: a text sits at the angle of the number it ends with."""
+
+    def __init__(self, model='test:angles'):
+        self.model = model
+        self.calls = []
+
+    def get_model_name(self):
+        return self.model
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [self._vector(text) for text in texts]
+
+    @staticmethod
+    def _vector(text):
+        if 'broken' in text:
+            return [0.0, 0.0]
+        angles = [float(word) for word in text.split() if word.isdigit()]
+        return np.mean([[np.cos(np.radians(a)), np.sin(np.radians(a))] for a in angles], axis=0).tolist()
+
+
+class TextService:
+    def __init__(self, encoder=None):
+        self.enhanced_features_enabled = encoder is not None
+        self.enhanced = SimpleNamespace(enabled=True, embedding_service=encoder)
+        self.pairs = []
+
+    def calculate_similarity(self, text1, text2):
+        self.pairs.append((text1, text2))
+        return 0.25
+
+
+def _reference(id, journal, content):
+    return SimpleNamespace(
+        id=id, title=f'Reference {id}', content=content,
+        source_metadata={'journal': journal}, reference_subtype='article',
+    )
+
+
+def _experiment(references, **configuration):
+    configuration.setdefault('target_terms', ['agent'])
+    return SimpleNamespace(configuration=json.dumps(configuration), references=references)
+
+
+REFERENCES = [
+    _reference(1, 'Philosophy', 'An agent acts 0'),
+    _reference(2, 'Philosophy', 'An agent decides 90'),
+    _reference(3, 'Engineering', 'An agent runs 0'),
+    _reference(4, 'Law', 'An agent represents 180'),
+]
+
+
+def test_each_snippet_is_embedded_once_and_matrices_are_symmetric():
+    encoder = Encoder()
+    service = DomainComparisonService(cache=DomainComparisonCache())
+    experiment = _experiment(REFERENCES, target_terms=['agent', 'an'], similarity_aggregation='centroid')
+
+    results, _ = service.run(experiment, TextService(encoder))
+
+    assert len(encoder.calls) == 1 and len(encoder.calls[0]) == 4
+    matrix = results['similarity_matrices']['agent']
+    assert matrix['Engineering']['Philosophy'] == matrix['Philosophy']['Engineering']
+    assert matrix['Engineering']['Philosophy'] == pytest.approx(np.cos(np.radians(45)))
+    assert matrix['Engineering']['Law'] == pytest.approx(-1.0)
+    assert matrix['Law']['Law'] == 1.0
+    assert results['similarity_aggregation'] == 'centroid'
+    assert results['similarity_model'] == 'test:angles'
+
+
+def test_aggregations_differ_only_in_how_buckets_are_represented():
+    def run(aggregation):
+        service = DomainComparisonService(cache=DomainComparisonCache())
+        experiment = _experiment(REFERENCES, similarity_aggregation=aggregation)
+        return service.run(experiment, TextService(Encoder()))[0]['similarity_matrices']['agent']
+
+    concatenated, pairwise = run('concatenated'), run('mean_pairwise')
+
+    # The concatenated Philosophy text averages its angles to 45 degrees
+    assert concatenated['Engineering']['Philosophy'] == pytest.approx(np.cos(np.radians(45)))
+    # Mean of cos(0) and cos(90)
+    assert pairwise['Engineering']['Philosophy'] == pytest.approx(0.5)
+    assert run('unknown') == concatenated
+
+
+def test_results_are_cached_against_configuration_and_corpus():
+    encoder = Encoder()
+    service = DomainComparisonService(cache=DomainComparisonCache())
+    references = list(REFERENCES)
+
+    first, _ = service.run(_experiment(references), TextService(encoder))
+    first['similarity_matrices'].clear()
+    second, summary = service.run(_experiment(references), TextService(encoder))
+    assert len(encoder.calls) == 1
+    assert second['similarity_matrices']['agent']['Law']['Philosophy'] is not None
+    assert summary == 'Compared 1 terms across 3 groups using 4 references.'
+
+    service.run(_experiment(references, similarity_aggregation='centroid'), TextService(encoder))
+    references[3] = _reference(4, 'Law', 'An agent represents 170')
+    service.run(_experiment(references, similarity_aggregation='centroid'), TextService(encoder))
+    service.run(_experiment(references), TextService(Encoder('test:other-model')))
+    assert len(encoder.calls) == 3
+
+
+def test_buckets_without_embeddings_fall_back_to_word_overlap():
+    references = REFERENCES + [_reference(5, 'Medicine', 'An agent broken')]
+    text_service = TextService(Encoder())
+    service = DomainComparisonService(cache=DomainComparisonCache())
+    results, _ = service.run(_experiment(references), text_service)
+    service.run(_experiment(references), text_service)
+
+    matrix = results['similarity_matrices']['agent']
+    # Recomputed: the failed bucket's similarities are not cached
+    assert len(text_service.pairs) == 6
+    assert {matrix['Medicine'][name] for name in ('Engineering', 'Law', 'Philosophy')} == {0.25}
+    assert matrix['Engineering']['Law'] == pytest.approx(-1.0)
+
+    plain = TextService()
+    cache = DomainComparisonCache()
+    results, _ = DomainComparisonService(cache=cache).run(_experiment(REFERENCES), plain)
+    DomainComparisonService(cache=cache).run(_experiment(REFERENCES), plain)
+    assert len(plain.pairs) == 3
+    assert results['similarity_model'] is None
+
+
+def test_results_using_fallback_vectors_are_not_cached():
+    from shared_services.embedding.embedding_service import EmbeddingService
+    from shared_services.embedding.memo_store import EmbeddingMemoStore
+
+    failing = {'An agent represents 180'}
+
+    class Provider:
+        model = None
+        model_name = 'angles'
+
+        def __init__(self, fail=()):
+            self.fail = fail
+            self.calls = []
+
+        def is_available(self):
+            return True
+
+        def get_embedding(self, text):
+            self.calls.append(text)
+            if text in self.fail:
+                raise RuntimeError('provider down')
+            return Encoder._vector(text)
+
+    primary, backup = Provider(fail=failing), Provider()
+    backup.model = 'backup'
+    embedding_service = EmbeddingService.__new__(EmbeddingService)
+    embedding_service.provider_priority = ['local', 'openai']
+    embedding_service.providers = {'local': primary, 'openai': backup}
+    embedding_service.embedding_dimension = 2
+    embedding_service.memo_store = EmbeddingMemoStore(path='')
+    service = DomainComparisonService(cache=DomainComparisonCache())
+
+    text_service = TextService(embedding_service)
+    first, _ = service.run(_experiment(REFERENCES), text_service)
+    failing.clear()
+    second, _ = service.run(_experiment(REFERENCES), TextService(embedding_service))
+
+    assert backup.calls == ['An agent represents 180']
+    assert len(text_service.pairs) == 2
+    assert first['similarity_matrices']['agent']['Law']['Philosophy'] == 0.25
+    assert second['similarity_matrices']['agent']['Engineering']['Law'] == pytest.approx(-1.0)
@@ -0,0 +1,147 @@
+"""Regression coverage for the persistent embedding memo."""
+
+import sqlite3
+
+import numpy as np
+
+from shared_services.embedding.memo_store import EmbeddingMemoStore, MemoKey, text_hash
+
+KEY = MemoKey('local:test-model', 'rev-1', 'max_seq_length=256')
+
+
+class Encoder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0 / 3.0] for text in texts]
+
+
+def _store(tmp_path, **kwargs):
+    return EmbeddingMemoStore(path=str(tmp_path / 'memo.sqlite3'), **kwargs)
+
+
+def test_batch_is_looked_up_before_encoding(tmp_path):
+    store = _store(tmp_path)
+    encoder = Encoder()
+
+    first = store.embed(['alpha', 'beta', 'alpha'], KEY, encoder)
+    again = _store(tmp_path).embed(['  alpha ', 'beta', 'gamma'], KEY, encoder)
+
+    assert encoder.calls == [['alpha', 'beta'], ['gamma']]
+    assert first == [[5.0, 1.0 / 3.0], [4.0, 1.0 / 3.0], [5.0, 1.0 / 3.0]]
+    assert again[:2] == first[:2]
+    assert store.stats()['hit_rate'] == 0.0
+    assert text_hash('alpha  beta') == text_hash('alpha\nbeta')
+
+
+def test_new_revision_evicts_only_that_models_old_rows(tmp_path):
+    store = _store(tmp_path)
+    other = MemoKey('openai:other', 'api', 'api')
+    store.embed(['alpha'], KEY, Encoder())
+    store.embed(['alpha'], other, Encoder())
+
+    upgraded = KEY._replace(revision='rev-2')
+    encoder = Encoder()
+    fresh = _store(tmp_path)
+    fresh.embed(['alpha'], upgraded, encoder)
+
+    with sqlite3.connect(fresh.path) as conn:
+        rows = conn.execute('SELECT model, revision FROM embedding_memo ORDER BY model').fetchall()
+    assert encoder.calls == [['alpha']]
+    assert rows == [('local:test-model', 'rev-2'), ('openai:other', 'api')]
+    assert fresh.stats()['evicted'] == 1
+
+
+def test_failed_vectors_and_disabled_store_are_not_memoized(tmp_path):
+    store = _store(tmp_path, max_rows=2)
+    store.embed(['zero'], KEY, lambda texts: [[0.0, 0.0] for _ in texts])
+    store.embed(['a', 'bb', 'ccc'], KEY, Encoder())
+
+    hashes = [text_hash(text) for text in ('zero', 'a', 'bb', 'ccc')]
+    assert sorted(store.get_many(hashes, KEY)) == sorted(hashes[2:])
+
+    disabled = EmbeddingMemoStore(path='')
+    encoder = Encoder()
+    disabled.embed(['a'], KEY, encoder)
+    disabled.embed(['a'], KEY, encoder)
+    assert len(encoder.calls) == 2
+
+
+def test_embedding_service_memoizes_only_its_primary_provider(tmp_path):
+    from shared_services.embedding.embedding_service import EmbeddingService
+
+    class Provider:
+        model = None
+
+        def __init__(self, fail=()):
+            self.fail = set(fail)
+            self.calls = []
+
+        def is_available(self):
+            return True
+
+        def get_embedding(self, text):
+            self.calls.append(text)
+            if text in self.fail:
+                raise RuntimeError('provider down')
+            return [float(len(text)), 2.0]
+
+    local = Provider(fail={'flaky'})
+    local.model_name = 'test-local'
+    backup = Provider()
+    backup.model = 'backup-model'
+    service = EmbeddingService.__new__(EmbeddingService)
+    service.provider_priority = ['local', 'openai']
+    service.providers = {'local': local, 'openai': backup}
+    service.embedding_dimension = 2
+    service.memo_store = _store(tmp_path)
+
+    assert service.embed_documents(['steady', 'flaky', '']) == [[6.0, 2.0], [5.0, 2.0], [0.0, 0.0]]
+    assert service.get_embedding('steady') == [6.0, 2.0]
+    service.get_embedding('flaky')
+
+    assert local.calls == ['steady', 'flaky', 'flaky']
+    assert backup.calls == ['flaky', 'flaky']
+
+
+def test_experiment_rerun_encodes_nothing(tmp_path):
+    from app.services.experiment_embedding_service import ExperimentEmbeddingService
+
+    class Model:
+        max_seq_length = 256
+
+        def __init__(self):
+            self.calls = []
+
+        def encode(self, texts):
+            self.calls.append(list(texts))
+            return np.array([[float(len(text)), 0.5] for text in texts], dtype=np.float32)
+
+    service = ExperimentEmbeddingService(memo_store=_store(tmp_path))
+    service.local_model = Model()
+
+    texts = ['The document.', 'A segment.', 'The document.']
+    first = service.generate_embeddings_batch(texts, 'local')
+    rerun = ExperimentEmbeddingService(memo_store=_store(tmp_path))
+    rerun.local_model = Model()
+    second = rerun.generate_embeddings_batch(texts, 'local')
+
+    assert service.local_model.calls == [['The document.', 'A segment.']]
+    assert rerun.local_model.calls == []
+    assert [result['vector'] for result in second] == [result['vector'] for result in first]
+    assert second[0]['model'] == 'all-MiniLM-L6-v2' and second[0]['dimensions'] == 2
+    assert rerun.generate_embeddings('A segment.', 'local')['vector'] == [10.0, 0.5]
+
+
+def test_default_path_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    from shared_services.embedding import memo_store
+
+    monkeypatch.delenv('EMBEDDING_MEMO_PATH', raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    store = EmbeddingMemoStore()
+
+    assert store.path == memo_store.DEFAULT_PATH
+    assert not store.path.startswith(str(tmp_path))
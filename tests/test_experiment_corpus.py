@@ -0,0 +1,109 @@
+"""Regression coverage for the trigger-maintained experiment corpus membership."""
+
+from app.models import Document, Experiment, ExperimentDocument
+from app.models.experiment_corpus import ExperimentCorpusMember
+from app.services.experiment_corpus_service import ExperimentCorpusService
+
+
+def _document(db_session, user, title, document_type='document', source=None, version=1):
+    document = Document(
+        title=title,
+        content=f'{title} content',
+        document_type=document_type,
+        content_type='text/plain',
+        status='completed',
+        user_id=user.id,
+        source_document_id=source.id if source else None,
+        version_number=version,
+    )
+    db_session.add(document)
+    db_session.flush()
+    return document
+
+
+def _experiment(db_session, user):
+    experiment = Experiment(
+        name='Corpus Experiment',
+        experiment_type='temporal_evolution',
+        user_id=user.id,
+        status='draft',
+    )
+    db_session.add(experiment)
+    db_session.flush()
+    return experiment
+
+
+def _rows(experiment):
+    return {
+        member.document_id: (member.role, member.is_latest, member.legacy)
+        for member in ExperimentCorpusMember.query.filter_by(experiment_id=experiment.id)
+    }
+
+
+def test_links_and_versions_are_materialized(db_session, test_user):
+    experiment = _experiment(db_session, test_user)
+    original = _document(db_session, test_user, 'Original')
+    processed = _document(db_session, test_user, 'Processed', source=original, version=2)
+    other = _document(db_session, test_user, 'Other')
+    reference = _document(db_session, test_user, 'Reference', document_type='reference')
+    for document in (original, processed, other):
+        db_session.add(ExperimentDocument(experiment_id=experiment.id, document_id=document.id))
+    db_session.commit()
+    experiment.add_reference(reference)
+
+    assert _rows(experiment) == {
+        original.id: ('document', False, False),
+        processed.id: ('document', True, False),
+        other.id: ('document', True, False),
+        reference.id: ('reference', False, False),
+    }
+    assert [document.id for _, document in ExperimentCorpusService.latest_associations(experiment.id)] == [
+        processed.id, other.id,
+    ]
+    documents, references = ExperimentCorpusService.documents_and_references(experiment.id)
+    assert [d.id for d in documents] == [original.id, processed.id, other.id]
+    assert [d.id for d in references] == [reference.id]
+    assert [d.id for d in ExperimentCorpusService.analysis_documents(experiment.id)] == [
+        processed.id, other.id, reference.id,
+    ]
+
+    # Version and association changes are reflected in the same transaction
+    original.version_number = 3
+    ExperimentDocument.query.filter_by(experiment_id=experiment.id, document_id=other.id).delete()
+    experiment.remove_reference(reference)
+
+    assert _rows(experiment) == {
+        original.id: ('document', True, False),
+        processed.id: ('document', False, False),
+    }
+
+
+def test_legacy_links_and_family_lookup(db_session, test_user):
+    experiment = _experiment(db_session, test_user)
+    root = _document(db_session, test_user, 'Root')
+    version = _document(db_session, test_user, 'Version', source=root, version=2)
+    unrelated = _document(db_session, test_user, 'Unrelated')
+    experiment.documents.append(version)
+    db_session.commit()
+
+    assert _rows(experiment) == {version.id: ('document', False, True)}
+    assert [d.id for d in ExperimentCorpusService.analysis_documents(experiment.id)] == [version.id]
+    assert ExperimentCorpusService.family_is_linked(experiment.id, root.id)
+    assert not ExperimentCorpusService.family_is_linked(experiment.id, unrelated.id)
+
+    # Legacy links are ignored by analyses once canonical associations exist
+    db_session.add(ExperimentDocument(experiment_id=experiment.id, document_id=unrelated.id))
+    db_session.commit()
+    assert [d.id for d in ExperimentCorpusService.analysis_documents(experiment.id)] == [unrelated.id]
+
+
+def test_refresh_rebuilds_membership(db_session, test_user):
+    experiment = _experiment(db_session, test_user)
+    document = _document(db_session, test_user, 'Doc')
+    db_session.add(ExperimentDocument(experiment_id=experiment.id, document_id=document.id))
+    db_session.commit()
+    ExperimentCorpusMember.query.filter_by(experiment_id=experiment.id).delete()
+
+    ExperimentCorpusService.refresh([experiment.id])
+
+    assert _rows(experiment) == {document.id: ('document', True, False)}
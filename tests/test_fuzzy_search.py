@@ -0,0 +1,59 @@
+"""Tests for ranked fuzzy and prefix search over terms, anchors and references."""
+
+import pytest
+
+from app.models import ContextAnchor, Document, Term
+from app.models.fuzzy_search import AUTOCOMPLETE_MAX_RESULTS, bounded_limit, trigram_available
+from app.services.term_api_service import TermApiService
+
+
+def _terms(db_session, user, *texts):
+    for term_text in texts:
+        db_session.add(Term(term_text=term_text, created_by=user.id))
+    db_session.commit()
+
+
+def test_prefix_mode_ranks_shortest_first_and_is_bounded(db_session, test_user):
+    _terms(db_session, test_user, 'gravitation', 'gravity', 'graviton', 'universal gravitation', 'levity')
+
+    results = TermApiService.search_terms('grav', limit=500, mode='prefix')
+
+    assert [term['term_text'] for term in results] == ['gravity', 'graviton', 'gravitation']
+    assert bounded_limit(500, 'prefix') == AUTOCOMPLETE_MAX_RESULTS
+    assert bounded_limit(500, 'fuzzy') == 100
+
+
+def test_historical_spellings_match_either_way(db_session, test_user):
+    _terms(db_session, test_user, 'music', 'chymistry')
+    db_session.add(ContextAnchor(anchor_term='publick', frequency=2))
+    db_session.commit()
+
+    assert [term['term_text'] for term in TermApiService.search_terms('musick')] == ['music']
+    assert [term['term_text'] for term in TermApiService.search_terms('chemistry')] == ['chymistry']
+    assert [anchor['term'] for anchor in TermApiService.search_context_anchors('public')] == ['publick']
+
+
+def test_reference_search_matches_titles_and_authors(auth_client, db_session, test_user):
+    for title, authors in (('A Compleat Treatise of Musick', 'Holder, William'), ('Opticks', 'Newton, Isaac')):
+        db_session.add(Document(title=title, authors=authors, content='text', content_type='text',
+                                document_type='reference', status='completed', user_id=test_user.id))
+    db_session.commit()
+
+    by_title = auth_client.get('/references/api/search?q=complete').get_json()
+    by_author = auth_client.get('/references/api/search?q=newt&mode=prefix').get_json()
+
+    assert [ref['title'] for ref in by_title] == ['A Compleat Treatise of Musick']
+    assert [ref['title'] for ref in by_author] == ['Opticks']
+    assert [ref['title'] for ref in auth_client.get('/references/api/search?q=newton').get_json()] == ['Opticks']
+    assert auth_client.get('/references/api/search?q=x&mode=regex').status_code == 400
+    assert auth_client.get('/terms/api/terms/search?q=x&mode=regex').status_code == 400
+
+
+def test_fuzzy_mode_tolerates_typos_with_pg_trgm(db_session, test_user):
+    if not trigram_available():
+        pytest.skip('pg_trgm is not installed in the test database')
+    _terms(db_session, test_user, 'gravitation', 'levity')
+
+    results = TermApiService.search_terms('gravitaton')
+
+    assert [term['term_text'] for term in results] == ['gravitation']
@@ -0,0 +1,129 @@
+"""Regression coverage for the shared pooled HTTP client."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from shared_services.http_client import HttpClientPool, HttpPoolSettings, get_http_pool
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    failures_remaining = 0
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        if type(self).failures_remaining > 0:
+            type(self).failures_remaining -= 1
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    _FlakyHandler.failures_remaining = 0
+    _FlakyHandler.hits = 0
+    server = HTTPServer(('127.0.0.1', 0), _FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def _pool(**overrides):
+    settings = HttpPoolSettings(retry_backoff=0, **overrides)
+    return HttpClientPool(settings)
+
+
+def test_global_pool_reuses_clients():
+    pool = get_http_pool()
+
+    assert get_http_pool() is pool
+    assert pool.session() is pool.session()
+    assert pool.httpx_client() is pool.httpx_client()
+
+
+def test_session_retries_transient_statuses_and_records_metrics(local_server):
+    pool = _pool(retry_total=2)
+    _FlakyHandler.failures_remaining = 1
+
+    response = pool.session().get(f'{local_server}/works')
+
+    assert response.status_code == 200
+    assert _FlakyHandler.hits == 2
+    host = local_server.split('//', 1)[1]
+    metrics = pool.get_metrics()[host]
+    assert metrics['requests'] == 1
+    assert metrics['errors'] == 0
+    assert metrics['statuses'] == {200: 1}
+
+
+def test_httpx_client_records_error_statuses(local_server):
+    pool = _pool(retry_total=0)
+    _FlakyHandler.failures_remaining = 1
+
+    response = pool.httpx_client().get(f'{local_server}/word/x/')
+
+    assert response.status_code == 503
+    host = local_server.split('//', 1)[1]
+    metrics = pool.get_metrics()[host]
+    assert metrics['errors'] == 1
+    assert metrics['last_error'] == 'HTTP 503'
+    pool.close()
+
+
+def test_connection_errors_are_counted_per_host():
+    import requests
+
+    pool = _pool(retry_total=0, timeout=1)
+    with pytest.raises(requests.RequestException):
+        pool.session().get('http://127.0.0.1:9/unreachable')
+
+    metrics = pool.get_metrics()['127.0.0.1:9']
+    assert metrics['requests'] == 1
+    assert metrics['errors'] == 1
+
+
+def test_crossref_extractor_does_not_mutate_shared_session_headers():
+    from app.services.crossref_metadata import CrossRefMetadataExtractor
+
+    extractor = CrossRefMetadataExtractor(email='team@example.org')
+
+    assert extractor.session is get_http_pool().session()
+    assert 'mailto:team@example.org' in extractor.headers['User-Agent']
+    assert 'mailto' not in extractor.session.headers['User-Agent']
+
+
+def test_semantic_scholar_parses_graph_api_records():
+    from app.services.semanticscholar_metadata import SemanticScholarMetadataExtractor
+
+    metadata = SemanticScholarMetadataExtractor()._parse_paper({
+        'paperId': 'abc123',
+        'title': 'Managing Semantic Change',
+        'year': 2024,
+        'authors': [{'authorId': '1', 'name': 'A. Author'}, {'authorId': '2'}],
+        'venue': 'JCDL',
+        'externalIds': {'DOI': '10.1/xyz', 'ArXiv': '2511.13699'},
+        'publicationTypes': ['Conference'],
+        'citationCount': 3,
+        'openAccessPdf': {'url': 'https://example.org/p.pdf'},
+    })
+
+    assert metadata['authors'] == ['A. Author']
+    assert metadata['doi'] == '10.1/xyz'
+    assert metadata['arxiv_id'] == '2511.13699'
+    assert metadata['pdf_url'] == 'https://example.org/p.pdf'
+    assert metadata['s2_paper_id'] == 'abc123'
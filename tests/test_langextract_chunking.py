@@ -0,0 +1,168 @@
+"""Regression coverage for windowed LangExtract execution and the shared rate limiter."""
+
+import re
+import threading
+
+import pytest
+from langextract import data
+
+from app.services.langextract_document_analyzer.chunked_extraction import (
+    ChunkedLangExtractRunner,
+    split_windows,
+)
+from app.services.langextract_document_analyzer.text_preprocessing import TextPreprocessor
+from app.services.llm_rate_limiter import (
+    LocalTokenBucket,
+    RateLimitTimeout,
+    RedisTokenBucket,
+    TokenBucket,
+    _build_bucket,
+)
+
+BOOK = ' '.join(
+    f"Chapter {i}. In {1900 + i % 100} Anscombe wrote on intentionality and agency."
+    for i in range(2000)
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class _RecordingLimiter:
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens, timeout=None):
+        with self.lock:
+            self.requests.append(tokens)
+        return 0.0
+
+
+def _extract_names(text):
+    extractions = []
+    for match in re.finditer(r'Anscombe', text):
+        extractions.append(data.Extraction(
+            extraction_class='person',
+            extraction_text='Anscombe',
+            char_interval=data.CharInterval(start_pos=match.start(), end_pos=match.end()),
+            attributes={'mentions': [{'term': 'Anscombe', 'position': [match.start(), match.end()]}]},
+        ))
+    return data.AnnotatedDocument(extractions=extractions, text=text)
+
+
+def test_windows_cover_text_and_end_on_boundaries():
+    windows = split_windows(BOOK, window_chars=5000, overlap_chars=200)
+
+    assert windows[0].start == 0
+    assert windows[-1].end == len(BOOK)
+    for previous, window in zip(windows, windows[1:]):
+        assert window.start < previous.end
+        assert BOOK[previous.end - 2:previous.end] == '. '
+    assert all(BOOK[w.start:w.end] == w.text for w in windows)
+
+
+def test_runner_merges_extractions_with_global_offsets():
+    limiter = _RecordingLimiter()
+    runner = ChunkedLangExtractRunner(
+        _extract_names, rate_limiter=limiter, window_chars=5000, overlap_chars=200,
+        max_workers=4, chars_per_request=2000,
+    )
+
+    extractions, stats = runner.run(BOOK)
+
+    assert len(BOOK) > 50000
+    assert len(extractions) == BOOK.count('Anscombe')
+    for extraction in extractions:
+        interval = extraction.char_interval
+        assert BOOK[interval.start_pos:interval.end_pos] == 'Anscombe'
+        start, end = extraction.attributes['mentions'][0]['position']
+        assert (start, end) == (interval.start_pos, interval.end_pos)
+    assert stats['windows'] == len(limiter.requests)
+    assert max(limiter.requests) == 3
+    assert stats['failed_windows'] == []
+
+
+def test_runner_keeps_successful_windows_when_some_fail():
+    calls = []
+
+    def flaky(text):
+        calls.append(text)
+        if len(calls) == 2:
+            raise RuntimeError('quota exceeded')
+        return _extract_names(text)
+
+    runner = ChunkedLangExtractRunner(flaky, window_chars=5000, overlap_chars=200, max_workers=1)
+    extractions, stats = runner.run(BOOK)
+
+    assert [f['window'] for f in stats['failed_windows']] == [1]
+    assert 0 < len(extractions) < BOOK.count('Anscombe')
+
+
+def test_runner_raises_when_every_window_fails():
+    def broken(text):
+        raise RuntimeError('no api key')
+
+    runner = ChunkedLangExtractRunner(broken, window_chars=5000, overlap_chars=200)
+
+    with pytest.raises(RuntimeError, match='no api key'):
+        runner.run(BOOK[:12000])
+
+
+def test_local_bucket_waits_for_refill_and_times_out():
+    clock = _Clock()
+    bucket = LocalTokenBucket(capacity=4, refill_per_second=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire(4) == 0
+    assert bucket.acquire(1) == pytest.approx(0.5)
+    with pytest.raises(RateLimitTimeout):
+        bucket.acquire(4, timeout=1)
+    assert bucket.acquire(10) == pytest.approx(2.0)
+
+
+def test_redis_bucket_runs_script_against_shared_key():
+    calls = []
+
+    class _Client:
+        def register_script(self, script):
+            def run(keys, args):
+                calls.append((keys, args))
+                return b'0.25' if len(calls) == 1 else b'0'
+            return run
+
+    clock = _Clock()
+    bucket = RedisTokenBucket(_Client(), 'langextract', 8, 2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire(3) == pytest.approx(0.25)
+    assert calls[0] == (['ontextract:ratelimit:langextract'], [8.0, 2.0, 3.0])
+    assert len(calls) == 2
+
+
+def test_unreachable_redis_warns_under_auto_and_fails_closed_under_redis(app, monkeypatch, caplog):
+    monkeypatch.setitem(app.config, 'REDIS_URL', 'redis://127.0.0.1:1/0')
+    monkeypatch.setitem(app.config, 'LANGEXTRACT_RATE_LIMIT_BACKEND', 'auto')
+
+    with caplog.at_level('WARNING', logger='app.services.llm_rate_limiter'):
+        assert isinstance(_build_bucket('test'), LocalTokenBucket)
+    assert 'per-process' in caplog.text
+
+    monkeypatch.setitem(app.config, 'LANGEXTRACT_RATE_LIMIT_BACKEND', 'redis')
+    with pytest.raises(Exception):
+        _build_bucket('test')
+    with pytest.raises(TypeError):
+        TokenBucket(1, 1)
+
+
+def test_preprocessor_keeps_full_text_when_unbounded():
+    text, truncated = TextPreprocessor.clean_text(BOOK + '\x00', max_length=None)
+
+    assert text == BOOK
+    assert truncated is False
@@ -0,0 +1,231 @@
+"""Regression coverage for the batched WordNet similarity engine."""
+
+import random
+
+import pytest
+from nltk.corpus.reader.wordnet import Synset
+
+from app.services.lexical_similarity import LexicalSimilarityEngine, WordNetIndex
+
+
+class _Synset(Synset):
+    """NLTK synset over an in-memory taxonomy, so NLTK's own metrics run on it."""
+
+    def __init__(self, reader, name, pos, parents=(), instance_parents=()):
+        super().__init__(reader)
+        self._name = name
+        self._pos = pos
+        self._parents = list(parents)
+        self._instance_parents = list(instance_parents)
+
+    def hypernyms(self):
+        return list(self._parents)
+
+    def instance_hypernyms(self):
+        return list(self._instance_parents)
+
+    _hypernyms = hypernyms
+    _instance_hypernyms = instance_hypernyms
+
+    def definition(self):
+        return f"definition of {self._name}"
+
+
+class _Reader:
+    def __init__(self):
+        self.synsets_by_name = {}
+        self.lemmas = {}
+
+    def add(self, name, pos, parents=(), instance_parents=(), words=()):
+        synset = _Synset(self, name, pos,
+                         [self.synsets_by_name[p] for p in parents],
+                         [self.synsets_by_name[p] for p in instance_parents])
+        self.synsets_by_name[name] = synset
+        for word in words:
+            self.lemmas.setdefault(word, []).append(synset)
+        return synset
+
+    def all_synsets(self):
+        return iter(self.synsets_by_name.values())
+
+    def synsets(self, word):
+        return list(self.lemmas.get(word, []))
+
+    def synset(self, name):
+        return self.synsets_by_name[name]
+
+    def get_version(self):
+        return '3.0'
+
+
+def _taxonomy(seed=7, size=300):
+    """Single-rooted noun tree plus several disconnected verb taxonomies."""
+    rng = random.Random(seed)
+    reader = _Reader()
+    reader.add('entity.n.01', 'n', words=['entity'])
+    nouns, verbs = ['entity.n.01'], []
+    for i in range(size):
+        if i % 3 == 2:
+            parents = [rng.choice(verbs)] if verbs and rng.random() < 0.8 else []
+            name = f"verb{i}.v.01"
+            reader.add(name, 'v', parents, words=[f"w{rng.randrange(60)}"])
+            verbs.append(name)
+        else:
+            parents = rng.sample(nouns, k=min(len(nouns), rng.choice([1, 1, 1, 2])))
+            instance = [rng.choice(nouns)] if rng.random() < 0.1 else []
+            name = f"noun{i}.n.01"
+            reader.add(name, 'n', parents, instance, words=[f"w{rng.randrange(60)}"])
+            nouns.append(name)
+    return reader
+
+
+def _nested_loop_similarity(reader, word1, word2):
+    best = 0.0
+    for s1 in reader.synsets(word1):
+        for s2 in reader.synsets(word2):
+            sim = s1.path_similarity(s2)
+            if sim and sim > best:
+                best = sim
+    return best
+
+
+def test_batch_scores_match_nltk_path_similarity():
+    reader = _taxonomy()
+    engine = LexicalSimilarityEngine(reader)
+    words = sorted(reader.lemmas)
+
+    scores, best_pairs = engine.similarity_matrix(words, words)
+
+    for i, word1 in enumerate(words):
+        for j, word2 in enumerate(words):
+            assert scores[i, j] == pytest.approx(_nested_loop_similarity(reader, word1, word2))
+            if scores[i, j]:
+                s1, s2 = (reader.synset(name) for name in best_pairs[i][j])
+                assert s1.path_similarity(s2) == pytest.approx(scores[i, j])
+
+
+def test_unknown_words_score_zero_and_expansions_are_cached():
+    reader = _taxonomy()
+    engine = LexicalSimilarityEngine(reader)
+
+    result = engine.score_terms(['w1', 'no-such-term'], ['w2', 'w3'], top_k=1)
+
+    assert len(result['terms'][0]['anchors']) <= 1
+    assert result['terms'][1] == {'term': 'no-such-term', 'found': False, 'anchors': []}
+    engine.score_terms(['w1'], ['w2'])
+    assert engine.stats()['cached_words'] == 4
+
+
+def test_index_round_trips_through_npz(tmp_path):
+    reader = _taxonomy()
+    index = WordNetIndex.from_reader(reader)
+    path = str(tmp_path / 'wordnet.npz')
+    index.save(path)
+
+    loaded = WordNetIndex.load(path)
+    words = sorted(reader.lemmas)[:10]
+
+    assert len(loaded) == len(index)
+    assert loaded.version == '3.0'
+    fresh, _ = LexicalSimilarityEngine(reader, index).similarity_matrix(words, words)
+    restored, _ = LexicalSimilarityEngine(reader, loaded).similarity_matrix(words, words)
+    assert (fresh == restored).all()
+    assert WordNetIndex.load(str(tmp_path / 'missing.npz')) is None
+
+
+def test_wordnet_service_uses_the_engine():
+    from app.services.wordnet_service import WordNetService
+
+    reader = _taxonomy()
+    service = WordNetService(engine=LexicalSimilarityEngine(reader))
+    service.available = True
+
+    pair = service.get_word_similarity('w1', 'w2')
+    batch = service.score_terms_against_anchors(['w1', ' '], ['w2'])
+
+    assert pair['similarity'] == pytest.approx(_nested_loop_similarity(reader, 'w1', 'w2'))
+    assert pair['best_match']['definition1'].startswith('definition of')
+    assert batch['success'] is True
+    assert [t['term'] for t in batch['terms']] == ['w1']
+    assert batch['terms'][0]['anchors'][0]['similarity'] == pytest.approx(pair['similarity'])
+
+
+class _Lemma:
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def antonyms(self):
+        return []
+
+
+class _SenseSynset:
+    """Just enough of an NLTK synset for WordNetService.search_word."""
+
+    def __init__(self, name, pos, lemmas):
+        self._name = name
+        self._pos = pos
+        self._lemmas = [_Lemma(lemma) for lemma in lemmas]
+
+    def name(self):
+        return self._name
+
+    def pos(self):
+        return self._pos
+
+    def definition(self):
+        return f"definition of {self._name}"
+
+    def examples(self):
+        return []
+
+    def lemmas(self):
+        return self._lemmas
+
+    def hypernyms(self):
+        return []
+
+    def hyponyms(self):
+        return []
+
+
+@pytest.fixture
+def search_service(monkeypatch):
+    from types import SimpleNamespace
+
+    from app.services import wordnet_service
+
+    senses = {'bank': [
+        _SenseSynset('bank.n.01', 'n', ['bank']),
+        _SenseSynset('depository_financial_institution.n.01', 'n', ['depository_financial_institution', 'bank']),
+        _SenseSynset('bank.v.01', 'v', ['bank']),
+    ]}
+    monkeypatch.setattr(wordnet_service, 'wn', SimpleNamespace(synsets=lambda word: senses.get(word, [])))
+    wordnet_service._expand_word.cache_clear()
+    service = wordnet_service.WordNetService(engine=LexicalSimilarityEngine(_Reader()))
+    service.available = True
+    yield service
+    wordnet_service._expand_word.cache_clear()
+
+
+def test_search_returns_every_sense_of_a_word(search_service):
+    result = search_service.search_word('Bank')
+
+    assert result['success'] is True
+    assert [s['name'] for s in result['synsets']] == [
+        'bank.n.01', 'depository_financial_institution.n.01', 'bank.v.01',
+    ]
+    assert result['total_synsets'] == 3
+    assert result['pos_distribution'] == {'n': 2, 'v': 1}
+    assert result['synsets'][1]['synonyms'] == ['depository financial institution']
+
+
+def test_search_for_unknown_word_reports_no_synsets(search_service):
+    for _ in range(2):
+        result = search_service.search_word('qwzx')
+
+        assert result['success'] is True
+        assert result['synsets'] == []
+        assert result['message'] == "No synsets found for 'qwzx'"
@@ -0,0 +1,162 @@
+"""Regression coverage for the LLM response cache, replay mode and local replay server."""
+
+import asyncio
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from shared_services.llm import gateway as gateway_module
+from shared_services.llm.gateway import LLMGateway, LLMReplayMissError, LLMResponseStore
+from shared_services.llm.replay_server import make_server
+
+MESSAGES = [{'role': 'user', 'content': 'Which tools suit a 1957 philosophy paper?'}]
+
+
+def _gateway(tmp_path, mode):
+    return LLMGateway(LLMResponseStore(str(tmp_path)), mode)
+
+
+def _live(answer='segment_paragraph, extract_temporal'):
+    calls = []
+
+    def call():
+        calls.append(1)
+        return answer
+    return call, calls
+
+
+def test_auto_mode_serves_identical_prompts_from_cache(tmp_path):
+    gateway = _gateway(tmp_path, 'auto')
+    call, calls = _live()
+
+    first = gateway.complete('anthropic', 'claude-x', MESSAGES, call, max_tokens=800, temperature=0.2)
+    second = gateway.complete('claude', 'claude-x', MESSAGES, call, max_tokens=800, temperature=0.2)
+    gateway.complete('anthropic', 'claude-x', MESSAGES, call, max_tokens=800, temperature=0.7)
+
+    assert first == second
+    assert len(calls) == 2
+    assert gateway.stats()['hits'] == 1
+
+
+def test_replay_mode_never_calls_the_provider(tmp_path):
+    call, calls = _live()
+    _gateway(tmp_path, 'record').complete('openai', 'gpt-4', MESSAGES, call, max_tokens=10)
+
+    replay = _gateway(tmp_path, 'replay')
+    assert replay.complete('openai', 'gpt-4', MESSAGES, call, max_tokens=10) == 'segment_paragraph, extract_temporal'
+    with pytest.raises(LLMReplayMissError):
+        replay.complete('openai', 'gpt-4', MESSAGES, call, max_tokens=11)
+    assert len(calls) == 1
+
+
+def test_record_mode_refreshes_and_off_mode_stores_nothing(tmp_path):
+    _gateway(tmp_path, 'record').complete('anthropic', 'm', MESSAGES, lambda: 'old')
+    _gateway(tmp_path, 'record').complete('anthropic', 'm', MESSAGES, lambda: 'new')
+    assert _gateway(tmp_path, 'replay').complete('anthropic', 'm', MESSAGES, lambda: 'live') == 'new'
+
+    off_dir = tmp_path / 'off'
+    assert _gateway(off_dir, 'off').complete('anthropic', 'm', MESSAGES, lambda: 'live') == 'live'
+    assert not off_dir.exists()
+
+
+def test_async_chat_nodes_use_the_gateway(tmp_path, monkeypatch):
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    from app.orchestration.llm_cache import ainvoke_cached
+
+    monkeypatch.setattr(gateway_module, '_global_gateway', _gateway(tmp_path, 'auto'))
+
+    class _Chat:
+        model = 'claude-sonnet-4-20250514'
+        max_tokens = 2000
+        temperature = 0.0
+        calls = 0
+
+        async def ainvoke(self, messages):
+            self.calls += 1
+            return type('Response', (), {'content': 'TOOLS: segment_paragraph'})()
+
+    client = _Chat()
+    messages = [SystemMessage(content='You pick tools.'), HumanMessage(content='Doc sample')]
+    first = asyncio.run(ainvoke_cached(client, messages))
+    second = asyncio.run(ainvoke_cached(client, messages))
+
+    assert first.content == second.content == 'TOOLS: segment_paragraph'
+    assert client.calls == 1
+
+
+def test_legacy_service_generate_text_is_cached(tmp_path, monkeypatch):
+    from shared_services.llm.base_service import BaseLLMService
+
+    monkeypatch.setattr(gateway_module, '_global_gateway', _gateway(tmp_path, 'auto'))
+    service = BaseLLMService(provider_priority=['claude'])
+    provider = service.providers['claude']
+    calls = []
+    monkeypatch.setattr(provider, 'is_available', lambda: True)
+    monkeypatch.setattr(provider, 'generate_text', lambda *args, **kwargs: calls.append(1) or 'summary')
+
+    assert service.generate_text('Summarize agency.') == 'summary'
+    assert service.generate_text('Summarize agency.') == 'summary'
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def replay_server(tmp_path):
+    server = make_server(str(tmp_path), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield tmp_path, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url, body):
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode('utf-8'), headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_replay_server_speaks_anthropic_and_openai(replay_server):
+    fixtures, base_url = replay_server
+    recorder = _gateway(fixtures, 'record')
+    recorder.complete('anthropic', 'claude-x', MESSAGES, lambda: 'from claude',
+                      system='Be brief.', max_tokens=100, temperature=0.2)
+    recorder.complete('openai', 'gpt-4', MESSAGES, lambda: 'from gpt', max_tokens=100)
+
+    status, message = _post(f"{base_url}/v1/messages", {
+        'model': 'claude-x', 'max_tokens': 100, 'temperature': 0.2,
+        'system': [{'type': 'text', 'text': 'Be brief.'}],
+        'messages': [{'role': 'user', 'content': [{'type': 'text', 'text': MESSAGES[0]['content']}]}],
+    })
+    assert status == 200
+    assert message['content'][0]['text'] == 'from claude'
+
+    status, completion = _post(f"{base_url}/v1/chat/completions", {
+        'model': 'gpt-4', 'max_tokens': 100, 'messages': MESSAGES,
+    })
+    assert status == 200
+    assert completion['choices'][0]['message']['content'] == 'from gpt'
+
+    status, error = _post(f"{base_url}/v1/messages", {'model': 'claude-x', 'messages': MESSAGES})
+    assert status == 404
+    assert error['error']['type'] == 'not_found_error'
+
+
+def test_anthropic_sdk_replays_through_local_server(replay_server):
+    anthropic = pytest.importorskip('anthropic')
+    fixtures, base_url = replay_server
+    _gateway(fixtures, 'record').complete('anthropic', 'claude-x', MESSAGES, lambda: 'offline answer',
+                                          max_tokens=50)
+
+    client = anthropic.Anthropic(api_key='replay', base_url=base_url, max_retries=0)
+    message = client.messages.create(model='claude-x', max_tokens=50, messages=MESSAGES)
+
+    assert message.content[0].text == 'offline answer'
@@ -0,0 +1,182 @@
+"""Regression coverage for concurrent upload metadata lookups."""
+
+import json
+import threading
+import time
+from io import BytesIO
+from types import SimpleNamespace
+
+from werkzeug.datastructures import FileStorage
+
+from app.services.metadata_fanout import MetadataFanout, SourceLookup
+
+
+def _lookup(name, precedence, result=None, delay=0.0, error=None, source='crossref'):
+    def fetch():
+        if delay:
+            time.sleep(delay)
+        if error:
+            raise error
+        return result
+
+    return SourceLookup(name, source, name.title(), precedence, fetch)
+
+
+def test_confident_match_returns_without_waiting_for_lower_precedence_sources():
+    release = threading.Event()
+    slow = SourceLookup('slow', 'crossref', 'Slow', 2, lambda: release.wait(2) and None)
+    fast = _lookup('fast', 1, {'title': 'Fast Paper'})
+
+    started = time.monotonic()
+    result = MetadataFanout(budget_seconds=2).run([slow, fast])
+    release.set()
+
+    assert time.monotonic() - started < 1
+    assert result.primary.lookup.name == 'fast'
+    assert [lookup.name for lookup in result.abandoned] == ['slow']
+
+
+def test_higher_precedence_source_outranks_a_faster_match():
+    fast = _lookup('crossref_title', 3, {'title': 'Title Guess', 'year': 2001})
+    slow = _lookup('semanticscholar_arxiv', 0, {'title': 'arXiv Paper'}, delay=0.1, source='semanticscholar')
+    middle = _lookup('crossref_doi', 2, None, delay=0.05)
+
+    result = MetadataFanout(budget_seconds=2).run([fast, slow, middle])
+
+    assert result.primary.lookup.name == 'semanticscholar_arxiv'
+    assert [o.lookup.name for o in result.accepted] == ['semanticscholar_arxiv', 'crossref_title']
+    assert result.abandoned == []
+
+
+def test_budget_keeps_the_best_match_received_so_far():
+    result = MetadataFanout(budget_seconds=0.05).run([
+        _lookup('stuck', 0, {'title': 'Too Late'}, delay=0.5),
+        _lookup('fast', 3, {'title': 'In Time'}),
+    ])
+
+    assert result.primary.lookup.name == 'fast'
+    assert [lookup.name for lookup in result.abandoned] == ['stuck']
+
+
+def test_budget_bounds_total_latency():
+    result = MetadataFanout(budget_seconds=0.05).run([
+        _lookup('stuck', 0, {'title': 'Too Late'}, delay=0.5),
+    ])
+
+    assert result.primary is None
+    assert [lookup.name for lookup in result.abandoned] == ['stuck']
+
+
+def test_low_confidence_match_is_used_when_nothing_confident_arrives():
+    result = MetadataFanout(budget_seconds=1).run([
+        _lookup('missing', 0, None),
+        _lookup('failing', 1, error=RuntimeError('503')),
+        _lookup('guess', 2, {'title': 'Maybe', 'confidence_level': 'low'}),
+    ])
+
+    assert result.primary.lookup.name == 'guess'
+    assert {o.lookup.name: o.error for o in result.outcomes}['failing'] == '503'
+
+
+def test_outcomes_are_reported_as_they_arrive():
+    events = []
+    MetadataFanout(budget_seconds=1).run(
+        [_lookup('none', 0, None), _lookup('hit', 1, {'title': 'Hit'}, delay=0.05)],
+        on_outcome=lambda outcome: events.append(outcome.to_event()),
+    )
+
+    assert [event['source'] for event in events] == ['none', 'hit']
+    assert events[1]['found'] is True
+    assert events[1]['metadata'] == {'title': 'Hit'}
+
+
+class _Extractor:
+    def __init__(self, **methods):
+        for name, value in methods.items():
+            setattr(self, name, value)
+
+
+def _upload_service(monkeypatch, pdf_info, semanticscholar, crossref):
+    from app.services import upload_service as module
+
+    monkeypatch.setattr(module.pdf_analyzer, 'analyze', lambda path, progress_callback=None: dict(pdf_info))
+    service = module.UploadService()
+    service.semanticscholar = semanticscholar
+    service.crossref = crossref
+    return service
+
+
+def test_accepted_outcomes_follow_cascade_precedence():
+    from app.services.metadata_fanout import FanoutResult, SourceOutcome
+
+    crossref = SourceOutcome(_lookup('crossref_doi', 2), {'title': 'CrossRef', 'publisher': 'ACM'})
+    arxiv = SourceOutcome(_lookup('semanticscholar_arxiv', 0), {'title': 'S2'})
+    low = SourceOutcome(_lookup('crossref_title', 3), {'title': 'Guess', 'confidence_level': 'low'})
+    result = FanoutResult(primary=crossref, outcomes=[low, crossref, arxiv])
+
+    assert [o.lookup.name for o in result.accepted] == ['semanticscholar_arxiv', 'crossref_doi']
+
+
+def test_upload_service_fanout_uses_first_confident_source(monkeypatch):
+    service = _upload_service(
+        monkeypatch,
+        {'doi': '10.1/x', 'title': 'PDF Title'},
+        _Extractor(extract_from_doi=lambda doi: {'title': 'S2 Title', 'authors': ['A']}),
+        _Extractor(
+            extract_from_doi=lambda doi: time.sleep(0.5),
+            extract_from_metadata=lambda title, authors=None: time.sleep(0.5),
+        ),
+    )
+    sources = []
+
+    result = service.extract_metadata_from_pdf_streaming(
+        '/tmp/paper.pdf', source_callback=sources.append, fanout=True,
+    )
+
+    assert result.success
+    assert result.source == 'semanticscholar'
+    assert result.metadata['title'] == 'S2 Title'
+    assert [event['source'] for event in sources] == ['semanticscholar_doi']
+    assert 'Found paper in Semantic Scholar (DOI)!' in result.progress
+
+
+def test_upload_service_falls_back_to_pdf_metadata(monkeypatch):
+    service = _upload_service(
+        monkeypatch,
+        {'title': 'PDF Title', 'authors': ['PDF Author'], 'metadata': {}},
+        _Extractor(),
+        _Extractor(extract_from_metadata=lambda title, authors=None: None),
+    )
+
+    result = service.extract_metadata_from_pdf('/tmp/paper.pdf', fanout=True)
+
+    assert not result.success
+    assert result.source == 'pdf_analysis'
+    assert result.metadata == {'title': 'PDF Title', 'authors': ['PDF Author']}
+    assert 'Not found in CrossRef (title search)' in result.progress
+
+
+def test_streaming_service_forwards_source_events(app):
+    from app.services.streaming_metadata_service import StreamingMetadataService
+
+    class Upload:
+        cleaned = []
+
+        @staticmethod
+        def save_to_temp(file):
+            return SimpleNamespace(success=True, temp_path='/tmp/p.pdf', filename='p.pdf', error=None)
+
+        def extract_metadata_from_pdf_streaming(self, path, progress_callback, source_callback=None):
+            source_callback({'source': 'crossref_doi', 'found': False})
+            raise RuntimeError('stop')
+
+        def cleanup_temp(self, path):
+            self.cleaned.append(path)
+
+    stream = StreamingMetadataService(Upload(), SimpleNamespace(), heartbeat_seconds=0.01).create_stream(
+        FileStorage(stream=BytesIO(b'pdf'), filename='p.pdf'), '', True, app,
+    )
+    events = [json.loads(frame[6:]) for frame in stream if '"heartbeat"' not in frame]
+
+    assert events[0] == {'type': 'source', 'source': 'crossref_doi', 'found': False}
+    assert events[-1]['type'] == 'error'
@@ -0,0 +1,90 @@
+"""Tests for Prometheus metrics and trace-context propagation."""
+
+from types import SimpleNamespace
+
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from shared_services.http_client.pool import HttpMetricsRecorder
+from shared_services.llm.gateway import LLMGateway, LLMResponseStore
+from shared_services.metrics import ActiveSpan, begin_query_stats, end_query_stats, inject_context
+from shared_services.metrics.celery_signals import _request_carrier
+
+TRACEPARENT = '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01'
+
+
+def _sample(metric, **labels):
+    return REGISTRY.get_sample_value(metric, labels) or 0
+
+
+def test_request_metrics_and_scrape_endpoint(app, client):
+    labels = {'endpoint': '/api/health', 'method': 'GET', 'status': '200'}
+    before = _sample('ontextract_http_request_duration_seconds_count', **labels)
+
+    assert client.get('/api/health').status_code == 200
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['Content-Type'].startswith('text/plain')
+    assert _sample('ontextract_http_request_duration_seconds_count', **labels) == before + 1
+    assert b'ontextract_http_request_duration_seconds_bucket' in response.data
+    assert b'ontextract_celery_broker_up' in response.data
+
+    app.config['METRICS_TOKEN'] = 'secret'
+    try:
+        assert client.get('/metrics').status_code == 401
+        assert client.get('/metrics', headers={'Authorization': 'Bearer secret'}).status_code == 200
+    finally:
+        app.config['METRICS_TOKEN'] = None
+
+
+def test_query_stats_count_statements(db_session):
+    labels = {'kind': 'task', 'name': 'test_query_stats'}
+    token = begin_query_stats()
+    db_session.execute(text('SELECT 1'))
+    db_session.execute(text('SELECT 2'))
+    stats = end_query_stats(token, 'task', 'test_query_stats')
+
+    assert stats.count == 2
+    assert _sample('ontextract_db_queries_per_unit_sum', **labels) >= 2
+
+
+def test_gateway_records_live_and_cached_calls(tmp_path):
+    gateway = LLMGateway(LLMResponseStore(str(tmp_path)), 'auto')
+    live = {'provider': 'anthropic', 'model': 'metrics-test', 'source': 'live'}
+    cache = dict(live, source='cache')
+    before = (_sample('ontextract_llm_request_duration_seconds_count', **live),
+              _sample('ontextract_llm_request_duration_seconds_count', **cache))
+
+    for _ in range(2):
+        gateway.complete(provider='claude', model='metrics-test', messages=[{'role': 'user', 'content': 'hi'}],
+                         call=lambda: 'hello')
+
+    assert _sample('ontextract_llm_request_duration_seconds_count', **live) == before[0] + 1
+    assert _sample('ontextract_llm_request_duration_seconds_count', **cache) == before[1] + 1
+
+
+def test_external_requests_are_labelled_by_host():
+    host = 'metrics.example.org'
+    before = _sample('ontextract_external_request_errors_total', host=host, error='http_503')
+
+    recorder = HttpMetricsRecorder()
+    recorder.record(f'https://{host}/a', 12.0, status=200)
+    recorder.record(f'https://{host}/b', 30.0, status=503)
+
+    assert _sample('ontextract_external_request_duration_seconds_count', host=host, status='200') >= 1
+    assert _sample('ontextract_external_request_errors_total', host=host, error='http_503') == before + 1
+
+
+def test_trace_context_flows_from_request_to_task_headers():
+    request_span = ActiveSpan('GET /input', {'traceparent': TRACEPARENT})
+    try:
+        headers = inject_context({})
+    finally:
+        request_span.end()
+
+    assert headers['traceparent'].split('-')[1] == TRACEPARENT.split('-')[1]
+
+    # Celery exposes custom message headers on the task request
+    task_request = SimpleNamespace(headers=None, **headers)
+    assert _request_carrier(task_request)['traceparent'] == headers['traceparent']
@@ -0,0 +1,124 @@
+"""Tests for background OED PDF parse jobs and the page layout cache."""
+
+from io import BytesIO
+
+from werkzeug.datastructures import FileStorage
+
+from app.models.oed_parse_job import OEDParseJob, OEDPdfPageLayout
+from app.services.oed_parse_job_service import OEDParseJobService
+from app.services.oed_parser_final import OEDParser
+from app.services.orchestration_progress_service import InMemoryProgressChannel
+
+
+class FakeParser:
+    """Three-page PDF; records extraction start pages and parse calls."""
+
+    extracted = []
+    parsed = []
+
+    @classmethod
+    def iter_pdf_pages(cls, path, start_page=1):
+        for page_number in range(start_page, 4):
+            cls.extracted.append(page_number)
+            yield page_number, 3, {'width': 600, 'height': 800,
+                                   'lines': [{'y': 10, 'left': '1663', 'right': f'quote {page_number}'}]}
+
+    def parse_pages(self, pages):
+        self.parsed.append(len(pages))
+        return {'headword': 'ontology', 'quotes': [page['lines'][0]['right'] for page in pages]}
+
+
+def _upload(content=b'%PDF-1.4 ontology'):
+    return FileStorage(stream=BytesIO(content), filename='ontology.pdf')
+
+
+def _service():
+    FakeParser.extracted, FakeParser.parsed = [], []
+    return OEDParseJobService(parser_class=FakeParser, channel=InMemoryProgressChannel())
+
+
+def test_job_caches_page_layouts_and_reuses_results(app, db_session, test_user, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    service = _service()
+
+    job = service.submit(_upload(), user_id=test_user.id, background=False)
+
+    assert job.status == 'completed'
+    assert job.result == {'headword': 'ontology', 'quotes': ['quote 1', 'quote 2', 'quote 3']}
+    assert (job.pages_done, job.pages_total) == (3, 3)
+    assert OEDPdfPageLayout.query.filter_by(file_hash=job.file_hash).count() == 3
+    assert job.file_path is None and not list((tmp_path / 'oed').iterdir())
+
+    again = service.submit(_upload(), user_id=test_user.id, background=False)
+    forced = service.submit(_upload(), user_id=test_user.id, background=False, force=True)
+
+    assert again.result == job.result and again.result_reused_from == job.id
+    assert forced.layout_cached and forced.result_reused_from is None
+    # One extraction pass and two structured parses (the first job and the forced one)
+    assert FakeParser.extracted == [1, 2, 3]
+    assert FakeParser.parsed == [3, 3]
+
+
+def test_interrupted_extraction_resumes_at_next_page(app, db_session, test_user, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    service = _service()
+    file_hash, file_path = service._store_upload(_upload(b'%PDF-1.4 resumed'))
+    db_session.add(OEDPdfPageLayout(file_hash=file_hash, page_number=1, page_count=3,
+                                    lines=[{'y': 10, 'left': '1700', 'right': 'cached'}]))
+    job = OEDParseJob(file_hash=file_hash, file_path=file_path, status='running', requested_by=test_user.id)
+    db_session.add(job)
+    db_session.commit()
+    channel = service.channel
+    events = channel.subscribe(job.id)
+
+    job = service.run(job)
+
+    assert job.status == 'completed'
+    assert FakeParser.extracted == [2, 3]
+    assert job.result['quotes'] == ['cached', 'quote 2', 'quote 3']
+    progress = []
+    while (event := events.get(timeout=0)) is not None:
+        progress.append((event['type'], event.get('pages_done') or event.get('stage') or event.get('status')))
+    assert ('progress', 2) in progress and ('progress', 3) in progress
+    assert progress[-1] == ('status', 'completed')
+
+
+def test_background_upload_returns_job_urls(app, auth_client, db_session, tmp_path, monkeypatch):
+    from app.tasks import oed
+
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    monkeypatch.setitem(app.config, 'OED_PARSE_BACKGROUND', True)
+    queued = []
+    monkeypatch.setattr(oed.run_oed_parse_job_task, 'delay',
+                        lambda job_id: queued.append(job_id) or type('Task', (), {'id': 'task-1'})())
+
+    response = auth_client.post('/references/parse_oed_pdf', data={'file': (BytesIO(b'%PDF'), 'entry.pdf')},
+                                content_type='multipart/form-data')
+
+    assert response.status_code == 202
+    payload = response.get_json()
+    assert queued == [payload['job']['id']]
+    status = auth_client.get(payload['status_url']).get_json()['job']
+    assert status['status'] == 'pending' and status['result'] is None
+    assert auth_client.post('/references/parse_oed_pdf', data={'file': (BytesIO(b'x'), 'entry.txt')},
+                            content_type='multipart/form-data').status_code == 400
+
+
+def test_page_layout_groups_words_into_lines_and_columns():
+    class Page:
+        width, height = 600, 800
+
+        def extract_words(self, **kwargs):
+            return [
+                {'text': 'the', 'top': 101.4, 'x0': 360, 'x1': 380},
+                {'text': '1663', 'top': 100.0, 'x0': 20, 'x1': 60},
+                {'text': 'Metaphysics', 'top': 100.6, 'x0': 300, 'x1': 355},
+                {'text': 'Next', 'top': 120.0, 'x0': 300, 'x1': 330},
+            ]
+
+    layout = OEDParser._page_layout(Page())
+
+    assert layout['lines'] == [
+        {'y': 100, 'left': '1663', 'right': 'Metaphysics the'},
+        {'y': 120, 'left': '', 'right': 'Next'},
+    ]
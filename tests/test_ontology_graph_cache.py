@@ -0,0 +1,120 @@
+"""Regression coverage for the shared parsed-ontology cache."""
+
+from pathlib import Path
+
+from shared_services.ontology.graph_cache import OntologyGraphCache
+
+ONTOLOGY_DIR = Path(__file__).resolve().parent.parent / 'ontologies'
+SCO_V2 = ONTOLOGY_DIR / 'semantic-change-ontology-v2.ttl'
+
+TTL = """
+@prefix ex: <http://example.org/> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+ex:Parent a owl:Class ; rdfs:label "Parent" .
+ex:Child a owl:Class ; rdfs:subClassOf ex:Parent ; rdfs:label "Child" .
+"""
+
+
+def test_repeated_loads_share_one_parse(tmp_path):
+    cache = OntologyGraphCache(cache_dir=str(tmp_path))
+
+    first = cache.load_content(TTL)
+    second = cache.load_content(TTL)
+
+    assert first is second
+    assert cache.stats()['parses'] == 1
+    assert cache.stats()['memory_hits'] == 1
+
+
+def test_new_process_reuses_disk_entry(tmp_path):
+    OntologyGraphCache(cache_dir=str(tmp_path)).load_content(TTL)
+
+    fresh = OntologyGraphCache(cache_dir=str(tmp_path))
+    parsed = fresh.load_content(TTL)
+
+    assert fresh.stats()['parses'] == 0
+    assert fresh.stats()['disk_hits'] == 1
+    assert len(parsed.graph) == 5
+    assert parsed.direct_subclasses('http://example.org/Parent') == ['http://example.org/Child']
+    assert parsed.label('http://example.org/Child') == 'Child'
+
+
+def test_changed_file_is_reparsed(tmp_path):
+    cache = OntologyGraphCache(cache_dir=str(tmp_path / 'cache'))
+    path = tmp_path / 'onto.ttl'
+    path.write_text(TTL)
+    before = cache.load_file(path)
+
+    path.write_text(TTL + '\nex:Other a owl:Class .\n')
+    after = cache.load_file(path)
+
+    assert after is not before
+    assert after.content_hash != before.content_hash
+    assert 'http://example.org/Other' in after.classes
+
+
+def test_corrupt_disk_entry_falls_back_to_parsing(tmp_path):
+    OntologyGraphCache(cache_dir=str(tmp_path)).load_content(TTL)
+    for entry in tmp_path.glob('*.pickle'):
+        entry.write_bytes(b'not a pickle')
+
+    cache = OntologyGraphCache(cache_dir=str(tmp_path))
+
+    assert len(cache.load_content(TTL).graph) == 5
+    assert cache.stats()['parses'] == 1
+
+
+def test_entries_writable_by_other_users_are_not_loaded(tmp_path):
+    OntologyGraphCache(cache_dir=str(tmp_path)).load_content(TTL)
+    tmp_path.chmod(0o777)
+
+    cache = OntologyGraphCache(cache_dir=str(tmp_path))
+
+    assert len(cache.load_content(TTL).graph) == 5
+    assert cache.stats()['parses'] == 1
+
+
+def test_default_directory_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv('ONTOLOGY_GRAPH_CACHE_DIR', raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    assert not OntologyGraphCache().cache_dir.startswith(str(tmp_path))
+
+
+def test_copy_graph_leaves_cached_graph_untouched(tmp_path):
+    from rdflib import URIRef
+    from shared_services.ontology.graph_cache import copy_graph
+
+    cached = OntologyGraphCache(cache_dir=str(tmp_path)).load_content(TTL).graph
+    copy = copy_graph(cached)
+    copy.add((URIRef('http://example.org/a'), URIRef('http://example.org/b'), URIRef('http://example.org/c')))
+
+    assert len(cached) == 5 and len(copy) == 6
+
+
+def test_event_types_match_sparql_lookup(tmp_path, monkeypatch):
+    import shared_services.ontology.graph_cache as graph_cache
+    from app.services.local_ontology_service import LocalOntologyService
+    from rdflib import Graph
+
+    monkeypatch.setattr(graph_cache, '_global_graph_cache', OntologyGraphCache(cache_dir=str(tmp_path)))
+    event_types = LocalOntologyService(SCO_V2).get_semantic_change_event_types()
+
+    graph = Graph().parse(str(SCO_V2), format='turtle')
+    rows = graph.query("""
+        PREFIX sco: <http://ontextract.org/sco#>
+        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+        PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
+        PREFIX owl: <http://www.w3.org/2002/07/owl#>
+        SELECT ?uri ?label ?definition WHERE {
+            ?uri a owl:Class ; rdfs:subClassOf sco:SemanticChangeEvent ;
+                 rdfs:label ?label ; skos:definition ?definition .
+        } ORDER BY ?label
+    """)
+
+    assert event_types
+    assert [(et.uri, et.label, et.definition) for et in event_types] == [
+        (str(r.uri), str(r.label), str(r.definition)) for r in rows
+    ]
@@ -0,0 +1,170 @@
+"""Regression coverage for the two-tier OntServe/MCP lookup cache."""
+
+import asyncio
+
+import pytest
+
+from app.services.mcp_client import MCPClient, MCPClientError
+from app.services.ontology_lookup_cache import CacheEntry, OntologyLookupCache, RedisLookupTier
+from app.services.ontserve_client import OntServeClient
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _InlineExecutor:
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode('utf-8')
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def _cache(clock, **kwargs):
+    kwargs.setdefault('executor', _InlineExecutor())
+    return OntologyLookupCache(ttl=60, stale_ttl=600, negative_ttl=30, clock=clock, **kwargs)
+
+
+def test_lru_is_bounded_and_counts_hits():
+    cache = _cache(_Clock(), max_entries=2)
+    for key in ('a', 'b', 'a', 'c'):
+        cache.get_or_load(key, lambda key=key: key.upper())
+
+    assert cache.get('a') == 'A'
+    assert cache.get('b') is None
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['memory_hits'] == 2
+    assert stats['size'] == 2
+
+
+def test_stale_entries_are_served_then_refreshed():
+    clock = _Clock()
+    cache = _cache(clock)
+    versions = iter(['v1', 'v2'])
+    loader = lambda: next(versions)
+
+    assert cache.get_or_load('event_types', loader) == 'v1'
+    clock.now += 61
+    assert cache.get_or_load('event_types', loader) == 'v1'
+    assert cache.get_or_load('event_types', loader) == 'v2'
+    assert cache.stats()['refreshes'] == 1
+
+    clock.now += 61 + 600
+    assert cache.get_or_load('event_types', lambda: 'v3') == 'v3'
+
+
+def test_failed_refresh_keeps_stale_value_and_backs_off():
+    clock = _Clock()
+    cache = _cache(clock)
+    cache.put('event_types', 'v1')
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise MCPClientError('OntServe down')
+
+    clock.now += 61
+    assert cache.get_or_load('event_types', broken) == 'v1'
+    assert cache.get_or_load('event_types', broken) == 'v1'
+    assert len(calls) == 1
+    assert cache.stats()['refresh_errors'] == 1
+
+
+def test_missing_entities_are_negatively_cached():
+    clock = _Clock()
+    cache = _cache(clock)
+    calls = []
+    loader = lambda: calls.append(1)
+
+    assert cache.get_or_load('event_type:unknown', loader) is None
+    assert cache.get_or_load('event_type:unknown', loader) is None
+    clock.now += 31
+    cache.get_or_load('event_type:unknown', loader)
+
+    assert len(calls) == 2
+    assert cache.stats()['negative_hits'] == 1
+
+
+def test_redis_tier_is_shared_between_processes():
+    clock = _Clock()
+    redis_client = _FakeRedis()
+    worker = _cache(clock, remote=RedisLookupTier(redis_client))
+    web = _cache(clock, remote=RedisLookupTier(redis_client))
+
+    worker.put('mcp:sparql_query', {'boolean': True})
+
+    assert web.get_or_load('mcp:sparql_query', lambda: pytest.fail('should not load')) == {'boolean': True}
+    assert web.stats()['remote_hits'] == 1
+    entry = CacheEntry.from_json(redis_client.data['ontextract:ontology:mcp:sparql_query'])
+    assert entry.stale_until - entry.fresh_until == 600
+
+
+def test_mcp_client_caches_results_and_failures():
+    clock = _Clock()
+    cache = _cache(clock, failure_ttl=5)
+    client = MCPClient(cache=cache)
+    calls = []
+
+    async def fake_call(method, params):
+        calls.append(params['ontology'])
+        if params['ontology'] == 'missing':
+            raise MCPClientError('HTTP 404')
+        if params['ontology'] == 'empty':
+            return None
+        return {'boolean': True}
+
+    client._call_uncached = fake_call
+
+    async def scenario():
+        first = await client.call_mcp('sparql_query', {'ontology': 'sco', 'query': 'ASK {}'})
+        second = await client.call_mcp('sparql_query', {'query': 'ASK {}', 'ontology': 'sco'})
+        for _ in range(2):
+            with pytest.raises(MCPClientError):
+                await client.call_mcp('sparql_query', {'ontology': 'missing'})
+        clock.now += 6
+        with pytest.raises(MCPClientError, match='HTTP 404'):
+            await client.call_mcp('sparql_query', {'ontology': 'missing'})
+        empty = [await client.call_mcp('sparql_query', {'ontology': 'empty'}) for _ in range(2)]
+        return first, second, empty
+
+    first, second, empty = asyncio.run(scenario())
+
+    assert first == second == {'boolean': True}
+    assert empty == [None, None]
+    assert calls == ['sco', 'missing', 'missing', 'empty']
+    assert cache.stats()['failure_hits'] == 1
+
+
+def test_prefill_answers_ontserve_queries_from_local_ontology():
+    client = OntServeClient()
+    client.mcp_client = MCPClient(cache=_cache(_Clock()))
+
+    async def unreachable(method, params):
+        raise MCPClientError('OntServe down')
+
+    client.mcp_client._call_uncached = unreachable
+    client.mcp_client._refresh_detached = lambda method, params: None
+
+    assert client.prefill_from_local_ontology() > 0
+    event_types = client.get_event_types()
+
+    assert {'InflectionPoint', 'SemanticDrift'} <= {et['name'] for et in event_types}
+    assert client.validate_event_uri(f"{client.namespace}InflectionPoint") is True
+    assert client.get_period_types() == client._get_fallback_period_types()
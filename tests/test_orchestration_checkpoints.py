@@ -0,0 +1,170 @@
+"""Regression coverage for resumable orchestration execution checkpoints."""
+
+import asyncio
+
+import pytest
+
+
+class _FakeTool:
+    def __init__(self, name, fail_times=0, delay=0):
+        self.name = name
+        self.fail_times = fail_times
+        self.delay = delay
+        self.calls = []
+        self.parameters = []
+        self.finished = 0
+
+    async def execute(self, document_text, document_id=None, checkpoint=None, **kwargs):
+        self.calls.append(document_id)
+        self.parameters.append(kwargs)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.finished += 1
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError('worker lost')
+        return {'tool': self.name, 'status': 'success', 'count': 3, 'success': True}
+
+
+@pytest.fixture
+def orchestration(db_session, test_user, experiment_with_documents, sample_documents, monkeypatch):
+    from app.models.experiment_orchestration_run import ExperimentOrchestrationRun
+    from app.orchestration import experiment_nodes
+
+    run = ExperimentOrchestrationRun(
+        experiment_id=experiment_with_documents.id,
+        user_id=test_user.id,
+        status='executing',
+        recommended_strategy={
+            str(doc.id): ['segment_paragraph', 'extract_temporal'] for doc in sample_documents[:2]
+        },
+    )
+    db_session.add(run)
+    db_session.commit()
+
+    tools = {
+        'segment_paragraph': _FakeTool('segment_paragraph'),
+        'extract_temporal': _FakeTool('extract_temporal'),
+    }
+    monkeypatch.setattr(experiment_nodes, 'get_tool_registry', lambda: tools)
+
+    state = {
+        'run_id': run.id,
+        'experiment_id': experiment_with_documents.id,
+        'recommended_strategy': run.recommended_strategy,
+        'documents': [
+            {'id': str(doc.id), 'title': doc.title, 'content': doc.content}
+            for doc in sample_documents[:2]
+        ],
+    }
+    return run, tools, state
+
+
+def _execute(state):
+    from app.orchestration.experiment_nodes import execute_strategy_node
+
+    return asyncio.run(execute_strategy_node(state))
+
+
+def test_rerun_skips_completed_tool_executions(orchestration):
+    run, tools, state = orchestration
+
+    first = _execute(state)
+    second = _execute(state)
+
+    assert len(tools['segment_paragraph'].calls) == 2
+    assert len(tools['extract_temporal'].calls) == 2
+    assert second['processing_results'] == first['processing_results']
+    assert {event['status'] for event in second['execution_trace']} == {'skipped'}
+    assert run.tool_checkpoints.count() == 4
+
+
+def test_failed_execution_is_retried_on_resume(orchestration):
+    run, tools, state = orchestration
+    tools['extract_temporal'].fail_times = 1
+
+    _execute(state)
+    result = _execute(state)
+
+    assert len(tools['segment_paragraph'].calls) == 2
+    assert len(tools['extract_temporal'].calls) == 3
+    retried = [e for e in result['execution_trace'] if e['status'] == 'success']
+    assert [e['tool'] for e in retried] == ['extract_temporal']
+    statuses = {c.status for c in run.tool_checkpoints}
+    assert statuses == {'completed'}
+
+
+def test_changed_document_content_invalidates_checkpoint(orchestration):
+    run, tools, state = orchestration
+    _execute(state)
+
+    state['documents'][0]['content'] += ' Revised.'
+    _execute(state)
+
+    assert len(tools['segment_paragraph'].calls) == 3
+    assert tools['segment_paragraph'].calls[-1] == int(state['documents'][0]['id'])
+
+
+def test_run_status_exposes_partial_results(orchestration):
+    from app.services.orchestration_status_service import OrchestrationStatusService
+
+    run, tools, state = orchestration
+    tools['extract_temporal'].fail_times = 2
+    _execute(state)
+
+    payload = OrchestrationStatusService.get_run_status(run.id)
+    progress = payload['execution_progress']
+
+    assert progress['planned'] == 4
+    assert progress['completed'] == 2
+    assert progress['failed'] == 2
+    assert set(progress['partial_results']) == {doc['id'] for doc in state['documents']}
+    assert payload['progress_percentage'] == 90
+
+
+def test_tools_receive_and_are_keyed_by_document_parameters(orchestration):
+    from app.services.orchestration_checkpoint_service import OrchestrationCheckpointService
+
+    run, tools, state = orchestration
+    tools['period_aware_embedding'] = _FakeTool('period_aware_embedding')
+    first = state['documents'][0]
+    state['recommended_strategy'] = {first['id']: ['period_aware_embedding']}
+    state['document_metadata'] = {first['id']: {'year': 1850}}
+
+    _execute(state)
+    state['document_metadata'][first['id']]['year'] = 1851
+    _execute(state)
+
+    assert [p.get('period') for p in tools['period_aware_embedding'].parameters] == ['1850', '1851']
+    key = OrchestrationCheckpointService.idempotency_key(
+        first['id'], OrchestrationCheckpointService.document_versions([first['id']])[first['id']],
+        first['content'], 'period_aware_embedding', {'period': '1851'},
+    )
+    assert key in OrchestrationCheckpointService.load(run.id)
+
+
+def test_timed_out_execution_is_cancelled_and_checkpoint_failed(orchestration, monkeypatch):
+    from app.orchestration import experiment_nodes
+
+    run, tools, state = orchestration
+    monkeypatch.setattr(experiment_nodes, 'TOOL_TIMEOUT_SECONDS', 0.05)
+    tools['extract_temporal'].delay = 0.5
+
+    result = _execute(state)
+
+    assert tools['extract_temporal'].finished == 0
+    assert {e['status'] for e in result['execution_trace'] if e['tool'] == 'extract_temporal'} == {'timeout'}
+    statuses = {(c.tool_name, c.status) for c in run.tool_checkpoints}
+    assert statuses == {('segment_paragraph', 'completed'), ('extract_temporal', 'failed')}
+
+
+def test_idempotency_key_covers_version_tool_and_parameters():
+    from app.services.orchestration_checkpoint_service import OrchestrationCheckpointService
+
+    key = OrchestrationCheckpointService.idempotency_key
+    base = key(1, 1, 'text', 'segment_paragraph', {'period': 'modern'})
+
+    assert base == key('1', 1, 'text', 'segment_paragraph', {'period': 'modern'})
+    assert base != key(1, 2, 'text', 'segment_paragraph', {'period': 'modern'})
+    assert base != key(1, 1, 'text', 'segment_sentence', {'period': 'modern'})
+    assert base != key(1, 1, 'text', 'segment_paragraph', {'period': 'early'})
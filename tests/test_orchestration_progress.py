@@ -0,0 +1,245 @@
+"""Regression coverage for pushed orchestration progress and coalesced writes."""
+
+import json
+
+import pytest
+
+from app.services.orchestration_progress_service import (
+    InMemoryProgressChannel,
+    _build_channel,
+    OrchestrationProgressReporter,
+    OrchestrationProgressStream,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def run(db_session, test_user):
+    from app.models.experiment import Experiment
+    from app.models.experiment_orchestration_run import ExperimentOrchestrationRun
+
+    experiment = Experiment(
+        name='Progress Experiment',
+        experiment_type='entity_extraction',
+        user_id=test_user.id,
+        status='draft',
+    )
+    db_session.add(experiment)
+    db_session.commit()
+    run = ExperimentOrchestrationRun(
+        experiment_id=experiment.id,
+        user_id=test_user.id,
+        status='executing',
+        current_stage='executing',
+    )
+    db_session.add(run)
+    db_session.commit()
+    return run
+
+
+def _frames(stream):
+    return [json.loads(frame[6:]) for frame in stream if frame.startswith('data: ')]
+
+
+def test_reporter_publishes_every_update_but_coalesces_db_writes(db_session, run):
+    channel = InMemoryProgressChannel()
+    subscription = channel.subscribe(run.id)
+    clock = _Clock()
+    reporter = OrchestrationProgressReporter(channel, flush_seconds=2.0, clock=clock)
+
+    for step in range(1, 4):
+        reporter.report(run.id, f'step {step}', completed=step)
+        clock.now += 0.5
+    db_session.refresh(run)
+    assert run.current_operation == 'step 1'
+
+    clock.now += 2.0
+    reporter.report(run.id, 'step 4')
+    db_session.refresh(run)
+    assert run.current_operation == 'step 4'
+
+    events = [subscription.get(timeout=0) for _ in range(4)]
+    assert [e['current_operation'] for e in events] == ['step 1', 'step 2', 'step 3', 'step 4']
+    assert events[1]['completed'] == 2
+    subscription.close()
+
+
+def test_status_change_flushes_pending_operation(db_session, run):
+    channel = InMemoryProgressChannel()
+    reporter = OrchestrationProgressReporter(channel, flush_seconds=60.0, clock=_Clock())
+    reporter.report(run.id, 'first')
+    reporter.report(run.id, 'last tool')
+    subscription = channel.subscribe(run.id)
+
+    run.status = 'completed'
+    db_session.commit()
+    reporter.status_changed(run)
+
+    db_session.refresh(run)
+    assert run.current_operation == 'last tool'
+    assert subscription.get(timeout=0)['type'] == 'status'
+
+
+def test_stream_forwards_events_and_ends_on_terminal_status(run):
+    channel = InMemoryProgressChannel()
+    statuses = iter([{'status': 'executing'}, {'status': 'completed'}])
+
+    class _PrefilledChannel:
+        def subscribe(self, run_id):
+            subscription = channel.subscribe(run_id)
+            channel.publish(run_id, {'type': 'operation', 'current_operation': 'tool 1/2'})
+            channel.publish(run_id, {'type': 'status', 'status': 'completed'})
+            return subscription
+
+    stream = OrchestrationProgressStream(
+        _PrefilledChannel(), lambda run_id: next(statuses), heartbeat_seconds=0.01,
+    )
+    frames = _frames(stream.stream(run.id))
+
+    assert [f['type'] for f in frames] == ['status', 'operation', 'status', 'status']
+    assert frames[1]['current_operation'] == 'tool 1/2'
+    assert frames[-1]['status'] == 'completed'
+    assert channel._subscribers == {}
+
+
+def test_stream_resyncs_status_when_no_events_arrive(run):
+    clock = _Clock()
+    statuses = iter([{'status': 'executing'}, {'status': 'failed'}])
+
+    class _SilentChannel:
+        def subscribe(self, run_id):
+            class _Subscription:
+                def get(self, timeout):
+                    clock.now += timeout
+                    return None
+
+                def close(self):
+                    pass
+            return _Subscription()
+
+    stream = OrchestrationProgressStream(
+        _SilentChannel(), lambda run_id: next(statuses),
+        heartbeat_seconds=10, resync_seconds=30, clock=clock,
+    )
+    output = list(stream.stream(run.id))
+
+    assert output.count(': heartbeat\n\n') == 3
+    assert _frames(output)[-1]['status'] == 'failed'
+
+
+def test_stream_route_returns_snapshot_for_finished_run(auth_client, db_session, run):
+    run.status = 'completed'
+    db_session.commit()
+
+    response = auth_client.get(f'/experiments/orchestration/stream/{run.id}')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    frames = _frames(response.get_data(as_text=True).split('\n\n'))
+    assert len(frames) == 1
+    assert frames[0]['type'] == 'status'
+    assert frames[0]['run_id'] == str(run.id)
+
+
+def test_auto_backend_warns_when_falling_back_outside_tests(app, monkeypatch, caplog):
+    monkeypatch.setitem(app.config, 'REDIS_URL', 'redis://127.0.0.1:1/0')
+    monkeypatch.setitem(app.config, 'ORCHESTRATION_PROGRESS_BACKEND', 'auto')
+    monkeypatch.setitem(app.config, 'TESTING', False)
+
+    with caplog.at_level('WARNING', logger='app.services.orchestration_progress_service'):
+        assert isinstance(_build_channel(), InMemoryProgressChannel)
+    assert 'will not reach progress streams' in caplog.text
+
+    monkeypatch.setitem(app.config, 'ORCHESTRATION_PROGRESS_BACKEND', 'redis')
+    with pytest.raises(Exception):
+        _build_channel()
+    monkeypatch.setitem(app.config, 'ORCHESTRATION_PROGRESS_BACKEND', 'memory')
+    assert isinstance(_build_channel(), InMemoryProgressChannel)
+
+
+@pytest.fixture
+def job_channel(monkeypatch):
+    from app.services import orchestration_progress_service
+
+    channel = InMemoryProgressChannel()
+    monkeypatch.setattr(orchestration_progress_service, '_progress_channel', channel)
+    return channel
+
+
+def test_committed_processing_job_changes_are_published(db_session, test_user, sample_document, job_channel):
+    from app.models.processing_job import ProcessingJob
+    from app.services.orchestration_progress_service import (
+        processing_document_channel_key,
+        processing_job_channel_key,
+    )
+
+    job = ProcessingJob(job_type='text_cleanup', status='pending', user_id=test_user.id,
+                        document_id=sample_document.id)
+    db_session.add(job)
+    db_session.commit()
+    job_events = job_channel.subscribe(processing_job_channel_key(job.id))
+    document_events = job_channel.subscribe(processing_document_channel_key(sample_document.id))
+
+    job.status = 'running'
+    job.progress_percent = 40
+    db_session.flush()
+    assert job_events.get(timeout=0) is None
+    db_session.commit()
+
+    event = job_events.get(timeout=0)
+    assert (event['type'], event['status'], event['progress_percent']) == ('status', 'running', 40)
+    assert document_events.get(timeout=0)['job_id'] == job.id
+    assert job_events.get(timeout=0) is None
+
+
+def test_job_stream_route_ends_on_terminal_status(client, db_session, test_user, sample_document, job_channel):
+    from app.models.processing_job import ProcessingJob
+
+    job = ProcessingJob(job_type='text_cleanup', status='completed', user_id=test_user.id,
+                        document_id=sample_document.id)
+    db_session.add(job)
+    db_session.commit()
+
+    response = client.get(f'/process/job/{job.id}/stream')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    frames = _frames(response.get_data(as_text=True).split('\n\n'))
+    assert [(f['type'], f['job_id'], f['status']) for f in frames] == [('status', job.id, 'completed')]
+    assert client.get('/process/job/999999/stream').status_code == 404
+
+
+def test_document_job_stream_pushes_the_grouped_jobs(db_session, test_user, sample_document, job_channel):
+    from app.models.processing_job import ProcessingJob
+    from app.services.orchestration_progress_service import processing_document_channel_key
+    from app.services.processing_status_service import ProcessingStatusService
+
+    job = ProcessingJob(job_type='segment_document', status='running', user_id=test_user.id,
+                        document_id=sample_document.id)
+    db_session.add(job)
+    db_session.commit()
+
+    class _Channel:
+        def subscribe(self, key):
+            subscription = job_channel.subscribe(key)
+            job.status = 'completed'
+            db_session.commit()
+            return subscription
+
+    stream = OrchestrationProgressStream(
+        _Channel(), ProcessingStatusService.get_document_processing_jobs,
+        heartbeat_seconds=0.01, max_seconds=0.05, terminal_statuses=(),
+    )
+    frames = _frames(stream.stream(str(sample_document.uuid),
+                                   channel_key=processing_document_channel_key(sample_document.id)))
+
+    assert [f['type'] for f in frames[:3]] == ['status', 'status', 'status']
+    assert frames[1]['job_id'] == job.id
+    assert frames[2]['processing_operations'][0]['status'] == 'completed'
@@ -0,0 +1,86 @@
+"""Regression coverage for the compiled extraction pattern engine."""
+
+import re
+
+import spacy
+
+from app.services import spacy_annotation_store
+from app.services.document_processing_tools.patterns import (
+    CompiledPatternSet,
+    IntervalSet,
+    PatternSpec,
+    get_pattern_set,
+)
+from app.services.spacy_annotation_store import SpacyAnnotationStore
+
+
+def _blank_store(tmp_path):
+    def loader(name):
+        nlp = spacy.blank('en')
+        nlp.add_pipe('sentencizer')
+        return nlp
+    return SpacyAnnotationStore(cache_dir=str(tmp_path), loader=loader)
+
+
+def test_interval_set_rejects_any_overlap():
+    spans = IntervalSet([(10, 20), (30, 40)])
+
+    assert spans.overlaps(15, 25)
+    assert spans.overlaps(5, 11)
+    assert spans.overlaps(0, 50)
+    assert not spans.overlaps(20, 30)
+    assert spans.add(20, 30)
+    assert not spans.add(25, 26)
+    assert spans.add(0, 10)
+    assert len(spans) == 4
+
+
+def test_scan_returns_matches_in_priority_order_and_skips_by_literal():
+    pattern_set = CompiledPatternSet('test', [
+        PatternSpec('word', r'\bmeans\b', re.IGNORECASE, ('means',)),
+        PatternSpec('number', r'\d+'),
+    ])
+    stats = {}
+
+    matches = pattern_set.scan('1 Means 2 means', stats=stats)
+    pattern_set.scan('nothing here 3', stats=stats)
+
+    assert [(spec.name, m.group()) for spec, m in matches] == [
+        ('word', 'Means'), ('word', 'means'), ('number', '1'), ('number', '2'),
+    ]
+    assert stats['word']['skipped'] == 1
+    assert stats['number']['matches'] == 3
+    assert pattern_set.stats()['number']['scans'] == 2
+
+
+def test_pattern_sets_are_compiled_once():
+    specs = [PatternSpec('year', r'\d{4}')]
+
+    assert get_pattern_set('test-once', specs) is get_pattern_set('test-once', [])
+
+
+def test_temporal_prefers_earlier_patterns_and_drops_containing_spans(tmp_path, monkeypatch):
+    from app.services.processing_tools import DocumentProcessor
+
+    monkeypatch.setattr(spacy_annotation_store, '_global_annotation_store', _blank_store(tmp_path))
+    text = "It grew in the early 1950s. Reforms came before 1968 and during the Cold War."
+
+    result = DocumentProcessor().extract_temporal(text)
+
+    found = [(expr['type'], expr['text']) for expr in result.data]
+    assert found == [('DECADE', '1950s'), ('YEAR', '1968'), ('HISTORICAL_PERIOD', 'Cold War')]
+    assert result.metadata['pattern_stats']['PERIOD']['matches'] == 1
+
+
+def test_definitions_report_pattern_stats(db_session, tmp_path, monkeypatch):
+    from app.services.processing_tools import DocumentProcessor
+
+    monkeypatch.setattr(spacy_annotation_store, '_global_annotation_store', _blank_store(tmp_path))
+    text = "Ontology is defined as the study of being and existence. Nothing else matters here."
+
+    result = DocumentProcessor().extract_definitions(text)
+
+    assert [d['term'] for d in result.data if d['pattern'] == 'explicit_definition'] == ['Ontology']
+    stats = result.metadata['pattern_stats']
+    assert stats['is_defined_as']['matches'] == 1
+    assert stats['denotes']['skipped'] == 2
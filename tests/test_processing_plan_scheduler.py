@@ -0,0 +1,132 @@
+"""Tests for dependency-aware scheduling of experiment processing plans."""
+
+from app.models.experiment_document import ExperimentDocument
+from app.models.experiment_processing import DocumentProcessingIndex, ExperimentDocumentProcessing
+from app.models.processing_plan import ProcessingPlanNode
+from app.services.pipeline_service import PipelineService
+from app.services.processing_plan_service import ProcessingPlanScheduler, ProcessingPlanService
+
+STAGES = [
+    {'processing_type': 'segmentation', 'processing_method': 'paragraph'},
+    {'processing_type': 'embeddings', 'processing_method': 'local'},
+    {'processing_type': 'entities', 'processing_method': 'spacy'},
+]
+
+
+class FakeRunner:
+    """Records (document, stage) runs; fails the stages listed in ``fail``."""
+
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+
+    def __call__(self, exp_doc, processing_type, processing_method, user_id):
+        self.calls.append((exp_doc.document_id, processing_type))
+        if (exp_doc.document_id, processing_type) in self.fail:
+            return {'processing_id': None, 'status': 'failed', 'error': 'boom'}
+        return {'processing_id': None, 'status': 'completed'}
+
+
+def _first_exp_doc(experiment):
+    return ExperimentDocument.query.filter_by(experiment_id=experiment.id).order_by(ExperimentDocument.id).first()
+
+
+def _nodes(plan, processing_type=None):
+    query = ProcessingPlanNode.query.filter_by(plan_id=plan.id)
+    if processing_type:
+        query = query.filter_by(processing_type=processing_type)
+    return query.order_by(ProcessingPlanNode.position).all()
+
+
+def test_plan_wires_stage_dependencies_and_skips_completed_work(db_session, test_user, experiment_with_documents):
+    exp_doc = _first_exp_doc(experiment_with_documents)
+    done = ExperimentDocumentProcessing(experiment_document_id=exp_doc.id, processing_type='entities',
+                                        processing_method='spacy', status='completed')
+    db_session.add(done)
+    db_session.commit()
+
+    plan = ProcessingPlanService().build_plan(experiment_with_documents.id, STAGES, test_user.id)
+
+    nodes = _nodes(plan)
+    assert len(nodes) == 5 * len(STAGES)
+    segmentation = {node.document_id: str(node.id) for node in _nodes(plan, 'segmentation')}
+    for node in _nodes(plan, 'embeddings'):
+        assert node.depends_on == [segmentation[node.document_id]]
+    assert all(node.depends_on == [] for node in _nodes(plan, 'entities'))
+    skipped = [node for node in nodes if node.status == 'skipped']
+    assert [(node.experiment_document_id, node.processing_id) for node in skipped] == [(exp_doc.id, done.id)]
+
+
+def test_dispatch_respects_dependencies_and_stage_limits(db_session, test_user, experiment_with_documents):
+    plan = ProcessingPlanService().build_plan(experiment_with_documents.id, STAGES, test_user.id)
+    submitted = []
+    scheduler = ProcessingPlanScheduler(runner=FakeRunner(), submit=submitted.append,
+                                        limits={'segmentation': 2, 'entities': 3})
+
+    scheduler.dispatch([plan.id])
+
+    queued = ProcessingPlanNode.query.filter(ProcessingPlanNode.id.in_(submitted)).all()
+    assert sorted(node.processing_type for node in queued) == ['entities'] * 3 + ['segmentation'] * 2
+
+    # Finishing a segmentation frees its slot and unblocks that document's embeddings
+    segmentation = next(node for node in queued if node.processing_type == 'segmentation')
+    submitted.clear()
+    scheduler.run_node(segmentation.id)
+
+    newly_queued = ProcessingPlanNode.query.filter(ProcessingPlanNode.id.in_(submitted)).all()
+    assert sorted((node.processing_type, node.document_id) for node in newly_queued) == sorted([
+        ('embeddings', segmentation.document_id),
+        ('segmentation', _nodes(plan, 'segmentation')[2].document_id),
+    ])
+
+
+def test_inline_plan_runs_in_dependency_order_and_blocks_on_failure(db_session, test_user,
+                                                                   experiment_with_documents):
+    plan = ProcessingPlanService().build_plan(experiment_with_documents.id, STAGES, test_user.id)
+    failing_doc = _nodes(plan)[0].document_id
+    runner = FakeRunner(fail={(failing_doc, 'segmentation')})
+
+    plan = ProcessingPlanScheduler(runner=runner, limits={'segmentation': 1}).run_inline(plan)
+
+    for document_id in {call[0] for call in runner.calls}:
+        stages = [stage for doc, stage in runner.calls if doc == document_id]
+        if 'embeddings' in stages:
+            assert stages.index('segmentation') < stages.index('embeddings')
+    assert (failing_doc, 'embeddings') not in runner.calls
+    assert plan.status == 'failed'
+    assert plan.to_dict()['node_counts'] == {'completed': 13, 'failed': 1, 'blocked': 1}
+
+
+def test_plan_route_runs_pipeline_operations_and_updates_index(auth_client, db_session, experiment_with_documents,
+                                                               monkeypatch):
+    def finish(self, processing_op, index_entry, exp_doc, processing_method):
+        processing_op.mark_completed({'fake': True})
+        index_entry.status = 'completed'
+
+    monkeypatch.setattr(PipelineService, '_process_segmentation', finish)
+    monkeypatch.setattr(PipelineService, '_process_embeddings', finish)
+    monkeypatch.setattr(PipelineService, '_create_provenance_record', lambda *args: None)
+    document_id = _first_exp_doc(experiment_with_documents).document_id
+
+    response = auth_client.post(f'/experiments/{experiment_with_documents.id}/api/processing-plans', json={
+        'stages': STAGES[:2], 'document_ids': [document_id],
+    })
+
+    assert response.status_code == 200
+    plan = response.get_json()['plan']
+    assert plan['status'] == 'completed'
+    assert plan['node_counts'] == {'completed': 2}
+    index = DocumentProcessingIndex.query.filter_by(document_id=document_id,
+                                                    experiment_id=experiment_with_documents.id).all()
+    assert sorted((entry.processing_type, entry.status) for entry in index) == [
+        ('embeddings', 'completed'), ('segmentation', 'completed'),
+    ]
+
+    status = auth_client.get(response.get_json()['status_url']).get_json()['plan']
+    assert [node['processing_type'] for node in status['nodes']] == ['segmentation', 'embeddings']
+    assert all(node['processing_id'] for node in status['nodes'])
+
+    invalid = auth_client.post(f'/experiments/{experiment_with_documents.id}/api/processing-plans', json={
+        'stages': [{'processing_type': 'embeddings', 'processing_method': 'paragraph'}],
+    })
+    assert invalid.status_code == 400
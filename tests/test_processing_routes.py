@@ -311,6 +311,45 @@ def test_processing_job_view_adapts_experiment_processing(
     }
 
 
+def test_experiment_job_history_is_one_query_and_pages_stably(
+    experiment_with_processing, sample_documents
+):
+    from sqlalchemy import event
+
+    from app import db
+    from app.services.processing_results import (
+        append_experiment_jobs,
+        experiment_job_history,
+    )
+
+    document_ids = [document.id for document in sample_documents]
+    statements = []
+
+    def count(*args):
+        statements.append(args[2])
+
+    engine = db.session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        jobs = append_experiment_jobs([], document_ids, "embeddings")
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert len(jobs) == len(sample_documents)
+    assert len(statements) == 1
+
+    full = [record.id for record in experiment_job_history(document_ids, "embeddings")]
+    pages = [
+        record.id
+        for offset in range(0, len(full), 2)
+        for record in experiment_job_history(
+            document_ids, "embeddings", limit=2, offset=offset
+        )
+    ]
+    assert pages == full
+    assert experiment_job_history([], "embeddings") == []
+
+
 def test_document_family_query_includes_base_and_derived_versions(
     db_session, sample_document
 ):
@@ -82,8 +82,12 @@ def test_oed_pdf_parser_returns_mocked_result(
     from app.services import oed_parser_final
 
     class FakeOEDParser:
-        def parse_pdf(self, path):
-            return {"headword": "agency", "source_path": path}
+        @staticmethod
+        def iter_pdf_pages(path, start_page=1):
+            yield 1, 1, {"width": 600, "height": 800, "lines": [{"y": 10, "left": "", "right": "agency"}]}
+
+        def parse_pages(self, pages):
+            return {"headword": pages[0]["lines"][0]["right"]}
 
     monkeypatch.setattr(oed_parser_final, "OEDParser", FakeOEDParser)
 
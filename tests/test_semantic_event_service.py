@@ -3,7 +3,7 @@
 import json
 from datetime import datetime
 from types import SimpleNamespace
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -32,14 +32,14 @@ class ProvenanceRecorder:
             raise self.error
 
 
-def _service(provenance=None, clock=None):
+def _service(provenance=None, clock=None, id_factory=None):
     from app.services.semantic_event_service import SemanticEventService
 
     return SemanticEventService(
         ontology_service=StubOntology(),
         provenance_service=provenance or ProvenanceRecorder(),
         clock=clock or (lambda: datetime(2026, 1, 1, 12, 0, 0)),
-        id_factory=lambda: UUID('11111111-1111-1111-1111-111111111111'),
+        id_factory=id_factory or (lambda: UUID('11111111-1111-1111-1111-111111111111')),
         workflow_logger=SimpleNamespace(warning=lambda message: None),
     )
 
@@ -83,10 +83,17 @@ def _link(db_session, experiment, document):
     db_session.commit()
 
 
+def _stored_events(experiment):
+    from app.services.semantic_event_service import SemanticEventService
+
+    return SemanticEventService.list_events(experiment.id)
+
+
 def test_semantic_event_routes_remain_canonical(app):
     expected = 'app.routes.experiments.temporal.events'
     assert app.view_functions['experiments.save_semantic_event'].__module__ == expected
     assert app.view_functions['experiments.remove_semantic_event'].__module__ == expected
+    assert app.view_functions['experiments.list_semantic_events'].__module__ == expected
 
 
 def test_create_event_generates_id_enriches_and_scopes_evidence(
@@ -123,8 +130,10 @@ def test_create_event_generates_id_enriches_and_scopes_evidence(
     assert event['created_by'] == test_user.id
     assert event['created_at'] == '2026-01-01T12:00:00'
     assert event['modified_by'] is None
+    assert event['version'] == 1
+    assert _stored_events(experiment) == [event]
     stored = json.loads(experiment.configuration)
-    assert stored['semantic_events'] == [event]
+    assert 'semantic_events' not in stored
     assert stored['preserved'] == {'value': True}
     assert len(provenance.calls) == 1
     assert provenance.calls[0]['is_update'] is False
@@ -197,6 +206,121 @@ def test_update_preserves_creation_metadata_and_sets_modification(
     assert provenance.calls[0]['is_update'] is True
 
 
+def test_stale_update_is_rejected(db_session, test_user):
+    from app.services.base_service import ConflictError
+
+    experiment = _temporal_experiment(db_session, test_user, 'stale')
+    created = _service().save(
+        experiment.id,
+        {'event_type': 'broadening', 'from_period': 1990, 'description': 'First.'},
+        test_user,
+    )['semantic_events'][0]
+    edit = {
+        'id': created['id'],
+        'version': created['version'],
+        'event_type': 'broadening',
+        'from_period': 1990,
+    }
+    updated = _service().save(
+        experiment.id, dict(edit, description='Second.'), test_user,
+    )['semantic_events'][0]
+
+    with pytest.raises(ConflictError, match='changed by someone else'):
+        _service().save(experiment.id, dict(edit, description='Stale.'), test_user)
+
+    assert updated['version'] == created['version'] + 1
+    assert _stored_events(experiment)[0]['description'] == 'Second.'
+
+
+def test_legacy_configuration_events_are_imported_on_first_edit(
+    db_session, test_user, sample_document
+):
+    from app.services.semantic_event_service import SemanticEventService
+
+    experiment = _temporal_experiment(db_session, test_user, 'legacy')
+    _link(db_session, experiment, sample_document)
+    experiment.configuration = json.dumps({
+        'preserved': {'value': True},
+        'semantic_events': [
+            {
+                'id': 'event_1700000000000',
+                'event_type': 'narrowing',
+                'from_period': 1850,
+                'to_period': 1900,
+                'description': 'Legacy event.',
+                'related_documents': [
+                    {'id': sample_document.id, 'title': 'Stale title'},
+                    {'id': 999999, 'title': 'Deleted document'},
+                ],
+                'created_at': '2024-05-01T10:00:00',
+            },
+            {'type': 'Emergence', 'year': 1995},
+        ],
+    })
+    db_session.commit()
+    assert [event.get('id') for event in SemanticEventService.events_for(experiment)] == [
+        'event_1700000000000',
+        None,
+    ]
+
+    events = _service(id_factory=uuid4).save(
+        experiment.id,
+        {'event_type': 'broadening', 'from_period': 1990, 'description': 'New.'},
+        test_user,
+    )['semantic_events']
+
+    assert [(event['event_type'], event['from_period']) for event in events] == [
+        ('narrowing', 1850),
+        ('broadening', 1990),
+        ('Emergence', 1995),
+    ]
+    assert events[0]['id'] == 'event_1700000000000'
+    assert events[0]['created_at'] == '2024-05-01T10:00:00'
+    assert events[0]['related_documents'] == [{
+        'id': sample_document.id,
+        'uuid': str(sample_document.uuid),
+        'title': sample_document.title,
+    }]
+    stored = json.loads(experiment.configuration)
+    assert 'semantic_events' not in stored
+    assert stored['preserved'] == {'value': True}
+
+
+def test_events_are_queried_by_period_range_and_type(db_session, test_user):
+    from app.services.semantic_event_service import SemanticEventService
+
+    experiment = _temporal_experiment(db_session, test_user, 'range')
+    for from_period, to_period, event_type in (
+        (1800, 1850, 'broadening'),
+        (1840, None, 'narrowing'),
+        (1900, 1950, 'broadening'),
+        (2000, None, 'broadening'),
+    ):
+        _service(id_factory=uuid4).save(
+            experiment.id,
+            {
+                'event_type': event_type,
+                'from_period': from_period,
+                'to_period': to_period,
+                'description': f'{event_type} from {from_period}.',
+            },
+            test_user,
+        )
+
+    def periods(**kwargs):
+        return [
+            event['from_period']
+            for event in SemanticEventService.list_events(experiment.id, **kwargs)
+        ]
+
+    assert periods() == [1800, 1840, 1900, 2000]
+    assert periods(start=1845, end=1920) == [1800, 1900]
+    assert periods(start=1840, end=1840) == [1800, 1840]
+    assert periods(end=1899) == [1800, 1840]
+    assert periods(start=1960) == [2000]
+    assert periods(event_type='narrowing') == [1840]
+
+
 def test_unknown_update_and_remove_return_not_found(db_session, test_user):
     from app.services.base_service import NotFoundError
 
@@ -236,7 +360,7 @@ def test_remove_persists_and_tracks_deletion(db_session, test_user):
     )
 
     assert result == {'success': True, 'semantic_events': []}
-    assert json.loads(experiment.configuration)['semantic_events'] == []
+    assert _stored_events(experiment) == []
     assert provenance.calls[0]['is_deletion'] is True
     assert provenance.calls[0]['event_metadata']['id'] == created['id']
 
@@ -259,9 +383,7 @@ def test_provenance_failure_does_not_undo_committed_event(
 
     db_session.refresh(experiment)
     assert result['success'] is True
-    assert json.loads(experiment.configuration)['semantic_events'][0][
-        'description'
-    ] == 'Durable event.'
+    assert _stored_events(experiment)[0]['description'] == 'Durable event.'
 
 
 def test_event_permissions_and_type_are_enforced(
@@ -371,6 +493,19 @@ def test_semantic_event_route_contracts(
             'description': 'Updated through the API.',
         },
     )
+    stale = auth_client.post(
+        f'/experiments/{temporal_experiment.id}/save_semantic_event',
+        json={
+            'id': event_id,
+            'version': 1,
+            'event_type': 'unrecorded_type',
+            'from_period': 1990,
+            'description': 'Edited from a stale page.',
+        },
+    )
+    listed = auth_client.get(
+        f'/experiments/{temporal_experiment.id}/semantic_events?from=1990&to=2000'
+    )
     invalid = auth_client.post(
         f'/experiments/{temporal_experiment.id}/save_semantic_event',
         json={},
@@ -386,12 +521,35 @@ def test_semantic_event_route_contracts(
 
     assert update.status_code == 200
     assert update.get_json()['semantic_events'][0]['from_period'] == 1995
+    assert stale.status_code == 409
+    assert [event['id'] for event in listed.get_json()['semantic_events']] == [event_id]
     assert invalid.status_code == 400
     assert missing.status_code == 404
     assert remove.status_code == 200
     assert remove.get_json()['semantic_events'] == []
 
 
+def test_listing_route_reads_events_not_yet_imported(auth_client, db_session, test_user):
+    experiment = _temporal_experiment(db_session, test_user, 'legacy-route')
+    experiment.configuration = json.dumps({'semantic_events': [
+        {'id': 'event_1', 'event_type': 'narrowing', 'from_period': 1850, 'to_period': 1900},
+        'not an event',
+        {'id': 'event_1', 'event_type': 'duplicate', 'from_period': 1850},
+        {'type': 'Emergence', 'year': 1995},
+    ]})
+    db_session.commit()
+
+    def listed(query=''):
+        response = auth_client.get(f'/experiments/{experiment.id}/semantic_events{query}')
+        assert response.status_code == 200
+        return [event.get('event_type') or event.get('type') for event in response.get_json()['semantic_events']]
+
+    assert listed('?from=1890&to=2000') == ['narrowing', 'Emergence']
+    assert listed('?from=1990') == ['Emergence']
+    assert listed('?event_type=narrowing') == ['narrowing']
+    assert 'semantic_events' in json.loads(experiment.configuration)
+
+
 def test_semantic_event_routes_require_authentication(app, temporal_experiment):
     client = app.test_client()
     create = client.post(
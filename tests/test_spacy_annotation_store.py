@@ -0,0 +1,103 @@
+"""Regression coverage for the parse-once spaCy annotation store."""
+
+import spacy
+
+from app.services import spacy_annotation_store
+from app.services.spacy_annotation_store import SpacyAnnotationStore
+
+TEXT = "Ontologies changed in 1998. Because agents drift, meaning shifts. Ontologies persist."
+
+
+def _loader(name):
+    nlp = spacy.blank('en')
+    nlp.add_pipe('sentencizer')
+    ruler = nlp.add_pipe('entity_ruler')
+    ruler.add_patterns([{'label': 'DATE', 'pattern': '1998'}])
+    return nlp
+
+
+def _store(tmp_path, **kwargs):
+    return SpacyAnnotationStore(cache_dir=str(tmp_path), loader=_loader, **kwargs)
+
+
+def test_repeated_parses_share_one_doc(tmp_path):
+    store = _store(tmp_path)
+
+    first = store.parse(TEXT)
+    second = store.parse(TEXT)
+
+    assert first is second
+    assert store.stats()['parses'] == 1
+    assert store.stats()['memory_hits'] == 1
+
+
+def test_new_process_reuses_serialized_doc(tmp_path):
+    _store(tmp_path).parse(TEXT)
+
+    fresh = _store(tmp_path)
+    doc = fresh.parse(TEXT)
+
+    assert fresh.stats()['parses'] == 0
+    assert fresh.stats()['disk_hits'] == 1
+    assert [ent.text for ent in doc.ents] == ['1998']
+    assert len(list(doc.sents)) == 3
+
+
+def test_changed_content_is_parsed_again(tmp_path):
+    store = _store(tmp_path)
+    store.parse(TEXT)
+
+    doc = store.parse(TEXT + " Revised in 1998.")
+
+    assert store.stats()['parses'] == 2
+    assert len(list(doc.sents)) == 4
+
+
+def test_missing_components_run_on_cached_doc(tmp_path):
+    store = _store(tmp_path)
+    partial = store.parse(TEXT, exclude=('entity_ruler',))
+    assert partial.ents == ()
+
+    full = store.parse(TEXT)
+    syntax_only = store.parse(TEXT, exclude=('entity_ruler',))
+
+    assert [ent.text for ent in full.ents] == ['1998']
+    assert partial.ents == ()
+    assert syntax_only is full
+    assert store.stats()['parses'] == 1
+    assert store.stats()['partial_parses'] == 1
+
+
+def test_disk_tier_is_pruned(tmp_path):
+    store = _store(tmp_path, max_disk_docs=2)
+
+    for i in range(4):
+        store.parse(f"{TEXT} Copy {i}.")
+
+    assert len(list(tmp_path.glob('*.spacy'))) == 2
+
+
+def test_extraction_tools_share_one_parse(tmp_path, monkeypatch):
+    from app.services.processing_tools import DocumentProcessor
+
+    store = _store(tmp_path)
+    monkeypatch.setattr(spacy_annotation_store, '_global_annotation_store', store)
+    processor = DocumentProcessor()
+
+    temporal = processor.extract_temporal(TEXT)
+    causal = processor.extract_causal(TEXT)
+
+    assert temporal.status == 'success'
+    assert causal.status == 'success'
+    assert store.stats()['parses'] == 1
+    assert store.stats()['memory_hits'] == 1
+
+
+def test_default_cache_dir_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv('SPACY_ANNOTATION_CACHE_DIR', raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    store = SpacyAnnotationStore(loader=_loader)
+
+    assert store.cache_dir == spacy_annotation_store.DEFAULT_CACHE_DIR
+    assert not store.cache_dir.startswith(str(tmp_path))
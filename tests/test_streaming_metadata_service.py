@@ -26,7 +26,7 @@ class FakeUploadService:
             error=None,
         )
 
-    def extract_metadata_from_pdf_streaming(self, path, progress_callback):
+    def extract_metadata_from_pdf_streaming(self, path, progress_callback, source_callback=None):
         self.extraction_calls.append((path, has_app_context()))
         progress_callback('Analyzing PDF')
         progress_callback('Checking CrossRef')
@@ -232,7 +232,7 @@ def test_abandoned_stream_cleans_temp_file(app):
     release = threading.Event()
 
     class BlockingUpload(FakeUploadService):
-        def extract_metadata_from_pdf_streaming(self, path, progress_callback):
+        def extract_metadata_from_pdf_streaming(self, path, progress_callback, source_callback=None):
             progress_callback('Started')
             release.wait(timeout=1)
             return _result()
@@ -108,38 +108,50 @@ def test_context_discovery_falls_back_to_existing_anchors(
 
 
 def test_context_discovery_uses_embeddings_and_skips_failed_anchor(
-    db_session
+    db_session, monkeypatch
 ):
+    from app.services import anchor_embedding_index
+    from app.services.anchor_embedding_index import AnchorEmbeddingIndex
     from app.services.term_api_service import TermApiService
 
+    monkeypatch.setattr(
+        anchor_embedding_index,
+        '_anchor_embedding_index',
+        AnchorEmbeddingIndex(),
+    )
     _anchor(db_session, 'high similarity', 10)
     _anchor(db_session, 'low similarity', 9)
     _anchor(db_session, 'broken anchor', 8)
+    encoded = []
 
     class Embeddings:
         @staticmethod
         def is_available():
             return True
 
+        @staticmethod
+        def get_model_name():
+            return 'test:term-api'
+
         @staticmethod
         def get_embedding(text):
+            encoded.append(text)
             if text == 'broken anchor':
                 raise RuntimeError('embedding unavailable')
-            return text
-
-        @staticmethod
-        def similarity(term_embedding, anchor_embedding):
             return {
-                'high similarity': 0.9126,
-                'low similarity': 0.3214,
-            }[anchor_embedding]
+                'high similarity': [0.9126, 0.4088],
+                'low similarity': [0.3214, 0.9469],
+            }.get(text, [1.0, 0.0])
+
+    def discover():
+        return TermApiService.discover_context_anchors(
+            'agency',
+            'A capacity to act.',
+            limit=2,
+            analysis_service=SimpleNamespace(embedding_service=Embeddings()),
+        )
 
-    results = TermApiService.discover_context_anchors(
-        'agency',
-        'A capacity to act.',
-        limit=2,
-        analysis_service=SimpleNamespace(embedding_service=Embeddings()),
-    )
+    results = discover()
     assert results == [
         {
             'term': 'high similarity',
@@ -155,6 +167,10 @@ def test_context_discovery_uses_embeddings_and_skips_failed_anchor(
         },
     ]
 
+    encoded.clear()
+    assert discover() == results
+    assert sorted(encoded) == ['agency. A capacity to act.', 'broken anchor']
+
 
 def test_adjust_fuzziness_creates_audit_record_for_owner(
     db_session, test_user
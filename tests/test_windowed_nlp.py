@@ -0,0 +1,85 @@
+"""Regression coverage for windowed spaCy processing of long texts."""
+
+import spacy
+
+from app.services import spacy_annotation_store, windowed_nlp
+from app.services.spacy_annotation_store import SpacyAnnotationStore
+from app.services.windowed_nlp import WindowedNLPRunner, iter_text_windows, phrase_key, phrase_keys
+
+SENTENCE = "The agent was first recorded in 1998. Because agents drift, meaning shifts. "
+BOOK = SENTENCE * 200
+
+
+def _loader(name):
+    nlp = spacy.blank('en')
+    nlp.add_pipe('sentencizer')
+    ruler = nlp.add_pipe('entity_ruler')
+    ruler.add_patterns([{'label': 'DATE', 'pattern': '1998'}])
+    return nlp
+
+
+def _runner(tmp_path, window_chars=500):
+    store = SpacyAnnotationStore(cache_dir=str(tmp_path), loader=_loader)
+    return WindowedNLPRunner(store=store, window_chars=window_chars, batch_size=2)
+
+
+def test_windows_cover_text_and_end_at_sentences():
+    windows = list(iter_text_windows(BOOK, 500))
+
+    assert windows[0][0] == 0 and windows[-1][1] == len(BOOK)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(windows, windows[1:]))
+    assert all(end - start <= 500 for start, end in windows)
+    assert all(BOOK[start:end].endswith('. ') for start, end in windows)
+
+
+def test_windows_fall_back_to_whitespace_then_hard_cut():
+    words = 'word ' * 100
+    assert all(words[start:end].endswith(' ') for start, end in iter_text_windows(words, 64))
+
+    solid = 'x' * 100
+    assert list(iter_text_windows(solid, 40)) == [(0, 40), (40, 80), (80, 100)]
+
+
+def test_entity_offsets_are_stitched_across_windows(tmp_path):
+    runner = _runner(tmp_path)
+
+    docs = list(runner.docs(BOOK))
+    entities = [(offset + ent.start_char, offset + ent.end_char) for offset, doc in docs for ent in doc.ents]
+
+    assert len(docs) > 1
+    assert len(entities) == BOOK.count('1998')
+    assert all(BOOK[start:end] == '1998' for start, end in entities)
+    assert len(list(runner.sentences(BOOK))) == 400
+
+
+def test_short_text_uses_the_shared_parse(tmp_path):
+    runner = _runner(tmp_path)
+
+    [(offset, doc)] = list(runner.docs(SENTENCE))
+
+    assert offset == 0
+    assert doc is runner.store.parse(SENTENCE)
+    assert runner.store.stats()['parses'] == 1
+
+
+def test_temporal_tool_positions_on_long_text(tmp_path, monkeypatch):
+    from app.services.processing_tools import DocumentProcessor
+
+    runner = _runner(tmp_path)
+    monkeypatch.setattr(spacy_annotation_store, '_global_annotation_store', runner.store)
+    monkeypatch.setattr(windowed_nlp, '_windowed_nlp_runner', runner)
+
+    result = DocumentProcessor().extract_temporal(BOOK)
+
+    dates = [expr for expr in result.data if expr['type'] == 'DATE']
+    assert result.status == 'success'
+    assert len(dates) == 200
+    assert all(BOOK[expr['start']:expr['end']] == '1998' for expr in dates)
+
+
+def test_phrase_keys_cover_word_subsequences():
+    keys = phrase_keys('the Royal Society')
+
+    assert phrase_key('Royal  Society') in keys
+    assert phrase_key('the Royal') in keys
+    assert phrase_key('Society of London') not in keys